@@ -8,12 +8,20 @@
 #===------------------------------------------------------------------------===#
 
 from ctypes import POINTER
+from ctypes import Structure
+from ctypes import byref
+from ctypes import c_char_p
+from ctypes import c_int
+from ctypes import c_ssize_t
 from ctypes import c_void_p
 from ctypes import cdll
+from ctypes import py_object
+from ctypes import pythonapi
 
 import ctypes.util
 
 __all__ = [
+    'SourceBuffer',
     'c_object_p',
     'find_library',
     'get_library',
@@ -87,10 +95,68 @@ class CachedProperty(object):
 
         return value
 
+class _Py_buffer(Structure):
+    """The Python 2.7 Py_buffer structure."""
+    _fields_ = [
+        ('buf', c_void_p),
+        ('obj', c_void_p),
+        ('len', c_ssize_t),
+        ('itemsize', c_ssize_t),
+        ('readonly', c_int),
+        ('ndim', c_int),
+        ('format', c_char_p),
+        ('shape', c_void_p),
+        ('strides', c_void_p),
+        ('suboffsets', c_void_p),
+        ('smalltable', c_ssize_t * 2),
+        ('internal', c_void_p),
+    ]
+
+pythonapi.PyObject_GetBuffer.argtypes = [py_object, POINTER(_Py_buffer), c_int]
+pythonapi.PyObject_GetBuffer.restype = c_int
+pythonapi.PyBuffer_Release.argtypes = [POINTER(_Py_buffer)]
+pythonapi.PyBuffer_Release.restype = None
+pythonapi.PyObject_AsReadBuffer.argtypes = [py_object, POINTER(c_void_p),
+                                            POINTER(c_ssize_t)]
+pythonapi.PyObject_AsReadBuffer.restype = c_int
+
+class SourceBuffer(object):
+    """The memory of a bytes-like object, without copying it.
+
+    str, bytearray, buffer, memoryview and mmap objects are supported. This is
+    a context manager; the memory is only valid inside the with block.
+    """
+    def __init__(self, source):
+        self.source = source
+        self.view = None
+
+    def __enter__(self):
+        if isinstance(self.source, memoryview):
+            # only has the new buffer interface
+            self.view = _Py_buffer()
+            pythonapi.PyObject_GetBuffer(self.source, byref(self.view), 0)
+            self.address = self.view.buf or 0
+            self.size = self.view.len
+        else:
+            # str, bytearray, buffer, mmap
+            ptr = c_void_p()
+            size = c_ssize_t()
+            pythonapi.PyObject_AsReadBuffer(self.source, byref(ptr), byref(size))
+            self.address = ptr.value or 0
+            self.size = size.value
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.view is not None:
+            pythonapi.PyBuffer_Release(byref(self.view))
+            self.view = None
+
 def find_library():
     # FIXME should probably have build system define absolute path of shared
     # library at install time.
-    for lib in ['LLVM-3.1svn', 'libLLVM-3.1svn', 'LLVM', 'libLLVM']:
+    for lib in ['LLVM-3.2', 'libLLVM-3.2', 'LLVM-3.1svn', 'libLLVM-3.1svn',
+                'LLVM', 'libLLVM']:
         result = ctypes.util.find_library(lib)
         if result:
             return result
@@ -16,6 +16,8 @@ from . import enumerations
 from ctypes import POINTER
 from ctypes import byref
 from ctypes import c_char_p
+from ctypes import c_size_t
+from ctypes import c_void_p
 
 __all__ = [
     "lib",
@@ -82,12 +84,27 @@ class MemoryBuffer(LLVMObject):
             raise Exception("Could not create memory buffer: %s" % out.value)
 
         LLVMObject.__init__(self, memory, disposer=lib.LLVMDisposeMemoryBuffer)
+        self.filename = filename
+
+    @property
+    def address(self):
+        """The address of the first byte of the buffer, as a long."""
+        return lib.LLVMGetBufferStart(self) or 0
+
+    def __len__(self):
+        return lib.LLVMGetBufferSize(self)
 
 def register_library(library):
     library.LLVMCreateMemoryBufferWithContentsOfFile.argtypes = [c_char_p,
             POINTER(c_object_p), POINTER(c_char_p)]
     library.LLVMCreateMemoryBufferWithContentsOfFile.restype = bool
 
+    library.LLVMGetBufferStart.argtypes = [MemoryBuffer]
+    library.LLVMGetBufferStart.restype = c_void_p
+
+    library.LLVMGetBufferSize.argtypes = [MemoryBuffer]
+    library.LLVMGetBufferSize.restype = c_size_t
+
     library.LLVMDisposeMemoryBuffer.argtypes = [MemoryBuffer]
 
 def register_enumerations():
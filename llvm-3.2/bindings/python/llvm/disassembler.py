@@ -7,6 +7,7 @@
 #
 #===------------------------------------------------------------------------===#
 
+from array import array
 from ctypes import CFUNCTYPE
 from ctypes import POINTER
 from ctypes import addressof
@@ -19,8 +20,10 @@ from ctypes import c_ubyte
 from ctypes import c_uint64
 from ctypes import c_void_p
 from ctypes import cast
+from ctypes import create_string_buffer
 
 from .common import LLVMObject
+from .common import SourceBuffer
 from .common import c_object_p
 from .common import get_library
 
@@ -30,6 +33,14 @@ __all__ = [
 
 lib = get_library()
 callbacks = {}
+_batch_disassembly = False
+
+# Bytes of instruction text collected per LLVMDisasmInstructions() call.
+TEXT_BUFFER_SIZE = 1 << 20
+
+# Instructions decoded per LLVMDisasmInstructions() call. The result arrays
+# grow by a window at a time rather than being sized for the input.
+WINDOW_INSTS = 1 << 16
 
 class Disassembler(LLVMObject):
     """Represents a disassembler instance.
@@ -113,6 +124,103 @@ class Disassembler(LLVMObject):
             address += result
             offset += result
 
+    def get_instruction_arrays(self, source, pc=0, offset=0, length=None,
+                               text=False):
+        """Disassemble a range of an input source in one call.
+
+        This is like get_instructions() for sweeping large inputs. The source
+        can be anything that exposes its bytes: str, bytearray, buffer,
+        memoryview or mmap. It is read in place, not copied.
+
+        The pc argument is the address of the first byte of the source. The
+        range starts offset bytes into the source and spans length bytes, or
+        up to the end of the source. Disassembly stops at the end of the range
+        or at the first byte that does not start a valid instruction.
+
+        This returns a 3-tuple of:
+
+          array('I') of the offset of each instruction in the source. Its
+            address is pc plus its offset.
+          array('B') of the size of each instruction, in bytes.
+          list of the str representation of each instruction if text is True,
+            otherwise None. Instructions are only printed when asked for.
+        """
+        offsets = array('I')
+        lengths = array('B')
+        texts = [] if text else None
+
+        with SourceBuffer(source) as buf:
+            if length is None:
+                end = buf.size
+            else:
+                end = min(buf.size, offset + length)
+
+            if offset >= end:
+                return (offsets, lengths, texts)
+
+            if _batch_disassembly:
+                self._decode_batch(buf.address, end, pc, offset,
+                                   offsets, lengths, texts)
+            else:
+                self._decode_each(buf.address, end, pc, offset,
+                                  offsets, lengths, texts)
+
+        return (offsets, lengths, texts)
+
+    def _decode_batch(self, address, end, pc, offset, offsets, lengths, texts):
+        out_str = None
+        out_size = 0
+        if texts is not None:
+            out_str = create_string_buffer(TEXT_BUFFER_SIZE)
+            out_size = TEXT_BUFFER_SIZE
+
+        # no instruction is shorter than a byte
+        window = min(WINDOW_INSTS, end - offset)
+        window_offsets = array('I', [0]) * window
+        window_lengths = array('B', [0]) * window
+        window_offsets_address = window_offsets.buffer_info()[0]
+        window_lengths_address = window_lengths.buffer_info()[0]
+
+        while offset < end:
+            n = lib.LLVMDisasmInstructions(self, address, end, pc, offset,
+                    window_offsets_address, window_lengths_address, window,
+                    out_str, out_size)
+            if n == 0:
+                break
+
+            if n == window:
+                offsets.extend(window_offsets)
+                lengths.extend(window_lengths)
+            else:
+                offsets.extend(window_offsets[:n])
+                lengths.extend(window_lengths[:n])
+            if texts is not None:
+                texts.extend(out_str.raw.split('\0', n)[:n])
+
+            offset = window_offsets[n - 1] + window_lengths[n - 1]
+
+            # without text, only an invalid instruction stops short of a
+            # full window
+            if texts is None and n < window:
+                break
+
+    def _decode_each(self, address, end, pc, offset, offsets, lengths, texts):
+        # for libraries without LLVMDisasmInstructions()
+        out_str = cast((c_byte * 255)(), c_char_p)
+
+        while offset < end:
+            result = lib.LLVMDisasmInstruction(self,
+                    cast(address + offset, POINTER(c_ubyte)),
+                    c_uint64(end - offset), c_uint64(pc + offset), out_str, 255)
+            if result == 0:
+                break
+
+            offsets.append(offset)
+            lengths.append(result)
+            if texts is not None:
+                texts.append(out_str.value)
+
+            offset += result
 
 def register_library(library):
     library.LLVMCreateDisasm.argtypes = [c_char_p, c_void_p, c_int,
@@ -125,6 +233,16 @@ def register_library(library):
             c_uint64, c_uint64, c_char_p, c_size_t]
     library.LLVMDisasmInstruction.restype = c_size_t
 
+    # added after LLVM 3.2 was released; older libraries fall back to one
+    # LLVMDisasmInstruction() call per instruction
+    global _batch_disassembly
+    _batch_disassembly = hasattr(library, 'LLVMDisasmInstructions')
+    if _batch_disassembly:
+        library.LLVMDisasmInstructions.argtypes = [Disassembler, c_void_p,
+                c_uint64, c_uint64, c_uint64, c_void_p, c_void_p, c_size_t,
+                c_char_p, c_size_t]
+        library.LLVMDisasmInstructions.restype = c_size_t
+
 callbacks['op_info'] = CFUNCTYPE(c_int, c_void_p, c_uint64, c_uint64, c_uint64,
                                  c_int, c_void_p)
 callbacks['symbol_lookup'] = CFUNCTYPE(c_char_p, c_void_p, c_uint64,
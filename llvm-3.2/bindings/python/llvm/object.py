@@ -75,13 +75,44 @@ Here are some examples on how to perform iteration:
     for symbol in symbols:
         print symbol.name # OK
 
+Address Tables
+--------------
+
+For lookups by address, the section_table, symbol_table and relocation_table
+properties of an ObjectFile read everything once into arrays sorted by
+address. Finding the section, symbol or relocations at an address is then a
+binary search instead of a walk over the iterators. Rows are returned as named
+tuples, which do not expire.
+
+Section contents are returned by SectionTable.contents() as memoryviews into
+the image property of the ObjectFile: a private, copy-on-write mapping of the
+file. No bytes are copied until they are written to.
+
+    obj = ObjectFile(filename='/bin/ls')
+    sections = obj.section_table
+    symbols = obj.symbol_table
+
+    i = symbols.lookup('main')
+    start = symbols[i].address
+    s = sections.find(start)
+    code = sections.contents(s)[start - sections[s].address:]
+
 """
 
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+from collections import namedtuple
+from ctypes import c_char
 from ctypes import c_char_p
 from ctypes import c_uint64
+from ctypes import c_void_p
+from ctypes import string_at
+import mmap
 
 from .common import CachedProperty
 from .common import LLVMObject
+from .common import SourceBuffer
 from .common import c_object_p
 from .common import get_library
 from .core import MemoryBuffer
@@ -90,10 +121,16 @@ __all__ = [
     "lib",
     "ObjectFile",
     "Relocation",
+    "RelocationTable",
     "Section",
+    "SectionTable",
     "Symbol",
+    "SymbolTable",
 ]
 
+# The address LLVM reports for undefined symbols.
+UNKNOWN_ADDRESS = 0xffffffffffffffffL
+
 class ObjectFile(LLVMObject):
     """Represents an object/binary file."""
 
@@ -116,6 +153,50 @@ class ObjectFile(LLVMObject):
         ptr = lib.LLVMCreateObjectFile(contents)
         LLVMObject.__init__(self, ptr, disposer=lib.LLVMDisposeObjectFile)
         self.take_ownership(contents)
+        self._buffer = contents
+
+    @CachedProperty
+    def image(self):
+        """The bytes of the object file, as a memoryview.
+
+        When the object file was loaded from a filename, this views a private
+        mapping of the file: it is paged in on demand and writes to it are not
+        carried through to the file. Otherwise, it views the MemoryBuffer the
+        object file was created from.
+        """
+        if self._buffer.filename is not None:
+            f = open(self._buffer.filename, 'rb')
+            try:
+                source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            finally:
+                f.close()
+
+            with SourceBuffer(source) as buf:
+                address, size = buf.address, buf.size
+        else:
+            source = self._buffer
+            address, size = source.address, len(source)
+
+        # memoryview() does not take an mmap in Python 2, but it takes a
+        # ctypes array over the same memory. The array keeps the memory alive.
+        data = (c_char * size).from_address(address)
+        data.source = source
+        return memoryview(data)
+
+    @CachedProperty
+    def section_table(self):
+        """The SectionTable of this object file."""
+        return SectionTable(self)
+
+    @CachedProperty
+    def symbol_table(self):
+        """The SymbolTable of this object file."""
+        return SymbolTable(self)
+
+    @CachedProperty
+    def relocation_table(self):
+        """The RelocationTable of this object file."""
+        return RelocationTable(self)
 
     def get_sections(self, cache=False):
         """Obtain the sections in this object file.
@@ -131,7 +212,7 @@ class ObjectFile(LLVMObject):
             if lib.LLVMIsSectionIteratorAtEnd(self, sections):
                 break
 
-            last = Section(sections)
+            last = Section(sections, self)
             if cache:
                 last.cache()
 
@@ -176,7 +257,7 @@ class ObjectFile(LLVMObject):
 class Section(LLVMObject):
     """Represents a section in an object file."""
 
-    def __init__(self, ptr):
+    def __init__(self, ptr, object_file=None):
         """Construct a new section instance.
 
         Section instances can currently only be created from an ObjectFile
@@ -186,6 +267,7 @@ class Section(LLVMObject):
         LLVMObject.__init__(self, ptr)
 
         self.expired = False
+        self._object_file = object_file
 
     @CachedProperty
     def name(self):
@@ -208,10 +290,19 @@ class Section(LLVMObject):
 
     @CachedProperty
     def contents(self):
+        """The raw bytes of the section, as a str.
+
+        Section contents are binary and may contain NUL bytes, so they are
+        copied using the section size.
+        """
         if self.expired:
             raise Exception('Section instance has expired.')
 
-        return lib.LLVMGetSectionContents(self)
+        ptr = lib.LLVMGetSectionContents(self)
+        if not ptr:
+            return ''
+
+        return string_at(ptr, self.size)
 
     @CachedProperty
     def address(self):
@@ -246,7 +337,7 @@ class Section(LLVMObject):
             if lib.LLVMIsRelocationIteratorAtEnd(self, relocations):
                 break
 
-            last = Relocation(relocations)
+            last = Relocation(relocations, self._object_file)
             if cache:
                 last.cache()
 
@@ -339,7 +430,7 @@ class Symbol(LLVMObject):
         sections = lib.LLVMGetSections(self._object_file)
         lib.LLVMMoveToContainingSection(sections, self)
 
-        return Section(sections)
+        return Section(sections, self._object_file)
 
     def cache(self):
         """Cache all cacheable properties."""
@@ -358,7 +449,7 @@ class Symbol(LLVMObject):
 
 class Relocation(LLVMObject):
     """Represents a relocation definition."""
-    def __init__(self, ptr):
+    def __init__(self, ptr, object_file=None):
         """Create a new relocation instance.
 
         Relocations are created from objects derived from Section instances.
@@ -371,6 +462,7 @@ class Relocation(LLVMObject):
         LLVMObject.__init__(self, ptr)
 
         self.expired = False
+        self._object_file = object_file
 
     @CachedProperty
     def address(self):
@@ -394,8 +486,11 @@ class Relocation(LLVMObject):
         if self.expired:
             raise Exception('Relocation instance has expired.')
 
+        if self._object_file is None:
+            raise Exception('Relocation is not associated with an ObjectFile.')
+
         ptr = lib.LLVMGetRelocationSymbol(self)
-        return Symbol(ptr)
+        return Symbol(ptr, self._object_file)
 
     @CachedProperty
     def type_number(self):
@@ -429,10 +524,304 @@ class Relocation(LLVMObject):
         getattr(self, 'address')
         getattr(self, 'offset')
         getattr(self, 'symbol')
-        getattr(self, 'type')
+        getattr(self, 'type_number')
         getattr(self, 'type_name')
         getattr(self, 'value_string')
 
+def _address_array():
+    """An empty sequence for 64-bit addresses and sizes.
+
+    array has no 64-bit integer typecode where a C long is 32 bits, so a list
+    is used there instead.
+    """
+    if array('L').itemsize >= 8:
+        return array('L')
+
+    return []
+
+def _section_key(sections):
+    """The key of the section a section iterator is at.
+
+    Sections have no index in the C API. Where their contents start in the
+    file tells them apart.
+    """
+    return (lib.LLVMGetSectionContents(sections),
+            lib.LLVMGetSectionName(sections),
+            lib.LLVMGetSectionSize(sections))
+
+SectionEntry = namedtuple('SectionEntry',
+    ['index', 'name', 'address', 'size', 'offset'])
+
+class SectionTable(object):
+    """The sections of an object file, sorted by address.
+
+    Sections are numbered by their position in the table. Sections at the
+    same address, like all of the sections of a relocatable object, keep the
+    order of the file.
+
+    Each row is a SectionEntry. Its offset is where the contents of the
+    section start in the object file.
+    """
+    def __init__(self, object_file):
+        rows = []
+        for section in object_file.get_sections():
+            key = _section_key(section)
+            rows.append((section.address, len(rows), key))
+
+        rows.sort()
+
+        base = object_file._buffer.address
+        end = len(object_file._buffer)
+
+        self._object_file = object_file
+        self.names = []
+        self.addresses = _address_array()
+        self.sizes = _address_array()
+        self.offsets = _address_array()
+        self._keys = {}
+        self._by_name = {}
+
+        for (address, order, key) in rows:
+            (ptr, name, size) = key
+            index = len(self.names)
+
+            self.names.append(name)
+            self.addresses.append(address)
+            self.sizes.append(size)
+            # contents(), of sections without any, is empty
+            if ptr:
+                self.offsets.append(ptr - base)
+            else:
+                self.offsets.append(end)
+
+            self._keys[key] = index
+            self._by_name.setdefault(name, index)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        return SectionEntry(index, self.names[index], self.addresses[index],
+                            self.sizes[index], self.offsets[index])
+
+    def __iter__(self):
+        for index in xrange(len(self)):
+            yield self[index]
+
+    def find(self, address):
+        """Obtain the index of the section containing an address.
+
+        Sections starting at the same address, like those of a relocatable
+        object, are ambiguous: the last of them that is long enough is
+        returned. Returns -1 if no section contains the address.
+        """
+        i = bisect_right(self.addresses, address) - 1
+        if i < 0:
+            return -1
+
+        start = self.addresses[i]
+        while i >= 0 and self.addresses[i] == start:
+            if address < start + self.sizes[i]:
+                return i
+            i -= 1
+
+        # an earlier, longer section may still cover it
+        if i >= 0 and address < self.addresses[i] + self.sizes[i]:
+            return i
+
+        return -1
+
+    def lookup(self, name):
+        """Obtain the index of the first section with a name, or -1."""
+        return self._by_name.get(name, -1)
+
+    def index_of(self, section):
+        """Obtain the index of a Section, or -1 if it is not in the table."""
+        return self._keys.get(_section_key(section), -1)
+
+    def contents(self, index):
+        """The contents of a section, as a memoryview.
+
+        The view is into the image of the object file; no bytes are copied.
+        Sections that take no space in the file, like .bss, may be shorter than
+        their size, or empty.
+        """
+        offset = self.offsets[index]
+        return self._object_file.image[offset:offset + self.sizes[index]]
+
+SymbolEntry = namedtuple('SymbolEntry',
+    ['index', 'name', 'address', 'size', 'section'])
+
+class SymbolTable(object):
+    """The symbols of an object file, sorted by address.
+
+    Each row is a SymbolEntry. Its section is the index of the containing
+    section in the SectionTable of the same object file, or -1 for undefined
+    and absolute symbols. Undefined symbols come after every defined one.
+    """
+    def __init__(self, object_file):
+        sections = object_file.section_table
+
+        rows = []
+        for symbol in object_file.get_symbols():
+            it = lib.LLVMGetSections(object_file)
+            lib.LLVMMoveToContainingSection(it, symbol)
+            if lib.LLVMIsSectionIteratorAtEnd(object_file, it):
+                section = -1
+            else:
+                section = sections._keys.get(_section_key(it), -1)
+            lib.LLVMDisposeSectionIterator(it)
+
+            rows.append((symbol.address, len(rows), symbol.name, symbol.size,
+                         section))
+
+        rows.sort()
+
+        self.names = []
+        self.addresses = _address_array()
+        self.sizes = _address_array()
+        self.sections = array('i')
+        self._by_name = {}
+        self._by_key = {}
+
+        for (address, order, name, size, section) in rows:
+            index = len(self.names)
+
+            self.names.append(name)
+            self.addresses.append(address)
+            self.sizes.append(size)
+            self.sections.append(section)
+
+            self._by_name.setdefault(name, index)
+            self._by_key.setdefault((name, address), index)
+
+        # where the undefined symbols start
+        self.defined = bisect_left(self.addresses, UNKNOWN_ADDRESS)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        return SymbolEntry(index, self.names[index], self.addresses[index],
+                           self.sizes[index], self.sections[index])
+
+    def __iter__(self):
+        for index in xrange(len(self)):
+            yield self[index]
+
+    def at(self, address):
+        """Obtain the indices of the symbols at an address, as an xrange."""
+        lo = bisect_left(self.addresses, address, 0, self.defined)
+        hi = bisect_right(self.addresses, address, lo, self.defined)
+        return xrange(lo, hi)
+
+    def find(self, address):
+        """Obtain the index of the symbol covering an address.
+
+        This is the last symbol starting at or before the address whose size
+        reaches it. Symbols without a size only cover their own address.
+        Returns -1 if no symbol covers the address.
+        """
+        i = bisect_right(self.addresses, address, 0, self.defined) - 1
+        while i >= 0:
+            start = self.addresses[i]
+            if address == start or address < start + self.sizes[i]:
+                return i
+            if i == 0 or self.addresses[i - 1] != start:
+                break
+            i -= 1
+
+        return -1
+
+    def lookup(self, name):
+        """Obtain the index of the first symbol with a name, or -1."""
+        return self._by_name.get(name, -1)
+
+    def index_of(self, symbol):
+        """Obtain the index of a Symbol, or -1 if it is not in the table."""
+        return self._by_key.get((symbol.name, symbol.address), -1)
+
+RelocationEntry = namedtuple('RelocationEntry',
+    ['index', 'section', 'address', 'type_number', 'type_name', 'symbol'])
+
+class RelocationTable(object):
+    """The relocations of an object file, sorted by section and address.
+
+    Each row is a RelocationEntry. Its section is the index of the section
+    the relocation applies to, and its symbol is an index into the
+    SymbolTable of the same object file, or -1.
+
+    The address of a relocation is where it applies in the address space of
+    its section. For relocatable objects this is the offset in the section.
+    """
+    def __init__(self, object_file):
+        sections = object_file.section_table
+        symbols = object_file.symbol_table
+
+        rows = []
+        for section in object_file.get_sections():
+            index = sections.index_of(section)
+            for relocation in section.get_relocations():
+                rows.append((index, relocation.address,
+                             relocation.type_number, relocation.type_name,
+                             symbols.index_of(relocation.symbol)))
+
+        rows.sort()
+
+        self.sections = array('i')
+        self.addresses = _address_array()
+        self.type_numbers = array('I')
+        self.type_names = []
+        self.symbols = array('i')
+        # relocations of section i are [starts[i], starts[i + 1])
+        self.starts = array('i', [0]) * (len(sections) + 1)
+
+        names = {}
+        for (section, address, type_number, type_name, symbol) in rows:
+            self.sections.append(section)
+            self.addresses.append(address)
+            self.type_numbers.append(type_number)
+            self.type_names.append(names.setdefault(type_name, type_name))
+            self.symbols.append(symbol)
+
+        # relocations in sections missing from the table come first
+        self.starts[0] = bisect_left(self.sections, 0)
+        for section in xrange(len(sections)):
+            self.starts[section + 1] = bisect_right(self.sections, section)
+
+    def __len__(self):
+        return len(self.sections)
+
+    def __getitem__(self, index):
+        return RelocationEntry(index, self.sections[index],
+                               self.addresses[index], self.type_numbers[index],
+                               self.type_names[index], self.symbols[index])
+
+    def __iter__(self):
+        for index in xrange(len(self)):
+            yield self[index]
+
+    def in_section(self, section):
+        """Obtain the indices of the relocations of a section, as an xrange."""
+        return xrange(self.starts[section], self.starts[section + 1])
+
+    def in_range(self, section, start, end):
+        """Obtain the indices of the relocations of a section that apply in
+        [start, end), as an xrange."""
+        lo = bisect_left(self.addresses, start, self.starts[section],
+                         self.starts[section + 1])
+        hi = bisect_left(self.addresses, end, lo, self.starts[section + 1])
+        return xrange(lo, hi)
+
+    def find(self, section, address):
+        """Obtain the index of the relocation of a section at an address, or
+        -1."""
+        r = self.in_range(section, address, address + 1)
+        if len(r) == 0:
+            return -1
+
+        return r[0]
+
 def register_library(library):
     """Register function prototypes with LLVM library instance."""
 
@@ -471,7 +860,7 @@ def register_library(library):
     library.LLVMGetSectionSize.restype = c_uint64
 
     library.LLVMGetSectionContents.argtypes = [c_object_p]
-    library.LLVMGetSectionContents.restype = c_char_p
+    library.LLVMGetSectionContents.restype = c_void_p
 
     library.LLVMGetSectionAddress.argtypes = [c_object_p]
     library.LLVMGetSectionAddress.restype = c_uint64
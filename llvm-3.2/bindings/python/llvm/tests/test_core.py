@@ -1,3 +1,5 @@
+import os.path
+
 from .base import TestBase
 from ..core import OpCode
 from ..core import MemoryBuffer
@@ -21,3 +23,10 @@ class TestCore(TestBase):
         with self.assertRaises(Exception):
             MemoryBuffer(filename="/hopefully/this/path/doesnt/exist")
 
+
+    def test_memory_buffer_len(self):
+        source = self.get_test_binary()
+
+        m = MemoryBuffer(filename=source)
+        self.assertEqual(len(m), os.path.getsize(source))
+        self.assertNotEqual(m.address, 0)
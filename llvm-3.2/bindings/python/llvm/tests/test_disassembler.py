@@ -1,5 +1,6 @@
 from .base import TestBase
 
+from .. import disassembler as disassembler_module
 from ..disassembler import Disassembler
 
 class TestDisassembler(TestBase):
@@ -26,3 +27,51 @@ class TestDisassembler(TestBase):
 
         self.assertEqual(instructions[0], (0, 3, '\tjcxz\t-127'))
         self.assertEqual(instructions[1], (3, 2, '\taddl\t%eax, %edi'))
+
+    def test_get_instruction_arrays(self):
+        sequence = '\x67\xe3\x81\x01\xc7' # jcxz -127; addl %eax, %edi
+
+        disassembler = Disassembler('i686-apple-darwin9')
+
+        offsets, lengths, texts = disassembler.get_instruction_arrays(sequence,
+                text=True)
+        self.assertEqual(list(offsets), [0, 3])
+        self.assertEqual(list(lengths), [3, 2])
+        self.assertEqual(texts, ['\tjcxz\t-127', '\taddl\t%eax, %edi'])
+
+        for source in (bytearray(sequence), memoryview(sequence)):
+            offsets, lengths, texts = disassembler.get_instruction_arrays(source)
+            self.assertEqual(list(offsets), [0, 3])
+            self.assertEqual(list(lengths), [3, 2])
+            self.assertIsNone(texts)
+
+        offsets, lengths, texts = disassembler.get_instruction_arrays(sequence,
+                pc=0x1000, offset=3, length=2, text=True)
+        self.assertEqual(list(offsets), [3])
+        self.assertEqual(list(lengths), [2])
+        self.assertEqual(texts, ['\taddl\t%eax, %edi'])
+
+    def test_get_instruction_arrays_windows(self):
+        # more instructions than fit in one window
+        sequence = '\x01\xc7\x90\x67\xe3\x81\x90\x01\xc7'
+
+        disassembler = Disassembler('i686-apple-darwin9')
+        expected = disassembler.get_instruction_arrays(sequence, text=True)
+
+        window = disassembler_module.WINDOW_INSTS
+        disassembler_module.WINDOW_INSTS = 2
+        try:
+            for text in (True, False):
+                offsets, lengths, texts = disassembler.get_instruction_arrays(
+                        sequence, text=text)
+                self.assertEqual(list(offsets), [0, 2, 3, 6, 7])
+                self.assertEqual(list(lengths), [2, 1, 3, 1, 2])
+                if text:
+                    self.assertEqual(texts, expected[2])
+
+            # stops at an invalid instruction in a later window
+            offsets, lengths, texts = disassembler.get_instruction_arrays(
+                    sequence[:7] + '\xff\xff')
+            self.assertEqual(list(offsets), [0, 2, 3, 6])
+        finally:
+            disassembler_module.WINDOW_INSTS = window
@@ -65,3 +65,85 @@ class TestObjectFile(TestBase):
                 assert isinstance(relocation.type_number, long)
                 assert isinstance(relocation.type_name, str)
                 assert isinstance(relocation.value_string, str)
+
+    def test_section_contents_size(self):
+        o = self.get_object_file()
+
+        for section in o.get_sections():
+            if section.name in ('.bss', '.tbss'):
+                continue
+
+            self.assertEqual(len(section.contents), section.size)
+
+    def test_relocation_symbol(self):
+        o = self.get_object_file()
+        for section in o.get_sections():
+            for relocation in section.get_relocations():
+                symbol = relocation.symbol
+                assert isinstance(symbol, Symbol)
+                assert isinstance(symbol.name, str)
+
+                relocation.cache()
+
+    def test_section_table(self):
+        o = self.get_object_file()
+        sections = o.section_table
+
+        self.assertGreater(len(sections), 0)
+        self.assertEqual(list(sections.addresses), sorted(sections.addresses))
+
+        for section in o.get_sections():
+            i = sections.index_of(section)
+            self.assertNotEqual(i, -1)
+
+            entry = sections[i]
+            self.assertEqual(entry.name, section.name)
+            self.assertEqual(entry.address, section.address)
+            self.assertEqual(entry.size, section.size)
+
+            if entry.name in ('.bss', '.tbss') or entry.address == 0:
+                continue
+
+            self.assertEqual(sections.contents(i).tobytes(), section.contents)
+
+            if entry.size > 0:
+                found = sections[sections.find(entry.address)]
+                self.assertLessEqual(found.address, entry.address)
+                self.assertLess(entry.address, found.address + found.size)
+
+    def test_symbol_table(self):
+        o = self.get_object_file()
+        symbols = o.symbol_table
+
+        self.assertGreater(len(symbols), 0)
+        self.assertEqual(list(symbols.addresses), sorted(symbols.addresses))
+
+        for symbol in o.get_symbols():
+            i = symbols.index_of(symbol)
+            self.assertNotEqual(i, -1)
+            self.assertEqual(symbols[i].name, symbol.name)
+            self.assertIn(symbols.lookup(symbol.name), range(len(symbols)))
+
+            if i < symbols.defined:
+                self.assertIn(i, symbols.at(symbol.address))
+
+    def test_relocation_table(self):
+        o = self.get_object_file()
+        relocations = o.relocation_table
+        sections = o.section_table
+
+        count = 0
+        for section in o.get_sections():
+            s = sections.index_of(section)
+            addresses = [r.address for r in section.get_relocations()]
+            count += len(addresses)
+
+            found = [relocations[i].address for i in relocations.in_section(s)]
+            self.assertEqual(found, sorted(addresses))
+
+            for address in addresses:
+                i = relocations.find(s, address)
+                self.assertNotEqual(i, -1)
+                self.assertEqual(relocations[i].section, s)
+
+        self.assertEqual(len(relocations), count)
@@ -173,6 +173,25 @@ size_t LLVMDisasmInstruction(LLVMDisasmContextRef DC, uint8_t *Bytes,
                              uint64_t BytesSize, uint64_t PC,
                              char *OutString, size_t OutStringSize);
 
+/**
+ * Disassemble the instructions in Bytes, from Offset up to BytesSize, using
+ * the disassembler context specified in the parameter DC.  The first byte of
+ * Bytes is at the address specified by the PC parameter.  The offset from
+ * Bytes and the size of each instruction are returned indirectly in Offsets
+ * and Lengths, which hold at least MaxInsts entries.  If OutString is not
+ * NULL, the string of each instruction is returned in it, NUL terminated, one
+ * after the other; instructions are only printed if it is given.
+ * Disassembly stops at the end of Bytes, at the first invalid instruction,
+ * after MaxInsts instructions, or when the next string does not fit in the
+ * OutStringSize bytes of OutString.  This function returns the number of
+ * instructions disassembled.
+ */
+size_t LLVMDisasmInstructions(LLVMDisasmContextRef DC, uint8_t *Bytes,
+                              uint64_t BytesSize, uint64_t PC, uint64_t Offset,
+                              uint32_t *Offsets, uint8_t *Lengths,
+                              size_t MaxInsts, char *OutString,
+                              size_t OutStringSize);
+
 /**
  * @}
  */
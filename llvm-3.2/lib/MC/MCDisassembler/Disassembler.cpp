@@ -185,6 +185,76 @@ size_t LLVMDisasmInstruction(LLVMDisasmContextRef DCR, uint8_t *Bytes,
   llvm_unreachable("Invalid DecodeStatus!");
 }
 
+//
+// LLVMDisasmInstructions() disassembles the instructions in Bytes, from Offset
+// up to BytesSize, with the disassembler context specified in the parameter
+// DC.  Bytes[0] is at the address specified in the parameter PC.  The offset
+// and size of each instruction are stored in Offsets and Lengths.  The
+// instructions are only printed when OutString is not NULL; their strings are
+// stored in it one after the other, each NUL terminated.  Decoding a range in
+// one call saves a call per instruction, and without OutString the
+// instruction printer is not run at all.  This function returns the number of
+// instructions disassembled, which stops short of the end of Bytes at the
+// first invalid instruction, after MaxInsts instructions, or when OutString
+// is full.
+//
+size_t LLVMDisasmInstructions(LLVMDisasmContextRef DCR, uint8_t *Bytes,
+                              uint64_t BytesSize, uint64_t PC, uint64_t Offset,
+                              uint32_t *Offsets, uint8_t *Lengths,
+                              size_t MaxInsts, char *OutString,
+                              size_t OutStringSize) {
+  LLVMDisasmContext *DC = (LLVMDisasmContext *)DCR;
+  // Wrap the whole buffer, so instruction addresses are PC + Offset.
+  DisasmMemoryObject MemoryObject(Bytes, BytesSize, PC);
+
+  const MCDisassembler *DisAsm = DC->getDisAsm();
+  MCInstPrinter *IP = DC->getIP();
+  size_t Count = 0;
+  size_t OutUsed = 0;
+
+  while (Count < MaxInsts && Offset < BytesSize) {
+    uint64_t Size;
+    MCInst Inst;
+    MCDisassembler::DecodeStatus S;
+    S = DisAsm->getInstruction(Inst, Size, MemoryObject, PC + Offset,
+                               /*REMOVE*/ nulls(), DC->CommentStream);
+    // FIXME: Do something different for soft failure modes?
+    if (S != MCDisassembler::Success)
+      break;
+
+    DC->CommentStream.flush();
+    if (OutString) {
+      StringRef Comments = DC->CommentsToEmit.str();
+
+      SmallVector<char, 64> InsnStr;
+      raw_svector_ostream OS(InsnStr);
+      IP->printInst(&Inst, OS, Comments);
+      OS.flush();
+
+      if (OutUsed + InsnStr.size() + 1 > OutStringSize) {
+        DC->CommentsToEmit.clear();
+        DC->CommentStream.resync();
+        break;
+      }
+
+      std::memcpy(OutString + OutUsed, InsnStr.data(), InsnStr.size());
+      OutUsed += InsnStr.size();
+      OutString[OutUsed++] = '\0'; // Terminate string.
+    }
+
+    // Tell the comment stream that the vector changed underneath it.
+    DC->CommentsToEmit.clear();
+    DC->CommentStream.resync();
+
+    Offsets[Count] = Offset;
+    Lengths[Count] = Size;
+    Offset += Size;
+    ++Count;
+  }
+
+  return Count;
+}
+
 //
 // LLVMSetDisasmOptions() sets the disassembler's options.  It returns 1 if it
 // can set all the Options and 0 otherwise.
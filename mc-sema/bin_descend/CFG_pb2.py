@@ -13,7 +13,7 @@ from google.protobuf import descriptor_pb2
 DESCRIPTOR = _descriptor.FileDescriptor(
   name='CFG.proto',
   package='',
-  serialized_pb='\n\tCFG.proto\"5\n\x07JumpTbl\x12\x15\n\rtable_entries\x18\x01 \x03(\x03\x12\x13\n\x0bzero_offset\x18\x02 \x02(\x05\":\n\x0cJumpIndexTbl\x12\x15\n\rtable_entries\x18\x01 \x02(\x0c\x12\x13\n\x0bzero_offset\x18\x02 \x02(\x05\"\xa6\x02\n\x0bInstruction\x12\x12\n\ninst_bytes\x18\x01 \x02(\x0c\x12\x11\n\tinst_addr\x18\x02 \x02(\x03\x12\x13\n\x0btrue_target\x18\x03 \x01(\x03\x12\x14\n\x0c\x66\x61lse_target\x18\x04 \x01(\x03\x12\x10\n\x08inst_len\x18\x05 \x02(\x05\x12\x13\n\x0b\x64\x61ta_offset\x18\x06 \x01(\x03\x12\x15\n\rext_call_name\x18\x07 \x01(\t\x12\x13\n\x0b\x63\x61ll_target\x18\x08 \x01(\x03\x12\x14\n\x0creloc_offset\x18\t \x01(\x05\x12\x1c\n\njump_table\x18\n \x01(\x0b\x32\x08.JumpTbl\x12\'\n\x10jump_index_table\x18\x0b \x01(\x0b\x32\r.JumpIndexTbl\x12\x15\n\rext_data_name\x18\x0c \x01(\t\"Q\n\x05\x42lock\x12\x1b\n\x05insts\x18\x01 \x03(\x0b\x32\x0c.Instruction\x12\x14\n\x0c\x62\x61se_address\x18\x02 \x02(\x03\x12\x15\n\rblock_follows\x18\x03 \x03(\x03\"9\n\x08\x46unction\x12\x16\n\x06\x62locks\x18\x01 \x03(\x0b\x32\x06.Block\x12\x15\n\rentry_address\x18\x02 \x02(\x03\"\xf0\x01\n\x10\x45xternalFunction\x12\x13\n\x0bsymbol_name\x18\x01 \x02(\t\x12?\n\x12\x63\x61lling_convention\x18\x02 \x02(\x0e\x32#.ExternalFunction.CallingConvention\x12\x12\n\nhas_return\x18\x03 \x02(\x08\x12\x11\n\tno_return\x18\x04 \x02(\x08\x12\x16\n\x0e\x61rgument_count\x18\x05 \x02(\x05\"G\n\x11\x43\x61llingConvention\x12\x11\n\rCallerCleanup\x10\x00\x12\x11\n\rCalleeCleanup\x10\x01\x12\x0c\n\x08\x46\x61stCall\x10\x02\"6\n\x0c\x45xternalData\x12\x13\n\x0bsymbol_name\x18\x01 \x02(\t\x12\x11\n\tdata_size\x18\x02 \x02(\x05\"7\n\nDataSymbol\x12\x14\n\x0c\x62\x61se_address\x18\x01 \x02(\x03\x12\x13\n\x0bsymbol_name\x18\x02 \x02(\t\"[\n\x04\x44\x61ta\x12\x14\n\x0c\x62\x61se_address\x18\x01 \x02(\x03\x12\x0c\n\x04\x64\x61ta\x18\x02 \x02(\x0c\x12\x1c\n\x07symbols\x18\x03 \x03(\x0b\x32\x0b.DataSymbol\x12\x11\n\tread_only\x18\x04 \x02(\x08\"u\n\x10\x45ntrySymbolExtra\x12\x12\n\nentry_argc\x18\x01 \x02(\x05\x12\x38\n\x0b\x65ntry_cconv\x18\x02 \x02(\x0e\x32#.ExternalFunction.CallingConvention\x12\x13\n\x0b\x64oes_return\x18\x03 \x02(\x08\"`\n\x0b\x45ntrySymbol\x12\x12\n\nentry_name\x18\x01 \x02(\t\x12\x15\n\rentry_address\x18\x02 \x02(\x03\x12&\n\x0b\x65ntry_extra\x18\x03 \x01(\x0b\x32\x11.EntrySymbolExtra\"\xce\x01\n\x06Module\x12!\n\x0einternal_funcs\x18\x01 \x03(\x0b\x32\t.Function\x12)\n\x0e\x65xternal_funcs\x18\x02 \x03(\x0b\x32\x11.ExternalFunction\x12\x1c\n\rinternal_data\x18\x03 \x03(\x0b\x32\x05.Data\x12\x13\n\x0bmodule_name\x18\x04 \x02(\t\x12\x1d\n\x07\x65ntries\x18\x05 \x03(\x0b\x32\x0c.EntrySymbol\x12$\n\rexternal_data\x18\x06 \x03(\x0b\x32\r.ExternalData')
+  serialized_pb='\n\tCFG.proto\"O\n\x07JumpTbl\x12\x15\n\rtable_entries\x18\x01 \x03(\x03\x12\x13\n\x0bzero_offset\x18\x02 \x02(\x05\x12\x18\n\x0c\x65ntry_deltas\x18\x03 \x03(\x12\x42\x02\x10\x01\":\n\x0cJumpIndexTbl\x12\x15\n\rtable_entries\x18\x01 \x02(\x0c\x12\x13\n\x0bzero_offset\x18\x02 \x02(\x05\"\xe3\x02\n\x0bInstruction\x12\x12\n\ninst_bytes\x18\x01 \x01(\x0c\x12\x11\n\tinst_addr\x18\x02 \x01(\x03\x12\x13\n\x0btrue_target\x18\x03 \x01(\x03\x12\x14\n\x0c\x66\x61lse_target\x18\x04 \x01(\x03\x12\x10\n\x08inst_len\x18\x05 \x01(\x05\x12\x13\n\x0b\x64\x61ta_offset\x18\x06 \x01(\x03\x12\x15\n\rext_call_name\x18\x07 \x01(\t\x12\x13\n\x0b\x63\x61ll_target\x18\x08 \x01(\x03\x12\x14\n\x0creloc_offset\x18\t \x01(\x05\x12\x1c\n\njump_table\x18\n \x01(\x0b\x32\x08.JumpTbl\x12\'\n\x10jump_index_table\x18\x0b \x01(\x0b\x32\r.JumpIndexTbl\x12\x15\n\rext_data_name\x18\x0c \x01(\t\x12\x12\n\ntrue_delta\x18\r \x01(\x12\x12\x13\n\x0b\x66\x61lse_delta\x18\x0e \x01(\x12\x12\x12\n\ncall_delta\x18\x0f \x01(\x12\"\x97\x01\n\x05\x42lock\x12\x1b\n\x05insts\x18\x01 \x03(\x0b\x32\x0c.Instruction\x12\x14\n\x0c\x62\x61se_address\x18\x02 \x02(\x03\x12\x15\n\rblock_follows\x18\x03 \x03(\x03\x12\x13\n\x0b\x63ode_offset\x18\x04 \x01(\x05\x12\x14\n\x0cinst_lengths\x18\x05 \x01(\x0c\x12\x19\n\rfollow_deltas\x18\x06 \x03(\x12\x42\x02\x10\x01\"M\n\x08\x46unction\x12\x16\n\x06\x62locks\x18\x01 \x03(\x0b\x32\x06.Block\x12\x15\n\rentry_address\x18\x02 \x02(\x03\x12\x12\n\ncode_image\x18\x03 \x01(\x0c\"\xf0\x01\n\x10\x45xternalFunction\x12\x13\n\x0bsymbol_name\x18\x01 \x02(\t\x12?\n\x12\x63\x61lling_convention\x18\x02 \x02(\x0e\x32#.ExternalFunction.CallingConvention\x12\x12\n\nhas_return\x18\x03 \x02(\x08\x12\x11\n\tno_return\x18\x04 \x02(\x08\x12\x16\n\x0e\x61rgument_count\x18\x05 \x02(\x05\"G\n\x11\x43\x61llingConvention\x12\x11\n\rCallerCleanup\x10\x00\x12\x11\n\rCalleeCleanup\x10\x01\x12\x0c\n\x08\x46\x61stCall\x10\x02\"6\n\x0c\x45xternalData\x12\x13\n\x0bsymbol_name\x18\x01 \x02(\t\x12\x11\n\tdata_size\x18\x02 \x02(\x05\"7\n\nDataSymbol\x12\x14\n\x0c\x62\x61se_address\x18\x01 \x02(\x03\x12\x13\n\x0bsymbol_name\x18\x02 \x02(\t\"[\n\x04\x44\x61ta\x12\x14\n\x0c\x62\x61se_address\x18\x01 \x02(\x03\x12\x0c\n\x04\x64\x61ta\x18\x02 \x02(\x0c\x12\x1c\n\x07symbols\x18\x03 \x03(\x0b\x32\x0b.DataSymbol\x12\x11\n\tread_only\x18\x04 \x02(\x08\"u\n\x10\x45ntrySymbolExtra\x12\x12\n\nentry_argc\x18\x01 \x02(\x05\x12\x38\n\x0b\x65ntry_cconv\x18\x02 \x02(\x0e\x32#.ExternalFunction.CallingConvention\x12\x13\n\x0b\x64oes_return\x18\x03 \x02(\x08\"`\n\x0b\x45ntrySymbol\x12\x12\n\nentry_name\x18\x01 \x02(\t\x12\x15\n\rentry_address\x18\x02 \x02(\x03\x12&\n\x0b\x65ntry_extra\x18\x03 \x01(\x0b\x32\x11.EntrySymbolExtra\"\xe3\x01\n\x06Module\x12!\n\x0einternal_funcs\x18\x01 \x03(\x0b\x32\t.Function\x12)\n\x0e\x65xternal_funcs\x18\x02 \x03(\x0b\x32\x11.ExternalFunction\x12\x1c\n\rinternal_data\x18\x03 \x03(\x0b\x32\x05.Data\x12\x13\n\x0bmodule_name\x18\x04 \x02(\t\x12\x1d\n\x07\x65ntries\x18\x05 \x03(\x0b\x32\x0c.EntrySymbol\x12$\n\rexternal_data\x18\x06 \x03(\x0b\x32\r.ExternalData\x12\x13\n\x0b\x63\x66g_version\x18\x07 \x01(\x05\"l\n\x07\x45\x64ge_64\x12\r\n\x05value\x18\x01 \x02(\x03\x12\x1b\n\x04kind\x18\x02 \x02(\x0e\x32\r.Edge_64.Kind\x12\r\n\x05label\x18\x03 \x01(\x08\"&\n\x04Kind\x12\x0b\n\x07Unknown\x10\x00\x12\x07\n\x03May\x10\x01\x12\x08\n\x04Must\x10\x02\"l\n\x07\x45\x64ge_32\x12\r\n\x05value\x18\x01 \x02(\x05\x12\x1b\n\x04kind\x18\x02 \x02(\x0e\x32\r.Edge_32.Kind\x12\r\n\x05label\x18\x03 \x01(\x08\"&\n\x04Kind\x12\x0b\n\x07Unknown\x10\x00\x12\x07\n\x03May\x10\x01\x12\x08\n\x04Must\x10\x02\"\x85\x04\n\x1c\x41nnotated_Branch_Instruction\x12?\n\x11\x62ranch_instr_name\x18\x01 \x02(\x0e\x32$.Annotated_Branch_Instruction.Branch\x12\x13\n\x0bis_resolved\x18\x02 \x02(\x08\x12\x13\n\x0bis_indirect\x18\x03 \x02(\x08\x12\x16\n\x0eis_conditional\x18\x04 \x02(\x08\x12\x0f\n\x07is_leaf\x18\x05 \x02(\x08\x12\x1b\n\ttarget_to\x18\x06 \x03(\x0b\x32\x08.Edge_64\x12%\n\x05instr\x18\x07 \x02(\x0b\x32\x16.Annotated_Instruction\x12\x1b\n\x13\x61\x62stract_expression\x18\x08 \x01(\t\"\xef\x01\n\x06\x42ranch\x12\x0b\n\x07Unknown\x10\x00\x12\x07\n\x03jmp\x10\x01\x12\x08\n\x04ljmp\x10\x02\x12\x06\n\x02jo\x10\x03\x12\x07\n\x03jno\x10\x04\x12\x06\n\x02jb\x10\x05\x12\x07\n\x03jae\x10\x06\x12\x06\n\x02je\x10\x07\x12\x07\n\x03jne\x10\x08\x12\x07\n\x03jbe\x10\t\x12\x06\n\x02ja\x10\n\x12\x06\n\x02js\x10\x0b\x12\x07\n\x03jns\x10\x0c\x12\x06\n\x02jp\x10\r\x12\x07\n\x03jnp\x10\x0e\x12\x06\n\x02jl\x10\x0f\x12\x07\n\x03jge\x10\x10\x12\x07\n\x03jle\x10\x11\x12\x06\n\x02jg\x10\x12\x12\n\n\x06loopne\x10\x13\x12\t\n\x05loope\x10\x14\x12\x08\n\x04loop\x10\x15\x12\t\n\x05jCcxz\x10\x16\x12\x07\n\x03ret\x10\x17\x12\x08\n\x04\x63\x61ll\x10\x18\"\xb8\x03\n\x15\x41nnotated_Instruction\x12\x12\n\ninstr_name\x18\x01 \x02(\t\x12\x14\n\x0cinstr_string\x18\x02 \x02(\t\x12\x11\n\tinst_addr\x18\x03 \x02(\x03\x12\x10\n\x08inst_len\x18\x04 \x02(\x05\x12\x10\n\x08op_count\x18\x05 \x02(\x05\x12\x15\n\rinst_addr_hex\x18\x06 \x01(\t\x12\x1d\n\x15is_branch_instruction\x18\x07 \x02(\x08\x12\x30\n\x08\x61rgument\x18\x08 \x03(\x0b\x32\x1e.Annotated_Instruction.Operand\x12 \n\x0ereferered_from\x18\t \x03(\x0b\x32\x08.Edge_64\x1a\xb3\x01\n\x07Operand\x12\x0b\n\x03pos\x18\x01 \x02(\x05\x12\x39\n\x04type\x18\x02 \x02(\x0e\x32+.Annotated_Instruction.Operand.Operand_Type\x12\r\n\x05value\x18\x03 \x01(\t\"Q\n\x0cOperand_Type\x12\x0b\n\x07Unknown\x10\x00\x12\r\n\tImmediate\x10\x01\x12\x0c\n\x08Register\x10\x02\x12\n\n\x06Memory\x10\x03\x12\x0b\n\x07\x41\x64\x64ress\x10\x04\"\xa9\x03\n\x15\x41nnotated_Register_32\x12-\n\x04name\x18\x01 \x02(\x0e\x32\x1f.Annotated_Register_32.Register\x12\x14\n\x0cused_at_addr\x18\x02 \x02(\x03\x12\x18\n\x10used_at_addr_hex\x18\x03 \x01(\t\x12\x17\n\x05value\x18\x07 \x03(\x0b\x32\x08.Edge_32\x12-\n\x04\x66\x61\x63t\x18\x08 \x02(\x0b\x32\x1f.Annotated_Register_32.Property\x12\x1b\n\x13\x61\x62stract_expression\x18\t \x01(\t\x1a*\n\x08Property\x12\x0f\n\x07Unknown\x18\x01 \x02(\x08\x12\r\n\x05\x41live\x18\x02 \x01(\x08\"\x9f\x01\n\x08Register\x12\x0b\n\x07Unknown\x10\x00\x12\x07\n\x03\x65\x61x\x10\x01\x12\x07\n\x03\x65\x63x\x10\x02\x12\x07\n\x03\x65\x64x\x10\x03\x12\x07\n\x03\x65\x62x\x10\x04\x12\x07\n\x03\x65sp\x10\x05\x12\x07\n\x03\x65\x62p\x10\x06\x12\x07\n\x03\x65si\x10\x07\x12\x07\n\x03\x65\x64i\x10\x08\x12\x07\n\x03\x65ip\x10\t\x12\x0b\n\x07\x66s_base\x10\n\x12\x0b\n\x07gs_base\x10\x0b\x12\x07\n\x03gtd\x10\x0c\x12\x07\n\x03ldt\x10\r\x12\t\n\x05mxcsr\x10\x0e\"\xe4\x03\n\x15\x41nnotated_Register_64\x12-\n\x04name\x18\x01 \x02(\x0e\x32\x1f.Annotated_Register_64.Register\x12\x14\n\x0cused_at_addr\x18\x02 \x02(\x03\x12\x18\n\x10used_at_addr_hex\x18\x03 \x01(\t\x12\x17\n\x05value\x18\x04 \x03(\x0b\x32\x08.Edge_64\x12-\n\x04\x66\x61\x63t\x18\x05 \x02(\x0b\x32\x1f.Annotated_Register_64.Property\x12\x1b\n\x13\x61\x62stract_expression\x18\x06 \x01(\t\x1a*\n\x08Property\x12\x0f\n\x07Unknown\x18\x01 \x02(\x08\x12\r\n\x05\x41live\x18\x02 \x01(\x08\"\xda\x01\n\x08Register\x12\x0b\n\x07Unknown\x10\x00\x12\x07\n\x03rax\x10\n\x12\x07\n\x03rcx\x10\x0b\x12\x07\n\x03rdx\x10\x0c\x12\x07\n\x03rbx\x10\r\x12\x07\n\x03rsp\x10\x0e\x12\x07\n\x03rbp\x10\x0f\x12\x07\n\x03rsi\x10\x10\x12\x07\n\x03rdi\x10\x11\x12\x07\n\x03rip\x10\x12\x12\x06\n\x02r8\x10\x13\x12\x06\n\x02r9\x10\x14\x12\x07\n\x03r10\x10\x15\x12\x07\n\x03r11\x10\x16\x12\x07\n\x03r12\x10\x17\x12\x07\n\x03r13\x10\x18\x12\x07\n\x03r14\x10\x19\x12\x07\n\x03r15\x10\x1a\x12\x0b\n\x07\x66s_base\x10\x1b\x12\x0b\n\x07gs_base\x10\x1c\x12\x07\n\x03gdt\x10\x1d\x12\x07\n\x03ldt\x10\x1e\"\x8d\x02\n\x12\x41nnotated_Function\x12\x0c\n\x04name\x18\x01 \x02(\t\x12\x15\n\rstart_at_addr\x18\x02 \x02(\x03\x12\x19\n\x11start_at_addr_hex\x18\x03 \x01(\t\x12\x13\n\x0b\x65nd_at_addr\x18\x04 \x01(\x03\x12\x17\n\x0f\x65nd_at_addr_hex\x18\x05 \x01(\t\x12&\n\x06prolog\x18\x06 \x03(\x0b\x32\x16.Annotated_Instruction\x12&\n\x06\x65pilog\x18\x07 \x03(\x0b\x32\x16.Annotated_Instruction\x12 \n\x0ereferered_from\x18\x08 \x03(\x0b\x32\x08.Edge_64\x12\x17\n\x05\x63\x61lls\x18\t \x03(\x0b\x32\x08.Edge_64\"\xdc\x01\n\x0b\x44isassembly\x12%\n\x05instr\x18\x01 \x03(\x0b\x32\x16.Annotated_Instruction\x12\x33\n\x0c\x62ranch_instr\x18\x02 \x03(\x0b\x32\x1d.Annotated_Branch_Instruction\x12&\n\x06reg_32\x18\x03 \x03(\x0b\x32\x16.Annotated_Register_32\x12&\n\x06reg_64\x18\x04 \x03(\x0b\x32\x16.Annotated_Register_64\x12!\n\x04\x66unc\x18\x05 \x03(\x0b\x32\x13.Annotated_Function')
 
 
 
@@ -38,29 +38,799 @@ _EXTERNALFUNCTION_CALLINGCONVENTION = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   options=None,
-  serialized_start=737,
-  serialized_end=808,
+  serialized_start=915,
+  serialized_end=986,
 )
 
+_EDGE_64_KIND = _descriptor.EnumDescriptor(
+  name='Kind',
+  full_name='Edge_64.Kind',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='Unknown', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='May', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='Must', index=2, number=2,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=1711,
+  serialized_end=1749,
+)
+
+_EDGE_32_KIND = _descriptor.EnumDescriptor(
+  name='Kind',
+  full_name='Edge_32.Kind',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='Unknown', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='May', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='Must', index=2, number=2,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=1711,
+  serialized_end=1749,
+)
+
+_ANNOTATED_BRANCH_INSTRUCTION_BRANCH = _descriptor.EnumDescriptor(
+  name='Branch',
+  full_name='Annotated_Branch_Instruction.Branch',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='Unknown', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jmp', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ljmp', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jo', index=3, number=3,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jno', index=4, number=4,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jb', index=5, number=5,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jae', index=6, number=6,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='je', index=7, number=7,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jne', index=8, number=8,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jbe', index=9, number=9,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ja', index=10, number=10,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='js', index=11, number=11,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jns', index=12, number=12,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jp', index=13, number=13,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jnp', index=14, number=14,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jl', index=15, number=15,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jge', index=16, number=16,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jle', index=17, number=17,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jg', index=18, number=18,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='loopne', index=19, number=19,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='loope', index=20, number=20,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='loop', index=21, number=21,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='jCcxz', index=22, number=22,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ret', index=23, number=23,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='call', index=24, number=24,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=2140,
+  serialized_end=2379,
+)
+
+_ANNOTATED_INSTRUCTION_OPERAND_OPERAND_TYPE = _descriptor.EnumDescriptor(
+  name='Operand_Type',
+  full_name='Annotated_Instruction.Operand.Operand_Type',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='Unknown', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='Immediate', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='Register', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='Memory', index=3, number=3,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='Address', index=4, number=4,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=2741,
+  serialized_end=2822,
+)
+
+_ANNOTATED_REGISTER_32_REGISTER = _descriptor.EnumDescriptor(
+  name='Register',
+  full_name='Annotated_Register_32.Register',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='Unknown', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='eax', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ecx', index=2, number=2,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='edx', index=3, number=3,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ebx', index=4, number=4,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='esp', index=5, number=5,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ebp', index=6, number=6,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='esi', index=7, number=7,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='edi', index=8, number=8,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='eip', index=9, number=9,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='fs_base', index=10, number=10,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='gs_base', index=11, number=11,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='gtd', index=12, number=12,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ldt', index=13, number=13,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='mxcsr', index=14, number=14,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=3091,
+  serialized_end=3250,
+)
+
+_ANNOTATED_REGISTER_64_REGISTER = _descriptor.EnumDescriptor(
+  name='Register',
+  full_name='Annotated_Register_64.Register',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='Unknown', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='rax', index=1, number=10,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='rcx', index=2, number=11,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='rdx', index=3, number=12,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='rbx', index=4, number=13,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='rsp', index=5, number=14,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='rbp', index=6, number=15,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='rsi', index=7, number=16,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='rdi', index=8, number=17,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='rip', index=9, number=18,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='r8', index=10, number=19,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='r9', index=11, number=20,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='r10', index=12, number=21,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='r11', index=13, number=22,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='r12', index=14, number=23,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='r13', index=15, number=24,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='r14', index=16, number=25,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='r15', index=17, number=26,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='fs_base', index=18, number=27,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='gs_base', index=19, number=28,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='gdt', index=20, number=29,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ldt', index=21, number=30,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=3519,
+  serialized_end=3737,
+)
+
+
+_JUMPTBL = _descriptor.Descriptor(
+  name='JumpTbl',
+  full_name='JumpTbl',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='table_entries', full_name='JumpTbl.table_entries', index=0,
+      number=1, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='zero_offset', full_name='JumpTbl.zero_offset', index=1,
+      number=2, type=5, cpp_type=1, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='entry_deltas', full_name='JumpTbl.entry_deltas', index=2,
+      number=3, type=18, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), '\020\001')),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  extension_ranges=[],
+  serialized_start=13,
+  serialized_end=92,
+)
+
+
+_JUMPINDEXTBL = _descriptor.Descriptor(
+  name='JumpIndexTbl',
+  full_name='JumpIndexTbl',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='table_entries', full_name='JumpIndexTbl.table_entries', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value="",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='zero_offset', full_name='JumpIndexTbl.zero_offset', index=1,
+      number=2, type=5, cpp_type=1, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  extension_ranges=[],
+  serialized_start=94,
+  serialized_end=152,
+)
+
+
+_INSTRUCTION = _descriptor.Descriptor(
+  name='Instruction',
+  full_name='Instruction',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='inst_bytes', full_name='Instruction.inst_bytes', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value="",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='inst_addr', full_name='Instruction.inst_addr', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='true_target', full_name='Instruction.true_target', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='false_target', full_name='Instruction.false_target', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='inst_len', full_name='Instruction.inst_len', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='data_offset', full_name='Instruction.data_offset', index=5,
+      number=6, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='ext_call_name', full_name='Instruction.ext_call_name', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=unicode("", "utf-8"),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='call_target', full_name='Instruction.call_target', index=7,
+      number=8, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='reloc_offset', full_name='Instruction.reloc_offset', index=8,
+      number=9, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='jump_table', full_name='Instruction.jump_table', index=9,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='jump_index_table', full_name='Instruction.jump_index_table', index=10,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='ext_data_name', full_name='Instruction.ext_data_name', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=unicode("", "utf-8"),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='true_delta', full_name='Instruction.true_delta', index=12,
+      number=13, type=18, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='false_delta', full_name='Instruction.false_delta', index=13,
+      number=14, type=18, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='call_delta', full_name='Instruction.call_delta', index=14,
+      number=15, type=18, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  extension_ranges=[],
+  serialized_start=155,
+  serialized_end=510,
+)
+
+
+_BLOCK = _descriptor.Descriptor(
+  name='Block',
+  full_name='Block',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='insts', full_name='Block.insts', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='base_address', full_name='Block.base_address', index=1,
+      number=2, type=3, cpp_type=2, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='block_follows', full_name='Block.block_follows', index=2,
+      number=3, type=3, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='code_offset', full_name='Block.code_offset', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='inst_lengths', full_name='Block.inst_lengths', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value="",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='follow_deltas', full_name='Block.follow_deltas', index=5,
+      number=6, type=18, cpp_type=2, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), '\020\001')),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  extension_ranges=[],
+  serialized_start=513,
+  serialized_end=664,
+)
+
+
+_FUNCTION = _descriptor.Descriptor(
+  name='Function',
+  full_name='Function',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='blocks', full_name='Function.blocks', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='entry_address', full_name='Function.entry_address', index=1,
+      number=2, type=3, cpp_type=2, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='code_image', full_name='Function.code_image', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value="",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  extension_ranges=[],
+  serialized_start=666,
+  serialized_end=743,
+)
+
+
+_EXTERNALFUNCTION = _descriptor.Descriptor(
+  name='ExternalFunction',
+  full_name='ExternalFunction',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='symbol_name', full_name='ExternalFunction.symbol_name', index=0,
+      number=1, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=unicode("", "utf-8"),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='calling_convention', full_name='ExternalFunction.calling_convention', index=1,
+      number=2, type=14, cpp_type=8, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='has_return', full_name='ExternalFunction.has_return', index=2,
+      number=3, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='no_return', full_name='ExternalFunction.no_return', index=3,
+      number=4, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='argument_count', full_name='ExternalFunction.argument_count', index=4,
+      number=5, type=5, cpp_type=1, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _EXTERNALFUNCTION_CALLINGCONVENTION,
+  ],
+  options=None,
+  is_extendable=False,
+  extension_ranges=[],
+  serialized_start=746,
+  serialized_end=986,
+)
+
+
+_EXTERNALDATA = _descriptor.Descriptor(
+  name='ExternalData',
+  full_name='ExternalData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='symbol_name', full_name='ExternalData.symbol_name', index=0,
+      number=1, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=unicode("", "utf-8"),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='data_size', full_name='ExternalData.data_size', index=1,
+      number=2, type=5, cpp_type=1, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  extension_ranges=[],
+  serialized_start=988,
+  serialized_end=1042,
+)
 
-_JUMPTBL = _descriptor.Descriptor(
-  name='JumpTbl',
-  full_name='JumpTbl',
+
+_DATASYMBOL = _descriptor.Descriptor(
+  name='DataSymbol',
+  full_name='DataSymbol',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='table_entries', full_name='JumpTbl.table_entries', index=0,
-      number=1, type=3, cpp_type=2, label=3,
-      has_default_value=False, default_value=[],
+      name='base_address', full_name='DataSymbol.base_address', index=0,
+      number=1, type=3, cpp_type=2, label=2,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='zero_offset', full_name='JumpTbl.zero_offset', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
+      name='symbol_name', full_name='DataSymbol.symbol_name', index=1,
+      number=2, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=unicode("", "utf-8"),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
@@ -73,32 +843,88 @@ _JUMPTBL = _descriptor.Descriptor(
   options=None,
   is_extendable=False,
   extension_ranges=[],
-  serialized_start=13,
-  serialized_end=66,
+  serialized_start=1044,
+  serialized_end=1099,
 )
 
 
-_JUMPINDEXTBL = _descriptor.Descriptor(
-  name='JumpIndexTbl',
-  full_name='JumpIndexTbl',
+_DATA = _descriptor.Descriptor(
+  name='Data',
+  full_name='Data',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='table_entries', full_name='JumpIndexTbl.table_entries', index=0,
-      number=1, type=12, cpp_type=9, label=2,
+      name='base_address', full_name='Data.base_address', index=0,
+      number=1, type=3, cpp_type=2, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='Data.data', index=1,
+      number=2, type=12, cpp_type=9, label=2,
       has_default_value=False, default_value="",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='zero_offset', full_name='JumpIndexTbl.zero_offset', index=1,
-      number=2, type=5, cpp_type=1, label=2,
+      name='symbols', full_name='Data.symbols', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='read_only', full_name='Data.read_only', index=3,
+      number=4, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  extension_ranges=[],
+  serialized_start=1101,
+  serialized_end=1192,
+)
+
+
+_ENTRYSYMBOLEXTRA = _descriptor.Descriptor(
+  name='EntrySymbolExtra',
+  full_name='EntrySymbolExtra',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='entry_argc', full_name='EntrySymbolExtra.entry_argc', index=0,
+      number=1, type=5, cpp_type=1, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='entry_cconv', full_name='EntrySymbolExtra.entry_cconv', index=1,
+      number=2, type=14, cpp_type=8, label=2,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
+    _descriptor.FieldDescriptor(
+      name='does_return', full_name='EntrySymbolExtra.does_return', index=2,
+      number=3, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
   ],
   extensions=[
   ],
@@ -108,99 +934,191 @@ _JUMPINDEXTBL = _descriptor.Descriptor(
   options=None,
   is_extendable=False,
   extension_ranges=[],
-  serialized_start=68,
-  serialized_end=126,
+  serialized_start=1194,
+  serialized_end=1311,
 )
 
 
-_INSTRUCTION = _descriptor.Descriptor(
-  name='Instruction',
-  full_name='Instruction',
+_ENTRYSYMBOL = _descriptor.Descriptor(
+  name='EntrySymbol',
+  full_name='EntrySymbol',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='inst_bytes', full_name='Instruction.inst_bytes', index=0,
-      number=1, type=12, cpp_type=9, label=2,
-      has_default_value=False, default_value="",
+      name='entry_name', full_name='EntrySymbol.entry_name', index=0,
+      number=1, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=unicode("", "utf-8"),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='inst_addr', full_name='Instruction.inst_addr', index=1,
+      name='entry_address', full_name='EntrySymbol.entry_address', index=1,
       number=2, type=3, cpp_type=2, label=2,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='true_target', full_name='Instruction.true_target', index=2,
-      number=3, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
+      name='entry_extra', full_name='EntrySymbol.entry_extra', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  extension_ranges=[],
+  serialized_start=1313,
+  serialized_end=1409,
+)
+
+
+_MODULE = _descriptor.Descriptor(
+  name='Module',
+  full_name='Module',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
     _descriptor.FieldDescriptor(
-      name='false_target', full_name='Instruction.false_target', index=3,
-      number=4, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
+      name='internal_funcs', full_name='Module.internal_funcs', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='inst_len', full_name='Instruction.inst_len', index=4,
-      number=5, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
+      name='external_funcs', full_name='Module.external_funcs', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='data_offset', full_name='Instruction.data_offset', index=5,
-      number=6, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
+      name='internal_data', full_name='Module.internal_data', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='ext_call_name', full_name='Instruction.ext_call_name', index=6,
-      number=7, type=9, cpp_type=9, label=1,
+      name='module_name', full_name='Module.module_name', index=3,
+      number=4, type=9, cpp_type=9, label=2,
       has_default_value=False, default_value=unicode("", "utf-8"),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='call_target', full_name='Instruction.call_target', index=7,
-      number=8, type=3, cpp_type=2, label=1,
+      name='entries', full_name='Module.entries', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='external_data', full_name='Module.external_data', index=5,
+      number=6, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='cfg_version', full_name='Module.cfg_version', index=6,
+      number=7, type=5, cpp_type=1, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  extension_ranges=[],
+  serialized_start=1412,
+  serialized_end=1639,
+)
+
+
+_EDGE_64 = _descriptor.Descriptor(
+  name='Edge_64',
+  full_name='Edge_64',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
     _descriptor.FieldDescriptor(
-      name='reloc_offset', full_name='Instruction.reloc_offset', index=8,
-      number=9, type=5, cpp_type=1, label=1,
+      name='value', full_name='Edge_64.value', index=0,
+      number=1, type=3, cpp_type=2, label=2,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='jump_table', full_name='Instruction.jump_table', index=9,
-      number=10, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='kind', full_name='Edge_64.kind', index=1,
+      number=2, type=14, cpp_type=8, label=2,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='jump_index_table', full_name='Instruction.jump_index_table', index=10,
-      number=11, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='label', full_name='Edge_64.label', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _EDGE_64_KIND,
+  ],
+  options=None,
+  is_extendable=False,
+  extension_ranges=[],
+  serialized_start=1641,
+  serialized_end=1749,
+)
+
+
+_EDGE_32 = _descriptor.Descriptor(
+  name='Edge_32',
+  full_name='Edge_32',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
     _descriptor.FieldDescriptor(
-      name='ext_data_name', full_name='Instruction.ext_data_name', index=11,
-      number=12, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=unicode("", "utf-8"),
+      name='value', full_name='Edge_32.value', index=0,
+      number=1, type=5, cpp_type=1, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='kind', full_name='Edge_32.kind', index=1,
+      number=2, type=14, cpp_type=8, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='label', full_name='Edge_32.label', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
@@ -209,40 +1127,76 @@ _INSTRUCTION = _descriptor.Descriptor(
   ],
   nested_types=[],
   enum_types=[
+    _EDGE_32_KIND,
   ],
   options=None,
   is_extendable=False,
   extension_ranges=[],
-  serialized_start=129,
-  serialized_end=423,
+  serialized_start=1751,
+  serialized_end=1859,
 )
 
 
-_BLOCK = _descriptor.Descriptor(
-  name='Block',
-  full_name='Block',
+_ANNOTATED_BRANCH_INSTRUCTION = _descriptor.Descriptor(
+  name='Annotated_Branch_Instruction',
+  full_name='Annotated_Branch_Instruction',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='insts', full_name='Block.insts', index=0,
-      number=1, type=11, cpp_type=10, label=3,
+      name='branch_instr_name', full_name='Annotated_Branch_Instruction.branch_instr_name', index=0,
+      number=1, type=14, cpp_type=8, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='is_resolved', full_name='Annotated_Branch_Instruction.is_resolved', index=1,
+      number=2, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='is_indirect', full_name='Annotated_Branch_Instruction.is_indirect', index=2,
+      number=3, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='is_conditional', full_name='Annotated_Branch_Instruction.is_conditional', index=3,
+      number=4, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='is_leaf', full_name='Annotated_Branch_Instruction.is_leaf', index=4,
+      number=5, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='target_to', full_name='Annotated_Branch_Instruction.target_to', index=5,
+      number=6, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='base_address', full_name='Block.base_address', index=1,
-      number=2, type=3, cpp_type=2, label=2,
-      has_default_value=False, default_value=0,
+      name='instr', full_name='Annotated_Branch_Instruction.instr', index=6,
+      number=7, type=11, cpp_type=10, label=2,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='block_follows', full_name='Block.block_follows', index=2,
-      number=3, type=3, cpp_type=2, label=3,
-      has_default_value=False, default_value=[],
+      name='abstract_expression', full_name='Annotated_Branch_Instruction.abstract_expression', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=unicode("", "utf-8"),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
@@ -251,125 +1205,160 @@ _BLOCK = _descriptor.Descriptor(
   ],
   nested_types=[],
   enum_types=[
+    _ANNOTATED_BRANCH_INSTRUCTION_BRANCH,
   ],
   options=None,
   is_extendable=False,
   extension_ranges=[],
-  serialized_start=425,
-  serialized_end=506,
+  serialized_start=1862,
+  serialized_end=2379,
 )
 
 
-_FUNCTION = _descriptor.Descriptor(
-  name='Function',
-  full_name='Function',
+_ANNOTATED_INSTRUCTION_OPERAND = _descriptor.Descriptor(
+  name='Operand',
+  full_name='Annotated_Instruction.Operand',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='blocks', full_name='Function.blocks', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
+      name='pos', full_name='Annotated_Instruction.Operand.pos', index=0,
+      number=1, type=5, cpp_type=1, label=2,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='entry_address', full_name='Function.entry_address', index=1,
-      number=2, type=3, cpp_type=2, label=2,
+      name='type', full_name='Annotated_Instruction.Operand.type', index=1,
+      number=2, type=14, cpp_type=8, label=2,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='Annotated_Instruction.Operand.value', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=unicode("", "utf-8"),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
+    _ANNOTATED_INSTRUCTION_OPERAND_OPERAND_TYPE,
   ],
   options=None,
   is_extendable=False,
   extension_ranges=[],
-  serialized_start=508,
-  serialized_end=565,
+  serialized_start=2643,
+  serialized_end=2822,
 )
 
-
-_EXTERNALFUNCTION = _descriptor.Descriptor(
-  name='ExternalFunction',
-  full_name='ExternalFunction',
+_ANNOTATED_INSTRUCTION = _descriptor.Descriptor(
+  name='Annotated_Instruction',
+  full_name='Annotated_Instruction',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='symbol_name', full_name='ExternalFunction.symbol_name', index=0,
+      name='instr_name', full_name='Annotated_Instruction.instr_name', index=0,
       number=1, type=9, cpp_type=9, label=2,
       has_default_value=False, default_value=unicode("", "utf-8"),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='calling_convention', full_name='ExternalFunction.calling_convention', index=1,
-      number=2, type=14, cpp_type=8, label=2,
-      has_default_value=False, default_value=0,
+      name='instr_string', full_name='Annotated_Instruction.instr_string', index=1,
+      number=2, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=unicode("", "utf-8"),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='has_return', full_name='ExternalFunction.has_return', index=2,
-      number=3, type=8, cpp_type=7, label=2,
-      has_default_value=False, default_value=False,
+      name='inst_addr', full_name='Annotated_Instruction.inst_addr', index=2,
+      number=3, type=3, cpp_type=2, label=2,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='no_return', full_name='ExternalFunction.no_return', index=3,
-      number=4, type=8, cpp_type=7, label=2,
-      has_default_value=False, default_value=False,
+      name='inst_len', full_name='Annotated_Instruction.inst_len', index=3,
+      number=4, type=5, cpp_type=1, label=2,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='argument_count', full_name='ExternalFunction.argument_count', index=4,
+      name='op_count', full_name='Annotated_Instruction.op_count', index=4,
       number=5, type=5, cpp_type=1, label=2,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
+    _descriptor.FieldDescriptor(
+      name='inst_addr_hex', full_name='Annotated_Instruction.inst_addr_hex', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=unicode("", "utf-8"),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='is_branch_instruction', full_name='Annotated_Instruction.is_branch_instruction', index=6,
+      number=7, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='argument', full_name='Annotated_Instruction.argument', index=7,
+      number=8, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='referered_from', full_name='Annotated_Instruction.referered_from', index=8,
+      number=9, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
   ],
   extensions=[
   ],
-  nested_types=[],
+  nested_types=[_ANNOTATED_INSTRUCTION_OPERAND, ],
   enum_types=[
-    _EXTERNALFUNCTION_CALLINGCONVENTION,
   ],
   options=None,
   is_extendable=False,
   extension_ranges=[],
-  serialized_start=568,
-  serialized_end=808,
+  serialized_start=2382,
+  serialized_end=2822,
 )
 
 
-_EXTERNALDATA = _descriptor.Descriptor(
-  name='ExternalData',
-  full_name='ExternalData',
+_ANNOTATED_REGISTER_32_PROPERTY = _descriptor.Descriptor(
+  name='Property',
+  full_name='Annotated_Register_32.Property',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='symbol_name', full_name='ExternalData.symbol_name', index=0,
-      number=1, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=unicode("", "utf-8"),
+      name='Unknown', full_name='Annotated_Register_32.Property.Unknown', index=0,
+      number=1, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='data_size', full_name='ExternalData.data_size', index=1,
-      number=2, type=5, cpp_type=1, label=2,
-      has_default_value=False, default_value=0,
+      name='Alive', full_name='Annotated_Register_32.Property.Alive', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
@@ -382,28 +1371,55 @@ _EXTERNALDATA = _descriptor.Descriptor(
   options=None,
   is_extendable=False,
   extension_ranges=[],
-  serialized_start=810,
-  serialized_end=864,
+  serialized_start=3046,
+  serialized_end=3088,
 )
 
-
-_DATASYMBOL = _descriptor.Descriptor(
-  name='DataSymbol',
-  full_name='DataSymbol',
+_ANNOTATED_REGISTER_32 = _descriptor.Descriptor(
+  name='Annotated_Register_32',
+  full_name='Annotated_Register_32',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='base_address', full_name='DataSymbol.base_address', index=0,
-      number=1, type=3, cpp_type=2, label=2,
+      name='name', full_name='Annotated_Register_32.name', index=0,
+      number=1, type=14, cpp_type=8, label=2,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='symbol_name', full_name='DataSymbol.symbol_name', index=1,
-      number=2, type=9, cpp_type=9, label=2,
+      name='used_at_addr', full_name='Annotated_Register_32.used_at_addr', index=1,
+      number=2, type=3, cpp_type=2, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='used_at_addr_hex', full_name='Annotated_Register_32.used_at_addr_hex', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=unicode("", "utf-8"),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='Annotated_Register_32.value', index=3,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='fact', full_name='Annotated_Register_32.fact', index=4,
+      number=8, type=11, cpp_type=10, label=2,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='abstract_expression', full_name='Annotated_Register_32.abstract_expression', index=5,
+      number=9, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=unicode("", "utf-8"),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
@@ -411,48 +1427,35 @@ _DATASYMBOL = _descriptor.Descriptor(
   ],
   extensions=[
   ],
-  nested_types=[],
+  nested_types=[_ANNOTATED_REGISTER_32_PROPERTY, ],
   enum_types=[
+    _ANNOTATED_REGISTER_32_REGISTER,
   ],
   options=None,
   is_extendable=False,
   extension_ranges=[],
-  serialized_start=866,
-  serialized_end=921,
+  serialized_start=2825,
+  serialized_end=3250,
 )
 
 
-_DATA = _descriptor.Descriptor(
-  name='Data',
-  full_name='Data',
+_ANNOTATED_REGISTER_64_PROPERTY = _descriptor.Descriptor(
+  name='Property',
+  full_name='Annotated_Register_64.Property',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='base_address', full_name='Data.base_address', index=0,
-      number=1, type=3, cpp_type=2, label=2,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='data', full_name='Data.data', index=1,
-      number=2, type=12, cpp_type=9, label=2,
-      has_default_value=False, default_value="",
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='symbols', full_name='Data.symbols', index=2,
-      number=3, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
+      name='Unknown', full_name='Annotated_Register_64.Property.Unknown', index=0,
+      number=1, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='read_only', full_name='Data.read_only', index=3,
-      number=4, type=8, cpp_type=7, label=2,
+      name='Alive', full_name='Annotated_Register_64.Property.Alive', index=1,
+      number=2, type=8, cpp_type=7, label=1,
       has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
@@ -466,78 +1469,141 @@ _DATA = _descriptor.Descriptor(
   options=None,
   is_extendable=False,
   extension_ranges=[],
-  serialized_start=923,
-  serialized_end=1014,
+  serialized_start=3046,
+  serialized_end=3088,
 )
 
-
-_ENTRYSYMBOLEXTRA = _descriptor.Descriptor(
-  name='EntrySymbolExtra',
-  full_name='EntrySymbolExtra',
+_ANNOTATED_REGISTER_64 = _descriptor.Descriptor(
+  name='Annotated_Register_64',
+  full_name='Annotated_Register_64',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='entry_argc', full_name='EntrySymbolExtra.entry_argc', index=0,
-      number=1, type=5, cpp_type=1, label=2,
+      name='name', full_name='Annotated_Register_64.name', index=0,
+      number=1, type=14, cpp_type=8, label=2,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='entry_cconv', full_name='EntrySymbolExtra.entry_cconv', index=1,
-      number=2, type=14, cpp_type=8, label=2,
+      name='used_at_addr', full_name='Annotated_Register_64.used_at_addr', index=1,
+      number=2, type=3, cpp_type=2, label=2,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='does_return', full_name='EntrySymbolExtra.does_return', index=2,
-      number=3, type=8, cpp_type=7, label=2,
-      has_default_value=False, default_value=False,
+      name='used_at_addr_hex', full_name='Annotated_Register_64.used_at_addr_hex', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=unicode("", "utf-8"),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='Annotated_Register_64.value', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='fact', full_name='Annotated_Register_64.fact', index=4,
+      number=5, type=11, cpp_type=10, label=2,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='abstract_expression', full_name='Annotated_Register_64.abstract_expression', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=unicode("", "utf-8"),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
   ],
   extensions=[
   ],
-  nested_types=[],
+  nested_types=[_ANNOTATED_REGISTER_64_PROPERTY, ],
   enum_types=[
+    _ANNOTATED_REGISTER_64_REGISTER,
   ],
   options=None,
   is_extendable=False,
   extension_ranges=[],
-  serialized_start=1016,
-  serialized_end=1133,
+  serialized_start=3253,
+  serialized_end=3737,
 )
 
 
-_ENTRYSYMBOL = _descriptor.Descriptor(
-  name='EntrySymbol',
-  full_name='EntrySymbol',
+_ANNOTATED_FUNCTION = _descriptor.Descriptor(
+  name='Annotated_Function',
+  full_name='Annotated_Function',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='entry_name', full_name='EntrySymbol.entry_name', index=0,
+      name='name', full_name='Annotated_Function.name', index=0,
       number=1, type=9, cpp_type=9, label=2,
       has_default_value=False, default_value=unicode("", "utf-8"),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='entry_address', full_name='EntrySymbol.entry_address', index=1,
+      name='start_at_addr', full_name='Annotated_Function.start_at_addr', index=1,
       number=2, type=3, cpp_type=2, label=2,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='entry_extra', full_name='EntrySymbol.entry_extra', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
+      name='start_at_addr_hex', full_name='Annotated_Function.start_at_addr_hex', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=unicode("", "utf-8"),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='end_at_addr', full_name='Annotated_Function.end_at_addr', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='end_at_addr_hex', full_name='Annotated_Function.end_at_addr_hex', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=unicode("", "utf-8"),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='prolog', full_name='Annotated_Function.prolog', index=5,
+      number=6, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='epilog', full_name='Annotated_Function.epilog', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='referered_from', full_name='Annotated_Function.referered_from', index=7,
+      number=8, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='calls', full_name='Annotated_Function.calls', index=8,
+      number=9, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
@@ -550,56 +1616,49 @@ _ENTRYSYMBOL = _descriptor.Descriptor(
   options=None,
   is_extendable=False,
   extension_ranges=[],
-  serialized_start=1135,
-  serialized_end=1231,
+  serialized_start=3740,
+  serialized_end=4009,
 )
 
 
-_MODULE = _descriptor.Descriptor(
-  name='Module',
-  full_name='Module',
+_DISASSEMBLY = _descriptor.Descriptor(
+  name='Disassembly',
+  full_name='Disassembly',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='internal_funcs', full_name='Module.internal_funcs', index=0,
+      name='instr', full_name='Disassembly.instr', index=0,
       number=1, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='external_funcs', full_name='Module.external_funcs', index=1,
+      name='branch_instr', full_name='Disassembly.branch_instr', index=1,
       number=2, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='internal_data', full_name='Module.internal_data', index=2,
+      name='reg_32', full_name='Disassembly.reg_32', index=2,
       number=3, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='module_name', full_name='Module.module_name', index=3,
-      number=4, type=9, cpp_type=9, label=2,
-      has_default_value=False, default_value=unicode("", "utf-8"),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='entries', full_name='Module.entries', index=4,
-      number=5, type=11, cpp_type=10, label=3,
+      name='reg_64', full_name='Disassembly.reg_64', index=3,
+      number=4, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None),
     _descriptor.FieldDescriptor(
-      name='external_data', full_name='Module.external_data', index=5,
-      number=6, type=11, cpp_type=10, label=3,
+      name='func', full_name='Disassembly.func', index=4,
+      number=5, type=11, cpp_type=10, label=3,
       has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
@@ -613,8 +1672,8 @@ _MODULE = _descriptor.Descriptor(
   options=None,
   is_extendable=False,
   extension_ranges=[],
-  serialized_start=1234,
-  serialized_end=1440,
+  serialized_start=4012,
+  serialized_end=4232,
 )
 
 _INSTRUCTION.fields_by_name['jump_table'].message_type = _JUMPTBL
@@ -631,6 +1690,38 @@ _MODULE.fields_by_name['external_funcs'].message_type = _EXTERNALFUNCTION
 _MODULE.fields_by_name['internal_data'].message_type = _DATA
 _MODULE.fields_by_name['entries'].message_type = _ENTRYSYMBOL
 _MODULE.fields_by_name['external_data'].message_type = _EXTERNALDATA
+_EDGE_64.fields_by_name['kind'].enum_type = _EDGE_64_KIND
+_EDGE_64_KIND.containing_type = _EDGE_64;
+_EDGE_32.fields_by_name['kind'].enum_type = _EDGE_32_KIND
+_EDGE_32_KIND.containing_type = _EDGE_32;
+_ANNOTATED_BRANCH_INSTRUCTION.fields_by_name['branch_instr_name'].enum_type = _ANNOTATED_BRANCH_INSTRUCTION_BRANCH
+_ANNOTATED_BRANCH_INSTRUCTION.fields_by_name['target_to'].message_type = _EDGE_64
+_ANNOTATED_BRANCH_INSTRUCTION.fields_by_name['instr'].message_type = _ANNOTATED_INSTRUCTION
+_ANNOTATED_BRANCH_INSTRUCTION_BRANCH.containing_type = _ANNOTATED_BRANCH_INSTRUCTION;
+_ANNOTATED_INSTRUCTION_OPERAND.fields_by_name['type'].enum_type = _ANNOTATED_INSTRUCTION_OPERAND_OPERAND_TYPE
+_ANNOTATED_INSTRUCTION_OPERAND.containing_type = _ANNOTATED_INSTRUCTION;
+_ANNOTATED_INSTRUCTION_OPERAND_OPERAND_TYPE.containing_type = _ANNOTATED_INSTRUCTION_OPERAND;
+_ANNOTATED_INSTRUCTION.fields_by_name['argument'].message_type = _ANNOTATED_INSTRUCTION_OPERAND
+_ANNOTATED_INSTRUCTION.fields_by_name['referered_from'].message_type = _EDGE_64
+_ANNOTATED_REGISTER_32_PROPERTY.containing_type = _ANNOTATED_REGISTER_32;
+_ANNOTATED_REGISTER_32.fields_by_name['name'].enum_type = _ANNOTATED_REGISTER_32_REGISTER
+_ANNOTATED_REGISTER_32.fields_by_name['value'].message_type = _EDGE_32
+_ANNOTATED_REGISTER_32.fields_by_name['fact'].message_type = _ANNOTATED_REGISTER_32_PROPERTY
+_ANNOTATED_REGISTER_32_REGISTER.containing_type = _ANNOTATED_REGISTER_32;
+_ANNOTATED_REGISTER_64_PROPERTY.containing_type = _ANNOTATED_REGISTER_64;
+_ANNOTATED_REGISTER_64.fields_by_name['name'].enum_type = _ANNOTATED_REGISTER_64_REGISTER
+_ANNOTATED_REGISTER_64.fields_by_name['value'].message_type = _EDGE_64
+_ANNOTATED_REGISTER_64.fields_by_name['fact'].message_type = _ANNOTATED_REGISTER_64_PROPERTY
+_ANNOTATED_REGISTER_64_REGISTER.containing_type = _ANNOTATED_REGISTER_64;
+_ANNOTATED_FUNCTION.fields_by_name['prolog'].message_type = _ANNOTATED_INSTRUCTION
+_ANNOTATED_FUNCTION.fields_by_name['epilog'].message_type = _ANNOTATED_INSTRUCTION
+_ANNOTATED_FUNCTION.fields_by_name['referered_from'].message_type = _EDGE_64
+_ANNOTATED_FUNCTION.fields_by_name['calls'].message_type = _EDGE_64
+_DISASSEMBLY.fields_by_name['instr'].message_type = _ANNOTATED_INSTRUCTION
+_DISASSEMBLY.fields_by_name['branch_instr'].message_type = _ANNOTATED_BRANCH_INSTRUCTION
+_DISASSEMBLY.fields_by_name['reg_32'].message_type = _ANNOTATED_REGISTER_32
+_DISASSEMBLY.fields_by_name['reg_64'].message_type = _ANNOTATED_REGISTER_64
+_DISASSEMBLY.fields_by_name['func'].message_type = _ANNOTATED_FUNCTION
 DESCRIPTOR.message_types_by_name['JumpTbl'] = _JUMPTBL
 DESCRIPTOR.message_types_by_name['JumpIndexTbl'] = _JUMPINDEXTBL
 DESCRIPTOR.message_types_by_name['Instruction'] = _INSTRUCTION
@@ -643,6 +1734,14 @@ DESCRIPTOR.message_types_by_name['Data'] = _DATA
 DESCRIPTOR.message_types_by_name['EntrySymbolExtra'] = _ENTRYSYMBOLEXTRA
 DESCRIPTOR.message_types_by_name['EntrySymbol'] = _ENTRYSYMBOL
 DESCRIPTOR.message_types_by_name['Module'] = _MODULE
+DESCRIPTOR.message_types_by_name['Edge_64'] = _EDGE_64
+DESCRIPTOR.message_types_by_name['Edge_32'] = _EDGE_32
+DESCRIPTOR.message_types_by_name['Annotated_Branch_Instruction'] = _ANNOTATED_BRANCH_INSTRUCTION
+DESCRIPTOR.message_types_by_name['Annotated_Instruction'] = _ANNOTATED_INSTRUCTION
+DESCRIPTOR.message_types_by_name['Annotated_Register_32'] = _ANNOTATED_REGISTER_32
+DESCRIPTOR.message_types_by_name['Annotated_Register_64'] = _ANNOTATED_REGISTER_64
+DESCRIPTOR.message_types_by_name['Annotated_Function'] = _ANNOTATED_FUNCTION
+DESCRIPTOR.message_types_by_name['Disassembly'] = _DISASSEMBLY
 
 class JumpTbl(_message.Message):
   __metaclass__ = _reflection.GeneratedProtocolMessageType
@@ -716,5 +1815,75 @@ class Module(_message.Message):
 
   # @@protoc_insertion_point(class_scope:Module)
 
+class Edge_64(_message.Message):
+  __metaclass__ = _reflection.GeneratedProtocolMessageType
+  DESCRIPTOR = _EDGE_64
+
+  # @@protoc_insertion_point(class_scope:Edge_64)
+
+class Edge_32(_message.Message):
+  __metaclass__ = _reflection.GeneratedProtocolMessageType
+  DESCRIPTOR = _EDGE_32
+
+  # @@protoc_insertion_point(class_scope:Edge_32)
+
+class Annotated_Branch_Instruction(_message.Message):
+  __metaclass__ = _reflection.GeneratedProtocolMessageType
+  DESCRIPTOR = _ANNOTATED_BRANCH_INSTRUCTION
+
+  # @@protoc_insertion_point(class_scope:Annotated_Branch_Instruction)
+
+class Annotated_Instruction(_message.Message):
+  __metaclass__ = _reflection.GeneratedProtocolMessageType
+
+  class Operand(_message.Message):
+    __metaclass__ = _reflection.GeneratedProtocolMessageType
+    DESCRIPTOR = _ANNOTATED_INSTRUCTION_OPERAND
+
+    # @@protoc_insertion_point(class_scope:Annotated_Instruction.Operand)
+  DESCRIPTOR = _ANNOTATED_INSTRUCTION
+
+  # @@protoc_insertion_point(class_scope:Annotated_Instruction)
+
+class Annotated_Register_32(_message.Message):
+  __metaclass__ = _reflection.GeneratedProtocolMessageType
+
+  class Property(_message.Message):
+    __metaclass__ = _reflection.GeneratedProtocolMessageType
+    DESCRIPTOR = _ANNOTATED_REGISTER_32_PROPERTY
+
+    # @@protoc_insertion_point(class_scope:Annotated_Register_32.Property)
+  DESCRIPTOR = _ANNOTATED_REGISTER_32
+
+  # @@protoc_insertion_point(class_scope:Annotated_Register_32)
+
+class Annotated_Register_64(_message.Message):
+  __metaclass__ = _reflection.GeneratedProtocolMessageType
+
+  class Property(_message.Message):
+    __metaclass__ = _reflection.GeneratedProtocolMessageType
+    DESCRIPTOR = _ANNOTATED_REGISTER_64_PROPERTY
+
+    # @@protoc_insertion_point(class_scope:Annotated_Register_64.Property)
+  DESCRIPTOR = _ANNOTATED_REGISTER_64
+
+  # @@protoc_insertion_point(class_scope:Annotated_Register_64)
+
+class Annotated_Function(_message.Message):
+  __metaclass__ = _reflection.GeneratedProtocolMessageType
+  DESCRIPTOR = _ANNOTATED_FUNCTION
+
+  # @@protoc_insertion_point(class_scope:Annotated_Function)
+
+class Disassembly(_message.Message):
+  __metaclass__ = _reflection.GeneratedProtocolMessageType
+  DESCRIPTOR = _DISASSEMBLY
+
+  # @@protoc_insertion_point(class_scope:Disassembly)
+
 
+_JUMPTBL.fields_by_name['entry_deltas'].has_options = True
+_JUMPTBL.fields_by_name['entry_deltas']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), '\020\001')
+_BLOCK.fields_by_name['follow_deltas'].has_options = True
+_BLOCK.fields_by_name['follow_deltas']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), '\020\001')
 # @@protoc_insertion_point(module_scope)
@@ -35,10 +35,198 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 #include <boost/tokenizer.hpp>
 #include <boost/foreach.hpp>
+#include <boost/cstdint.hpp>
+#include <boost/filesystem.hpp>
+#include <boost/interprocess/file_mapping.hpp>
+#include <boost/interprocess/mapped_region.hpp>
 
 #include <algorithm>
+#include <cstring>
 
 using namespace std;
+using boost::uint32_t;
+using boost::uint64_t;
+
+/* layout of an index written by std_defs_index.py, all fields little endian:
+ *
+ * header (64 bytes):
+ *   0  magic               8 bytes
+ *   8  version             uint32
+ *  12  record count        uint32
+ *  16  records offset      uint32
+ *  20  strtab offset       uint32
+ *  24  source size         uint64
+ *  32  source mtime        uint64
+ *  40  source SHA-1        20 bytes
+ *
+ * record (16 bytes, sorted by name, then kind):
+ *   0  name offset         uint32, into strtab
+ *   4  name length         uint16
+ *   6  kind                uint8, function or data
+ *   7  calling convention  uint8, same order as CallingConvention
+ *   8  noreturn            uint8
+ *  12  argc or data size   int32
+ */
+static const char       DEFS_MAGIC[] = {'M', 'C', 'S', 'D', 'E', 'F', 'S', '\0'};
+static const uint32_t   DEFS_VERSION = 2;
+static const size_t     DEFS_HEADER_SIZE = 64;
+static const size_t     DEFS_RECORD_SIZE = 16;
+
+enum DefsKind {
+  DefsFunction = 0,
+  DefsData = 1
+};
+
+template <class T>
+static T readField(const char *p)
+{
+    T   v;
+    memcpy(&v, p, sizeof(v));
+    return v;
+}
+
+/* reads the header of fileName, returns false if it is not an index */
+static bool readDefsHeader(const string &fileName, char *hdr)
+{
+    ifstream  inFile(fileName.c_str(), ios::in | ios::binary);
+    if(inFile.good() == false) return false;
+
+    inFile.read(hdr, DEFS_HEADER_SIZE);
+    if(inFile.gcount() != (streamsize)DEFS_HEADER_SIZE) return false;
+
+    return memcmp(hdr, DEFS_MAGIC, sizeof(DEFS_MAGIC)) == 0 &&
+        readField<uint32_t>(hdr+8) == DEFS_VERSION;
+}
+
+/* an index built by std_defs_index.py next to its source is used
+ * if the source still has the size and mtime it was built from
+ */
+static bool defsIndexIsCurrent(const string &fileName, const string &idxName)
+{
+    char  hdr[DEFS_HEADER_SIZE];
+
+    if(readDefsHeader(idxName, hdr) == false) return false;
+
+    try {
+        uint64_t  size = boost::filesystem::file_size(fileName);
+        uint64_t  mtime = boost::filesystem::last_write_time(fileName);
+
+        return readField<uint64_t>(hdr+24) == size &&
+            readField<uint64_t>(hdr+32) == mtime;
+    } catch (boost::filesystem::filesystem_error &) {
+        return false;
+    }
+}
+
+class ExternalFunctionMap::DefsIndex
+{
+  boost::interprocess::file_mapping   file;
+  boost::interprocess::mapped_region  region;
+  const char                          *base;
+  uint32_t                            count;
+  uint32_t                            records_off;
+  uint32_t                            strtab_off;
+  size_t                              strtab_size;
+
+  const char *record(uint32_t i) const {
+      return this->base + this->records_off + i*DEFS_RECORD_SIZE;
+  }
+
+  int compare(const string &name, uint32_t i) const {
+      const char  *r = this->record(i);
+      return name.compare(0, name.size(),
+              this->base + this->strtab_off + readField<uint32_t>(r),
+              readField<boost::uint16_t>(r+4));
+  }
+
+public:
+  DefsIndex(const string &fileName) :
+      file(fileName.c_str(), boost::interprocess::read_only),
+      region(file, boost::interprocess::read_only)
+  {
+      size_t  size = this->region.get_size();
+      this->base = static_cast<const char *>(this->region.get_address());
+
+      if(size < DEFS_HEADER_SIZE ||
+         memcmp(this->base, DEFS_MAGIC, sizeof(DEFS_MAGIC)) != 0 ||
+         readField<uint32_t>(this->base+8) != DEFS_VERSION)
+      {
+          throw LErr(__LINE__, __FILE__, "Not a std_defs index: "+fileName);
+      }
+
+      this->count = readField<uint32_t>(this->base+12);
+      this->records_off = readField<uint32_t>(this->base+16);
+      this->strtab_off = readField<uint32_t>(this->base+20);
+
+      if(this->strtab_off > size ||
+         this->records_off + (uint64_t)this->count*DEFS_RECORD_SIZE > this->strtab_off)
+      {
+          throw LErr(__LINE__, __FILE__, "Truncated std_defs index: "+fileName);
+      }
+
+      this->strtab_size = size - this->strtab_off;
+      for(uint32_t i = 0; i < this->count; i++) {
+          const char  *r = this->record(i);
+          if(readField<uint32_t>(r) + (uint64_t)readField<boost::uint16_t>(r+4) > this->strtab_size) {
+              throw LErr(__LINE__, __FILE__, "Corrupt std_defs index: "+fileName);
+          }
+      }
+  }
+
+  uint32_t size(void) const { return this->count; }
+
+  string name(uint32_t i) const {
+      const char  *r = this->record(i);
+      return string(this->base + this->strtab_off + readField<uint32_t>(r),
+              readField<boost::uint16_t>(r+4));
+  }
+
+  bool isData(uint32_t i) const {
+      return this->record(i)[6] == DefsData;
+  }
+
+  CallingConvention conv(uint32_t i) const {
+      return (CallingConvention)this->record(i)[7];
+  }
+
+  bool noReturn(uint32_t i) const {
+      return this->record(i)[8] != 0;
+  }
+
+  int value(uint32_t i) const {
+      return readField<boost::int32_t>(this->record(i)+12);
+  }
+
+  /* a name defined both as a function and as data has a record of
+   * each kind. external_map keeps one element per name, so the first
+   * record, the function, is the one returned
+   */
+  bool find(const string &name, ValueElement &elt) const {
+      uint32_t  lo = 0;
+      uint32_t  hi = this->count;
+
+      while(lo < hi) {
+          uint32_t  mid = lo + (hi-lo)/2;
+
+          if(this->compare(name, mid) > 0) {
+              lo = mid+1;
+          } else {
+              hi = mid;
+          }
+      }
+
+      if(lo == this->count || this->compare(name, lo) != 0) {
+          return false;
+      }
+
+      if(this->isData(lo)) {
+          elt = ValueElement(name, this->value(lo));
+      } else {
+          elt = ValueElement(this->noReturn(lo), this->value(lo), this->conv(lo), "");
+      }
+      return true;
+  }
+};
 
 string ExternalFunctionMap::mangleELFSymbol(string inSym, CallingConvention &conv, int &rNumParams)
 {
@@ -100,11 +288,10 @@ string ExternalFunctionMap::sym_sym(string inSym)
   /* hey, maybe we have the pre-transformed symbol from the sym map
    * and we can avoid touching it
    */
-  map<string, ValueElement>::iterator it = this->external_map.find(outSym);
-  if(it != this->external_map.end())
-  {
-      ValueElement  elt = (*it).second;
+  ValueElement  elt;
 
+  if(this->lookup(outSym, elt))
+  {
       if(elt.realName.size() != 0)
       {
           outSym = elt.realName;
@@ -128,8 +315,7 @@ string ExternalFunctionMap::sym_sym(string inSym)
 
 
   /* do we already have a record for this symbol? if we don't, we should add */
-  it = this->external_map.find(outSym);
-  if(it == this->external_map.end())
+  if(this->lookup(outSym, elt) == false)
   {
     ExternalFunctionMap::ValueElement vk(false, rNumParams, conv, "");
     this->external_map.insert(
@@ -137,8 +323,6 @@ string ExternalFunctionMap::sym_sym(string inSym)
   }
   else
   {
-    ValueElement  elt = (*it).second;
-
     if(elt.realName.size() != 0)
     {
       outSym = elt.realName;
@@ -148,7 +332,105 @@ string ExternalFunctionMap::sym_sym(string inSym)
   return outSym;
 }
 
+bool ExternalFunctionMap::lookup(const string &name, ValueElement &elt)
+{
+  map<string,ValueElement>::iterator  it = this->external_map.find(name);
+  if(it != this->external_map.end())
+  {
+    elt = it->second;
+    return true;
+  }
+
+  for(unsigned i = 0; i < this->indexes.size(); i++)
+  {
+    if(this->indexes[i]->find(name, elt))
+    {
+      return true;
+    }
+  }
+
+  return false;
+}
+
+void ExternalFunctionMap::addElement(const string &name, const ValueElement &elt)
+{
+  /* symbols are never redefined by a later map, and indexes are only
+   * searched after external_map, so do not shadow what they know
+   */
+  ValueElement  old;
+  for(unsigned i = 0; i < this->indexes.size(); i++)
+  {
+    if(this->indexes[i]->find(name, old))
+    {
+      return;
+    }
+  }
+
+  this->external_map.insert(
+    pair<string, ExternalFunctionMap::ValueElement>(name, elt));
+}
+
+void ExternalFunctionMap::addOrdinal(string funcName, int argCount, CallingConvention conv, bool nret)
+{
+  /* split around the ':' character */
+  int atPos = funcName.find(':');
+
+  LASSERT(atPos >= 0, "Malformed line in file");
+
+  string realName = funcName.substr(atPos+1, funcName.size());
+
+  // ensure dll name is capitalized for correct matching
+  // as DLLs are case insensitive on windows
+  funcName = funcName.substr(1, atPos-1);
+  std::transform(funcName.begin(), funcName.end(), funcName.begin(), ::toupper);
+
+  this->addElement(funcName, ValueElement(nret, argCount, conv, realName));
+  this->addElement(realName, ValueElement(nret, argCount, conv, ""));
+}
+
+void ExternalFunctionMap::parseIndex(string fileName)
+{
+  boost::shared_ptr<DefsIndex>  index(new DefsIndex(fileName));
+
+  /* ordinal imports are looked up by DLL and ordinal, which the index
+   * does not sort by. '!' sorts before any other symbol character, so
+   * they are all at the start.
+   */
+  vector<uint32_t>  ordinals;
+  for(uint32_t i = 0; i < index->size(); i++)
+  {
+    string  name = index->name(i);
+    if(name.size() == 0 || name[0] != '!') break;
+    if(name.find("!ORDINAL_") == 0 && !index->isData(i)) ordinals.push_back(i);
+  }
+
+  BOOST_FOREACH(uint32_t i, ordinals)
+  {
+    this->addOrdinal(index->name(i), index->value(i), index->conv(i), index->noReturn(i));
+  }
+
+  this->indexes.push_back(index);
+}
+
 void ExternalFunctionMap::parseMap(string fileName)
+{
+  char  hdr[DEFS_HEADER_SIZE];
+
+  if(readDefsHeader(fileName, hdr))
+  {
+    this->parseIndex(fileName);
+  }
+  else if(defsIndexIsCurrent(fileName, fileName+".idx"))
+  {
+    this->parseIndex(fileName+".idx");
+  }
+  else
+  {
+    this->parseText(fileName);
+  }
+}
+
+void ExternalFunctionMap::parseText(string fileName)
 {
   /* open and read in the file given by fileName
    */
@@ -178,7 +460,6 @@ void ExternalFunctionMap::parseMap(string fileName)
     if(vtok.size() >= 3 && vtok[0][0] != '#')
     {
       string            funcName;
-      string            realName;
       int               argCount;
       bool              nret = false;
 
@@ -191,8 +472,7 @@ void ExternalFunctionMap::parseMap(string fileName)
           istringstream(vtok[2]) >> dataSize;
 
           ExternalFunctionMap::ValueElement dataVK(dataName, dataSize);
-          this->external_map.insert(
-                  pair<string, ExternalFunctionMap::ValueElement>(dataName, dataVK));
+          this->addElement(dataName, dataVK);
           continue;
 
       }
@@ -200,23 +480,6 @@ void ExternalFunctionMap::parseMap(string fileName)
       /* read function name */
       funcName = vtok[0];
 
-      /* we might need to split funcName if it contains "!ORDINAL" */
-      size_t ordpos = funcName.find("!ORDINAL_");
-      if(ordpos != string::npos)
-      {
-        /* split around the ':' character */
-        int atPos = funcName.find(':');
-
-        LASSERT(atPos >= 0, "Malformed line in file");
-
-        realName = funcName.substr(atPos+1, funcName.size());
-
-        // ensure dll name is capitalized for correct matching
-        // as DLLs are case insensitive on windows
-        funcName = funcName.substr(1, atPos-1);
-        std::transform(funcName.begin(), funcName.end(), funcName.begin(), ::toupper);
-      }
-
       /* read argument count */
       istringstream(vtok[1]) >> argCount;
       if(argCount < 0) {
@@ -248,16 +511,16 @@ void ExternalFunctionMap::parseMap(string fileName)
           nret = true;
       }
 
-      /* populate map data */
-      ExternalFunctionMap::ValueElement vk(nret, argCount, conv, realName);
-      this->external_map.insert(
-        pair<string, ExternalFunctionMap::ValueElement>(funcName, vk));
-      if(realName.size() != 0)
+      /* we might need to split funcName if it contains "!ORDINAL" */
+      if(funcName.find("!ORDINAL_") != string::npos)
       {
-        ExternalFunctionMap::ValueElement vk2(nret, argCount, conv, "");
-        this->external_map.insert(
-          pair<string, ExternalFunctionMap::ValueElement>(realName, vk2));
+        this->addOrdinal(funcName, argCount, conv, nret);
+        continue;
       }
+
+      /* populate map data */
+      ExternalFunctionMap::ValueElement vk(nret, argCount, conv, "");
+      this->addElement(funcName, vk);
     }
   }
 
@@ -281,11 +544,11 @@ ExternalFunctionMap::ExternalFunctionMap(void) : triple(DEFAULT_TRIPLE)
 bool
 ExternalFunctionMap::get_calling_convention(string funcName, CallingConvention &c)
 {
-  map<string,ValueElement>::iterator  it = this->external_map.find(funcName);
+  ValueElement  elt;
 
-  if(it != this->external_map.end() && !it->second.is_data)
+  if(this->lookup(funcName, elt) && !elt.is_data)
   {
-    c = (*it).second.conv;
+    c = elt.conv;
     return true;
   }
 
@@ -295,10 +558,10 @@ ExternalFunctionMap::get_calling_convention(string funcName, CallingConvention &
 bool
 ExternalFunctionMap::get_noreturn(string funcName, bool &r)
 {
-  map<string,ValueElement>::iterator  it = this->external_map.find(funcName);
+  ValueElement  elt;
 
-  if(it != this->external_map.end() && !it->second.is_data) {
-    r = (*it).second.isNoReturn;
+  if(this->lookup(funcName, elt) && !elt.is_data) {
+    r = elt.isNoReturn;
     return true;
   }
 
@@ -308,10 +571,10 @@ ExternalFunctionMap::get_noreturn(string funcName, bool &r)
 bool
 ExternalFunctionMap::get_num_stack_params(string  funcName, int &r)
 {
-  map<string,ValueElement>::iterator  it = this->external_map.find(funcName);
+  ValueElement  elt;
 
-  if(it != this->external_map.end() && !it->second.is_data) {
-    r = (*it).second.numParams;
+  if(this->lookup(funcName, elt) && !elt.is_data) {
+    r = elt.numParams;
     return true;
   }
 
@@ -321,9 +584,9 @@ ExternalFunctionMap::get_num_stack_params(string  funcName, int &r)
 bool
 ExternalFunctionMap::is_data(const std::string &dn)
 {
-  map<string,ValueElement>::iterator  it = this->external_map.find(dn);
+  ValueElement  elt;
 
-  if(it != this->external_map.end() && it->second.is_data) {
+  if(this->lookup(dn, elt) && elt.is_data) {
     return true;
   }
 
@@ -333,10 +596,10 @@ ExternalFunctionMap::is_data(const std::string &dn)
 bool
 ExternalFunctionMap::get_data_size(const std::string &dn, int &sz)
 {
-    map<string,ValueElement>::iterator  it = this->external_map.find(dn);
+    ValueElement  elt;
 
-    if(it != this->external_map.end() && it->second.is_data) {
-        sz = it->second.data_size;
+    if(this->lookup(dn, elt) && elt.is_data) {
+        sz = elt.data_size;
         return true;
     }
 
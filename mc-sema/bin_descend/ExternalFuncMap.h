@@ -30,7 +30,9 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #define _EXTERNAL_FUNC_MAP_H
 #include <string>
 #include <map>
+#include <vector>
 #include <LExcn.h>
+#include <boost/shared_ptr.hpp>
 
 /* This class represents external functions as known by the overall system.
  * By default, it takes a file with a specific format and constructs a table
@@ -65,6 +67,19 @@ private:
   };
 
   std::map<std::string,ValueElement>  external_map;  
+
+  /* compiled std_defs indexes (see std_defs_index.py), searched in place
+   * through a memory mapping. Maps are consulted in the order they were
+   * loaded, and the first one that knows a symbol wins.
+   */
+  class DefsIndex;
+  std::vector<boost::shared_ptr<DefsIndex> > indexes;
+
+  bool lookup(const std::string &, ValueElement &);
+  void addElement(const std::string &, const ValueElement &);
+  void addOrdinal(std::string, int, CallingConvention, bool);
+  void parseIndex(std::string filename);
+  void parseText(std::string filename);
 protected:
   std::string triple;
   std::string manglePESymbol(std::string inSym, CallingConvention &conv, int &rNumParams);
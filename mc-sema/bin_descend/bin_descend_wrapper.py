@@ -2,8 +2,10 @@
 
 import sys
 import subprocess
-from os.path import join, dirname, splitext
+from os.path import join, dirname, splitext, basename
 import os
+import shutil
+import tempfile
 
 
 ida_env = os.getenv("IDA_PATH")
@@ -31,6 +33,21 @@ ARGS_TO_SKIP = ('-mc-x86-disable-arith-relaxation',
 
 UNSUPPORTED_ARGS = ('-e=',)
 
+# part of the IDB cache key: get_cfg.py --batch turns off the
+# "automatically make offset" heuristic before auto-analysis
+ANALYSIS_FLAGS = "batch:-AF_IMMOFF"
+
+IDB_CACHE_DIR = os.getenv("MCSEMA_IDB_CACHE")
+
+# in megabytes
+IDB_CACHE_SIZE = int(os.getenv("MCSEMA_IDB_CACHE_SIZE") or 10240)
+
+# written into a -profile directory, next to one profile per input
+PROFILE_SUMMARY = "summary.json"
+
+# the merge step and the IDB cache run in this interpreter, not inside IDA
+sys.path.insert(0, dirname(GET_CFG_PY))
+
 
 def decommafy(arg):
     (argname, argval) = arg.split('=')
@@ -50,6 +67,127 @@ def do_func_map(arg):
     return_args.extend(decommafy(arg))
     return return_args
 
+def ida_command(script_args, input_file):
+    internal_args = [GET_CFG_PY]
+    internal_args.extend(script_args)
+
+    argstr = " ".join(internal_args)
+
+    return [IDA_EXE, "-B", "-S"+argstr, input_file]
+
+def run_ida(script_args, input_file):
+    external_args = ida_command(script_args, input_file)
+    sys.stdout.write("Executing: {0}\n".format(str(external_args)))
+    return subprocess.call(external_args)
+
+def analyze(input_file, idb):
+    if run_ida(['--batch', '--save-database', idb], input_file) != 0 \
+            or not os.path.exists(idb):
+        sys.stderr.write("Auto-analysis of {0} failed\n".format(input_file))
+        return False
+    return True
+
+def prepare_database(input_file, workdir, cache):
+    # returns an analyzed database of input_file inside workdir, taken
+    # from the cache when possible, or None if analysis failed
+    base_idb = join(workdir, "base.idb")
+    if cache is None:
+        if analyze(input_file, base_idb):
+            return base_idb
+        return None
+
+    key = cache.key(input_file, IDA_EXE, ANALYSIS_FLAGS)
+    if cache.fetch(key, base_idb):
+        sys.stdout.write("IDB cache hit for {0}: {1}\n".format(input_file, cache.path(key)))
+    else:
+        sys.stdout.write("IDB cache miss for {0}\n".format(input_file))
+        if not analyze(input_file, base_idb):
+            return None
+        cache.insert(key, base_idb)
+
+    return base_idb
+
+def run_cached(script_args, input_file, output_file, cache):
+    workdir = tempfile.mkdtemp(prefix="mcsema_idb_",
+                               dir=dirname(os.path.abspath(output_file)))
+    try:
+        base_idb = prepare_database(input_file, workdir, cache)
+        if base_idb is None:
+            return -3
+
+        script_args = list(script_args)
+        script_args.extend(['--output', output_file])
+        return run_ida(script_args, base_idb)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+def shard_profile(workdir, k):
+    return join(workdir, "shard{0}.json".format(k))
+
+def summarize_profiles(profile_dir):
+    # aggregate every profile in a corpus directory into summary.json
+    import cfg_profile
+
+    summary = join(profile_dir, PROFILE_SUMMARY)
+    names = [join(profile_dir, name) for name in sorted(os.listdir(profile_dir))
+             if name.endswith(".json") and name != PROFILE_SUMMARY]
+
+    prof = cfg_profile.aggregate([cfg_profile.readProfile(name) for name in names])
+    cfg_profile.writeProfile(prof, summary)
+
+    sys.stdout.write("Corpus profile: {0}\n".format(summary))
+    cfg_profile.report(prof, sys.stdout)
+
+def run_sharded(script_args, input_file, output_file, jobs, cache, profile_file=None):
+    # analyze once, then lift a partition of the entry symbols in each
+    # of `jobs' IDA instances working on their own copy of the database
+    import cfg_merge
+
+    workdir = tempfile.mkdtemp(prefix="mcsema_shards_",
+                               dir=dirname(os.path.abspath(output_file)))
+    try:
+        base_idb = prepare_database(input_file, workdir, cache)
+        if base_idb is None:
+            return -3
+
+        shards = []
+        for k in xrange(jobs):
+            shard_idb = join(workdir, "shard{0}.idb".format(k))
+            shard_cfg = join(workdir, "shard{0}.cfg".format(k))
+            shutil.copyfile(base_idb, shard_idb)
+
+            shard_args = list(script_args)
+            shard_args.extend(['--shard', "{0}/{1}".format(k, jobs),
+                               '--output', shard_cfg])
+            if profile_file:
+                shard_args.extend(['--profile', shard_profile(workdir, k)])
+
+            external_args = ida_command(shard_args, shard_idb)
+            sys.stdout.write("Executing: {0}\n".format(str(external_args)))
+            shards.append( (subprocess.Popen(external_args), shard_cfg) )
+
+        failed = False
+        for (proc, shard_cfg) in shards:
+            if proc.wait() != 0 or not os.path.exists(shard_cfg):
+                sys.stderr.write("Shard failed: {0}\n".format(shard_cfg))
+                failed = True
+
+        if failed:
+            return -4
+
+        M = cfg_merge.mergeFiles([shard_cfg for (proc, shard_cfg) in shards], output_file)
+        sys.stdout.write("Merged {0} functions from {1} shards into {2}\n".format(
+            len(M.internal_funcs), jobs, output_file))
+
+        if profile_file:
+            import cfg_profile
+            profiles = [cfg_profile.readProfile(shard_profile(workdir, k)) for k in xrange(jobs)]
+            cfg_profile.writeProfile(cfg_profile.aggregate(profiles), profile_file)
+
+        return 0
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
 
 if __name__ == "__main__":
 
@@ -63,6 +201,10 @@ if __name__ == "__main__":
                   }
 
     input_file = None
+    jobs = 1
+    idb_cache_dir = IDB_CACHE_DIR
+    idb_cache_size = IDB_CACHE_SIZE
+    profile = None
 
     for arg in sys.argv[1:]:
         # skip args which are not applicable to IDAPython
@@ -81,6 +223,20 @@ if __name__ == "__main__":
         if arg.startswith('-i='):
             dummy, input_file = arg.split('=')
 
+        if arg.startswith('-jobs='):
+            dummy, jobs = arg.split('=')
+            jobs = int(jobs)
+
+        if arg.startswith('-idb-cache='):
+            dummy, idb_cache_dir = arg.split('=')
+
+        if arg.startswith('-idb-cache-size='):
+            dummy, idb_cache_size = arg.split('=')
+            idb_cache_size = int(idb_cache_size)
+
+        if arg.startswith('-profile='):
+            dummy, profile = arg.split('=')
+
         # process other args
         for k,v in argproc_map.iteritems():
             if k(arg):
@@ -95,14 +251,31 @@ if __name__ == "__main__":
     in_fname, in_ext = splitext(input_file)
     output_file = in_fname + ".cfg"
 
-    new_args.extend(['--output', output_file])
+    # a directory collects one profile per input and a corpus summary
+    profile_file = profile
+    if profile and os.path.isdir(profile):
+        profile_file = join(profile, basename(input_file) + ".json")
 
-    internal_args = [GET_CFG_PY]
-    internal_args.extend(new_args)
+    if profile_file and jobs == 1:
+        new_args.extend(['--profile', profile_file])
 
-    argstr = " ".join(internal_args)
+    cache = None
+    if idb_cache_dir:
+        from idb_cache import IdbCache
+        cache = IdbCache(idb_cache_dir, idb_cache_size * 1024 * 1024)
 
-    external_args = [IDA_EXE, "-B", "-S"+argstr, input_file]
+    if jobs > 1:
+        rv = run_sharded(new_args, input_file, output_file, jobs, cache, profile_file)
+    elif cache:
+        rv = run_cached(new_args, input_file, output_file, cache)
+    else:
+        new_args.extend(['--output', output_file])
+        rv = run_ida(new_args, input_file)
 
-    sys.stdout.write("Executing: {0}\n".format(str(external_args)))
-    subprocess.call(external_args)
+    if cache:
+        cache.report(sys.stdout)
+
+    if profile and os.path.isdir(profile) and rv == 0:
+        summarize_profiles(profile)
+
+    sys.exit(rv)
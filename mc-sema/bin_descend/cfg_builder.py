@@ -0,0 +1,860 @@
+##
+## CFG recovery: block discovery, jump tables, external references and
+## data segment handling, over a Program.
+##
+## This is the one implementation of the recovery walk. get_cfg.py runs
+## it inside IDA over an IdaProgram that asks the database; cfg_facts.py
+## and llvm_cfg.py run it in plain Python processes over facts collected
+## up front, so any number of them can work side by side.
+##
+## A Program provides
+##
+##   segments   Segment list in address order; code, data, bss, and
+##              extern segments holding one slot per imported name
+##   names      {ea: name}, for entry symbols and externals
+##   symbols    {name: ea}, for entry symbols
+##   fixups     a cfg_common.FixupTable of relocated addresses, their
+##              fixup type, and the address each one refers to
+##   decode(ea) an Insn, or None if there is no instruction at ea
+##
+## and may refine isCode, itemSize, entryType, symbol, heads and
+## forwardedExport where it knows more than the segment layout tells.
+##
+
+import sys
+import heapq
+import bisect
+import struct
+import CFG_pb2
+import cfg_stream
+import cfg_profile
+from cfg_common import DEBUG, DataSegmentIndex, MovedDataIndex, FixupTable, Block, \
+    Worklist, SHARD_DATA_STRIDE, compactFunction, setModuleVersion, convertFunction, \
+    BlockCache, BLOCK_CACHE_SIZE, addExternals, \
+    INSN_CALL, INSN_RET, INSN_COND_JMP, INSN_UCOND_JMP, INSN_TRAP, INSN_HLT
+
+SEG_CODE = 'code'
+SEG_DATA = 'data'
+SEG_BSS = 'bss'
+SEG_EXTERN = 'extern'
+# loaded, but neither code nor data; only the items referenced from code
+# are copied into the CFG
+SEG_OTHER = 'other'
+
+# fixup types, as in IDA
+FIXUP_OFF32 = 4
+FIXUP_REL32 = 5
+
+class Segment:
+    def __init__(self, name, start, end, kind, writable, contents=None, executable=None):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.kind = kind
+        self.writable = writable
+        # a str, bytearray or memoryview; None for bss and extern segments
+        self.contents = contents
+        # data referenced in executable segments is moved out of them
+        if executable is None:
+            executable = kind == SEG_CODE
+        self.executable = executable
+
+    def read(self, start, end):
+        if self.contents is None:
+            return "\x00" * (end-start)
+        data = memoryview(self.contents)[start-self.start:end-self.start].tobytes()
+        # virtual size may be bigger than the initialized contents
+        return data + "\x00" * (end-start-len(data))
+
+class Insn:
+    def __init__(self, ea, size, kind, inst_bytes, crefs=(), drefs=(),
+            jump_table=None, lock=False, flow=None):
+        self.ea = ea
+        self.size = size
+        self.kind = kind
+        self.inst_bytes = inst_bytes
+        # code references other than falling through to the next
+        # instruction, and data references, as IDA reports them
+        self.crefs = list(crefs)
+        self.drefs = list(drefs)
+        # start of the table of 4 byte targets of a switch jump
+        self.jump_table = jump_table
+        self.lock = lock
+        # whether execution falls through to the next instruction, where
+        # the disassembler said so; otherwise implied by the kind
+        self.flow = flow
+
+    def flows(self):
+        if self.flow is not None:
+            return self.flow
+        return self.kind not in (INSN_RET, INSN_UCOND_JMP, INSN_TRAP, INSN_HLT)
+
+    def follows(self):
+        # same as idautils.CodeRefsFrom(ea, 1)
+        if self.flows():
+            return [self.ea+self.size] + [c for c in self.crefs if c != self.ea+self.size]
+        return list(self.crefs)
+
+class JumpTableRefs:
+    def __init__(self):
+        self.zero_offset = 0
+        self.table_entries = []
+
+class InsnRefs:
+    # stands in for a CFG_pb2.Instruction while functions are discovered:
+    # instructionHandler fills it in as it would the real one, and it is
+    # dropped
+    def __init__(self):
+        self.jump_table = JumpTableRefs()
+
+def dealFunctions(functions, count):
+    # split (ea, size) pairs into count lists of EAs of about the same
+    # total size, largest functions first
+    shards = [[] for k in xrange(count)]
+    loads = [(0, k) for k in xrange(count)]
+    for (ea, size) in sorted(functions, key=lambda (ea, size): (-size, ea)):
+        (load, k) = heapq.heappop(loads)
+        shards[k].append(ea)
+        heapq.heappush(loads, (load+size, k))
+
+    return [sorted(eas) for eas in shards]
+
+class Program:
+    def __init__(self, name):
+        self.module_name = name
+        self.segments = []
+        self.starts = []
+        self.names = {}
+        self.symbols = {}
+        self.fixups = FixupTable()
+        self.linked_elf = False
+
+    def addSegment(self, seg):
+        i = bisect.bisect_right(self.starts, seg.start)
+        self.starts.insert(i, seg.start)
+        self.segments.insert(i, seg)
+
+    def segment(self, ea):
+        # the segment containing ea, or None
+        i = bisect.bisect_right(self.starts, ea) - 1
+        if i >= 0 and ea < self.segments[i].end:
+            return self.segments[i]
+        return None
+
+    def read(self, start, end):
+        seg = self.segment(start)
+        if seg is None:
+            return "\x00" * (end-start)
+        return seg.read(start, end)
+
+    def byte(self, ea):
+        return ord(self.read(ea, ea+1))
+
+    def itemSize(self, ea):
+        # programs without data item boundaries move dwords
+        return 4
+
+    def name(self, ea):
+        return self.names.get(ea, "")
+
+    def symbol(self, name):
+        # address of an entry symbol, or None
+        return self.symbols.get(name)
+
+    def forwardedExport(self, name, ea):
+        # the name an export forwards to, or None if it is defined here
+        return None
+
+    def relocationTarget(self, ea):
+        # where the fixup at ea points to. An OFF32 fixup holds its
+        # target in place
+        rtype = self.fixups.type(ea)
+        if rtype == FIXUP_OFF32:
+            return struct.unpack("<L", self.read(ea, ea+4))[0]
+        elif rtype == -1:
+            raise Exception("No relocation type at ea: {0:x}".format(ea))
+        else:
+            return self.fixups.target(ea)
+
+    def isCode(self, ea):
+        seg = self.segment(ea)
+        return seg is not None and seg.kind == SEG_CODE
+
+    def entryType(self, name, ea):
+        # (argc, convention, noreturn) of an entry point not in std_defs,
+        # or None if unknown
+        return None
+
+    def decode(self, ea):
+        raise NotImplementedError()
+
+    def heads(self, start, end):
+        # the instructions of a block, in order
+        ea = start
+        while ea < end:
+            yield ea
+            insn = self.decode(ea)
+            if insn is None:
+                break
+            ea += insn.size
+
+class CfgBuilder:
+    def __init__(self, program, names, profile=None, code_image=False, cfg_version=1,
+                 exports_are_apis=False):
+        self.program = program
+        self.names = names
+        self.exports_are_apis = exports_are_apis
+        if profile is None:
+            profile = cfg_profile.NullProfiler()
+        self.profile = profile
+        self.code_image = code_image
+        self.cfg_version = cfg_version
+        self.externals = set()
+        self.recovered_eas = set()
+        self.data_segments = DataSegmentIndex()
+        self.moved_data = MovedDataIndex()
+        self.block_cache = BlockCache(BLOCK_CACHE_SIZE)
+
+    def state(self):
+        # what recovery has learned so far, for a checkpoint
+        return {
+            'recovered_eas': list(self.recovered_eas),
+            'externals': list(self.externals),
+            'data_segments': (list(self.data_segments.starts),
+                              list(self.data_segments.ends),
+                              self.data_segments.max_end),
+            'moved_data': self.moved_data.items(),
+            }
+
+    def restore(self, state):
+        self.recovered_eas.update(state['recovered_eas'])
+        self.externals.update(state['externals'])
+        (starts, ends, max_end) = state['data_segments']
+        for (start, end) in zip(starts, ends):
+            self.data_segments.add(start, end)
+        self.data_segments.max_end = max_end
+        for (start, end, offset) in state.get('moved_data', []):
+            self.moved_data.add(start, end, offset)
+
+    def isInternalCode(self, ea):
+        return self.program.isCode(ea)
+
+    def isExternalReference(self, ea):
+        # see if this is in an internal or external code ref
+        DEBUG("Testing {0:x} for externality\n".format(ea))
+        seg = self.program.segment(ea)
+        if seg is None:
+            raise Exception("Could not get segment addr for: {0:x}\n".format(ea))
+
+        return seg.kind == SEG_EXTERN
+
+    def inValidSegment(self, ea):
+        return self.program.segment(ea) is not None
+
+    def isInData(self, start_ea, end_ea):
+        return self.data_segments.contains(start_ea, end_ea)
+
+    def handleExternalRef(self, fn):
+        sym = self.names.lookup(fn)
+        self.externals.add(sym.name)
+        return sym
+
+    def isElfThunk(self, ea):
+        if not self.program.linked_elf:
+            return False, None
+
+        insn = self.program.decode(ea)
+        if insn is not None and insn.kind == INSN_UCOND_JMP:
+            for cref in insn.crefs:
+                if self.isExternalReference(cref):
+                    return True, self.program.name(cref)
+
+        return False, None
+
+    def entryPointHandler(self, M, ep, name):
+        EP = M.entries.add()
+        EP.entry_name = name
+        EP.entry_address = ep
+
+        # the program's type for the entry point comes first, unless
+        # exports are known to be APIs described in std_defs
+        etype = None
+        if self.exports_are_apis:
+            etype = self.names.symbol(name).func
+        if etype is None:
+            etype = self.program.entryType(name, ep)
+        if etype is None:
+            etype = self.names.symbol(name).func
+        if etype is None:
+            sys.stdout.write("WARNING: Cannot determine type of function: {0} at: {1:x}\n".format(name, ep))
+            etype = (0, CFG_pb2.ExternalFunction.CalleeCleanup, "N")
+        (argc, conv, ret) = etype
+
+        EP.entry_extra.entry_argc = argc
+        EP.entry_extra.entry_cconv = conv
+        EP.entry_extra.does_return = (ret != 'Y')
+
+        F = M.internal_funcs.add()
+        F.entry_address = ep
+        return F
+
+    def addInst(self, block, insn):
+        # without a block, nothing is emitted
+        if block is None:
+            return InsnRefs()
+
+        addr = insn.ea
+        inst_bytes = insn.inst_bytes
+
+        if insn.lock:
+            i_lock = block.insts.add()
+            i_lock.inst_addr = addr
+            i_lock.inst_bytes = inst_bytes[0]
+            i_lock.inst_len = 1
+
+            addr += 1
+            inst_bytes = inst_bytes[1:]
+
+        inst = block.insts.add()
+        inst.inst_addr = addr
+        inst.inst_bytes = inst_bytes
+        inst.inst_len = len(inst_bytes)
+        return inst
+
+    def findRelocOffset(self, ea, size):
+        relocs = self.program.fixups.inRange(ea, ea+size)
+        if len(relocs) > 0:
+            return relocs[0]-ea
+
+        return -1
+
+    def handleJmpTable(self, I, insn, new_eas):
+        jstart = insn.jump_table
+        jsize = 4
+
+        DEBUG("\tJMPTable Start: {0:x}\n".format(jstart))
+        I.jump_table.zero_offset = 0
+        i = 0
+        je = self.program.fixups.target(jstart+i*jsize)
+        while je != -1:
+            I.jump_table.table_entries.append(je)
+            if je not in self.recovered_eas:
+                new_eas.add(je)
+            DEBUG("\t\tAdding JMPTable {0}: {1:x}\n".format(i, je))
+            i += 1
+            je = self.program.fixups.target(jstart+i*jsize)
+
+    def instructionHandler(self, M, B, ea, new_eas):
+        insn = self.program.decode(ea)
+        if not insn:
+            # handle jumps after noreturn functions
+            if self.program.byte(ea) == 0xCC:
+                if B is None:
+                    return InsnRefs(), True
+                I = B.insts.add()
+                I.inst_addr = ea
+                I.inst_bytes = "\xCC"
+                I.inst_len = 1
+                return I, True
+            else:
+                raise Exception("Cannot read instruction at: {0:x}".format(ea))
+
+        # skip HLTs -- they are privileged, and are used in ELFs after a noreturn call
+        if insn.kind == INSN_HLT:
+            return None, False
+
+        I = self.addInst(B, insn)
+
+        if insn.jump_table is not None:
+            self.handleJmpTable(I, insn, new_eas)
+            return I, False
+
+        for cref in insn.crefs:
+            fn = self.program.name(cref)
+            if insn.kind == INSN_CALL:
+
+                elfy, fn_replace = self.isElfThunk(cref)
+                if elfy:
+                    fn = fn_replace
+
+                if self.isExternalReference(cref) or elfy:
+                    sym = self.handleExternalRef(fn)
+                    I.ext_call_name = sym.name
+                    DEBUG("EXTERNAL CALL: {0}\n".format(sym.name))
+
+                    if sym.doesNotReturn():
+                        return I, True
+                else:
+                    I.call_target = cref
+
+                    if cref not in self.recovered_eas:
+                        new_eas.add(cref)
+
+                    DEBUG("INTERNAL CALL: {0}\n".format(fn))
+            elif insn.kind == INSN_UCOND_JMP:
+                if self.isExternalReference(cref):
+                    sym = self.handleExternalRef(fn)
+                    I.ext_call_name = sym.name
+                    DEBUG("EXTERNAL JMP: {0}\n".format(sym.name))
+
+                    if sym.doesNotReturn():
+                        DEBUG("Nonreturn JMP\n")
+                        return I, True
+                else:
+                    DEBUG("INTERNAL JMP: {0:x}\n".format(cref))
+                    I.true_target = cref
+
+        #true: jump to where we have a code-ref
+        #false: continue as we were
+        if insn.kind == INSN_COND_JMP:
+            I.true_target = insn.crefs[0]
+            I.false_target = ea+insn.size
+            return I, False
+
+        relo_off = self.findRelocOffset(ea, insn.size)
+        if relo_off != -1:
+            I.reloc_offset = relo_off
+
+        for dref in insn.drefs:
+            if dref in insn.crefs:
+                continue
+
+            if self.inValidSegment(dref):
+                if self.isExternalReference(dref):
+                    fn = self.program.name(dref)
+
+                    sym = self.handleExternalRef(fn)
+                    if sym.isData():
+                        I.ext_data_name = sym.name
+                        sys.stdout.write("EXTERNAL DATA REF FROM {0:x} to {1}\n".format(ea, sym.name))
+                    else:
+                        I.ext_call_name = sym.name
+                        sys.stdout.write("EXTERNAL CODE REF FROM {0:x} to {1}\n".format(ea, sym.name))
+
+                elif self.isInternalCode(dref):
+                    I.call_target = dref
+                    if dref not in self.recovered_eas:
+                        new_eas.add(dref)
+                else:
+                    DEBUG("\t\tData Ref: {0:x}\n".format(dref))
+                    I.data_offset = self.handleDataRelocation(M, dref, new_eas)
+            else:
+                DEBUG("Data not in valid segment {0:x}\n".format(dref))
+
+        return I, False
+
+    def handleDataRelocation(self, M, dref, new_eas):
+        # data moved out of a code segment before is not moved again when
+        # a block is walked a second time
+        moved = self.moved_data.offset(dref)
+        if moved is not None:
+            return dref + moved
+
+        dref_size = self.program.itemSize(dref)
+        if not self.isInData(dref, dref+dref_size):
+            return dref + self.addDataSegment(M, dref, dref+dref_size, new_eas)
+        else:
+            return dref
+
+    def processRelocationsInData(self, M, D, start, end, new_eas, seg_offset):
+        if start == 0:
+            start = 1
+
+        for i in self.program.fixups.inRange(start, end):
+
+            pointsto = self.program.relocationTarget(i)
+            DEBUG("{0:x} Found reloc to: {1:x}\n".format(i, pointsto))
+
+            if not self.inValidSegment(pointsto):
+                DEBUG("Reloc target not in valid segment {0:x}\n".format(pointsto))
+                continue
+
+            if not self.isExternalReference(pointsto):
+                DS = D.symbols.add()
+                DS.base_address = i+seg_offset
+
+                if self.isInternalCode(pointsto):
+                    DS.symbol_name = "sub_0x{0:x}".format(pointsto)
+                    DEBUG("Code Ref: {0:x}!\n".format(pointsto))
+
+                    if pointsto not in self.recovered_eas:
+                        new_eas.add(pointsto)
+                else:
+                    pointsto = self.handleDataRelocation(M, pointsto, new_eas)
+                    DS.symbol_name = "dta_0x{0:x}".format(pointsto)
+                    DEBUG("Data Ref!\n")
+
+    def addDataSegment(self, M, start, end, new_eas):
+        if end < start:
+            raise Exception("Start must be before end")
+
+        seg = self.program.segment(start)
+        if seg is None:
+            raise Exception("Data must be in a valid segment")
+
+        # if this is in an executable region,
+        # move it to a data section
+        seg_offset = 0
+        if seg.executable:
+            free_data = self.data_segments.findFree()
+            seg_offset = free_data - start
+            DEBUG("Data Segment {0:x} moved to: {1:x}\n".format(start, start+seg_offset))
+
+        D = M.internal_data.add()
+        D.base_address = start+seg_offset
+        D.read_only = not seg.writable
+        D.data = self.program.read(start, end)
+
+        self.data_segments.add(start+seg_offset, end+seg_offset)
+        if seg.executable:
+            self.moved_data.add(start, end, seg_offset)
+
+        self.processRelocationsInData(M, D, start, end, new_eas, seg_offset)
+
+        DEBUG("Adding data seg: {0}: {1}-{2}\n".format(
+            seg.name, hex(start+seg_offset), hex(end+seg_offset)))
+
+        return seg_offset
+
+    def processDataSegments(self, M, new_eas):
+        for seg in self.program.segments:
+            if seg.kind in (SEG_DATA, SEG_BSS) and seg.end > seg.start:
+                self.addDataSegment(M, seg.start, seg.end, new_eas)
+
+    def recoverBlock(self, startEA):
+        b = Block(startEA)
+        curEA = startEA
+
+        while True:
+            insn = self.program.decode(curEA)
+            if insn is None:
+                if self.program.byte(curEA) == 0xCC:
+                    b.endEA = curEA+1
+                    return b
+                else:
+                    sys.stdout.write("WARNING: Couldn't decode insn at: {0:x}. Ending block.\n".format(curEA))
+                    b.endEA = curEA
+                    return b
+
+            nextEA = curEA+insn.size
+            follows = insn.follows()
+
+            if follows == [nextEA] or insn.kind == INSN_CALL:
+                # there is only one following branch, to the next instruction
+                # check if this is a JMP 0; in that case, make a new block
+                if insn.kind == INSN_UCOND_JMP:
+                    b.endEA = nextEA
+                    for f in follows:
+                        # do not decode external code refs
+                        if not self.isExternalReference(f):
+                            b.succs.append(f)
+                    return b
+
+                # if its not JMP 0, add next instruction to current block
+                curEA = nextEA
+            # check if we need to make a new block
+            elif len(follows) == 0:
+                # this is a ret, no follows
+                b.endEA = nextEA
+                return b
+            else:
+                # this block has several follow blocks
+                b.endEA = nextEA
+                for f in follows:
+                    # do not decode external code refs
+                    if not self.isExternalReference(f):
+                        b.succs.append(f)
+                return b
+
+    def getFunctionBlocks(self, startea):
+        to_recover = [startea]
+        blocks = {}
+
+        while len(to_recover) > 0:
+            bstart = to_recover.pop()
+            # recover the block, unless another function already did
+            cached = self.block_cache.get(bstart)
+            if cached is not None:
+                newb = cached.block
+            else:
+                newb = self.recoverBlock(bstart)
+                self.block_cache.put(newb)
+            blocks[newb.startEA] = newb
+            for fba in newb.succs:
+                if fba not in blocks:
+                    to_recover.append(fba)
+
+        return [blocks[k] for k in sorted(blocks.keys())]
+
+    def walkBlock(self, M, B, block, targets):
+        # emits the instructions of block into B, or only follows their
+        # references if B is None; returns how many there were
+        count = 0
+        for head in self.program.heads(block.startEA, block.endEA):
+            I, endBlock = self.instructionHandler(M, B, head, targets)
+            count += 1
+            # sometimes there is junk after a terminator due to
+            # off-by-ones in the disassembly. Ignore them.
+            insn = self.program.decode(head)
+            if endBlock or insn is None or \
+                    insn.kind in (INSN_RET, INSN_UCOND_JMP, INSN_TRAP):
+                break
+
+        return count
+
+    def recoverFunctionFromSet(self, M, F, blockset, new_eas):
+        processed_blocks = set()
+
+        # blocks are emitted in address order
+        for block in blockset:
+
+            if block.startEA == block.endEA:
+                sys.stdout.write("Zero sized block: {0:x}\n".format(block.startEA))
+
+            if block.startEA in processed_blocks:
+                raise Exception("Attempting to add same block twice: {0:x}".format(block.startEA))
+
+            processed_blocks.add(block.startEA)
+
+            cached = self.block_cache.get(block.startEA)
+            if cached is not None and cached.proto is not None:
+                # already walked for another function
+                F.blocks.add().CopyFrom(cached.proto)
+                for ea in cached.targets:
+                    if ea not in self.recovered_eas:
+                        new_eas.add(ea)
+                self.block_cache.reused += 1
+                continue
+
+            # function EAs discovered in this block
+            targets = set()
+
+            B = F.blocks.add()
+            B.base_address = block.startEA
+            B.block_follows.extend(block.succs)
+            DEBUG("BB: {0:x}\n".format(block.startEA))
+
+            self.walkBlock(M, B, block, targets)
+
+            new_eas.update(targets)
+            self.block_cache.walked += 1
+
+            if cached is None:
+                cached = self.block_cache.put(block)
+            cached.proto = CFG_pb2.Block()
+            cached.proto.CopyFrom(B)
+            cached.targets = targets
+
+    def recoverFunction(self, M, F, fnea, name, new_eas):
+        with self.profile.function(fnea, name):
+            self.recoverFunctionFromSet(M, F, self.getFunctionBlocks(fnea), new_eas)
+
+        if self.code_image:
+            compactFunction(F)
+        convertFunction(F, 1, self.cfg_version)
+
+    def entries(self, to_recover):
+        # (name, ea) of the entry symbols that point to code
+        our_entries = []
+        for name in to_recover:
+            ea = self.program.symbol(name)
+            if ea is None:
+                raise Exception("Could not locate entry symbol: {0}".format(name))
+
+            fwdname = self.program.forwardedExport(name, ea)
+            if fwdname is not None:
+                sys.stdout.write("Skipping fwd export {0} : {1}\n".format(name, fwdname))
+                continue
+
+            if not self.isInternalCode(ea):
+                sys.stdout.write("Export {0} does not point to code; skipping\n".format(name))
+                continue
+
+            our_entries.append( (name, ea) )
+
+        return our_entries
+
+    def discover(self, to_recover):
+        # every function recover() reaches from the entry symbols, as
+        # (ea, number of instructions) in address order. Blocks are walked
+        # and references followed as in recover(), but no function is
+        # emitted, so a recovery can be split by function up front.
+        M = CFG_pb2.Module()
+        new_eas = Worklist()
+        self.processDataSegments(M, new_eas)
+        new_eas.update([ea for (name, ea) in self.entries(to_recover)])
+
+        functions = []
+        while len(new_eas) > 0:
+            ea = new_eas.pop()
+            if not self.isInternalCode(ea):
+                raise Exception("Function EA not code: {0:x}".format(ea))
+            self.recovered_eas.add(ea)
+
+            targets = set()
+            size = 0
+            for block in self.getFunctionBlocks(ea):
+                size += self.walkBlock(M, None, block, targets)
+
+            functions.append( (ea, size) )
+            new_eas.update(targets)
+            new_eas.difference_update(self.recovered_eas)
+
+        return sorted(functions)
+
+    def recover(self, to_recover, shard=(0, 1), stream=None, checkpoint=None, resume=False,
+            functions=None):
+        # returns the recovered Module, or None if no function was
+        # recovered. With stream, an open file, every function is written
+        # there as a length-delimited record once it is recovered, and
+        # dropped from the Module. A checkpoint is saved as recovery goes
+        # and, with resume, picked up again. With functions, the EAs
+        # dealFunctions dealt to each shard, the shard recovers its own
+        # functions instead of its share of the entry symbols.
+        M = CFG_pb2.Module()
+        M.module_name = self.program.module_name
+        setModuleVersion(M, self.cfg_version)
+        DEBUG("PROCESSING: {0}\n".format(M.module_name))
+
+        new_eas = Worklist()
+        recovered_fns = 0
+        next_entry = 0
+
+        state = None
+        if resume and checkpoint:
+            state = checkpoint.load()
+            if state is None:
+                sys.stdout.write("No checkpoint at {0}; starting from scratch\n".format(checkpoint.path))
+
+        if state:
+            sys.stdout.write("Resuming from checkpoint: {0} functions recovered\n".format(
+                state['recovered_fns']))
+            M.ParseFromString(state['module'])
+            new_eas.update(state['new_eas'])
+            self.restore(state)
+            recovered_fns = state['recovered_fns']
+            next_entry = state['next_entry']
+
+            if stream:
+                # drop anything written after the checkpoint
+                stream.seek(state['output_offset'])
+                stream.truncate()
+        else:
+            if stream:
+                stream.seek(0)
+                stream.truncate()
+            with self.profile.phase("data_segments"):
+                self.processDataSegments(M, new_eas)
+
+        writer = None
+        if stream:
+            writer = cfg_stream.StreamWriter(stream, M.module_name, header=(state is None),
+                                             version=self.cfg_version)
+
+        def saveCheckpoint(next_entry):
+            if not checkpoint or not checkpoint.due():
+                return
+
+            saved = self.state()
+            saved.update({
+                'module': M.SerializeToString(),
+                'new_eas': list(new_eas),
+                'recovered_fns': recovered_fns,
+                'next_entry': next_entry,
+                'output_offset': stream.tell() if stream else 0,
+                })
+            checkpoint.save(saved)
+
+        our_entries = self.entries(to_recover)
+
+        shard_index, shard_count = shard
+        if shard_count > 1 and functions is not None:
+            # every function was dealt to one shard by dealFunctions.
+            # Recover the ones dealt here, entry points or not; the
+            # others count as recovered.
+            mine = set(functions[shard_index])
+            for (k, eas) in enumerate(functions):
+                if k != shard_index:
+                    self.recovered_eas.update(eas)
+
+            sys.stdout.write("Shard {0}/{1}: lifting {2} of {3} functions\n".format(
+                shard_index, shard_count, len(mine), sum([len(eas) for eas in functions])))
+            our_entries = [(name, ea) for (name, ea) in our_entries if ea in mine]
+            new_eas.update(mine)
+        elif shard_count > 1:
+            # entries are dealt out to shards in name order. Entries that
+            # belong to other shards count as recovered, so they are not
+            # lifted again here when reached as subfunctions.
+            mine = []
+            for i, (name, ea) in enumerate(sorted(our_entries)):
+                if i % shard_count == shard_index:
+                    mine.append( (name, ea) )
+                else:
+                    self.recovered_eas.add(ea)
+
+            sys.stdout.write("Shard {0}/{1}: lifting {2} of {3} entries\n".format(
+                shard_index, shard_count, len(mine), len(our_entries)))
+            our_entries = mine
+
+        if shard_count > 1 and state is None:
+            self.data_segments.reserve(shard_index * SHARD_DATA_STRIDE)
+
+        # entries are recovered in address order, whatever order the
+        # symbols were given in, so reruns produce the same CFG
+        our_entries.sort(key=lambda (name, ea): (ea, name))
+
+        with self.profile.phase("entries"):
+            for entry_index, (fname, fea) in enumerate(our_entries):
+
+                if entry_index < next_entry:
+                    continue
+
+                sys.stdout.write("Recovering: {0}\n".format(fname))
+                F = self.entryPointHandler(M, fea, fname)
+                self.recovered_eas.add(fea)
+                self.recoverFunction(M, F, fea, fname, new_eas)
+
+                recovered_fns += 1
+                if writer:
+                    writer.flush(M)
+
+                saveCheckpoint(entry_index+1)
+
+        # process subfunctions
+        new_eas.difference_update(self.recovered_eas)
+
+        with self.profile.phase("subfunctions"):
+            while len(new_eas) > 0:
+                cur_ea = new_eas.pop()
+                if not self.isInternalCode(cur_ea):
+                    raise Exception("Function EA not code: {0:x}".format(cur_ea))
+
+                F = M.internal_funcs.add()
+                F.entry_address = cur_ea
+                sys.stdout.write("Recovering: 0x{0:x}\n".format(cur_ea))
+                self.recovered_eas.add(cur_ea)
+                self.recoverFunction(M, F, cur_ea, self.program.name(cur_ea), new_eas)
+
+                recovered_fns += 1
+                if writer:
+                    writer.flush(M)
+
+                saveCheckpoint(len(our_entries))
+
+        if recovered_fns == 0:
+            sys.stderr.write("COULD NOT RECOVER ANY FUNCTIONS\n")
+            return None
+
+        with self.profile.phase("externals"):
+            addExternals(M, self.names, self.externals)
+
+        with self.profile.phase("serialization"):
+            if writer:
+                writer.flush(M)
+            else:
+                cfg_stream.sortModule(M)
+
+        sys.stdout.write("Recovered {0} functions.\n".format(recovered_fns))
+        sys.stdout.write("Block cache: {0} blocks reused, {1} walked ({2:.1f}% reuse)\n".format(
+            self.block_cache.reused, self.block_cache.walked, self.block_cache.reuseRatio()))
+        return M
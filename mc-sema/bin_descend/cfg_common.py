@@ -0,0 +1,484 @@
+##
+## CFG recovery pieces that do not need IDA.
+##
+## get_cfg.py uses these from inside IDA. cfg_builder.py uses them to
+## recover a CFG outside of IDA, from the sections, symbols and
+## relocations of an object file read by llvm_cfg.py.
+##
+
+import sys
+import bisect
+import heapq
+import array
+import collections
+import CFG_pb2
+
+_DEBUG = False
+
+def DEBUG(s):
+    if _DEBUG:
+        sys.stdout.write(s)
+
+# std_defs calling convention letters as stored in the CFG
+CALLING_CONVENTIONS = {
+        'C': CFG_pb2.ExternalFunction.CallerCleanup,
+        'E': CFG_pb2.ExternalFunction.CalleeCleanup,
+        'F': CFG_pb2.ExternalFunction.FastCall,
+        }
+
+# instruction classes, precomputed once per decoded instruction
+INSN_OTHER = 0
+INSN_CALL = 1
+INSN_RET = 2
+INSN_COND_JMP = 3
+INSN_UCOND_JMP = 4
+INSN_TRAP = 5
+INSN_HLT = 6
+
+class DataSegmentIndex:
+    # non-overlapping [start, end) data ranges, kept sorted by start
+    # address so containment and overlap checks are a bisect away
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.max_end = 0
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return iter(zip(self.starts, self.ends))
+
+    def add(self, start, end):
+        i = bisect.bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        if end > self.max_end:
+            self.max_end = end
+
+    def contains(self, start_ea, end_ea):
+        # segment the range starts in
+        i = bisect.bisect_right(self.starts, start_ea) - 1
+        if i >= 0 and start_ea < self.ends[i]:
+            start, end = self.starts[i], self.ends[i]
+            DEBUG("{0:x} > {1:x}\n".format(start_ea, start))
+            if end_ea <= end:
+                return True
+            else:
+                DEBUG("{0:x} NOT <= {1:x}\n".format(end_ea, end))
+                DEBUG("{0:x}-{1:x} overlaps with: {2:x}-{3:x}\n".format(start_ea, end_ea, start, end))
+                raise Exception("Overlapping data segments!")
+
+        # segment the range ends in
+        i = bisect.bisect_left(self.starts, end_ea) - 1
+        if i >= 0 and end_ea > self.starts[i] and end_ea <= self.ends[i]:
+            DEBUG("Overlaps with: {0:x}-{1:x}\n".format(self.starts[i], self.ends[i]))
+            raise Exception("Overlapping data segments!")
+
+        return False
+
+    def findFree(self):
+        # high-water mark for data moved out of code segments
+        return self.max_end+4
+
+    def reserve(self, size):
+        # leave a gap before the next moved data segment
+        self.max_end += size
+
+class MovedDataIndex:
+    # data ranges moved out of code segments, by their original [start,
+    # end), and how far each was moved. A reference into data that was
+    # already moved resolves to the same copy, so walking a block again
+    # does not move its data a second time
+    def __init__(self):
+        self.ranges = DataSegmentIndex()
+        self.offsets = {}
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def add(self, start, end, offset):
+        self.ranges.add(start, end)
+        self.offsets[start] = offset
+
+    def offset(self, ea):
+        # how far the data holding ea was moved, or None if it was not
+        i = bisect.bisect_right(self.ranges.starts, ea) - 1
+        if i >= 0 and ea < self.ranges.ends[i]:
+            return self.offsets[self.ranges.starts[i]]
+        return None
+
+    def items(self):
+        return [(start, end, self.offsets[start]) for (start, end) in self.ranges]
+
+# when lifting in shards, each shard places data moved out of code
+# segments in its own region so the partial CFGs can be merged
+SHARD_DATA_STRIDE = 0x1000000
+
+# lifting targets 32-bit x86, so addresses always fit an unsigned long
+ADDR_TYPECODE = 'L'
+
+class FixupTable:
+    # every fixup in the input, enumerated once into parallel arrays
+    # sorted by address, so relocation queries are bisects
+    def __init__(self):
+        self.eas = array.array(ADDR_TYPECODE)
+        self.types = array.array('i')
+        self.targets = array.array(ADDR_TYPECODE)
+
+    def __len__(self):
+        return len(self.eas)
+
+    def load(self, fixups):
+        # fixups is an iterable of (ea, type, target), in address order
+        del self.eas[:]
+        del self.types[:]
+        del self.targets[:]
+
+        for (ea, rtype, target) in fixups:
+            self.eas.append(ea)
+            self.types.append(rtype)
+            self.targets.append(target)
+
+    def find(self, ea):
+        i = bisect.bisect_left(self.eas, ea)
+        if i < len(self.eas) and self.eas[i] == ea:
+            return i
+        return -1
+
+    def target(self, ea):
+        i = self.find(ea)
+        if i == -1:
+            return -1
+        return self.targets[i]
+
+    def type(self, ea):
+        i = self.find(ea)
+        if i == -1:
+            return -1
+        return self.types[i]
+
+    def inRange(self, start, end):
+        # addresses of all fixups in [start, end)
+        lo = bisect.bisect_left(self.eas, start)
+        hi = bisect.bisect_left(self.eas, end, lo)
+        return self.eas[lo:hi]
+
+class Block:
+    def __init__(self, startEA):
+        self.startEA = startEA
+        self.endEA = startEA
+        self.succs = []
+
+class Worklist:
+    # function EAs still to be recovered, handed out in ascending address
+    # order. Recovery moves through the database instead of jumping
+    # around it, and the output does not depend on set iteration order.
+    def __init__(self):
+        self.heap = []
+        self.members = set()
+
+    def add(self, ea):
+        if ea not in self.members:
+            self.members.add(ea)
+            heapq.heappush(self.heap, ea)
+
+    def update(self, eas):
+        for ea in eas:
+            self.add(ea)
+
+    def difference_update(self, eas):
+        # removed EAs stay in the heap until pop skips them
+        self.members.difference_update(eas)
+
+    def pop(self):
+        while True:
+            ea = heapq.heappop(self.heap)
+            if ea in self.members:
+                self.members.remove(ea)
+                return ea
+
+    def __len__(self):
+        return len(self.members)
+
+    def __contains__(self, ea):
+        return ea in self.members
+
+    def __iter__(self):
+        return iter(sorted(self.members))
+
+# recovered basic blocks kept for reuse by later functions
+BLOCK_CACHE_SIZE = 0x10000
+
+class CachedBlock:
+    def __init__(self, block):
+        self.block = block
+        # the CFG_pb2.Block emitted for it, and the function EAs it
+        # discovered; set once the block has been walked
+        self.proto = None
+        self.targets = ()
+
+class BlockCache:
+    # blocks reached from several functions (shared tails, tail calls,
+    # jumps into other functions) are only decoded and walked once.
+    # A block's contents depend only on its start address.
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.blocks = collections.OrderedDict()
+        self.reused = 0
+        self.walked = 0
+
+    def get(self, ea):
+        try:
+            cached = self.blocks.pop(ea)
+        except KeyError:
+            return None
+
+        # most recently used entries live at the end
+        self.blocks[ea] = cached
+        return cached
+
+    def put(self, block):
+        if len(self.blocks) >= self.max_size:
+            self.blocks.popitem(last=False)
+
+        cached = CachedBlock(block)
+        self.blocks[block.startEA] = cached
+        return cached
+
+    def reuseRatio(self):
+        total = self.reused + self.walked
+        if total == 0:
+            return 0.0
+        return 100.0 * self.reused / total
+
+def compactFunction(F):
+    # move the instruction bytes of F's blocks into F.code_image. A block
+    # only references the image when its instructions run back to back
+    # from its base address; the others keep their own inst_bytes.
+    image = []
+    size = 0
+    for B in F.blocks:
+        chunk = []
+        ea = B.base_address
+        for I in B.insts:
+            if I.inst_addr != ea or I.inst_len != len(I.inst_bytes) or not 0 < I.inst_len < 0x100:
+                chunk = None
+                break
+            chunk.append(I.inst_bytes)
+            ea += I.inst_len
+
+        if not chunk:
+            continue
+
+        B.code_offset = size
+        B.inst_lengths = "".join([chr(len(b)) for b in chunk])
+        for I in B.insts:
+            I.ClearField('inst_bytes')
+            I.ClearField('inst_addr')
+            I.ClearField('inst_len')
+
+        image.extend(chunk)
+        size += ea - B.base_address
+
+    if size:
+        F.code_image = "".join(image)
+
+# CFG schema versions (Module.cfg_version, unset in version 1). Version 2
+# stores block follows, branch and call targets and jump table entries as
+# packed deltas from the block's base address.
+CFG_VERSIONS = (1, 2)
+
+def moduleVersion(M):
+    if M.HasField('cfg_version'):
+        return M.cfg_version
+    return 1
+
+def setModuleVersion(M, version):
+    if version not in CFG_VERSIONS:
+        raise Exception("Unsupported CFG version: {0}".format(version))
+    if version == 1:
+        M.ClearField('cfg_version')
+    else:
+        M.cfg_version = version
+
+def packFunction(F):
+    # rewrite a version 1 function in the version 2 encoding
+    for B in F.blocks:
+        base = B.base_address
+
+        B.follow_deltas.extend([ea-base for ea in B.block_follows])
+        del B.block_follows[:]
+
+        for I in B.insts:
+            if I.HasField('true_target'):
+                I.true_delta = I.true_target-base
+                I.ClearField('true_target')
+            if I.HasField('false_target'):
+                I.false_delta = I.false_target-base
+                I.ClearField('false_target')
+            if I.HasField('call_target'):
+                I.call_delta = I.call_target-base
+                I.ClearField('call_target')
+            if I.HasField('jump_table'):
+                J = I.jump_table
+                J.entry_deltas.extend([ea-base for ea in J.table_entries])
+                del J.table_entries[:]
+
+def unpackFunction(F):
+    # rewrite a version 2 function in the version 1 encoding
+    for B in F.blocks:
+        base = B.base_address
+
+        B.block_follows.extend([base+d for d in B.follow_deltas])
+        del B.follow_deltas[:]
+
+        for I in B.insts:
+            if I.HasField('true_delta'):
+                I.true_target = base+I.true_delta
+                I.ClearField('true_delta')
+            if I.HasField('false_delta'):
+                I.false_target = base+I.false_delta
+                I.ClearField('false_delta')
+            if I.HasField('call_delta'):
+                I.call_target = base+I.call_delta
+                I.ClearField('call_delta')
+            if I.HasField('jump_table'):
+                J = I.jump_table
+                J.table_entries.extend([base+d for d in J.entry_deltas])
+                del J.entry_deltas[:]
+
+def convertFunction(F, from_version, to_version):
+    if from_version == to_version:
+        return
+    if to_version == 2:
+        packFunction(F)
+    else:
+        unpackFunction(F)
+
+class ExternalSymbol:
+    # an external as it is written to the CFG, and its std_defs entry
+    def __init__(self, name, names):
+        self.name = name
+
+        # fixExternalName: strip one leading underscore unless the
+        # decorated name is itself defined
+        self.fixed = name
+        if name not in names.emap and not names.linked_elf and name[:1] == '_':
+            self.fixed = name[1:]
+
+        self.func = names.emap.get(self.fixed)
+
+        incode = name in names.emap
+        indata = name in names.emap_data
+        self.conflict = incode and indata
+        self.is_data = indata and not incode
+
+    def doesNotReturn(self):
+        if self.func is None:
+            raise Exception("Unknown external: " + self.name)
+        return self.func[2] == "Y"
+
+    def isData(self):
+        if self.conflict:
+            raise Exception("Symbol "+self.name+" defined as both code and data!")
+        return self.is_data
+
+class ExternalNameIndex:
+    # maps every name an external is referenced by (__imp_ prefixes, _0
+    # suffixes, _ and @ decorations, @N argument sizes) to the canonical
+    # std_defs symbol, computed once per name instead of per reference
+    def __init__(self, emap=None, emap_data=None, linked_elf=False):
+        # std_defs views are not truth-tested; their len walks every record
+        if emap is None:
+            emap = {}
+        if emap_data is None:
+            emap_data = {}
+        self.emap = emap
+        self.emap_data = emap_data
+        self.linked_elf = linked_elf
+        self.refs = {}
+        self.symbols = {}
+
+    def canonical(self, fn):
+        # Don't mangle symbols for fully linked ELFs... yet
+        if self.linked_elf:
+            return fn
+
+        if fn.startswith("__imp_"):
+            fn = fn[6:]
+
+        if fn.endswith("_0"):
+            fn = fn[:-2]
+
+        if fn.startswith("_") and fn not in self.emap:
+            fn = fn[1:]
+
+        if fn.startswith("@") and fn not in self.emap:
+            fn = fn[1:]
+
+        if '@' in fn:
+            fn = fn[:fn.find('@')]
+
+        return fn
+
+    def symbol(self, name):
+        # the entry for an already canonical name
+        try:
+            return self.symbols[name]
+        except KeyError:
+            sym = ExternalSymbol(name, self)
+            self.symbols[name] = sym
+            return sym
+
+    def lookup(self, fn):
+        # the entry for a name as the input references it
+        try:
+            return self.refs[fn]
+        except KeyError:
+            sym = self.symbol(self.canonical(fn))
+            self.refs[fn] = sym
+            return sym
+
+    def addNames(self, names):
+        # index every external name up front, and report code/data
+        # conflicts once
+        for name in names:
+            self.lookup(name)
+
+        for sym in self.symbols.itervalues():
+            if sym.conflict:
+                sys.stderr.write("WARNING: {0} is defined as both code and data\n".format(sym.name))
+
+def addExternalFunction(M, fn, func):
+    args, conv, ret = func
+
+    extfn = M.external_funcs.add()
+    extfn.symbol_name = fn
+    extfn.calling_convention = conv
+    extfn.argument_count = args
+    if ret == 'N':
+        extfn.has_return = True
+        extfn.no_return = False
+    else:
+        extfn.has_return = False
+        extfn.no_return = True
+
+def addExternalData(M, dt, data_size):
+    extdt = M.external_data.add()
+    extdt.symbol_name = dt
+    extdt.data_size = data_size
+
+def addExternals(M, names, externals):
+    # write every referenced external that std_defs knows about
+    for name in sorted(externals):
+
+        fn = names.symbol(name).fixed
+        sym = names.symbol(fn)
+
+        if sym.fixed in names.emap:
+            addExternalFunction(M, fn, sym.func)
+        elif sym.fixed in names.emap_data:
+            addExternalData(M, fn, names.emap_data[fn])
+        else:
+            sys.stderr.write("UNKNOWN API: {0}\n".format(fn))
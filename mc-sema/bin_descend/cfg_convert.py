@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+##
+## Convert CFGs between schema versions.
+##
+## Version 1 stores every address as an absolute int64. Version 2, written
+## by get_cfg.py --cfg-version 2, stores block follows, branch and call
+## targets and jump table entries as packed deltas from the base address
+## of their block. Streamed CFGs are converted one record at a time and
+## stay streamed.
+##
+
+import sys
+import os
+import argparse
+import CFG_pb2
+import cfg_stream
+from os import path
+from cfg_common import CFG_VERSIONS, moduleVersion, setModuleVersion, convertFunction
+
+def checkVersion(version):
+    if version not in CFG_VERSIONS:
+        raise Exception("Unsupported CFG version: {0}".format(version))
+
+def convertModule(M, version):
+    old = moduleVersion(M)
+    checkVersion(old)
+
+    for F in M.internal_funcs:
+        convertFunction(F, old, version)
+
+    setModuleVersion(M, version)
+    return M
+
+def convertStream(inf, outf, version):
+    writer = None
+    old = None
+    for kind, msg in cfg_stream.iterRecords(inf):
+        if kind == cfg_stream.HEADER:
+            old = moduleVersion(msg)
+            checkVersion(old)
+            writer = cfg_stream.StreamWriter(outf, msg.module_name, version=version)
+            continue
+
+        if writer is None:
+            raise Exception("CFG stream does not start with a header")
+
+        if kind == cfg_stream.FUNCTION:
+            convertFunction(msg, old, version)
+        writer.writeRecord(kind, msg)
+
+def convertFile(in_name, out_name, version):
+    inf = open(in_name, 'rb')
+    outf = open(out_name, 'wb')
+    try:
+        if cfg_stream.isStream(inf):
+            convertStream(inf, outf, version)
+        else:
+            M = CFG_pb2.Module()
+            M.ParseFromString(inf.read())
+            outf.write(convertModule(M, version).SerializeToString())
+    finally:
+        inf.close()
+        outf.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("inputs", nargs='+',
+        help="Single-message or streamed CFGs, of any version")
+    parser.add_argument("-o", "--output", required=True,
+        help="The converted CFG, or a directory for the CFGs of several inputs")
+    parser.add_argument("--to-version", type=int, choices=CFG_VERSIONS, default=max(CFG_VERSIONS),
+        help="CFG schema version to write. Defaults to the newest")
+
+    args = parser.parse_args()
+
+    many = len(args.inputs) > 1
+    if many and not path.isdir(args.output):
+        os.makedirs(args.output)
+
+    for in_name in args.inputs:
+        out_name = args.output
+        if many or path.isdir(args.output):
+            out_name = path.join(args.output, path.basename(in_name))
+
+        if path.abspath(out_name) == path.abspath(in_name):
+            sys.stderr.write("Not overwriting input: {0}\n".format(in_name))
+            sys.exit(1)
+
+        convertFile(in_name, out_name, args.to_version)
+        sys.stdout.write("Converted {0} to version {1}: {2}\n".format(
+            in_name, args.to_version, out_name))
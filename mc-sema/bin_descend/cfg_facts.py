@@ -0,0 +1,435 @@
+#!/usr/bin/env python
+##
+## Two-phase CFG recovery: a fact dump taken inside IDA, and a CFG built
+## from it outside of IDA.
+##
+## get_cfg.py --dump-facts only copies out what CFG recovery asks IDA
+## about: segments and their bytes, instruction boundaries and kinds,
+## code and data references, fixups, switch tables, data item sizes,
+## names, imports and exports. It does no recovery of its own, so IDA is
+## done as soon as the database is read.
+##
+## This script then builds the CFG_pb2.Module from the dump with
+## cfg_builder, the recovery walk get_cfg.py runs inside IDA. With -j a
+## quick serial pass first discovers every function reachable from the
+## entry symbols, the functions are dealt out between processes by size,
+## and the partial CFGs are merged. A dump can be rebuilt with other
+## std_defs or entry symbols without starting IDA again:
+##
+##   idaq -B -S"get_cfg.py --batch --dump-facts foo.facts" foo.exe
+##   cfg_facts.py foo.facts -s std_defs.txt -j 8 -o foo.cfg
+##
+## The dump is columnar: a header, then named arrays, each stored as raw
+## little-endian machine values:
+##
+##   header   MAGIC, version, column count
+##   column   name, array typecode, byte length, then the values padded
+##            to 8 bytes
+##
+## Lists of strings are one 'c' column of NUL separated strings. A
+## variable number of references per instruction is stored as one column
+## of all references and a column of where each instruction's references
+## start.
+##
+
+import sys
+import json
+import array
+import bisect
+import struct
+import argparse
+import traceback
+import multiprocessing
+
+import CFG_pb2
+import cfg_common
+import cfg_merge
+import std_defs_index
+from cfg_common import CALLING_CONVENTIONS, CFG_VERSIONS, ExternalNameIndex
+from cfg_builder import Program, Segment, Insn, CfgBuilder, dealFunctions, \
+    SEG_CODE, SEG_DATA, SEG_BSS, SEG_EXTERN, SEG_OTHER
+
+MAGIC = "MCSFACT\x00"
+VERSION = 1
+
+# magic, version, column count
+HEADER = struct.Struct("<8sII")
+
+# name, array typecode, byte length
+COLUMN = struct.Struct("<16sc7xQ")
+
+# addresses are stored as 4 bytes on every host; the dumps are of 32-bit
+# x86 databases
+ADDR = 'I'
+
+SEGMENT_KINDS = [SEG_CODE, SEG_DATA, SEG_BSS, SEG_EXTERN, SEG_OTHER]
+
+# insn_flags bits
+INSN_LOCK = 1
+INSN_FLOW = 2
+
+# export_ret values
+RET_UNKNOWN = 0
+
+class FactWriter:
+    # collects facts into columns; get_cfg.py fills one in from IDA
+    def __init__(self, module_name, linked_elf):
+        self.meta = {'module_name': module_name, 'linked_elf': linked_elf}
+        self.columns = {}
+        self.strings = {}
+
+        for name in ('seg_start', 'seg_end', 'seg_data_start', 'seg_data_end',
+                     'name_ea', 'export_ea', 'fixup_ea', 'fixup_target',
+                     'insn_ea', 'cref', 'dref', 'jt_ea', 'jt_start', 'item_ea'):
+            self.columns[name] = array.array(ADDR)
+
+        for name in ('seg_kind', 'seg_writable', 'insn_size', 'insn_kind',
+                     'insn_flags', 'jt_size', 'export_ret'):
+            self.columns[name] = array.array('B')
+
+        for name in ('export_argc', 'export_conv', 'fixup_type'):
+            self.columns[name] = array.array('i')
+
+        for name in ('cref_start', 'dref_start', 'item_size'):
+            self.columns[name] = array.array('I')
+
+        self.columns['cref_start'].append(0)
+        self.columns['dref_start'].append(0)
+
+        for name in ('seg_names', 'names', 'imports', 'exports'):
+            self.strings[name] = []
+
+        self.seg_data = []
+        self.seg_data_size = 0
+
+    def addSegment(self, name, start, end, kind, writable, contents=None):
+        c = self.columns
+        c['seg_start'].append(start)
+        c['seg_end'].append(end)
+        c['seg_kind'].append(SEGMENT_KINDS.index(kind))
+        c['seg_writable'].append(int(writable))
+        self.strings['seg_names'].append(name)
+
+        if contents is None:
+            contents = ""
+        c['seg_data_start'].append(self.seg_data_size)
+        self.seg_data.append(contents)
+        self.seg_data_size += len(contents)
+        c['seg_data_end'].append(self.seg_data_size)
+
+    def addInsn(self, ea, size, kind, crefs, drefs, lock, flow):
+        c = self.columns
+        c['insn_ea'].append(ea)
+        c['insn_size'].append(size)
+        c['insn_kind'].append(kind)
+        c['insn_flags'].append((INSN_LOCK if lock else 0) | (INSN_FLOW if flow else 0))
+        c['cref'].extend(crefs)
+        c['cref_start'].append(len(c['cref']))
+        c['dref'].extend(drefs)
+        c['dref_start'].append(len(c['dref']))
+
+    def addJumpTable(self, ea, start, element_size):
+        self.columns['jt_ea'].append(ea)
+        self.columns['jt_start'].append(start)
+        self.columns['jt_size'].append(element_size)
+
+    def addItem(self, ea, size):
+        self.columns['item_ea'].append(ea)
+        self.columns['item_size'].append(size)
+
+    def addName(self, ea, name):
+        self.columns['name_ea'].append(ea)
+        self.strings['names'].append(name)
+
+    def addImport(self, name):
+        self.strings['imports'].append(name)
+
+    def addExport(self, ea, name, etype=None):
+        # etype is (argc, convention, noreturn) if IDA knows the type
+        self.columns['export_ea'].append(ea)
+        self.strings['exports'].append(name)
+        if etype is None:
+            etype = (-1, -1, None)
+        (argc, conv, ret) = etype
+        self.columns['export_argc'].append(argc)
+        self.columns['export_conv'].append(conv)
+        self.columns['export_ret'].append(ord(ret) if ret else RET_UNKNOWN)
+
+    def addFixup(self, ea, rtype, target):
+        self.columns['fixup_ea'].append(ea)
+        self.columns['fixup_type'].append(rtype)
+        self.columns['fixup_target'].append(target)
+
+    def write(self, fname):
+        blobs = [('meta', json.dumps(self.meta, sort_keys=True))]
+        for (name, strings) in sorted(self.strings.items()):
+            blobs.append( (name, "\x00".join(strings)) )
+        blobs.append( ('seg_data', "".join(self.seg_data)) )
+
+        f = open(fname, 'wb')
+        f.write(HEADER.pack(MAGIC, VERSION, len(self.columns) + len(blobs)))
+        for (name, values) in sorted(self.columns.items()):
+            writeColumn(f, name, values.typecode, values.tostring())
+        for (name, data) in blobs:
+            writeColumn(f, name, 'c', data)
+        f.close()
+
+def writeColumn(f, name, typecode, data):
+    f.write(COLUMN.pack(name, typecode, len(data)))
+    f.write(data)
+    f.write("\x00" * (-len(data) % 8))
+
+def readFacts(fname):
+    # returns {column name: array, or str for 'c' columns}
+    f = open(fname, 'rb')
+    data = f.read()
+    f.close()
+
+    (magic, version, count) = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise Exception("Not a fact dump: {0}".format(fname))
+    if version != VERSION:
+        raise Exception("Unsupported fact dump version {0} in {1}".format(version, fname))
+
+    columns = {}
+    offset = HEADER.size
+    for i in xrange(count):
+        (name, typecode, size) = COLUMN.unpack_from(data, offset)
+        offset += COLUMN.size
+        name = name.rstrip("\x00")
+        if typecode == 'c':
+            columns[name] = data[offset:offset+size]
+        else:
+            values = array.array(typecode)
+            values.fromstring(data[offset:offset+size])
+            columns[name] = values
+        offset += size + (-size % 8)
+
+    return columns
+
+def splitStrings(blob, count):
+    # count tells no strings from a single empty one
+    if count == 0:
+        return []
+    return blob.split("\x00")
+
+class FactProgram(Program):
+    def __init__(self, fname):
+        facts = readFacts(fname)
+        meta = json.loads(facts['meta'])
+
+        Program.__init__(self, meta['module_name'])
+        self.linked_elf = meta['linked_elf']
+
+        seg_data = facts['seg_data']
+        seg_names = splitStrings(facts['seg_names'], len(facts['seg_start']))
+        for i in xrange(len(facts['seg_start'])):
+            kind = SEGMENT_KINDS[facts['seg_kind'][i]]
+            contents = None
+            if kind not in (SEG_BSS, SEG_EXTERN):
+                contents = seg_data[facts['seg_data_start'][i]:facts['seg_data_end'][i]]
+            self.addSegment(Segment(seg_names[i], facts['seg_start'][i], facts['seg_end'][i],
+                                    kind, bool(facts['seg_writable'][i]), contents))
+
+        for (ea, name) in zip(facts['name_ea'], splitStrings(facts['names'], len(facts['name_ea']))):
+            self.names[ea] = name
+            self.symbols.setdefault(name, ea)
+
+        # exports are looked up before other names, as get_cfg.py does
+        self.exports = []
+        self.export_types = {}
+        for (i, name) in enumerate(splitStrings(facts['exports'], len(facts['export_ea']))):
+            ea = facts['export_ea'][i]
+            self.exports.append(name)
+            self.symbols[name] = ea
+            if facts['export_argc'][i] >= 0:
+                self.export_types[name] = (facts['export_argc'][i], facts['export_conv'][i],
+                                           chr(facts['export_ret'][i]))
+
+        self.imports = [name for name in facts['imports'].split("\x00") if name]
+
+        self.fixups.load(zip(facts['fixup_ea'], facts['fixup_type'], facts['fixup_target']))
+
+        self.insn_ea = facts['insn_ea']
+        self.insn_size = facts['insn_size']
+        self.insn_kind = facts['insn_kind']
+        self.insn_flags = facts['insn_flags']
+        self.cref = facts['cref']
+        self.cref_start = facts['cref_start']
+        self.dref = facts['dref']
+        self.dref_start = facts['dref_start']
+        self.jump_tables = dict([(ea, (start, size)) for (ea, start, size) in
+                                 zip(facts['jt_ea'], facts['jt_start'], facts['jt_size'])])
+        self.item_ea = facts['item_ea']
+        self.item_size = facts['item_size']
+        self.insns = {}
+
+    def insnIndex(self, ea):
+        i = bisect.bisect_left(self.insn_ea, ea)
+        if i < len(self.insn_ea) and self.insn_ea[i] == ea:
+            return i
+        return -1
+
+    def isCode(self, ea):
+        # only instruction heads are code, as with IDA's isCode flag
+        return self.insnIndex(ea) != -1
+
+    def itemSize(self, ea):
+        # what is left of the data item containing ea, as idc.ItemSize
+        i = bisect.bisect_right(self.item_ea, ea) - 1
+        if i >= 0 and ea < self.item_ea[i] + self.item_size[i]:
+            return self.item_ea[i] + self.item_size[i] - ea
+        return 1
+
+    def entryType(self, name, ea):
+        return self.export_types.get(name)
+
+    def externalNames(self):
+        # every import and every name in an external segment
+        names = set(self.imports)
+        for (ea, name) in self.names.iteritems():
+            seg = self.segment(ea)
+            if seg is not None and seg.kind == SEG_EXTERN:
+                names.add(name)
+        return names
+
+    def decode(self, ea):
+        try:
+            return self.insns[ea]
+        except KeyError:
+            insn = self.decodeInsn(ea)
+            self.insns[ea] = insn
+            return insn
+
+    def decodeInsn(self, ea):
+        i = self.insnIndex(ea)
+        if i == -1:
+            return None
+
+        size = self.insn_size[i]
+        flags = self.insn_flags[i]
+
+        jump_table = None
+        if ea in self.jump_tables:
+            (jump_table, element_size) = self.jump_tables[ea]
+            # only handle size 4 cases
+            if element_size != 4:
+                raise Exception("Jump table size not 4!")
+
+        return Insn(ea, size, self.insn_kind[i], self.read(ea, ea+size),
+                    self.cref[self.cref_start[i]:self.cref_start[i+1]],
+                    self.dref[self.dref_start[i]:self.dref_start[i+1]],
+                    jump_table, lock=bool(flags & INSN_LOCK),
+                    flow=bool(flags & INSN_FLOW))
+
+# set up in each pool process by initWorker
+WORKER = {}
+
+def initWorker(fname, std_defs, debug, options):
+    # options are passed on to CfgBuilder
+    cfg_common._DEBUG = debug
+
+    emap = {}
+    emap_data = {}
+    if std_defs:
+        defs = std_defs_index.loadDefs(std_defs, CALLING_CONVENTIONS)
+        emap = defs.functions
+        emap_data = defs.data
+
+    program = FactProgram(fname)
+    names = ExternalNameIndex(emap, emap_data, program.linked_elf)
+    names.addNames(program.externalNames())
+
+    WORKER['program'] = program
+    WORKER['names'] = names
+    WORKER['options'] = options
+
+def recoverShard(task):
+    # runs in a pool worker; returns (shard, serialized Module or None, error)
+    (entries, shard, functions) = task
+    try:
+        builder = CfgBuilder(WORKER['program'], WORKER['names'], **WORKER['options'])
+        M = builder.recover(entries, shard, functions=functions)
+        if M is None:
+            return (shard, None, None)
+        return (shard, M.SerializeToString(), None)
+    except Exception:
+        return (shard, None, traceback.format_exc())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("facts",
+        help="A fact dump written by get_cfg.py --dump-facts")
+    parser.add_argument("-o", "--output", required=True,
+        help="The output control flow graph")
+    parser.add_argument("-s", "--std-defs", nargs='*', default=None,
+        help="std_defs file: definitions and calling conventions of imported functions and data")
+    parser.add_argument("--entry-symbol", nargs='*', default=None,
+        help="Symbol(s) to start disassembling from. Defaults to every export")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+        help="Split the functions between this many processes")
+    parser.add_argument("--code-image", action="store_true", default=False,
+        help="Store the instruction bytes of each function once, in a code image its blocks point into")
+    parser.add_argument("--cfg-version", type=int, choices=CFG_VERSIONS, default=1,
+        help="CFG schema version to write")
+    parser.add_argument("--exports-are-apis", action="store_true", default=False,
+        help="Exported functions are defined in std_defs")
+    parser.add_argument("-d", "--debug", action="store_true", default=False,
+        help="Enable verbose debugging mode")
+
+    args = parser.parse_args()
+
+    options = {'code_image': args.code_image, 'cfg_version': args.cfg_version,
+               'exports_are_apis': args.exports_are_apis}
+    initWorker(args.facts, args.std_defs, args.debug, options)
+
+    entries = args.entry_symbol or WORKER['program'].exports
+    if len(entries) == 0:
+        sys.stderr.write("Need to have at least one entry point to lift\n")
+        sys.exit(1)
+
+    jobs = max(1, args.jobs)
+    functions = None
+    if jobs > 1:
+        # functions, not entry symbols, are split between processes: a
+        # few entries often reach most of the code
+        builder = CfgBuilder(WORKER['program'], WORKER['names'], **options)
+        discovered = builder.discover(entries)
+        jobs = max(1, min(jobs, len(discovered)))
+        sys.stdout.write("Discovered {0} functions; recovering them in {1} processes\n".format(
+            len(discovered), jobs))
+        if jobs > 1:
+            functions = dealFunctions(discovered, jobs)
+
+    tasks = [(entries, (k, jobs), functions) for k in xrange(jobs)]
+
+    if jobs > 1:
+        pool = multiprocessing.Pool(jobs, initWorker,
+            (args.facts, args.std_defs, args.debug, options))
+        results = pool.map(recoverShard, tasks)
+        pool.close()
+        pool.join()
+    else:
+        results = [recoverShard(task) for task in tasks]
+
+    modules = []
+    for (shard, data, error) in results:
+        if error:
+            sys.stderr.write("Shard {0} failed: {1}\n".format(shard[0], error))
+            sys.exit(1)
+        if data is not None:
+            M = CFG_pb2.Module()
+            M.ParseFromString(data)
+            modules.append(M)
+
+    if len(modules) == 0:
+        sys.stderr.write("COULD NOT RECOVER ANY FUNCTIONS\n")
+        sys.exit(1)
+
+    M = cfg_merge.mergeModules(modules)
+    outf = open(args.output, 'wb')
+    outf.write(M.SerializeToString())
+    outf.close()
+
+    sys.stdout.write("Recovered {0} functions from {1} into: {2}\n".format(
+        len(M.internal_funcs), args.facts, args.output))
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+##
+## Merge several partial CFGs of the same module into one.
+##
+## Used by bin_descend_wrapper.py -jobs to combine the output of each IDA
+## shard. Functions and data sections are deduplicated by address, and
+## externals and entry symbols by name. Inputs may be single-message or
+## streamed CFGs.
+##
+
+import sys
+import argparse
+import CFG_pb2
+import cfg_stream
+from cfg_common import moduleVersion, setModuleVersion
+
+def checkDataOverlap(M):
+    ranges = sorted([(D.base_address, D.base_address+len(D.data)) for D in M.internal_data])
+    for (prev, cur) in zip(ranges, ranges[1:]):
+        if cur[0] < prev[1]:
+            raise Exception("Conflicting data sections at {0:x}-{1:x} and {2:x}-{3:x}".format(
+                prev[0], prev[1], cur[0], cur[1]))
+
+def mergeModules(modules):
+    M = CFG_pb2.Module()
+    if len(modules) == 0:
+        return M
+
+    M.module_name = modules[0].module_name
+    setModuleVersion(M, moduleVersion(modules[0]))
+
+    funcs = set()
+    ext_funcs = set()
+    ext_data = set()
+    entries = set()
+    data = {}
+
+    for part in modules:
+        if part.module_name != M.module_name:
+            raise Exception("Cannot merge CFGs of different modules: {0} and {1}".format(
+                M.module_name, part.module_name))
+
+        if moduleVersion(part) != moduleVersion(M):
+            raise Exception("Cannot merge CFGs of different versions: {0} and {1}".format(
+                moduleVersion(M), moduleVersion(part)))
+
+        for F in part.internal_funcs:
+            if F.entry_address not in funcs:
+                funcs.add(F.entry_address)
+                M.internal_funcs.add().CopyFrom(F)
+
+        for D in part.internal_data:
+            if D.base_address in data:
+                if data[D.base_address] != D.data:
+                    raise Exception("Conflicting data sections at {0:x}".format(D.base_address))
+                continue
+            data[D.base_address] = D.data
+            M.internal_data.add().CopyFrom(D)
+
+        for E in part.external_funcs:
+            if E.symbol_name not in ext_funcs:
+                ext_funcs.add(E.symbol_name)
+                M.external_funcs.add().CopyFrom(E)
+
+        for E in part.external_data:
+            if E.symbol_name not in ext_data:
+                ext_data.add(E.symbol_name)
+                M.external_data.add().CopyFrom(E)
+
+        for EP in part.entries:
+            if EP.entry_name not in entries:
+                entries.add(EP.entry_name)
+                M.entries.add().CopyFrom(EP)
+
+    checkDataOverlap(M)
+    cfg_stream.sortModule(M)
+    return M
+
+def mergeFiles(in_names, out_name):
+    modules = []
+    for name in in_names:
+        f = open(name, 'rb')
+        modules.append(cfg_stream.readModule(f))
+        f.close()
+
+    M = mergeModules(modules)
+
+    outf = open(out_name, 'wb')
+    outf.write(M.SerializeToString())
+    outf.close()
+
+    return M
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-o", "--output", required=True,
+        help="The merged control flow graph")
+    parser.add_argument("inputs", nargs='+',
+        help="Partial control flow graphs of the same module")
+
+    args = parser.parse_args()
+
+    M = mergeFiles(args.inputs, args.output)
+    sys.stdout.write("Merged {0} functions from {1} CFGs into {2}\n".format(
+        len(M.internal_funcs), len(args.inputs), args.output))
@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+##
+## Profiling support for get_cfg.py --profile.
+##
+## A Profiler records wall and CPU time, IDA API calls and peak memory for
+## each recovery phase, plus the time taken by every recovered function.
+## The result is written as JSON. Profiles of several runs (shards of one
+## binary, or a whole corpus) are combined with aggregate, and compared
+## against a baseline to find phases that got slower.
+##
+## Peak memory comes from tracemalloc where the interpreter has it, from
+## the process maximum RSS otherwise, and is left out on hosts with
+## neither.
+##
+
+import os
+import sys
+import json
+import time
+import heapq
+import types
+import argparse
+import contextlib
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+VERSION = 1
+
+# slowest functions kept in a profile
+TOP_FUNCTIONS = 20
+
+# allocation sites listed per phase when tracemalloc is available
+TOP_ALLOCATIONS = 5
+
+def cpuTime():
+    (user, system) = os.times()[:2]
+    return user + system
+
+def memorySource():
+    if tracemalloc is not None:
+        return "tracemalloc"
+    if resource is not None:
+        return "max_rss"
+    return None
+
+def maxRss():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes everywhere but OS X
+    if sys.platform != "darwin":
+        rss *= 1024
+    return rss
+
+def maxMemory(a, b):
+    # peak memory is None until it has been measured
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return max(a, b)
+
+class NullProfiler:
+    # stands in for a Profiler when --profile is not given
+    @contextlib.contextmanager
+    def phase(self, name):
+        yield
+
+    @contextlib.contextmanager
+    def function(self, ea, name):
+        yield
+
+class Profiler:
+    def __init__(self, module_name):
+        self.module_name = module_name
+        self.phases = {}
+        self.phase_order = []
+        self.current = None
+        self.calls = {}
+        self.depth = 0
+        self.functions = []
+
+        if tracemalloc is not None and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def countCalls(self, modules):
+        # replace the functions of each module with counting wrappers.
+        # Calls made from inside another counted call are not counted
+        # again, so idautils helpers count once.
+        for module in modules:
+            prefix = module.__name__ + "."
+            for (name, fn) in vars(module).items():
+                if name.startswith("_"):
+                    continue
+                if not isinstance(fn, (types.FunctionType, types.BuiltinFunctionType)):
+                    continue
+                setattr(module, name, self.counted(prefix + name, fn))
+
+    def counted(self, api, fn):
+        def wrapper(*args, **kwargs):
+            if self.depth == 0:
+                self.calls[api] = self.calls.get(api, 0) + 1
+                if self.current is not None:
+                    self.current['calls'] += 1
+
+            self.depth += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.depth -= 1
+
+        wrapper.__name__ = fn.__name__
+        wrapper.__doc__ = fn.__doc__
+        return wrapper
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if name not in self.phases:
+            self.phases[name] = {'wall': 0.0, 'cpu': 0.0, 'calls': 0,
+                                 'count': 0, 'peak_memory': None}
+            self.phase_order.append(name)
+
+        outer = self.current
+        p = self.phases[name]
+        self.current = p
+
+        if tracemalloc is not None and hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+
+        wall = time.time()
+        cpu = cpuTime()
+        try:
+            yield
+        finally:
+            p['wall'] += time.time() - wall
+            p['cpu'] += cpuTime() - cpu
+            p['count'] += 1
+            self.snapshotMemory(p)
+            self.current = outer
+
+    def snapshotMemory(self, p):
+        if tracemalloc is not None:
+            (size, peak) = tracemalloc.get_traced_memory()
+            stats = tracemalloc.take_snapshot().statistics('lineno')
+            p['top_allocations'] = [str(stat) for stat in stats[:TOP_ALLOCATIONS]]
+        elif resource is not None:
+            peak = maxRss()
+        else:
+            return
+
+        p['peak_memory'] = maxMemory(peak, p['peak_memory'])
+
+    @contextlib.contextmanager
+    def function(self, ea, name):
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.functions.append( (time.time() - start, ea, name) )
+
+    def result(self, avoided=None):
+        total = sum([seconds for (seconds, ea, name) in self.functions])
+        slowest = heapq.nlargest(TOP_FUNCTIONS, self.functions)
+
+        return {
+            'version': VERSION,
+            'runs': 1,
+            'inputs': [self.module_name],
+            'memory_source': memorySource(),
+            'phase_order': self.phase_order,
+            'phases': self.phases,
+            'ida_calls': self.calls,
+            'avoided_calls': dict(avoided or {}),
+            'functions': {
+                'count': len(self.functions),
+                'total': total,
+                'slowest': [{'input': self.module_name, 'ea': ea, 'name': name,
+                             'seconds': seconds} for (seconds, ea, name) in slowest],
+                },
+            }
+
+    def write(self, fname, avoided=None):
+        writeProfile(self.result(avoided), fname)
+
+def readProfile(fname):
+    f = open(fname, 'r')
+    prof = json.load(f)
+    f.close()
+
+    if prof.get('version') != VERSION:
+        raise Exception("Unsupported profile version in {0}".format(fname))
+    return prof
+
+def writeProfile(prof, fname):
+    f = open(fname, 'w')
+    json.dump(prof, f, indent=1, sort_keys=True)
+    f.close()
+
+def addCounts(into, counts):
+    for (k, v) in counts.items():
+        into[k] = into.get(k, 0) + v
+
+def aggregate(profiles):
+    # combine profiles into one of the same shape. Times and counts are
+    # summed, peak memory is the largest seen, and the slowest functions
+    # are taken over all inputs.
+    out = {
+        'version': VERSION,
+        'runs': 0,
+        'inputs': [],
+        'memory_source': None,
+        'phase_order': [],
+        'phases': {},
+        'ida_calls': {},
+        'avoided_calls': {},
+        'functions': {'count': 0, 'total': 0.0, 'slowest': []},
+        }
+
+    slowest = []
+    for prof in profiles:
+        out['runs'] += prof['runs']
+        out['inputs'].extend(prof['inputs'])
+        out['memory_source'] = out['memory_source'] or prof['memory_source']
+
+        for name in prof['phase_order']:
+            p = prof['phases'][name]
+            if name not in out['phases']:
+                out['phase_order'].append(name)
+                out['phases'][name] = {'wall': 0.0, 'cpu': 0.0, 'calls': 0,
+                                       'count': 0, 'peak_memory': None}
+            q = out['phases'][name]
+            for k in ('wall', 'cpu', 'calls', 'count'):
+                q[k] += p[k]
+            q['peak_memory'] = maxMemory(q['peak_memory'], p['peak_memory'])
+
+        addCounts(out['ida_calls'], prof['ida_calls'])
+        addCounts(out['avoided_calls'], prof['avoided_calls'])
+
+        out['functions']['count'] += prof['functions']['count']
+        out['functions']['total'] += prof['functions']['total']
+        slowest.extend(prof['functions']['slowest'])
+
+    out['functions']['slowest'] = heapq.nlargest(TOP_FUNCTIONS, slowest,
+        key=lambda f: f['seconds'])
+    return out
+
+def regressions(baseline, current, threshold):
+    # phases whose mean wall time per run grew by more than threshold
+    # (a fraction) over the baseline
+    found = []
+    for name in current['phase_order']:
+        if name not in baseline['phases']:
+            continue
+        old = baseline['phases'][name]['wall'] / max(baseline['runs'], 1)
+        new = current['phases'][name]['wall'] / max(current['runs'], 1)
+        if old > 0 and (new - old) / old > threshold:
+            found.append( (name, old, new) )
+    return found
+
+def report(prof, outf):
+    outf.write("{0} runs, {1} functions in {2:.2f}s\n".format(
+        prof['runs'], prof['functions']['count'], prof['functions']['total']))
+
+    outf.write("{0:<20} {1:>10} {2:>10} {3:>10} {4:>14}\n".format(
+        "phase", "wall", "cpu", "IDA calls", "peak memory"))
+    for name in prof['phase_order']:
+        p = prof['phases'][name]
+        peak = p['peak_memory']
+        if peak is None:
+            peak = "-"
+        outf.write("{0:<20} {1:>10.2f} {2:>10.2f} {3:>10} {4:>14}\n".format(
+            name, p['wall'], p['cpu'], p['calls'], peak))
+
+    outf.write("Slowest functions:\n")
+    for f in prof['functions']['slowest']:
+        outf.write("    {0:>8.3f}s {1} {2:x} {3}\n".format(
+            f['seconds'], f['input'], f['ea'], f['name']))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-o", "--output", default=None,
+        help="Write the aggregated profile here")
+    parser.add_argument("--baseline", default=None,
+        help="An earlier aggregated profile to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1,
+        help="Report phases whose mean wall time grew by more than this fraction of the baseline")
+    parser.add_argument("profiles", nargs='+',
+        help="Profiles written by get_cfg.py --profile")
+
+    args = parser.parse_args()
+
+    prof = aggregate([readProfile(fname) for fname in args.profiles])
+    report(prof, sys.stdout)
+
+    if args.output:
+        writeProfile(prof, args.output)
+
+    if args.baseline:
+        found = regressions(readProfile(args.baseline), prof, args.threshold)
+        for (name, old, new) in found:
+            sys.stdout.write("REGRESSION: {0} {1:.2f}s -> {2:.2f}s per run\n".format(name, old, new))
+        if found:
+            sys.exit(1)
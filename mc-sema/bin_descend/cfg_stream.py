@@ -0,0 +1,156 @@
+##
+## Streaming CFG container.
+##
+## A streamed CFG starts with MAGIC and is followed by records. Each record
+## is one kind byte, a varint length, and a serialized protobuf message:
+##
+##   H  Module header (module_name only)
+##   F  Function
+##   D  Data
+##   X  ExternalFunction
+##   Y  ExternalData
+##   E  EntrySymbol
+##
+## Records are written as soon as they are recovered, so neither the
+## writer nor the reader needs the whole Module in memory. Files without
+## MAGIC are plain single-message Modules, as written by earlier versions.
+##
+## The header carries the Module's cfg_version, which applies to every
+## record in the stream.
+##
+
+import CFG_pb2
+from cfg_common import setModuleVersion
+
+MAGIC = "MCSCFG\x00\x01"
+
+HEADER = 'H'
+FUNCTION = 'F'
+DATA = 'D'
+EXTERNAL_FUNCTION = 'X'
+EXTERNAL_DATA = 'Y'
+ENTRY = 'E'
+
+# record kind, the Module field it is stored in, and its message type
+RECORD_FIELDS = [
+        (FUNCTION, 'internal_funcs', CFG_pb2.Function),
+        (DATA, 'internal_data', CFG_pb2.Data),
+        (EXTERNAL_FUNCTION, 'external_funcs', CFG_pb2.ExternalFunction),
+        (EXTERNAL_DATA, 'external_data', CFG_pb2.ExternalData),
+        (ENTRY, 'entries', CFG_pb2.EntrySymbol),
+        ]
+
+RECORD_TYPES = dict([(kind, msgtype) for (kind, field, msgtype) in RECORD_FIELDS])
+RECORD_TYPES[HEADER] = CFG_pb2.Module
+
+def encodeVarint(n):
+    out = []
+    while True:
+        bits = n & 0x7f
+        n >>= 7
+        if n:
+            out.append(chr(bits | 0x80))
+        else:
+            out.append(chr(bits))
+            return "".join(out)
+
+def readVarint(f):
+    result = 0
+    shift = 0
+    while True:
+        c = f.read(1)
+        if c == "":
+            if shift == 0:
+                return None
+            raise Exception("Truncated record length in CFG stream")
+        b = ord(c)
+        result |= (b & 0x7f) << shift
+        if not (b & 0x80):
+            return result
+        shift += 7
+
+class StreamWriter:
+    def __init__(self, outf, module_name, header=True, version=1):
+        self.outf = outf
+        if not header:
+            # appending to a stream that already has its header
+            return
+
+        self.outf.write(MAGIC)
+
+        H = CFG_pb2.Module()
+        H.module_name = module_name
+        setModuleVersion(H, version)
+        self.writeRecord(HEADER, H)
+
+    def writeRecord(self, kind, msg):
+        data = msg.SerializeToString()
+        self.outf.write(kind)
+        self.outf.write(encodeVarint(len(data)))
+        self.outf.write(data)
+
+    def flush(self, M):
+        # write out every finished entry in M, then drop it from memory
+        for (kind, field, msgtype) in RECORD_FIELDS:
+            entries = getattr(M, field)
+            for entry in entries:
+                self.writeRecord(kind, entry)
+            del entries[:]
+
+        self.outf.flush()
+
+def sortModule(M):
+    # put M in canonical order, so that equal CFGs serialize to equal bytes
+    M.internal_funcs.sort(key=lambda F: F.entry_address)
+    for F in M.internal_funcs:
+        F.blocks.sort(key=lambda B: B.base_address)
+    M.internal_data.sort(key=lambda D: D.base_address)
+    M.external_funcs.sort(key=lambda E: E.symbol_name)
+    M.external_data.sort(key=lambda E: E.symbol_name)
+    M.entries.sort(key=lambda E: (E.entry_address, E.entry_name))
+
+def isStream(f):
+    pos = f.tell()
+    magic = f.read(len(MAGIC))
+    f.seek(pos)
+    return magic == MAGIC
+
+def iterRecords(f):
+    # yields (kind, message) for every record in a streamed CFG
+    if f.read(len(MAGIC)) != MAGIC:
+        raise Exception("Not a streamed CFG file")
+
+    while True:
+        kind = f.read(1)
+        if kind == "":
+            return
+
+        size = readVarint(f)
+        if size is None or kind not in RECORD_TYPES:
+            raise Exception("Malformed record in CFG stream")
+
+        data = f.read(size)
+        if len(data) != size:
+            raise Exception("Truncated record in CFG stream")
+
+        msg = RECORD_TYPES[kind]()
+        msg.ParseFromString(data)
+        yield kind, msg
+
+def readModule(f):
+    # read either container format into a single in-memory Module
+    M = CFG_pb2.Module()
+    if not isStream(f):
+        M.ParseFromString(f.read())
+        return M
+
+    fields = dict([(kind, field) for (kind, field, msgtype) in RECORD_FIELDS])
+    for kind, msg in iterRecords(f):
+        if kind == HEADER:
+            M.module_name = msg.module_name
+            if msg.HasField('cfg_version'):
+                M.cfg_version = msg.cfg_version
+        else:
+            getattr(M, fields[kind]).add().CopyFrom(msg)
+
+    return M
@@ -4,6 +4,7 @@ import idc
 from os import path
 import sys
 import argparse
+import std_defs_index
 
 
 FAKE_DLL = """
@@ -15,42 +16,12 @@ int __stdcall DllMain(void* inst, unsigned int dwReason, void* lpr) {
 
 """
 
-def parseDefsFile(df):
-    emap = {}
-    emap_data = {}
-    for l in df.readlines():
-        #skip comments
-        if l[0] == "#":
-            continue
-         
-        l = l.strip()
-        
-        if l.startswith('DATA:') :
-            # process as data
-            (marker, symname, dsize) = l.split()
-            emap_data[symname] = int(dsize)
-        else:
-
-            (fname, args, conv, ret) = l.split()
-
-            if conv == "C":
-                realconv = "__cdecl"
-            elif conv == "E":
-                realconv = "__stdcall"
-            elif conv == "F":
-                realconv = "__fastacll"
-            else:
-                raise Exception("Unknown calling convention:"+conv)
-
-            if ret not in ['Y', 'N']:
-                raise Exception("Unknown return type:"+ret)
-
-            emap[fname] = (int(args), realconv, ret)
-
-    
-    df.close()
-
-    return emap, emap_data
+# std_defs calling convention letters as written in the stub sources
+CALLING_CONVENTIONS = {
+        'C': "__cdecl",
+        'E': "__stdcall",
+        'F': "__fastcall",
+        }
 
 def find_imported_funcs():
     def imp_cb(ea, name, ord):
@@ -88,7 +59,7 @@ if __name__ == "__main__":
     myname = idc.GetInputFile()
 
     parser = argparse.ArgumentParser()
-    parser.add_argument("-s", "--std-defs", nargs='*', type=argparse.FileType('r'),
+    parser.add_argument("-s", "--std-defs", nargs='*',
         default=None,
 	required=True,
         help="std_defs file: definitions and calling conventions of imported functions and data"
@@ -112,15 +83,9 @@ if __name__ == "__main__":
     sys.stdout.write("Gathering imports...\n")
     imps = find_imported_funcs()
 
-    EMAP = {}
-    EMAP_DATA = {}
-
-    if args.std_defs:
-        for defsfile in args.std_defs:
-            sys.stdout.write("Loading Standard Definitions file: {0}\n".format(defsfile.name))
-            em_update, emd_update = parseDefsFile(defsfile)
-            EMAP.update(em_update)
-            EMAP_DATA.update(emd_update)
+    defs = std_defs_index.loadDefs(args.std_defs, CALLING_CONVENTIONS)
+    EMAP = defs.functions
+    EMAP_DATA = defs.data
 
     batfile = open(path.join(outpath, "makelibs.bat"), 'wb')
 
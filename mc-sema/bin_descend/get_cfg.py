@@ -12,31 +12,142 @@ import idaapi
 import idc
 import sys
 import CFG_pb2
+import std_defs_index
+import cfg_profile
+import cfg_common
+import cfg_facts
+from cfg_common import DEBUG, CALLING_CONVENTIONS, ADDR_TYPECODE, CFG_VERSIONS, \
+    ExternalNameIndex, \
+    INSN_OTHER, INSN_CALL, INSN_RET, INSN_COND_JMP, INSN_UCOND_JMP, INSN_TRAP, INSN_HLT
+from cfg_builder import Program, Segment, Insn, CfgBuilder, \
+    SEG_CODE, SEG_DATA, SEG_BSS, SEG_EXTERN, SEG_OTHER
 from os import path
 import os
 import argparse
-import struct
+import collections
+import re
+import bisect
+import array
+import time
+import cPickle
 
 _DEBUG = False
 
-EXTERNALS = set()
-DATA_SEGMENTS = []
+def idaFixups():
+    # every fixup in the database, in address order
+    ea = idc.GetNextFixupEA(0)
+    while ea != idc.BADADDR:
+        yield (ea, idc.GetFixupTgtType(ea), idc.GetFixupTgtOff(ea))
+        ea = idc.GetNextFixupEA(ea)
+
+class DatabaseSnapshot:
+    # segment table, names and code flags, taken once after
+    # auto-analysis. The address classification predicates are
+    # answered from here instead of going back to IDA per reference.
+    def __init__(self):
+        self.starts = array.array(ADDR_TYPECODE)
+        self.ends = array.array(ADDR_TYPECODE)
+        self.types = array.array('i')
+        self.perms = array.array('i')
+        self.names = {}
+        self.code = {}
+        self.linked_elf = False
+
+    def load(self):
+        segs = []
+        for n in xrange(idaapi.get_segm_qty()):
+            seg = idaapi.getnseg(n)
+            segs.append( (seg.startEA, seg.endEA, seg.type, seg.perm) )
+        segs.sort()
+
+        for (start, end, segtype, perm) in segs:
+            self.starts.append(start)
+            self.ends.append(end)
+            self.types.append(segtype)
+            self.perms.append(perm)
+
+        self.linked_elf = idc.GetLongPrm(idc.INF_FILETYPE) == idc.FT_ELF and \
+            idc.BeginEA() != 0xffffffffL
+
+    def segment(self, ea):
+        # index of the segment containing ea, or -1
+        i = bisect.bisect_right(self.starts, ea) - 1
+        if i >= 0 and ea < self.ends[i]:
+            return i
+        return -1
+
+    def name(self, ea):
+        try:
+            fn = self.names[ea]
+            STATS['GetTrueNameEx'] += 1
+        except KeyError:
+            fn = idc.GetTrueNameEx(ea, ea)
+            self.names[ea] = fn
+        return fn
+
+    def isCode(self, ea):
+        try:
+            code = self.code[ea]
+            STATS['GetFlags'] += 1
+        except KeyError:
+            pf = idc.GetFlags(ea)
+            code = idc.isCode(pf) and not idc.isData(pf)
+            self.code[ea] = code
+        return code
+
+class IdaExternalNameIndex(ExternalNameIndex):
+    def load(self):
+        # index every import and every name in an external segment
+        names = set()
+
+        def imp_cb(ea, name, ordinal):
+            if name:
+                names.add(name)
+            return True
+
+        for i in xrange(idaapi.get_import_module_qty()):
+            idaapi.enum_import_names(i, imp_cb)
+
+        for seg in xrange(len(SNAPSHOT.starts)):
+            if SNAPSHOT.types[seg] != idc.SEG_XTRN:
+                continue
+            for ea in idautils.Heads(SNAPSHOT.starts[seg], SNAPSHOT.ends[seg]):
+                name = SNAPSHOT.name(ea)
+                if name:
+                    names.add(name)
+
+        self.addNames(names)
+
+EXTERNAL_NAMES = IdaExternalNameIndex()
+SNAPSHOT = DatabaseSnapshot()
+
+# IDA API calls answered from a snapshot or cache instead, by API
+STATS = collections.Counter()
+
+# replaced by a cfg_profile.Profiler with --profile
+PROFILE = cfg_profile.NullProfiler()
+
+# set with --code-image: store each function's instruction bytes once,
+# in Function.code_image
+CODE_IMAGE = False
+
+# the Module.cfg_version to write, set with --cfg-version
+CFG_VERSION = 1
 
-RECOVERED_EAS = set()
 EMAP = {}
 EMAP_DATA = {}
 
-TRAPS = [ 
+TRAPS = frozenset([
         idaapi.NN_int3,
         idaapi.NN_icebp,
-        ]
+        ])
 
-CALLS = [
+CALLS = frozenset([
         idaapi.NN_call,
         idaapi.NN_callfi,
-        idaapi.NN_callni]
+        idaapi.NN_callni])
 
-RETS = [
+RETS = frozenset([
         idaapi.NN_retf,
         idaapi.NN_retfd,
         idaapi.NN_retfq,
@@ -44,9 +155,9 @@ RETS = [
         idaapi.NN_retn,
         idaapi.NN_retnd,
         idaapi.NN_retnq,
-        idaapi.NN_retnw]
+        idaapi.NN_retnw])
 
-COND_BRANCHES = [\
+COND_BRANCHES = frozenset([\
     idaapi.NN_ja,\
     idaapi.NN_jae,\
     idaapi.NN_jb,\
@@ -79,31 +190,91 @@ COND_BRANCHES = [\
     idaapi.NN_jpo,\
     idaapi.NN_jrcxz,\
     idaapi.NN_js,\
-    idaapi.NN_jz,]
+    idaapi.NN_jz,])
 
-UCOND_BRANCHES = [\
+UCOND_BRANCHES = frozenset([\
     idaapi.NN_jmp,\
     idaapi.NN_jmpfi,\
     idaapi.NN_jmpni,\
-    idaapi.NN_jmpshort]
-
-def DEBUG(s):
-    if _DEBUG:
-        sys.stdout.write(s)
-
-def isLinkedElf():
-    return idc.GetLongPrm(INF_FILETYPE) == idc.FT_ELF and \
-        idc.BeginEA() !=0xffffffffL 
+    idaapi.NN_jmpshort])
+
+# jumps that IDA may have attached switch information to
+JMP_TABLE_BRANCHES = frozenset([
+    idaapi.NN_jmp,
+    idaapi.NN_jmpfi,
+    idaapi.NN_jmpni])
+
+HLTS = frozenset([idaapi.NN_hlt])
+
+def classifyInsn(itype):
+    if itype in CALLS: return INSN_CALL
+    if itype in RETS: return INSN_RET
+    if itype in COND_BRANCHES: return INSN_COND_JMP
+    if itype in UCOND_BRANCHES: return INSN_UCOND_JMP
+    if itype in TRAPS: return INSN_TRAP
+    if itype in HLTS: return INSN_HLT
+    return INSN_OTHER
+
+# number of decoded instructions kept around. Block discovery and
+# instruction emission for a function touch the same instructions
+# close together, so this only needs to cover a few large functions.
+INSN_CACHE_SIZE = 0x10000
+
+def decodeIdaInsn(ea, insn_t):
+    # everything cfg_builder asks about an instruction, read once
+    size = insn_t.size
+    inst_bytes = idaapi.get_many_bytes(ea, size)
+    if inst_bytes is None:
+        inst_bytes = "".join([chr(idc.Byte(b)) for b in xrange(ea, ea+size)])
+
+    jump_table = None
+    if insn_t.itype in JMP_TABLE_BRANCHES:
+        si = idaapi.get_switch_info_ex(ea)
+        if si:
+            # only handle size 4 cases
+            if si.get_jtable_element_size() != 4:
+                raise Exception("Jump table size not 4!")
+            jump_table = si.jumps
+
+    crefs = list(idautils.CodeRefsFrom(ea, 0))
+    drefs = list(idautils.DataRefsFrom(ea))
+    flow = ea+size in idautils.CodeRefsFrom(ea, 1)
+
+    return Insn(ea, size, classifyInsn(insn_t.itype), inst_bytes, crefs, drefs,
+                jump_table, lock=(insn_t.auxpref & 0x1) == 0x1, flow=flow)
+
+class InstructionCache:
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.insns = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, ea):
+        try:
+            insn = self.insns.pop(ea)
+            self.hits += 1
+        except KeyError:
+            insn_t = idautils.DecodeInstruction(ea)
+            insn = decodeIdaInsn(ea, insn_t) if insn_t else None
+            self.misses += 1
+            if len(self.insns) >= self.max_size:
+                self.insns.popitem(last=False)
+
+        # most recently used entries live at the end
+        self.insns[ea] = insn
+        return insn
+
+    def hitRate(self):
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return 100.0 * self.hits / total
+
+INSN_CACHE = InstructionCache(INSN_CACHE_SIZE)
 
 def fixExternalName(fn):
-    
-    if fn in EMAP:
-        return fn
-
-    if not isLinkedElf() and fn[0] == '_':
-        return fn[1:]
-
-    return fn
+    return EXTERNAL_NAMES.symbol(fn).fixed
 
 def nameInMap(themap, fn):
 
@@ -112,751 +283,265 @@ def nameInMap(themap, fn):
 
 def getFromEMAP(fname):
 
-    fixname = fixExternalName(fname)
-    return EMAP[fixname]
+    func = EXTERNAL_NAMES.symbol(fname).func
+    if func is None:
+        raise KeyError(fname)
+    return func
 
 
 def doesNotReturn(fname):
-    try:
-        args, conv, ret = getFromEMAP(fname)
-        if ret == "Y":
-            return True
-    except KeyError, ke:
-        raise Exception("Unknown external: " + fname)
-    
-    return False
-
-def isHlt(ea):
-    insn_t = idautils.DecodeInstruction(ea)
-    return insn_t.itype in [idaapi.NN_hlt]
-
-def isJmpTable(ea):
-    insn_t = idautils.DecodeInstruction(ea)
-    is_jmp = insn_t.itype in [idaapi.NN_jmp, 
-            idaapi.NN_jmpfi,
-            idaapi.NN_jmpni]
-
-    if not is_jmp: return False
-
-    if idaapi.get_switch_info_ex(ea):
-        return True
-
-    return False
-
-def addFunction(M, ep):
-    F = M.internal_funcs.add()
-    F.entry_address = ep
-
-    return F
-
-def entryPointHandler(M, ep, name, args_from_stddef=False):
-
-    EP = M.entries.add()
-    EP.entry_name = name
-    EP.entry_address = ep
-
-    have_edata = False
-
-
-    # should we get argument count  
-    # calling ocnvention, and return type from std_defs?
-    if args_from_stddef:
-        try:
-            (argc, conv, ret) = getFromEMAP(name)
-            have_edata = True
-        except KeyError as ke:
-            pass
-
-    if not have_edata:
-        (argc, conv, ret) = getExportType(name, ep)
-
-    EP.entry_extra.entry_argc = argc
-    EP.entry_extra.entry_cconv = conv
-    if ret == 'Y':
-        EP.entry_extra.does_return = False
-    else:
-        EP.entry_extra.does_return = True
-    
-    F = addFunction(M, ep)
-
-    DEBUG("At EP {0}:{1:x}\n".format(name,ep))
-
-    return F
-
-def basicBlockHandler(F, block, blockset, processed_blocks):
-    B = F.blocks.add()
-    B.base_address = block.startEA
-    DEBUG("BB: {0:x}\n".format(block.startEA))
-
-    B.block_follows.extend(block.succs)
-
-    if _DEBUG:
-        str_l = ["{0:x}".format(i) for i in block.succs]
-        if len(str_l) > 0:
-            DEBUG("Successors: {0}\n".format(", ".join(str_l)))
-
-    return B
-
-def readInstructionBytes(inst):
-    insn_t = idautils.DecodeInstruction(inst)
-    return [idc.Byte(b) for b in xrange(inst, inst+insn_t.size)]
-        
-def isInternalCode(ea):
-
-    pf = idc.GetFlags(ea)
-    return idc.isCode(pf) and not idc.isData(pf)
-
-def isExternalReference(ea):
-    # see if this is in an internal or external code ref
-    DEBUG("Testing {0:x} for externality\n".format(ea))
-    ext_types = [idc.SEG_XTRN]
-    seg = idc.SegStart(ea)
-    if seg == idc.BADADDR:
-        raise Exception("Could not get segment addr for: {0:x}\n".format(ea))
-
-    segtype = idc.GetSegmentAttr(seg, idc.SEGATTR_TYPE)
-    if segtype in ext_types:
-        return True
-
-    return False
-
-def getFunctionName(ea):
-    return idc.GetTrueNameEx(ea,ea)
-    
-def addInst(block, addr, inst_bytes, true_target=None, false_target=None):
-    # check if there is a lock prefix:
-    insn_t = idautils.DecodeInstruction(addr)
-    if insn_t is not None and (insn_t.auxpref & 0x1) == 0x1:
-        # has LOCK
-        i_lock = block.insts.add()
-        i_lock.inst_addr = addr
-        i_lock.inst_bytes = chr(inst_bytes[0])
-        i_lock.inst_len = 1
-
-        addr += 1
-        inst_bytes = inst_bytes[1:]
-
-    inst = block.insts.add()
-    inst.inst_addr = addr
-    str_val = "".join([chr(b) for b in inst_bytes])
-    inst.inst_bytes = str_val
-    inst.inst_len = len(inst_bytes)
-    if true_target != None: inst.true_target = true_target
-    if false_target != None: inst.false_target = false_target
-
-    return inst
-
-def isConditionalJump(ea):
-    insn_t = idautils.DecodeInstruction(ea)
-    return insn_t.itype in COND_BRANCHES
-
-def isUnconditionalJump(ea):
-    insn_t = idautils.DecodeInstruction(ea)
-    return insn_t.itype in UCOND_BRANCHES
-
-def isCall(ea):
-    insn_t = idautils.DecodeInstruction(ea)
-    return insn_t.itype in CALLS
-
-def isRet(ea):
-    insn_t = idautils.DecodeInstruction(ea)
-    return insn_t.itype in RETS
-
-def isTrap(ea):
-    insn_t = idautils.DecodeInstruction(ea)
-    return insn_t.itype in TRAPS
-
-def findRelocOffset(ea, size):
-    for i in xrange(ea,ea+size):
-        if idc.GetFixupTgtOff(i) != -1:
-            return i-ea
-    
-    return -1
-
-def handleExternalRef(fn):
-    # Don't mangle symbols for fully linked ELFs... yet
-    if not isLinkedElf():
-        if fn.startswith("__imp_"):
-            fn = fn[6:]
-
-        if fn.endswith("_0"):
-            fn = fn[:-2]
-
-        if fn.startswith("_") and fn not in EMAP:
-            fn = fn[1:]
-
-        if fn.startswith("@") and fn not in EMAP:
-            fn = fn[1:]
-
-        if '@' in fn:
-            fn = fn[:fn.find('@')]
-
-    EXTERNALS.add(fn)
-    return fn
-
-def isInData(start_ea, end_ea):
-    for (start,end) in DATA_SEGMENTS:
-        if start_ea >= start and start_ea < end:
-            DEBUG("{0:x} > {1:x}\n".format(start_ea, start))
-            if end_ea <= end:
-                return True
-            else:
-                DEBUG("{0:x} NOT <= {1:x}\n".format(end_ea, end))
-                DEBUG("{0:x}-{1:x} overlaps with: {2:x}-{3:x}\n".format(start_ea, end_ea, start, end))
-                raise Exception("Overlapping data segments!")
-        else:
-            if end_ea > start and end_ea <= end:
-                DEBUG("Overlaps with: {0:x}-{1:x}\n".format(start, end))
-                raise Exception("Overlapping data segments!")
-
-    return False
+    return EXTERNAL_NAMES.symbol(fname).doesNotReturn()
 
 def isExternalData(fn):
-    indata = fn in EMAP_DATA
-    incode = fn in EMAP
-
-    if indata and not incode:
-        return True
-    elif indata and incode:
-        raise Exception("Symbol "+fn+" defined as both code and data!")
-    else:
-        return False
-
-
-def handleJmpTable(I, inst, new_eas):
-    si = idaapi.get_switch_info_ex(inst)
-    jsize = si.get_jtable_element_size()
-    jstart = si.jumps
-
-    # only handle size 4 cases
-    if jsize != 4:
-        raise Exception("Jump table size not 4!")
-        return
-
-    DEBUG("\tJMPTable Start: {0:x}\n".format(jstart))
-    I.jump_table.zero_offset = 0
-    i = 0
-    je = idc.GetFixupTgtOff(jstart+i*jsize)
-    while je != -1:
-        I.jump_table.table_entries.append(je)
-        if je not in RECOVERED_EAS: 
-            new_eas.add(je)
-        DEBUG("\t\tAdding JMPTable {0}: {1:x}\n".format( i, je))
-        i += 1
-        je = idc.GetFixupTgtOff(jstart+i*jsize)
-
-def isElfThunk(ea):
-    if not isLinkedElf():
-        return False, None
-
-
-    if isUnconditionalJump(ea):
-        have_ext_ref = False
-        for cref in idautils.CodeRefsFrom(ea, 0):
-            if isExternalReference(cref):
-                have_ext_ref = True
-                break
-
-        if have_ext_ref:
-            fn = getFunctionName(cref)
-            return True, fn
-
-    return False, None
-
-def instructionHandler(M, B, inst, new_eas):
-    insn_t = idautils.DecodeInstruction(inst)
-    if not insn_t:
-        # handle jumps after noreturn functions
-        if idc.Byte(inst) == 0xCC:
-            I = addInst(B, inst, [0xCC])
-            return I, True
-        else:
-            raise Exception("Cannot read instruction at: {0:x}".format(inst))
-
-    # skip HLTs -- they are privileged, and are used in ELFs after a noreturn call
-    if isHlt(inst):
-        return None, False
-
-    DEBUG("\t\tinst: {0}\n".format(idc.GetDisasm(inst)))
-    inst_bytes = readInstructionBytes(inst)
-    DEBUG("\t\tBytes: {0}\n".format(inst_bytes))
-
-    I = addInst(B, inst, inst_bytes)
-
-    if isJmpTable(inst):
-        handleJmpTable(I, inst, new_eas)
-        return I, False
-
-    #check for code refs from here
-    crefs = []
-    for cref in idautils.CodeRefsFrom(inst, 0):
-        crefs.append(cref)
-        fn = getFunctionName(cref)
-        if isCall(inst):
-
-            elfy, fn_replace = isElfThunk(cref) 
-            if elfy:
-                fn = fn_replace
-
-            if isExternalReference(cref) or elfy:
-                fn = handleExternalRef(fn)
-                I.ext_call_name = fn 
-                DEBUG("EXTERNAL CALL: {0}\n".format(fn))
-
-                if doesNotReturn(fn):
-                    return I, True
-            else:
-                I.call_target = cref
-
-                if cref not in RECOVERED_EAS: 
-                    new_eas.add(cref)
-
-                DEBUG("INTERNAL CALL: {0}\n".format(fn))
-        elif isUnconditionalJump(inst):
-            if isExternalReference(cref):
-                fn = handleExternalRef(fn)
-                I.ext_call_name = fn 
-                DEBUG("EXTERNAL JMP: {0}\n".format(fn))
-
-                if doesNotReturn(fn):
-                    DEBUG("Nonreturn JMP\n")
-                    return I, True
-            else:
-                DEBUG("INTERNAL JMP: {0:x}\n".format(cref))
-                I.true_target = cref
-
-    #true: jump to where we have a code-ref
-    #false: continue as we were
-    if isConditionalJump(inst):
-        I.true_target = crefs[0]
-        I.false_target = inst+len(inst_bytes)
-        return I, False
-
-    relo_off = findRelocOffset(inst, len(inst_bytes))
-    if relo_off != -1:
-        I.reloc_offset = relo_off
-
-    for dref in idautils.DataRefsFrom(inst):
-        if dref in crefs:
-            continue
-
-        if inValidSegment(dref): 
-            if isExternalReference(dref):
-                fn = getFunctionName(dref)
-
-                fn = handleExternalRef(fn)
-                if isExternalData(fn):
-                    I.ext_data_name = fn
-                    sys.stdout.write("EXTERNAL DATA REF FROM {0:x} to {1}\n".format(inst, fn))
-                else:
-                    I.ext_call_name = fn 
-                    sys.stdout.write("EXTERNAL CODE REF FROM {0:x} to {1}\n".format(inst, fn))
-
-            elif isInternalCode(dref):
-                I.call_target = dref
-                if dref not in RECOVERED_EAS: 
-                    new_eas.add(dref)
-            else:
-                dref_size = idc.ItemSize(dref)
-                DEBUG("\t\tData Ref: {0:x}, size: {1}\n".format(
-                    dref, dref_size))
-                I.data_offset = handleDataRelocation(M, dref, new_eas)
-        else:
-            DEBUG("Data not in valid segment {0:x}\n".format(dref))
-
-
-    return I, False
-
-def parseDefsFile(df):
-    emap = {}
-    emap_data = {}
-    for l in df.readlines():
-        #skip comments
-        if l[0] == "#":
-            continue
-         
-        l = l.strip()
-        
-        if l.startswith('DATA:') :
-            # process as data
-            (marker, symname, dsize) = l.split()
-            emap_data[symname] = int(dsize)
+    return EXTERNAL_NAMES.symbol(fn).isData()
+
+def segmentKind(seg):
+    # the cfg_builder kind of a snapshot segment, by its IDA type
+    segtype = SNAPSHOT.types[seg]
+    if segtype == idc.SEG_XTRN:
+        return SEG_EXTERN
+    if segtype == idc.SEG_CODE:
+        return SEG_CODE
+    if segtype == idc.SEG_BSS:
+        return SEG_BSS
+    if segtype == idc.SEG_DATA:
+        return SEG_DATA
+    return SEG_OTHER
+
+class IdaProgram(Program):
+    # the database, as cfg_builder recovers it. Segments, names and code
+    # flags are answered from SNAPSHOT, instructions from INSN_CACHE.
+    def __init__(self):
+        Program.__init__(self, idc.GetInputFile())
+        self.linked_elf = SNAPSHOT.linked_elf
+
+        SEGPERM_WRITE = 2
+        for seg in xrange(len(SNAPSHOT.starts)):
+            start = SNAPSHOT.starts[seg]
+            perm = SNAPSHOT.perms[seg]
+            self.addSegment(Segment(idc.SegName(start), start, SNAPSHOT.ends[seg],
+                                    segmentKind(seg), (perm & SEGPERM_WRITE) != 0,
+                                    executable=(perm & idaapi.SEGPERM_EXEC) != 0))
+
+        self.fixups.load(idaFixups())
+        DEBUG("Loaded {0} fixups\n".format(len(self.fixups)))
+
+        self.exports = {}
+        for (index, ordinal, ea, name) in idautils.Entries():
+            self.exports[name] = ea
+
+    def segment(self, ea):
+        STATS['SegStart'] += 1
+        return Program.segment(self, ea)
+
+    def read(self, start, end):
+        return readSegmentBytes(start, end)
+
+    def byte(self, ea):
+        return idc.Byte(ea)
+
+    def itemSize(self, ea):
+        return idc.ItemSize(ea)
+
+    def name(self, ea):
+        return SNAPSHOT.name(ea)
+
+    def isCode(self, ea):
+        return SNAPSHOT.isCode(ea)
+
+    def symbol(self, name):
+        if name in self.exports:
+            return self.exports[name]
+
+        ea = idc.LocByName(name)
+        if ea == idc.BADADDR:
+            return None
+        return ea
+
+    def forwardedExport(self, name, ea):
+        return isFwdExport(name, ea)
+
+    def entryType(self, name, ea):
+        return exportTypeFromIda(name, ea)
+
+    def decode(self, ea):
+        return INSN_CACHE.get(ea)
+
+    def heads(self, start, end):
+        return idautils.Heads(start, end)
+
+# largest single read issued to IDA when copying segment contents
+READ_CHUNK_SIZE = 0x100000
+
+# runs of fully set, fully clear, or mixed bytes in an initialized-byte mask
+MASK_RUN_RE = re.compile('\xff+|\x00+|[\x01-\xfe]')
+
+def maskRuns(mask, size):
+    # turn a get_many_bytes_ex bitmask (bit N set if byte N has a value)
+    # into a list of (start, end) offsets of initialized runs
+    runs = []
+    cur = None
+    for m in MASK_RUN_RE.finditer(mask):
+        off = m.start() * 8
+        c = m.group()[0]
+        if c == '\xff':
+            if cur is None:
+                cur = off
+        elif c == '\x00':
+            if cur is not None:
+                runs.append( (cur, off) )
+                cur = None
         else:
-
-            (fname, args, conv, ret) = l.split()
-
-            if conv == "C":
-                realconv = CFG_pb2.ExternalFunction.CallerCleanup
-            elif conv == "E":
-                realconv = CFG_pb2.ExternalFunction.CalleeCleanup
-            elif conv == "F":
-                realconv = CFG_pb2.ExternalFunction.FastCall
-            else:
-                raise Exception("Unknown calling convention:"+conv)
-
-            if ret not in ['Y', 'N']:
-                raise Exception("Unknown return type:"+ret)
-
-            emap[fname] = (int(args), realconv, ret)
-
-    
-    df.close()
-
-    return emap, emap_data
-
-def processExternalFunction(M, fn):
-
-    args, conv, ret = getFromEMAP(fn)
-
-    extfn = M.external_funcs.add()
-    extfn.symbol_name = fn
-    extfn.calling_convention = conv
-    extfn.argument_count = args
-    if ret == 'N':
-        extfn.has_return = True
-        extfn.no_return = False
+            bits = ord(c)
+            for bit in xrange(8):
+                if bits & (1 << bit):
+                    if cur is None:
+                        cur = off+bit
+                elif cur is not None:
+                    runs.append( (cur, off+bit) )
+                    cur = None
+
+    if cur is not None:
+        runs.append( (cur, size) )
+
+    return [(s, min(e, size)) for (s, e) in runs if s < size]
+
+def readInitializedRuns(start, end):
+    # returns a list of (ea, bytes) for every initialized run in [start, end)
+    data = idaapi.get_many_bytes(start, end-start)
+    if data is not None:
+        return [(start, data)]
+
+    if hasattr(idaapi, "get_many_bytes_ex"):
+        res = idaapi.get_many_bytes_ex(start, end-start)
+        if res is not None:
+            data, mask = res
+            return [(start+rs, data[rs:re_]) for (rs, re_) in maskRuns(mask, end-start)]
+
+    # no mask support: skip each gap with nextthat, and find where each
+    # initialized run ends with a few growing get_many_bytes reads
+    runs = []
+    ea = nextInitialized(start, end)
+    while ea < end:
+        run_end = initializedRunEnd(ea, end)
+        runs.append( (ea, idaapi.get_many_bytes(ea, run_end-ea)) )
+        ea = nextInitialized(run_end, end)
+
+    return runs
+
+def nextInitialized(ea, end):
+    # the first address in [ea, end) that has a value, or end
+    if ea >= end or idc.hasValue(idc.GetFlags(ea)):
+        return ea
+
+    ea = idaapi.nextthat(ea, end, idaapi.hasValue)
+    if ea == idc.BADADDR or ea > end:
+        return end
+    return ea
+
+def initializedRunEnd(ea, end):
+    # ea has a value; returns the first address after it without one, or
+    # end. The read doubles until it fails, then the failing range is
+    # bisected, so a run of n bytes costs O(log n) reads
+    good = ea + 1
+    step = 1
+    while good < end:
+        probe = min(good+step, end)
+        if idaapi.get_many_bytes(good, probe-good) is None:
+            break
+        good = probe
+        step *= 2
     else:
-        extfn.has_return = False
-        extfn.no_return = True
-
-def processExternalData(M, dt):
-
-    data_size = EMAP_DATA[dt]
-
-    extdt = M.external_data.add()
-    extdt.symbol_name = dt 
-    extdt.data_size = data_size
-
-def processExternals(M):
-
-    for fn in EXTERNALS:
+        return end
 
-        fn = fixExternalName(fn)
-
-        if nameInMap(EMAP, fn):
-            processExternalFunction(M, fn)
-        elif nameInMap(EMAP_DATA, fn):
-            processExternalData(M, fn)
-        else:
-            sys.stderr.write("UNKNOWN API: {0}\n".format(fn))
-
-def readBytesSlowly(start, end):
-    bytestr = ""
-    for i in xrange(start, end):
-        if idc.hasValue(idc.GetFlags(i)):
-            bt = idc.Byte(i)
-            bytestr += chr(bt)
+    # [ea, good) has values, and some byte in [good, probe) does not
+    while probe - good > 1:
+        mid = good + (probe-good)/2
+        if idaapi.get_many_bytes(good, mid-good) is None:
+            probe = mid
         else:
-            #virtual size may be bigger than size on disk
-            #pad with nulls
-            #DEBUG("Failed on {0:x}\n".format(i))
-            bytestr += "\x00"
-    return bytestr
-
-def handleDataRelocation(M, dref, new_eas):
-    dref_size = idc.ItemSize(dref)
-    if not isInData(dref, dref+dref_size):
-        return dref + addDataSegment(M, dref, dref+dref_size, new_eas)
-    else:
-        return dref
-
-def resolveRelocation(ea):
-    rtype = idc.GetFixupTgtType(ea) 
-    if rtype == idc.FIXUP_OFF32:
-        bytestr = readBytesSlowly(ea, ea+4);
-        relocVal = struct.unpack("<L", bytestr)[0]
-        return relocVal
-    elif rtype == -1:
-        raise Exception("No relocation type at ea: {:x}".format(ea))
-    else:
-        return idc.GetFixupTgtOff(ea)
-
-def processRelocationsInData(M, D, start, end, new_eas, seg_offset):
-
-    if start == 0:
-        start = 1
-
-    i = idc.GetNextFixupEA(start-1)
-
-    while i < end and i != idc.BADADDR:
-
-        pointsto = resolveRelocation(i)
-        fn = getFunctionName(i)
-        DEBUG("{0:x} Found reloc to: {1:x}\n".format(i, pointsto))
-
-        if not isExternalReference(pointsto):
-            pf = idc.GetFlags(pointsto)
-
-            DS = D.symbols.add()
-            DS.base_address = i+seg_offset
-
-            if idc.isCode(pf):
-                DS.symbol_name = "sub_"+hex(pointsto)
-                DEBUG("Code Ref: {0:x}!\n".format(pointsto))
-
-                if pointsto not in RECOVERED_EAS:
-                    new_eas.add(pointsto)
-
-            elif idc.isData(pf):
-                pointsto = handleDataRelocation(M, pointsto, new_eas)
-                DS.symbol_name = "dta_"+hex(pointsto)
-                DEBUG("Data Ref!\n")
-            else:
-                pointsto = handleDataRelocation(M, pointsto, new_eas)
-                DS.symbol_name = "dta_"+hex(pointsto)
-                DEBUG("UNKNOWN Ref, assuming data\n")
-
-
-        i = idc.GetNextFixupEA(i)
-
-def inValidSegment(ea):
-    if idc.SegStart(ea) == idc.BADADDR:
+            good = mid
+
+    return good
+
+def readSegmentBytes(start, end):
+    # virtual size may be bigger than size on disk;
+    # bytes without a value are left as nulls
+    buf = bytearray(end-start)
+    for chunk_start in xrange(start, end, READ_CHUNK_SIZE):
+        chunk_end = min(chunk_start+READ_CHUNK_SIZE, end)
+        for (ea, data) in readInitializedRuns(chunk_start, chunk_end):
+            buf[ea-start:ea-start+len(data)] = data
+
+    return str(buf)
+
+class Checkpointer:
+    # periodically saves enough of recoverCfg's state to a sidecar file
+    # to pick up an interrupted recovery where it left off
+    def __init__(self, path, every=0, interval=0):
+        self.path = path
+        self.every = every
+        self.interval = interval
+        self.count = 0
+        self.last = time.time()
+
+    def due(self):
+        self.count += 1
+        if self.every and self.count % self.every == 0:
+            return True
+        if self.interval and time.time() - self.last >= self.interval:
+            return True
         return False
 
-    return True
-
-def findFreeData():
-
-    max_end = 0
-    for (start, end) in DATA_SEGMENTS:
-        if end > max_end:
-            max_end = end
-
-    return max_end+4
-
-def addDataSegment(M, start, end, new_eas):
-    if end < start:
-        raise Exception("Start must be before end")
-
-    seg = idaapi.getseg(start)
-
-    if not seg:
-        raise Exception("Data must be in a valid segment")
-
-    # if this is in an executalbe region,
-    # move it to a data section
-    seg_offset = 0
-    need_move = (seg.perm & idaapi.SEGPERM_EXEC) != 0
-    if need_move:
-        free_data = findFreeData()
-        seg_offset = free_data - start
-        DEBUG("Data Segment {0:x} moved to: {1:x}\n".format(start, start+seg_offset))
-
-    D = M.internal_data.add()
-    D.base_address = start+seg_offset
-
-    SEGPERM_WRITE = 2
-    
-    if (seg.perm & SEGPERM_WRITE) == 0:
-        D.read_only = True
-    else:
-        D.read_only = False
-
-    #D.data = idaapi.get_many_bytes(start, end-start)
-    D.data = readBytesSlowly(start, end)
-
-    DATA_SEGMENTS.append( (start+seg_offset,end+seg_offset) )
-
-    processRelocationsInData(M, D, start, end, new_eas, seg_offset)
-
-    DEBUG("Adding data seg: {0}: {1}-{2}\n".format( 
-        idc.SegName(start),
-        hex(start+seg_offset),
-        hex(end+seg_offset)))
-
-    return seg_offset
-
-def processDataSegments(M, new_eas):
-    for n in xrange(idaapi.get_segm_qty()):
-        seg = idaapi.getnseg(n)
-        ea = seg.startEA
-        segtype = idc.GetSegmentAttr(ea, idc.SEGATTR_TYPE)
-        if segtype in [idc.SEG_DATA, idc.SEG_BSS]:
-            start = idc.SegStart(ea)
-            end = idc.SegEnd(ea)
-            addDataSegment(M, start, end, new_eas)
-
-def recoverFunctionFromSet(M, F, blockset, new_eas):
-    processed_blocks = set()
-
-    while len(blockset) > 0:
-        block = blockset.pop()
-
-        if block.startEA == block.endEA:
-            sys.stdout.write("Zero sized block: {0:x}\n".format(block.startEA))
-
-        if block.startEA in processed_blocks:
-            raise Exception("Attempting to add same block twice: {0:x}".format(block.startEA))
-
-        processed_blocks.add(block.startEA)
-
-        B = basicBlockHandler(F, block, blockset, processed_blocks)
-        for head in idautils.Heads(block.startEA, block.endEA):
-            I, endBlock = instructionHandler(M, B, head, new_eas)
-            # sometimes there is junk after a terminator due to off-by-ones in
-            # IDAPython. Ignore them.
-            if endBlock or isRet(head) or isUnconditionalJump(head) or isTrap(head):
-                break
-
-def recoverFunction(M, F, fnea, new_eas):
-    blockset = getFunctionBlocks(fnea)
-    recoverFunctionFromSet(M, F, blockset, new_eas)
-
-class Block:
-    def __init__(self, startEA):
-        self.startEA = startEA
-        self.endEA = startEA
-        self.succs = []
-
-def recoverBlock(startEA):
-    b = Block(startEA)
-    curEA = startEA
-
-    while True:
-        insn_t = idautils.DecodeInstruction(curEA)
-        if insn_t is None:
-            if idc.Byte(curEA) == 0xCC:
-                b.endEA = curEA+1
-                return b
-            else:
-                sys.stdout.write("WARNING: Couldn't decode insn at: {0:x}. Ending block.\n".format(curEA))
-                b.endEA = curEA
-                return b
-
-        nextEA = curEA+insn_t.size
-
-        crefs = idautils.CodeRefsFrom(curEA, 1)
-
-        # get curEA follows
-        follows = [cref for cref in crefs]
-
-        if follows == [nextEA] or isCall(curEA):
-            # there is only one following branch, to the next instruction
-            # check if this is a JMP 0; in that case, make a new block
-            if isUnconditionalJump(curEA):
-                b.endEA = nextEA
-                for f in follows:
-                    # do not decode external code refs
-                    if not isExternalReference(f):
-                        b.succs.append(f)
-                return b
-
-            # if its not JMP 0, add next instruction to current block
-            curEA = nextEA
-        # check if we need to make a new block
-        elif len(follows) == 0:
-            # this is a ret, no follows
-            b.endEA = nextEA
-            return b
-        else:
-            # this block has several follow blocks
-            b.endEA = nextEA
-            for f in follows:
-                # do not decode external code refs
-                if not isExternalReference(f):
-                    b.succs.append(f)
-            return b
-
-def getFunctionBlocks(startea):
-    to_recover = [startea]
-    
-    blocks = {}
-
-    while len(to_recover) > 0:
-        # get new block start to recover
-        bstart = to_recover.pop()
-        # recover the block
-        newb = recoverBlock(bstart)
-        # save to our recovered block list
-        blocks[newb.startEA] = newb
-        # add new workers
-        for fba in newb.succs:
-            if fba not in blocks:
-                to_recover.append(fba)
-
-    rv = []
-    # easier to debug
-    for k in sorted(blocks.keys()):
-        rv.append(blocks[k])
-
-    return rv
-
-def recoverCfg(to_recover, outf, exports_are_apis=False):
-    M = CFG_pb2.Module()
-    M.module_name = idc.GetInputFile()
-    DEBUG("PROCESSING: {0}\n".format(M.module_name))
-
-    our_entries = []
-    entrypoints = idautils.Entries()
-    exports = {}
-    for index,ordinal,exp_ea, exp_name in entrypoints:
-        exports[exp_name] = exp_ea
-        
-    new_eas = set()
-    processDataSegments(M, new_eas)
-
-    for name in to_recover:
-
-        if name in exports:
-            ea = exports[name]
-        else:
-            ea = idc.LocByName(name)
-            if ea == idc.BADADDR:
-                raise Exception("Could not locate entry symbol: {0}".format(name))
-
-        fwdname = isFwdExport(name, ea)
-
-        if fwdname is not None:
-            sys.stdout.write("Skipping fwd export {0} : {1}\n".format(name, fwdname))
-            continue
-
-        if not isInternalCode(ea):
-            sys.stdout.write("Export {0} does not point to code; skipping\n".format(name))
-            continue
-            
-        our_entries.append( (name, ea) )
-
-    recovered_fns = 0
-
-    # process main entry points
-    for fname, fea in our_entries:
-
-        sys.stdout.write("Recovering: {0}\n".format(fname))
-
-        F = entryPointHandler(M, fea, fname, exports_are_apis)
-
-        RECOVERED_EAS.add(fea)
-        recoverFunction(M, F, fea, new_eas)
-
-        recovered_fns += 1
-
-    # process subfunctions
-    new_eas.difference_update(RECOVERED_EAS)
-
-    while len(new_eas) > 0:
-        cur_ea = new_eas.pop()
-        if not isInternalCode(cur_ea):
-            raise Exception("Function EA not code: {0:x}".format(cur_ea))
-
-        F = addFunction(M, cur_ea)
-        sys.stdout.write("Recovering: {0}\n".format(hex(cur_ea)))
-        RECOVERED_EAS.add(cur_ea)
-
-        recoverFunction(M, F, cur_ea, new_eas)
-
-        recovered_fns += 1
-
-    if recovered_fns == 0:
-        sys.stderr.write("COULD NOT RECOVER ANY FUNCTIONS\n")
+    def save(self, state):
+        tmp = self.path + ".tmp"
+        f = open(tmp, 'wb')
+        cPickle.dump(state, f, cPickle.HIGHEST_PROTOCOL)
+        f.close()
+
+        # rename does not replace existing files on windows
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        os.rename(tmp, self.path)
+
+        self.last = time.time()
+        DEBUG("Checkpoint saved to {0}\n".format(self.path))
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return None
+
+        f = open(self.path, 'rb')
+        state = cPickle.load(f)
+        f.close()
+        return state
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def recoverCfg(to_recover, outf, exports_are_apis=False, stream=False, shard=(0, 1),
+               checkpoint=None, resume=False):
+    program = IdaProgram()
+    builder = CfgBuilder(program, EXTERNAL_NAMES, PROFILE, CODE_IMAGE, CFG_VERSION,
+                         exports_are_apis)
+
+    # in streaming mode, recovered functions are written out and
+    # dropped from M as recovery goes
+    M = builder.recover(to_recover, shard, outf if stream else None, checkpoint, resume)
+    if M is None:
         return
 
-    mypath = path.dirname(__file__)
-    processExternals(M)
+    with PROFILE.phase("serialization"):
+        if not stream:
+            outf.write(M.SerializeToString())
+        outf.close()
 
-    outf.write(M.SerializeToString())
-    outf.close()
+    if checkpoint:
+        checkpoint.remove()
 
-    sys.stdout.write("Recovered {0} functions.\n".format(recovered_fns))
+    sys.stdout.write("Instruction cache: {0} hits, {1} misses ({2:.1f}% hit rate)\n".format(
+        INSN_CACHE.hits, INSN_CACHE.misses, INSN_CACHE.hitRate()))
     sys.stdout.write("Saving to: {0}\n".format(outf.name))
 
 def isFwdExport(iname, ea):
@@ -1045,6 +730,105 @@ def generateExportStub(cname, eps):
 
     cfile.close()
 
+def avoidedCalls():
+    avoided = collections.Counter(STATS)
+    avoided['DecodeInstruction'] += INSN_CACHE.hits
+    return avoided
+
+def writeStats(outf):
+    avoided = avoidedCalls()
+
+    outf.write("IDA API calls avoided:\n")
+    for api, count in sorted(avoided.iteritems()):
+        outf.write("    {0:<20} {1}\n".format(api, count))
+    outf.write("    {0:<20} {1}\n".format("total", sum(avoided.values())))
+
+def factSegmentKind(seg):
+    # dumps have no executable flag: executable segments are code
+    kind = segmentKind(seg)
+    if kind != SEG_EXTERN and (SNAPSHOT.perms[seg] & idaapi.SEGPERM_EXEC) != 0:
+        return SEG_CODE
+    return kind
+
+def exportTypeFromIda(name, ea):
+    # the type IDA gives an export, or None; std_defs are applied when
+    # the CFG is built
+    tp = idc.GetType(ea)
+    if tp is None or "__" not in tp:
+        return None
+
+    try:
+        return parseTypeString(tp, ea)
+    except Exception:
+        return None
+
+def dumpFacts(fname):
+    # everything recovery asks IDA about, for cfg_facts.py to build the
+    # CFG from outside of IDA
+    W = cfg_facts.FactWriter(idc.GetInputFile(), SNAPSHOT.linked_elf)
+
+    with PROFILE.phase("dump_segments"):
+        for seg in xrange(len(SNAPSHOT.starts)):
+            start = SNAPSHOT.starts[seg]
+            end = SNAPSHOT.ends[seg]
+            kind = factSegmentKind(seg)
+
+            contents = None
+            if kind not in (SEG_BSS, SEG_EXTERN):
+                contents = readSegmentBytes(start, end)
+
+            SEGPERM_WRITE = 2
+            W.addSegment(idc.SegName(start), start, end, kind,
+                         (SNAPSHOT.perms[seg] & SEGPERM_WRITE) != 0, contents)
+
+    with PROFILE.phase("dump_heads"):
+        for seg in xrange(len(SNAPSHOT.starts)):
+            for head in idautils.Heads(SNAPSHOT.starts[seg], SNAPSHOT.ends[seg]):
+                pf = idc.GetFlags(head)
+                if not idc.isCode(pf) or idc.isData(pf):
+                    W.addItem(head, idc.ItemSize(head))
+                    continue
+
+                insn_t = idautils.DecodeInstruction(head)
+                if insn_t is None:
+                    continue
+
+                next_ea = head + insn_t.size
+                crefs = list(idautils.CodeRefsFrom(head, 0))
+                drefs = list(idautils.DataRefsFrom(head))
+                flow = next_ea in idautils.CodeRefsFrom(head, 1)
+
+                W.addInsn(head, insn_t.size, classifyInsn(insn_t.itype),
+                          crefs, drefs, (insn_t.auxpref & 0x1) == 0x1, flow)
+
+                if insn_t.itype in JMP_TABLE_BRANCHES:
+                    si = idaapi.get_switch_info_ex(head)
+                    if si:
+                        W.addJumpTable(head, si.jumps, si.get_jtable_element_size())
+
+    with PROFILE.phase("dump_names"):
+        for (ea, name) in idautils.Names():
+            W.addName(ea, name)
+
+        def imp_cb(ea, name, ordinal):
+            if name:
+                W.addImport(name)
+            return True
+
+        for i in xrange(idaapi.get_import_module_qty()):
+            idaapi.enum_import_names(i, imp_cb)
+
+        for (index, ordinal, ea, name) in idautils.Entries():
+            W.addExport(ea, name, exportTypeFromIda(name, ea))
+
+        for (ea, rtype, target) in idaFixups():
+            W.addFixup(ea, rtype, target)
+
+    with PROFILE.phase("serialization"):
+        W.write(fname)
+
+    sys.stdout.write("Saved facts to: {0}\n".format(fname))
+
 def getAllExports() :
     entrypoints = idautils.Entries()
     to_recover = set()
@@ -1066,13 +850,13 @@ if __name__ == "__main__":
 
     parser.add_argument("--entry-symbol", nargs='*', help="Symbol(s) to start disassembling from")
 
-    parser.add_argument("-o", "--output", type=argparse.FileType('wb'),
+    parser.add_argument("-o", "--output",
         default=None,
         help="The output control flow graph recovered from this file")
 
-    parser.add_argument("-s", "--std-defs", nargs='*', type=argparse.FileType('r'),
+    parser.add_argument("-s", "--std-defs", nargs='*',
         default=None,
-        help="std_defs file: definitions and calling conventions of imported functions and data"
+        help="std_defs file: definitions and calling conventions of imported functions and data. A compiled index is built and reused automatically"
         )
     
     parser.add_argument("-e", "--exports-to-lift", type=argparse.FileType('r'),
@@ -1085,17 +869,65 @@ if __name__ == "__main__":
         )
     parser.add_argument("--exports-are-apis", action="store_true",
         default=False,
-        help="Exported functions are defined in std_defs. Useful when lifting DLLs"
+        help="Exported functions are defined in std_defs. Useful when lifting DLLs. Without it, the type IDA gives an export is used before its std_defs entry"
         )
     parser.add_argument("-d", "--debug", action="store_true",
         default=False,
         help="Enable verbose debugging mode"
         )
+    parser.add_argument("--stream", action="store_true",
+        default=False,
+        help="Write the CFG as a stream of length-delimited records, one per function, data section and external. Use this for very large modules"
+        )
+    parser.add_argument("--code-image", action="store_true",
+        default=False,
+        help="Store the instruction bytes of each function once, in a code image its blocks point into, instead of in every instruction. Makes smaller CFGs that are faster to load"
+        )
+    parser.add_argument("--cfg-version", type=int, choices=CFG_VERSIONS,
+        default=1,
+        help="CFG schema version to write. Version 2 stores addresses as packed deltas from their block, which is smaller and faster to encode. cfg_convert.py converts between versions"
+        )
+    parser.add_argument("--shard", default=None,
+        help="K/N: lift only the K-th (counting from 0) of N partitions of the entry symbols. Used by bin_descend_wrapper.py -jobs"
+        )
+    parser.add_argument("--dump-facts", default=None,
+        help="Only dump segments, instructions, references, fixups and names to this file, for cfg_facts.py to build the CFG from outside of IDA"
+        )
+    parser.add_argument("--save-database", default=None,
+        help="Save the analyzed database to this path and exit without recovering a CFG"
+        )
+    parser.add_argument("--checkpoint-every", type=int,
+        default=0,
+        help="Save a checkpoint next to the output file after every N recovered functions"
+        )
+    parser.add_argument("--checkpoint-interval", type=int,
+        default=0,
+        help="Save a checkpoint next to the output file at most every N seconds"
+        )
+    parser.add_argument("--resume", action="store_true",
+        default=False,
+        help="Continue an interrupted recovery from its last checkpoint"
+        )
+    parser.add_argument("--stats", action="store_true",
+        default=False,
+        help="Report how many IDA API calls were answered from snapshots and caches"
+        )
+    parser.add_argument("--profile", default=None,
+        help="Write wall and CPU time, IDA API calls and peak memory per phase, and the slowest functions, to this JSON file"
+        )
                         
     args = parser.parse_args(args=idc.ARGV[1:])
 
     if args.debug:
         _DEBUG = True
+        cfg_common._DEBUG = True
+
+    CODE_IMAGE = args.code_image
+    CFG_VERSION = args.cfg_version
+
+    if args.profile:
+        PROFILE = cfg_profile.Profiler(idc.GetInputFile())
+        PROFILE.countCalls([idc, idaapi, idautils])
 
     # for batch mode: ensure IDA is done processing
     if args.batch:
@@ -1103,7 +935,28 @@ if __name__ == "__main__":
         analysis_flags &= ~idc.AF_IMMOFF
         # turn off "automatically make offset" heuristic
         idc.SetShortPrm(idc.INF_START_AF, analysis_flags)
-        idaapi.autoWait()
+        with PROFILE.phase("auto_analysis"):
+            idaapi.autoWait()
+
+    if args.save_database:
+        sys.stdout.write("Saving database to: {0}\n".format(args.save_database))
+        idc.SaveBase(args.save_database)
+        idc.Exit(0)
+
+    SNAPSHOT.load()
+
+    if args.dump_facts:
+        dumpFacts(args.dump_facts)
+        if args.profile:
+            PROFILE.write(args.profile, avoidedCalls())
+        idc.Exit(0)
+
+    shard = (0, 1)
+    if args.shard:
+        (shard_index, shard_count) = args.shard.split('/')
+        shard = (int(shard_index), int(shard_count))
+        if shard[0] < 0 or shard[0] >= shard[1]:
+            raise Exception("Invalid shard: {0}".format(args.shard))
 
     myname = idc.GetInputFile()
     mypath = path.dirname(__file__)
@@ -1112,14 +965,15 @@ if __name__ == "__main__":
     EMAP_DATA = {}
 
     if args.std_defs:
-        for defsfile in args.std_defs:
-            sys.stdout.write("Loading Standard Definitions file: {0}\n".format(defsfile.name))
-            em_update, emd_update = parseDefsFile(defsfile)
-            EMAP.update(em_update)
-            EMAP_DATA.update(emd_update)
+        defs = std_defs_index.loadDefs(args.std_defs, CALLING_CONVENTIONS)
+        EMAP = defs.functions
+        EMAP_DATA = defs.data
+
+    EXTERNAL_NAMES = IdaExternalNameIndex(EMAP, EMAP_DATA, SNAPSHOT.linked_elf)
+    EXTERNAL_NAMES.load()
 
     if args.output:
-        outpath = os.path.dirname(args.output.name)
+        outpath = os.path.dirname(args.output)
     else:
         outpath =  os.path.join(mypath, myname)
         try:
@@ -1163,14 +1017,31 @@ if __name__ == "__main__":
 
 
     if args.output:
-        outf = args.output
+        cfgpath = args.output
     else:
         cfgname = path.join(outpath, myname + "_ida.cfg")
         cfgpath = path.join(outpath, cfgname)
+
+    # a resumed streaming recovery appends to what was already written
+    if args.resume and args.stream and path.exists(cfgpath):
+        outf = open(cfgpath, 'r+b')
+    else:
         outf = open(cfgpath, 'wb')
 
+    checkpoint = None
+    if args.checkpoint_every or args.checkpoint_interval or args.resume:
+        checkpoint = Checkpointer(cfgpath + ".ckpt",
+            args.checkpoint_every, args.checkpoint_interval)
+
     sys.stdout.write("CFG Output File file: {0}\n".format(outf.name))
-    recoverCfg(eps, outf, args.exports_are_apis)
+    recoverCfg(eps, outf, args.exports_are_apis, args.stream, shard, checkpoint, args.resume)
+
+    if args.stats:
+        writeStats(sys.stdout)
+
+    if args.profile:
+        sys.stdout.write("Writing profile to: {0}\n".format(args.profile))
+        PROFILE.write(args.profile, avoidedCalls())
 
     #for batch mode: exit IDA when done
     if args.batch:
@@ -0,0 +1,192 @@
+##
+## Content-addressed cache of analyzed IDA databases.
+##
+## Auto-analysis dominates the time of a get_cfg.py run, and it is the same
+## every time a binary is lifted again with different entry symbols or
+## std_defs. Databases are stored under a key made from the SHA-256 of the
+## input, the IDA installation and the analysis flags. Least recently used
+## databases are evicted once the cache grows past its size limit.
+##
+## Several wrappers may share a cache. Reading, copying, inserting and
+## evicting databases, and updating the statistics, happen while holding
+## an exclusive lock on LOCK_FILE in the cache directory.
+##
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+from os.path import join, exists, getsize, getmtime
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+STATS_FILE = "stats.json"
+LOCK_FILE = "lock"
+
+def hashFile(fname):
+    h = hashlib.sha256()
+    f = open(fname, 'rb')
+    while True:
+        chunk = f.read(0x100000)
+        if not chunk:
+            break
+        h.update(chunk)
+    f.close()
+    return h.hexdigest()
+
+def idaIdentity(ida_exe):
+    # IDA has no version query usable outside of IDA; the path, size
+    # and modification time of the executable change with every install
+    if not exists(ida_exe):
+        return ida_exe
+    return "{0}:{1}:{2}".format(ida_exe, getsize(ida_exe), int(getmtime(ida_exe)))
+
+def replaceFile(src, dst):
+    # os.rename does not replace an existing file on Windows
+    try:
+        os.rename(src, dst)
+    except OSError:
+        if not exists(dst):
+            raise
+        os.remove(dst)
+        os.rename(src, dst)
+
+class CacheLock:
+    # an exclusive lock on the cache directory, released when the process
+    # holding it exits
+    def __init__(self, cache_dir):
+        self.fname = join(cache_dir, LOCK_FILE)
+        self.f = None
+
+    def __enter__(self):
+        self.f = open(self.fname, 'a+')
+        if fcntl is not None:
+            fcntl.flock(self.f.fileno(), fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    # LK_LOCK gives up after 10 seconds
+                    self.f.seek(0)
+                    msvcrt.locking(self.f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except IOError:
+                    pass
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self.f.fileno(), fcntl.LOCK_UN)
+        else:
+            self.f.seek(0)
+            msvcrt.locking(self.f.fileno(), msvcrt.LK_UNLCK, 1)
+        self.f.close()
+        self.f = None
+
+class IdbCache:
+    def __init__(self, cache_dir, max_size):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        if not exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+    def key(self, input_file, ida_exe, analysis_flags):
+        h = hashlib.sha256()
+        h.update(hashFile(input_file))
+        h.update(idaIdentity(ida_exe))
+        h.update(analysis_flags)
+        return h.hexdigest()
+
+    def path(self, key):
+        return join(self.cache_dir, key + ".idb")
+
+    def lock(self):
+        return CacheLock(self.cache_dir)
+
+    def fetch(self, key, dest):
+        # copies the cached database for key to dest. IDA writes to the
+        # database it opens, so it is never given the cached copy. returns
+        # False if key is not cached
+        with self.lock():
+            idb = self.path(key)
+            if not exists(idb):
+                self.record('misses')
+                return False
+
+            # mtime doubles as the last use time for eviction
+            os.utime(idb, None)
+            shutil.copyfile(idb, dest)
+            self.record('hits')
+            return True
+
+    def insert(self, key, idb):
+        # copies a freshly analyzed database into the cache
+        dest = self.path(key)
+        tmp = "{0}.{1}.tmp".format(dest, os.getpid())
+        shutil.copyfile(idb, tmp)
+
+        with self.lock():
+            replaceFile(tmp, dest)
+            self.evict()
+        return dest
+
+    def entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".idb"):
+                continue
+            fname = join(self.cache_dir, name)
+            entries.append( (getmtime(fname), getsize(fname), fname) )
+        return entries
+
+    def evict(self):
+        # called with the lock held
+        entries = sorted(self.entries())
+        total = sum([size for (mtime, size, fname) in entries])
+
+        # always keep the most recently used database
+        while total > self.max_size and len(entries) > 1:
+            (mtime, size, fname) = entries.pop(0)
+            sys.stdout.write("IDB cache: evicting {0}\n".format(fname))
+            os.remove(fname)
+            total -= size
+
+    def stats(self):
+        fname = join(self.cache_dir, STATS_FILE)
+        if not exists(fname):
+            return {'hits': 0, 'misses': 0}
+
+        f = open(fname, 'r')
+        stats = json.load(f)
+        f.close()
+        return stats
+
+    def record(self, what):
+        # called with the lock held. the new counts are written beside the
+        # old ones and renamed over them, so a reader never sees half a file
+        stats = self.stats()
+        stats[what] = stats.get(what, 0) + 1
+
+        fname = join(self.cache_dir, STATS_FILE)
+        tmp = "{0}.{1}.tmp".format(fname, os.getpid())
+        f = open(tmp, 'w')
+        json.dump(stats, f)
+        f.close()
+        replaceFile(tmp, fname)
+
+    def report(self, outf):
+        with self.lock():
+            stats = self.stats()
+            size = sum([size for (mtime, size, fname) in self.entries()])
+
+        total = stats['hits'] + stats['misses']
+        rate = 0.0
+        if total > 0:
+            rate = 100.0 * stats['hits'] / total
+
+        outf.write("IDB cache: {0} hits, {1} misses ({2:.1f}% hit rate), {3} bytes in {4}\n".format(
+            stats['hits'], stats['misses'], rate, size, self.cache_dir))
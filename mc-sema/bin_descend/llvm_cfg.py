@@ -0,0 +1,450 @@
+#!/usr/bin/env python
+##
+## Recover a CFG from an ELF or COFF object file without IDA.
+##
+## Sections, symbols and relocations are read with the LLVM Python
+## bindings (llvm.object) and instructions are decoded with
+## llvm.disassembler. The object is laid out and relocated the way IDA
+## loads it, and handed to cfg_builder, the recovery walk get_cfg.py
+## runs inside IDA. Recovery is less thorough than IDA's: only
+## references that carry a relocation or a direct branch are followed.
+##
+## Several inputs are recovered in parallel with -j:
+##
+##   llvm_cfg.py -s std_defs.txt -j 8 -o cfgs/ *.o
+##
+## The bindings need the LLVM shared library (built with
+## --enable-shared). They are looked up in MCSEMA_LLVM_PYTHON, then in
+## the llvm-3.2 tree next to mc-sema.
+##
+
+import os
+import sys
+import struct
+import argparse
+import traceback
+import multiprocessing
+from os import path
+
+try:
+    import llvm.object
+except ImportError:
+    sys.path.insert(0, os.getenv("MCSEMA_LLVM_PYTHON") or
+        path.join(path.dirname(path.abspath(__file__)), "..", "..", "llvm-3.2", "bindings", "python"))
+    import llvm.object
+
+import llvm.disassembler
+import cfg_common
+import std_defs_index
+from cfg_common import CALLING_CONVENTIONS, CFG_VERSIONS, ExternalNameIndex, \
+    INSN_OTHER, INSN_CALL, INSN_RET, INSN_COND_JMP, INSN_UCOND_JMP, INSN_TRAP, INSN_HLT
+from cfg_builder import Program, Segment, Insn, CfgBuilder, \
+    SEG_CODE, SEG_DATA, SEG_BSS, SEG_EXTERN, FIXUP_OFF32, FIXUP_REL32
+
+ELF_TRIPLE = "i386-pc-linux-gnu"
+COFF_TRIPLE = "i386-pc-win32"
+
+# relocatable objects have every section at address 0; sections are
+# laid out from here, aligned, with the extern segment after them
+LAYOUT_BASE = 0x1000
+LAYOUT_ALIGN = 0x10
+EXTERN_SLOT_SIZE = 4
+
+# the LLVM 3.2 C API has no section flags, so sections are classified
+# by name. Anything not listed (debug info, symbol and string tables,
+# relocations, notes, linker directives) is not loaded.
+CODE_SECTIONS = ('.text', '.init', '.fini', '.plt')
+BSS_SECTIONS = ('.bss', '.tbss', '.sbss')
+DATA_SECTIONS = ('.data', '.rodata', '.rdata', '.sdata', '.tdata', '.tls',
+    '.ctors', '.dtors', '.init_array', '.fini_array', '.got', '.CRT')
+READ_ONLY_SECTIONS = ('.rodata', '.rdata')
+
+ABSOLUTE_RELOCS = frozenset(['R_386_32', 'IMAGE_REL_I386_DIR32'])
+# stored as S + A - P
+ELF_PCREL_RELOCS = frozenset(['R_386_PC32', 'R_386_PLT32'])
+# stored as S + A - (P + 4)
+COFF_PCREL_RELOCS = frozenset(['IMAGE_REL_I386_REL32'])
+
+# longest x86 instruction
+MAX_INSN_SIZE = 15
+
+PREFIXES = frozenset([0x26, 0x2e, 0x36, 0x3e, 0x64, 0x65, 0x66, 0x67, 0xf0, 0xf2, 0xf3])
+
+# prefixes the disassembler prints as separate words
+PREFIX_MNEMONICS = frozenset(['lock', 'rep', 'repe', 'repne', 'repz', 'repnz',
+    'data16', 'data32', 'addr16', 'addr32'])
+
+def classifyMnemonic(m):
+    if m.startswith('call') or m.startswith('lcall'): return INSN_CALL
+    if m.startswith('ret') or m.startswith('lret') or m.startswith('iret'): return INSN_RET
+    if m.startswith('jmp') or m.startswith('ljmp'): return INSN_UCOND_JMP
+    if m.startswith('j') or m.startswith('loop'): return INSN_COND_JMP
+    if m in ('int3', 'int1', 'icebp'): return INSN_TRAP
+    if m == 'hlt': return INSN_HLT
+    return INSN_OTHER
+
+def splitAsm(text):
+    # (mnemonic, operands) of the disassembler's AT&T output
+    words = text.split()
+    while words and words[0] in PREFIX_MNEMONICS:
+        words = words[1:]
+    if not words:
+        return ('', '')
+    return (words[0], " ".join(words[1:]))
+
+def branchTarget(ea, inst_bytes):
+    # the target of a relative jump or call, or None for indirect ones
+    i = 0
+    opsize16 = False
+    while i < len(inst_bytes) and ord(inst_bytes[i]) in PREFIXES:
+        if ord(inst_bytes[i]) == 0x66:
+            opsize16 = True
+        i += 1
+
+    if i >= len(inst_bytes):
+        return None
+
+    op = ord(inst_bytes[i])
+    if op in (0xe8, 0xe9):
+        dsize = 2 if opsize16 else 4
+    elif op == 0xeb or 0x70 <= op <= 0x7f or 0xe0 <= op <= 0xe3:
+        dsize = 1
+    elif op == 0x0f and i+1 < len(inst_bytes) and 0x80 <= ord(inst_bytes[i+1]) <= 0x8f:
+        dsize = 2 if opsize16 else 4
+    else:
+        return None
+
+    fmt = {1: '<b', 2: '<h', 4: '<i'}[dsize]
+    disp = struct.unpack(fmt, inst_bytes[-dsize:])[0]
+    return (ea + len(inst_bytes) + disp) & 0xffffffff
+
+def sectionKind(name):
+    for (prefixes, kind) in ((CODE_SECTIONS, SEG_CODE),
+                             (BSS_SECTIONS, SEG_BSS),
+                             (DATA_SECTIONS, SEG_DATA)):
+        for prefix in prefixes:
+            if name == prefix or name.startswith(prefix + '.') or name.startswith(prefix + '$'):
+                return kind
+    return None
+
+def isReadOnly(name):
+    return sectionKind(name) == SEG_CODE or \
+        [p for p in READ_ONLY_SECTIONS if name.startswith(p)] != []
+
+def align(ea, alignment):
+    return (ea + alignment - 1) & ~(alignment - 1)
+
+class LlvmProgram(Program):
+    def __init__(self, fname, triple=None):
+        Program.__init__(self, path.basename(fname))
+
+        f = open(fname, 'rb')
+        magic = f.read(4)
+        f.close()
+
+        self.is_elf = magic == "\x7fELF"
+        if triple is None:
+            triple = ELF_TRIPLE if self.is_elf else COFF_TRIPLE
+
+        self.obj = llvm.object.ObjectFile(filename=fname)
+        self.disassembler = llvm.disassembler.Disassembler(triple)
+        self.insns = {}
+
+        # section table index -> (Segment, section address)
+        self.layout = {}
+        self.extern_slots = {}
+        self.warned = set()
+
+        self.loadSections()
+        self.loadSymbols()
+        self.loadRelocations()
+
+    def loadSections(self):
+        table = self.obj.section_table
+
+        sections = []
+        for section in table:
+            kind = sectionKind(section.name)
+            if kind is None or section.size == 0:
+                continue
+            sections.append( (section, kind) )
+
+        # a relocatable object has all of its sections at address 0
+        relocatable = len([s for (s, kind) in sections if s.address != 0]) == 0
+
+        next_ea = LAYOUT_BASE
+        for (section, kind) in sections:
+            if relocatable:
+                start = align(next_ea, LAYOUT_ALIGN)
+            else:
+                start = section.address
+            next_ea = max(next_ea, start + section.size)
+
+            # relocations are applied in place, to a private mapping of
+            # the file
+            contents = None
+            if kind != SEG_BSS:
+                contents = table.contents(section.index)
+
+            seg = Segment(section.name, start, start + section.size, kind,
+                          not isReadOnly(section.name), contents)
+            self.addSegment(seg)
+            self.layout[section.index] = (seg, section.address)
+
+        self.extern_start = align(next_ea, LAYOUT_ALIGN)
+
+    def externSlot(self, name):
+        try:
+            return self.extern_slots[name]
+        except KeyError:
+            ea = self.extern_start + len(self.extern_slots) * EXTERN_SLOT_SIZE
+            self.extern_slots[name] = ea
+            self.names[ea] = name
+            return ea
+
+    def symbolAddress(self, symbol):
+        # where a symbol table entry ends up in the layout, or None if it
+        # is absolute or its section was not loaded
+        if symbol.address == llvm.object.UNKNOWN_ADDRESS:
+            return self.externSlot(symbol.name)
+
+        placed = self.layout.get(symbol.section)
+        if placed is None:
+            return None
+
+        (seg, address) = placed
+        return seg.start + (symbol.address - address)
+
+    def loadSymbols(self):
+        table = self.obj.symbol_table
+        for i in xrange(table.defined):
+            symbol = table[i]
+            if not symbol.name:
+                continue
+
+            ea = self.symbolAddress(symbol)
+            if ea is None:
+                continue
+
+            self.symbols.setdefault(symbol.name, ea)
+            if ea not in self.names or self.names[ea].startswith('.'):
+                self.names[ea] = symbol.name
+
+    def warnOnce(self, msg):
+        if msg not in self.warned:
+            self.warned.add(msg)
+            sys.stderr.write("WARNING: {0}\n".format(msg))
+
+    def loadRelocations(self):
+        table = self.obj.relocation_table
+
+        fixups = []
+        for (index, (seg, address)) in sorted(self.layout.iteritems()):
+            if seg.contents is None:
+                continue
+
+            for i in table.in_section(index):
+                reloc = table[i]
+                fixup = self.applyRelocation(seg, seg.start + (reloc.address - address), reloc)
+                if fixup is not None:
+                    fixups.append(fixup)
+
+        self.fixups.load(sorted(fixups))
+
+        # the extern segment holds one slot per referenced undefined symbol
+        if self.extern_slots:
+            end = self.extern_start + len(self.extern_slots) * EXTERN_SLOT_SIZE
+            self.addSegment(Segment("extern", self.extern_start, end, SEG_EXTERN, False))
+
+    def applyRelocation(self, seg, ea, reloc):
+        # patch the section contents the way a loader would, and return
+        # the (ea, type, target) fixup
+        rtype = reloc.type_name
+        if rtype not in ABSOLUTE_RELOCS and rtype not in ELF_PCREL_RELOCS \
+                and rtype not in COFF_PCREL_RELOCS:
+            self.warnOnce("Ignoring {0} relocations".format(rtype))
+            return None
+
+        if reloc.symbol == -1:
+            return None
+
+        S = self.symbolAddress(self.obj.symbol_table[reloc.symbol])
+        if S is None:
+            return None
+
+        off = ea - seg.start
+        A = struct.unpack_from("<i", seg.contents, off)[0]
+        if S >= self.extern_start:
+            # references to externals are to the slot itself
+            A = 0 if rtype in ABSOLUTE_RELOCS or rtype in COFF_PCREL_RELOCS else -4
+
+        if rtype in ABSOLUTE_RELOCS:
+            value = (S + A) & 0xffffffff
+            target = value
+            fixup_type = FIXUP_OFF32
+        elif rtype in ELF_PCREL_RELOCS:
+            value = (S + A - ea) & 0xffffffff
+            target = (S + A + 4) & 0xffffffff
+            fixup_type = FIXUP_REL32
+        else:
+            value = (S + A - (ea + 4)) & 0xffffffff
+            target = (S + A) & 0xffffffff
+            fixup_type = FIXUP_REL32
+
+        struct.pack_into("<I", seg.contents, off, value)
+        return (ea, fixup_type, target)
+
+    def decode(self, ea):
+        try:
+            return self.insns[ea]
+        except KeyError:
+            insn = self.decodeInsn(ea)
+            self.insns[ea] = insn
+            return insn
+
+    def decodeInsn(self, ea):
+        seg = self.segment(ea)
+        if seg is None or seg.kind != SEG_CODE:
+            return None
+
+        buf = seg.read(ea, min(ea+MAX_INSN_SIZE, seg.end))
+        (size, text) = self.disassembler.get_instruction(buf, ea)
+        if size == 0:
+            return None
+
+        inst_bytes = buf[:size]
+        (mnemonic, operands) = splitAsm(text)
+        kind = classifyMnemonic(mnemonic)
+
+        crefs = []
+        drefs = []
+        jump_table = None
+
+        target = None
+        if kind in (INSN_CALL, INSN_UCOND_JMP, INSN_COND_JMP):
+            target = branchTarget(ea, inst_bytes)
+
+        if target is not None:
+            if self.segment(target) is not None:
+                crefs.append(target)
+            elif kind == INSN_COND_JMP:
+                self.warnOnce("Branch out of the image at {0:x}".format(ea))
+                kind = INSN_OTHER
+        else:
+            for fea in self.fixups.inRange(ea, ea+size):
+                if self.fixups.type(fea) != FIXUP_OFF32:
+                    continue
+                ref = self.fixups.target(fea)
+                if self.segment(ref) is None:
+                    continue
+
+                if kind in (INSN_CALL, INSN_UCOND_JMP) and self.segment(ref).kind == SEG_EXTERN:
+                    # call [__imp_name]
+                    crefs.append(ref)
+                elif kind == INSN_UCOND_JMP and '(,%' in operands and operands.endswith(',4)'):
+                    # jmp *table(,%reg,4)
+                    jump_table = ref
+                else:
+                    drefs.append(ref)
+
+        return Insn(ea, size, kind, inst_bytes, crefs, drefs, jump_table,
+                    lock=(inst_bytes[0] == "\xf0"))
+
+def defaultEntries(program):
+    # every named symbol in code, other than section symbols
+    return sorted([name for (name, ea) in program.symbols.iteritems()
+                   if not name.startswith('.') and not name.startswith('$')
+                   and program.segment(ea) is not None
+                   and program.segment(ea).kind == SEG_CODE])
+
+def recoverFile(task):
+    # runs in a pool worker; returns (input, output, error)
+    # options are passed on to CfgBuilder
+    (input_file, output_file, std_defs, entries, triple, options, debug) = task
+    try:
+        cfg_common._DEBUG = debug
+
+        emap = {}
+        emap_data = {}
+        if std_defs:
+            defs = std_defs_index.loadDefs(std_defs, CALLING_CONVENTIONS)
+            emap = defs.functions
+            emap_data = defs.data
+
+        program = LlvmProgram(input_file, triple)
+
+        names = ExternalNameIndex(emap, emap_data, program.linked_elf)
+        names.addNames(program.extern_slots.keys())
+
+        builder = CfgBuilder(program, names, **options)
+        M = builder.recover(entries or defaultEntries(program))
+        if M is None:
+            return (input_file, output_file, "no functions recovered")
+
+        outf = open(output_file, 'wb')
+        outf.write(M.SerializeToString())
+        outf.close()
+        return (input_file, output_file, None)
+    except Exception:
+        return (input_file, output_file, traceback.format_exc())
+
+def outputFor(input_file, output, many):
+    cfgname = path.splitext(path.basename(input_file))[0] + ".cfg"
+    if output is None:
+        return path.join(path.dirname(input_file), cfgname)
+    if many or path.isdir(output):
+        return path.join(output, cfgname)
+    return output
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("inputs", nargs='+',
+        help="ELF or COFF object files to recover")
+    parser.add_argument("-o", "--output", default=None,
+        help="The output CFG, or a directory for the CFGs of several inputs. Defaults to <input>.cfg")
+    parser.add_argument("-s", "--std-defs", nargs='*', default=None,
+        help="std_defs file: definitions and calling conventions of imported functions and data")
+    parser.add_argument("--entry-symbol", nargs='*', default=None,
+        help="Symbol(s) to start disassembling from. Defaults to every symbol in code")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+        help="Recover this many inputs at once")
+    parser.add_argument("--triple", default=None,
+        help="Disassembler target triple. Defaults to 32-bit x86 for the input's format")
+    parser.add_argument("--code-image", action="store_true", default=False,
+        help="Store the instruction bytes of each function once, in a code image its blocks point into")
+    parser.add_argument("--cfg-version", type=int, choices=CFG_VERSIONS, default=1,
+        help="CFG schema version to write")
+    parser.add_argument("-d", "--debug", action="store_true", default=False,
+        help="Enable verbose debugging mode")
+
+    args = parser.parse_args()
+
+    many = len(args.inputs) > 1
+    if many and args.output and not path.isdir(args.output):
+        os.makedirs(args.output)
+
+    options = {'code_image': args.code_image, 'cfg_version': args.cfg_version}
+    tasks = [(input_file, outputFor(input_file, args.output, many), args.std_defs,
+              args.entry_symbol, args.triple, options, args.debug)
+             for input_file in args.inputs]
+
+    if args.jobs > 1 and many:
+        pool = multiprocessing.Pool(args.jobs)
+        results = pool.imap_unordered(recoverFile, tasks)
+    else:
+        pool = None
+        results = (recoverFile(task) for task in tasks)
+
+    failed = 0
+    for (input_file, output_file, error) in results:
+        if error:
+            failed += 1
+            sys.stderr.write("Recovery of {0} failed: {1}\n".format(input_file, error))
+        else:
+            sys.stdout.write("Saved {0} to: {1}\n".format(input_file, output_file))
+
+    if pool:
+        pool.close()
+        pool.join()
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+##
+## Precompiled index of std_defs files.
+##
+## std_defs.txt is tens of thousands of lines, and used to be parsed line by
+## line on every run. compileDefs turns a defs file into a binary index that
+## is opened with mmap and searched in place:
+##
+##   header   MAGIC, version, record count, table offsets, and the size,
+##            mtime and SHA-1 of the source file
+##   records  fixed width, sorted by symbol name and then kind
+##   strtab   symbol names, referenced by (offset, length) from records
+##
+## An index is stored next to its source as <source>.idx, or in a per-user
+## cache directory if that is not writable. It is rebuilt when the source
+## changes. ExternalFuncMap.cpp reads the same format.
+##
+## A name may be defined both as a function and as DATA:, and is then
+## kept as both, just as the old parser kept separate function and data
+## tables. Several defs files are layered with loadDefs; later files
+## override earlier ones, one kind at a time, as repeated --std-defs
+## files always have.
+##
+
+import os
+import sys
+import mmap
+import struct
+import hashlib
+import tempfile
+import argparse
+
+MAGIC = "MCSDEFS\x00"
+VERSION = 2
+
+# magic, version, record count, records offset, strtab offset,
+# source size, source mtime, source SHA-1
+HEADER = struct.Struct("<8sIIIIQQ20s4x")
+
+# name offset, name length, kind, convention, noreturn, argc or data size
+RECORD = struct.Struct("<IHBBB3xi")
+
+KIND_FUNCTION = 0
+KIND_DATA = 1
+
+CONVENTIONS = "CEF"
+
+INDEX_SUFFIX = ".idx"
+
+def parseDefsLine(l):
+    # returns (name, kind, conv, noreturn, value) or None for comments
+    if not l.strip() or l[0] == "#":
+        return None
+
+    l = l.strip()
+
+    if l.startswith('DATA:'):
+        (marker, symname, dsize) = l.split()
+        return (symname, KIND_DATA, 0, 0, int(dsize))
+
+    (fname, args, conv, ret) = l.split()
+
+    if conv not in CONVENTIONS:
+        raise Exception("Unknown calling convention:"+conv)
+
+    if ret not in ['Y', 'N']:
+        raise Exception("Unknown return type:"+ret)
+
+    return (fname, KIND_FUNCTION, CONVENTIONS.index(conv), int(ret == 'Y'), int(args))
+
+def sourceIdentity(src):
+    st = os.stat(src)
+    return (st.st_size, int(st.st_mtime))
+
+def hashFile(fname):
+    f = open(fname, 'rb')
+    digest = hashlib.sha1(f.read()).digest()
+    f.close()
+    return digest
+
+def compileDefs(src, dst):
+    f = open(src, 'rb')
+    data = f.read()
+    f.close()
+
+    defs = {}
+    for l in data.splitlines():
+        rec = parseDefsLine(l)
+        if rec is not None:
+            # later definitions of the same kind win, as with the old 
+            # dict based parser
+            defs[(rec[0], rec[1])] = rec
+
+    strtab = []
+    records = []
+    offset = 0
+    for key in sorted(defs):
+        (name, kind, conv, noreturn, value) = defs[key]
+        records.append(RECORD.pack(offset, len(name), kind, conv, noreturn, value))
+        strtab.append(name)
+        offset += len(name)
+
+    (size, mtime) = sourceIdentity(src)
+    records_off = HEADER.size
+    strtab_off = records_off + len(records) * RECORD.size
+
+    # write and rename so a concurrent reader never maps half an index
+    tmp = "{0}.{1}.tmp".format(dst, os.getpid())
+    outf = open(tmp, 'wb')
+    outf.write(HEADER.pack(MAGIC, VERSION, len(records), records_off, strtab_off,
+        size, mtime, hashlib.sha1(data).digest()))
+    outf.write("".join(records))
+    outf.write("".join(strtab))
+    outf.close()
+
+    if os.path.exists(dst):
+        os.remove(dst)
+    os.rename(tmp, dst)
+
+def readHeader(fname):
+    f = open(fname, 'rb')
+    hdr = f.read(HEADER.size)
+    f.close()
+
+    if len(hdr) != HEADER.size:
+        return None
+
+    fields = HEADER.unpack(hdr)
+    if fields[0] != MAGIC or fields[1] != VERSION:
+        return None
+    return fields
+
+def isCurrent(src, idx):
+    # an index is current if it was built from a source with the same
+    # contents; the hash is only checked when size or mtime changed
+    if not os.path.exists(idx):
+        return False
+
+    hdr = readHeader(idx)
+    if hdr is None:
+        return False
+
+    (magic, version, count, records_off, strtab_off, size, mtime, digest) = hdr
+    if (size, mtime) == sourceIdentity(src):
+        return True
+
+    return digest == hashFile(src)
+
+def cachedIndexPath(src):
+    cache_dir = os.path.join(tempfile.gettempdir(), "mcsema_defs")
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    key = hashlib.sha1(os.path.abspath(src)).hexdigest()
+    return os.path.join(cache_dir, key + INDEX_SUFFIX)
+
+def indexFor(src):
+    # returns the path of an up to date index for src, building it if needed
+    if readHeader(src) is not None:
+        # already an index
+        return src
+
+    for idx in (src + INDEX_SUFFIX, cachedIndexPath(src)):
+        if isCurrent(src, idx):
+            return idx
+        try:
+            compileDefs(src, idx)
+            return idx
+        except (IOError, OSError):
+            continue
+
+    raise Exception("Cannot write an index for "+src)
+
+class DefsIndex:
+    def __init__(self, fname):
+        self.fname = fname
+        f = open(fname, 'rb')
+        self.m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        f.close()
+
+        hdr = HEADER.unpack_from(self.m, 0)
+        if hdr[0] != MAGIC or hdr[1] != VERSION:
+            raise Exception("Not a std_defs index: "+fname)
+
+        (magic, version, self.count, self.records_off, self.strtab_off,
+            size, mtime, digest) = hdr
+
+    def record(self, i):
+        return RECORD.unpack_from(self.m, self.records_off + i * RECORD.size)
+
+    def name(self, rec):
+        start = self.strtab_off + rec[0]
+        return self.m[start:start+rec[1]]
+
+    def find(self, name, kind):
+        # returns (kind, conv, noreturn, value) for name as kind, or None
+        key = (name, kind)
+        lo = 0
+        hi = self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            rec = self.record(mid)
+            cur = (self.name(rec), rec[2])
+            if cur < key:
+                lo = mid + 1
+            elif cur > key:
+                hi = mid
+            else:
+                return rec[2:]
+        return None
+
+    def __iter__(self):
+        for i in xrange(self.count):
+            rec = self.record(i)
+            yield self.name(rec), rec[2:]
+
+class DefsView:
+    # read-only mapping over the functions or the data of a DefsMap
+    def __init__(self, defs, kind):
+        self.defs = defs
+        self.kind = kind
+
+    def __contains__(self, name):
+        return self.defs.find(name, self.kind) is not None
+
+    def __getitem__(self, name):
+        v = self.defs.find(name, self.kind)
+        if v is None:
+            raise KeyError(name)
+        return v
+
+    def get(self, name, default=None):
+        v = self.defs.find(name, self.kind)
+        if v is None:
+            return default
+        return v
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        return [name for (name, kind) in self.defs.names() if kind == self.kind]
+
+    def __len__(self):
+        return len(self.keys())
+
+class DefsMap:
+    def __init__(self, conventions=None):
+        # conventions maps 'C', 'E' and 'F' to what callers expect to get back
+        self.conventions = conventions or dict([(c, c) for c in CONVENTIONS])
+        self.layers = []
+        self.memo = {}
+        self.functions = DefsView(self, KIND_FUNCTION)
+        self.data = DefsView(self, KIND_DATA)
+
+    def add(self, index):
+        self.layers.append(index)
+        self.memo = {}
+
+    def lookup(self, name, kind):
+        key = (name, kind)
+        if key in self.memo:
+            return self.memo[key]
+
+        found = None
+        for index in reversed(self.layers):
+            found = index.find(name, kind)
+            if found is not None:
+                break
+
+        self.memo[key] = found
+        return found
+
+    def find(self, name, kind):
+        found = self.lookup(name, kind)
+        if found is None:
+            return None
+
+        (kind, conv, noreturn, value) = found
+        if kind == KIND_DATA:
+            return value
+        return (value, self.conventions[CONVENTIONS[conv]], 'Y' if noreturn else 'N')
+
+    def names(self):
+        # (name, kind) of every visible symbol
+        seen = set()
+        for index in self.layers:
+            for (name, rec) in index:
+                seen.add((name, rec[0]))
+        return sorted(seen)
+
+def loadDefs(paths, conventions=None):
+    defs = DefsMap(conventions)
+    for src in paths:
+        sys.stdout.write("Loading Standard Definitions file: {0}\n".format(src))
+        defs.add(DefsIndex(indexFor(src)))
+    return defs
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-o", "--output",
+        help="Index to write; only valid with a single input. Defaults to <input>.idx")
+    parser.add_argument("inputs", nargs='+',
+        help="std_defs files to compile")
+
+    args = parser.parse_args()
+
+    if args.output and len(args.inputs) != 1:
+        sys.stderr.write("--output needs exactly one input\n")
+        sys.exit(1)
+
+    for src in args.inputs:
+        dst = args.output or src + INDEX_SUFFIX
+        compileDefs(src, dst)
+        sys.stdout.write("Compiled {0} into {1}\n".format(src, dst))
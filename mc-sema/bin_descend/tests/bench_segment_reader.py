@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+##
+## Time get_cfg.py's segment reader on a synthetic 64 MB segment, outside
+## of IDA. The segment is 16 MB of initialized data, 16 MB where only the
+## first 4 KB of every 64 KB has a value, and 32 MB of .bss. It is read
+## with get_many_bytes_ex value masks and without them, and the per-byte
+## reader get_cfg.py used before is timed on a 1 MB sample of the same
+## layout. Inside IDA each API call costs far more than it does here, so
+## the call counts matter as much as the times.
+##
+## usage: python bench_segment_reader.py [MB]
+##
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import fake_ida
+
+MB = 1 << 20
+BASE = 0x10000000
+
+def layout(size):
+    # (start, end) offsets of the initialized runs
+    quarter = size / 4
+    runs = [(0, quarter)]
+    for off in xrange(quarter, 2*quarter, 64*1024):
+        runs.append( (off, min(off+4096, 2*quarter)) )
+    return runs
+
+def readBytesSlowly(idc, start, end):
+    # the reader get_cfg.py used before
+    bytestr = ""
+    for i in xrange(start, end):
+        if idc.hasValue(idc.GetFlags(i)):
+            bt = idc.Byte(i)
+            bytestr += chr(bt)
+        else:
+            bytestr += "\x00"
+    return bytestr
+
+def bench(size, read):
+    start = time.time()
+    data = read()
+    seconds = time.time() - start
+    assert len(data) == size
+    return seconds
+
+def main():
+    size = int(sys.argv[1]) * MB if len(sys.argv) > 1 else 64 * MB
+    runs = layout(size)
+
+    sys.stdout.write("{0:<22} {1:>8} {2:>10} {3:>12}\n".format(
+        "reader", "MB", "seconds", "IDA calls"))
+
+    for masks in (True, False):
+        db = fake_ida.FakeDatabase(BASE, size, runs)
+        get_cfg = fake_ida.install(db)
+        fake_ida.useMasks(get_cfg, db, masks)
+
+        seconds = bench(size, lambda: get_cfg.readSegmentBytes(BASE, BASE+size))
+        name = "chunked, masks" if masks else "chunked, no masks"
+        sys.stdout.write("{0:<22} {1:>8} {2:>10.3f} {3:>12}\n".format(
+            name, size/MB, seconds, sum(db.calls.values())))
+
+    # the old reader on a 1 MB sample; it is linear in calls and
+    # quadratic in string building, so the sample understates it
+    sample = MB
+    db = fake_ida.FakeDatabase(BASE, sample, layout(sample))
+    get_cfg = fake_ida.install(db)
+    seconds = bench(sample, lambda: readBytesSlowly(get_cfg.idc, BASE, BASE+sample))
+    sys.stdout.write("{0:<22} {1:>8} {2:>10.3f} {3:>12}\n".format(
+        "per byte (old)", sample/MB, seconds, sum(db.calls.values())))
+
+if __name__ == "__main__":
+    main()
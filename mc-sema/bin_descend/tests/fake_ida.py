@@ -0,0 +1,133 @@
+##
+## Just enough of idaapi, idc and idautils to import get_cfg.py outside of
+## IDA and run its byte reading against a synthetic database. The
+## database is one segment whose initialized bytes are given as runs.
+## Every call is counted, since inside IDA the number of API calls is
+## what reading costs.
+##
+
+import sys
+import bisect
+import collections
+
+BADADDR = 0xFFFFFFFF
+FF_IVL = 0x100
+
+class FakeDatabase:
+    def __init__(self, base, size, runs, fill='\x5a'):
+        # runs: sorted, disjoint (start, end) offsets of initialized bytes
+        self.base = base
+        self.size = size
+        self.starts = [base+s for (s, e) in runs]
+        self.ends = [base+e for (s, e) in runs]
+        self.fill = fill
+        self.calls = collections.Counter()
+
+    def run(self, ea):
+        # index of the run holding ea, or None
+        i = bisect.bisect_right(self.starts, ea) - 1
+        if i >= 0 and ea < self.ends[i]:
+            return i
+        return None
+
+    def valued(self, ea, size):
+        i = self.run(ea)
+        return i is not None and ea+size <= self.ends[i]
+
+    def data(self, size):
+        return self.fill * size
+
+    def get_many_bytes(self, ea, size):
+        self.calls['get_many_bytes'] += 1
+        if size <= 0 or not self.valued(ea, size):
+            return None
+        return self.data(size)
+
+    def get_many_bytes_ex(self, ea, size):
+        self.calls['get_many_bytes_ex'] += 1
+        mask = bytearray((size+7)/8)
+        data = bytearray(size)
+        i = max(bisect.bisect_right(self.starts, ea) - 1, 0)
+        while i < len(self.starts) and self.starts[i] < ea+size:
+            s = max(self.starts[i], ea) - ea
+            e = min(self.ends[i], ea+size) - ea
+            if s < e:
+                data[s:e] = self.data(e-s)
+                for off in range(s, min(e, (s+7)/8*8)):
+                    mask[off/8] |= 1 << (off%8)
+                if (s+7)/8 < e/8:
+                    mask[(s+7)/8:e/8] = '\xff' * (e/8 - (s+7)/8)
+                for off in range(max(s, e/8*8), e):
+                    mask[off/8] |= 1 << (off%8)
+            i += 1
+        return (str(data), str(mask))
+
+    def GetFlags(self, ea):
+        self.calls['GetFlags'] += 1
+        if self.run(ea) is not None:
+            return FF_IVL
+        return 0
+
+    def Byte(self, ea):
+        self.calls['Byte'] += 1
+        if self.run(ea) is not None:
+            return ord(self.fill)
+        return 0xFF
+
+    def nextthat(self, ea, maxea, testf):
+        # IDA walks the flags in C; only hasValue is supported here
+        self.calls['nextthat'] += 1
+        i = bisect.bisect_right(self.starts, ea)
+        if ea+1 >= maxea:
+            return BADADDR
+        if self.run(ea+1) is not None:
+            return ea+1
+        if i < len(self.starts) and self.starts[i] < maxea:
+            return self.starts[i]
+        return BADADDR
+
+def hasValue(flags):
+    return (flags & FF_IVL) != 0
+
+class FakeModule(object):
+    # any constant not defined, such as idaapi.NN_jmp, is a distinct int
+    def __init__(self, name, **attrs):
+        self.__name__ = name
+        self.__dict__.update(attrs)
+        self.next_const = 0x10000
+
+    def __getattr__(self, name):
+        if not (name.startswith('NN_') or name.isupper()):
+            raise AttributeError(name)
+        self.next_const += 1
+        setattr(self, name, self.next_const)
+        return self.next_const
+
+def install(db):
+    # make db the database get_cfg.py sees; returns the get_cfg module
+    idaapi = FakeModule('idaapi',
+        get_many_bytes=db.get_many_bytes,
+        nextthat=db.nextthat,
+        hasValue=hasValue)
+    idc = FakeModule('idc',
+        BADADDR=BADADDR,
+        GetFlags=db.GetFlags,
+        Byte=db.Byte,
+        hasValue=hasValue)
+    idautils = FakeModule('idautils')
+
+    sys.modules['idaapi'] = idaapi
+    sys.modules['idc'] = idc
+    sys.modules['idautils'] = idautils
+
+    import get_cfg
+    get_cfg.idaapi = idaapi
+    get_cfg.idc = idc
+    return get_cfg
+
+def useMasks(get_cfg, db, enabled):
+    # IDA builds before get_many_bytes_ex have no value masks
+    if enabled:
+        get_cfg.idaapi.get_many_bytes_ex = db.get_many_bytes_ex
+    elif 'get_many_bytes_ex' in get_cfg.idaapi.__dict__:
+        del get_cfg.idaapi.get_many_bytes_ex
@@ -0,0 +1,136 @@
+import struct
+import unittest
+
+import CFG_pb2
+import cfg_merge
+from cfg_common import ExternalNameIndex, INSN_CALL, INSN_RET
+from cfg_builder import Program, Segment, Insn, CfgBuilder, dealFunctions, \
+    SEG_CODE, SEG_DATA, FIXUP_OFF32, FIXUP_REL32
+
+TEXT = 0x401000
+DATA = 0x402000
+NOWHERE = 0x900000
+
+class PointerProgram(Program):
+    # a data segment of three pointers, each with a fixup
+    def __init__(self, fixups):
+        Program.__init__(self, "pointers.exe")
+        contents = struct.pack("<LLL", TEXT, DATA+8, NOWHERE)
+        self.addSegment(Segment(".text", TEXT, TEXT+0x100, SEG_CODE, False, "\xc3" * 0x100))
+        self.addSegment(Segment(".data", DATA, DATA+len(contents), SEG_DATA, True, contents))
+        self.fixups.load(fixups)
+
+    def decode(self, ea):
+        return None
+
+class TestDataRelocations(unittest.TestCase):
+    def symbols(self, fixups):
+        builder = CfgBuilder(PointerProgram(fixups), ExternalNameIndex())
+        M = CFG_pb2.Module()
+        new_eas = set()
+        builder.processDataSegments(M, new_eas)
+        self.assertEqual(len(M.internal_data), 1)
+        return [(DS.base_address, DS.symbol_name) for DS in M.internal_data[0].symbols], new_eas
+
+    def test_off32_target_is_read_in_place(self):
+        # the fixup table's target is not used for OFF32 fixups
+        symbols, new_eas = self.symbols([(DATA, FIXUP_OFF32, 0), (DATA+4, FIXUP_OFF32, 0)])
+        self.assertEqual(symbols, [(DATA, "sub_0x401000"), (DATA+4, "dta_0x402008")])
+        self.assertEqual(new_eas, set([TEXT]))
+
+    def test_other_fixups_use_their_target(self):
+        symbols, new_eas = self.symbols([(DATA, FIXUP_REL32, TEXT+0x10)])
+        self.assertEqual(symbols, [(DATA, "sub_0x401010")])
+        self.assertEqual(new_eas, set([TEXT+0x10]))
+
+    def test_targets_outside_segments_are_skipped(self):
+        symbols, new_eas = self.symbols([(DATA+8, FIXUP_OFF32, 0)])
+        self.assertEqual(symbols, [])
+
+class TypedProgram(PointerProgram):
+    # IDA typed 'typed' as a cdecl function of one argument
+    def __init__(self):
+        PointerProgram.__init__(self, [])
+
+    def entryType(self, name, ea):
+        if name == 'typed':
+            return (1, CFG_pb2.ExternalFunction.CallerCleanup, 'N')
+        return None
+
+class TestEntryTypes(unittest.TestCase):
+    EMAP = {'typed': (2, CFG_pb2.ExternalFunction.CalleeCleanup, 'N'),
+            'untyped': (3, CFG_pb2.ExternalFunction.FastCall, 'Y')}
+
+    def entry(self, name, exports_are_apis):
+        names = ExternalNameIndex(dict(self.EMAP))
+        builder = CfgBuilder(TypedProgram(), names, exports_are_apis=exports_are_apis)
+        M = CFG_pb2.Module()
+        builder.entryPointHandler(M, TEXT, name)
+        E = M.entries[0].entry_extra
+        return (E.entry_argc, E.entry_cconv, E.does_return)
+
+    def test_program_type_comes_first(self):
+        self.assertEqual(self.entry('typed', False),
+                         (1, CFG_pb2.ExternalFunction.CallerCleanup, True))
+
+    def test_std_defs_when_program_has_no_type(self):
+        self.assertEqual(self.entry('untyped', False),
+                         (3, CFG_pb2.ExternalFunction.FastCall, False))
+
+    def test_exports_are_apis_prefers_std_defs(self):
+        self.assertEqual(self.entry('typed', True),
+                         (2, CFG_pb2.ExternalFunction.CalleeCleanup, True))
+
+class CallProgram(Program):
+    # functions at TEXT+0x10*n that call the functions listed for them,
+    # and a data pointer to one more
+    CALLS = {0: [2, 3], 1: [3, 4], 2: [5], 3: [], 4: [5], 5: [], 6: [2]}
+
+    def __init__(self):
+        Program.__init__(self, "calls.exe")
+        contents = struct.pack("<L", TEXT+0x60)
+        self.addSegment(Segment(".text", TEXT, TEXT+0x100, SEG_CODE, False, "\x90" * 0x100))
+        self.addSegment(Segment(".data", DATA, DATA+len(contents), SEG_DATA, True, contents))
+        self.fixups.load([(DATA, FIXUP_OFF32, 0)])
+        self.symbols = {'a': TEXT, 'b': TEXT+0x10}
+
+    def decode(self, ea):
+        (n, off) = divmod(ea-TEXT, 0x10)
+        calls = self.CALLS.get(n, [])
+        if off < 5*len(calls) and off % 5 == 0:
+            return Insn(ea, 5, INSN_CALL, "\xe8\x00\x00\x00\x00",
+                        crefs=[TEXT+0x10*calls[off/5]])
+        if off == 5*len(calls):
+            return Insn(ea, 1, INSN_RET, "\xc3")
+        return None
+
+class TestFunctionShards(unittest.TestCase):
+    def test_discover_finds_every_function(self):
+        builder = CfgBuilder(CallProgram(), ExternalNameIndex())
+        functions = builder.discover(['a', 'b'])
+        self.assertEqual([ea for (ea, size) in functions],
+                         [TEXT+0x10*n for n in xrange(7)])
+        self.assertEqual(functions[0], (TEXT, 3))
+
+    def test_deal_balances_sizes(self):
+        shards = dealFunctions([(1, 10), (2, 1), (3, 6), (4, 5), (5, 1)], 2)
+        self.assertEqual(shards, [[1, 2, 5], [3, 4]])
+
+    def test_shards_merge_to_serial_cfg(self):
+        serial = CfgBuilder(CallProgram(), ExternalNameIndex()).recover(['a', 'b'])
+
+        discovered = CfgBuilder(CallProgram(), ExternalNameIndex()).discover(['a', 'b'])
+        for jobs in (2, 3, 7):
+            functions = dealFunctions(discovered, jobs)
+            parts = [CfgBuilder(CallProgram(), ExternalNameIndex()).recover(
+                        ['a', 'b'], (k, jobs), functions=functions)
+                     for k in xrange(jobs)]
+            self.assertEqual(sorted([len(M.internal_funcs) for M in parts]),
+                             sorted([len(eas) for eas in functions]))
+
+            M = cfg_merge.mergeModules(parts)
+            self.assertEqual(M.internal_funcs, serial.internal_funcs)
+            self.assertEqual(M.entries, serial.entries)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+import cfg_profile
+
+def profile(peak):
+    return {
+        'runs': 1,
+        'inputs': ["a.exe"],
+        'memory_source': "tracemalloc" if peak is not None else None,
+        'phase_order': ["recover"],
+        'phases': {"recover": {'wall': 1.0, 'cpu': 1.0, 'calls': 3,
+                               'count': 1, 'peak_memory': peak}},
+        'ida_calls': {},
+        'avoided_calls': {},
+        'functions': {'count': 1, 'total': 1.0, 'slowest': []},
+    }
+
+class TestPeakMemory(unittest.TestCase):
+    def test_max_memory(self):
+        self.assertEqual(cfg_profile.maxMemory(None, None), None)
+        self.assertEqual(cfg_profile.maxMemory(None, 10), 10)
+        self.assertEqual(cfg_profile.maxMemory(10, None), 10)
+        self.assertEqual(cfg_profile.maxMemory(10, 20), 20)
+
+    def test_snapshot_first_measurement(self):
+        prof = cfg_profile.Profiler("a.exe")
+        p = {'peak_memory': None}
+        prof.snapshotMemory(p)
+
+        if cfg_profile.tracemalloc is None and cfg_profile.resource is None:
+            self.assertEqual(p['peak_memory'], None)
+        else:
+            self.assertTrue(p['peak_memory'] >= 0)
+
+    def test_aggregate_unmeasured(self):
+        out = cfg_profile.aggregate([profile(None), profile(100), profile(None)])
+        self.assertEqual(out['phases']["recover"]['peak_memory'], 100)
+
+        out = cfg_profile.aggregate([profile(None)])
+        self.assertEqual(out['phases']["recover"]['peak_memory'], None)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+from StringIO import StringIO
+
+import CFG_pb2
+import cfg_stream
+
+def module():
+    M = CFG_pb2.Module()
+    M.module_name = "stream.exe"
+    for ea in (0x401000, 0x401010):
+        F = M.internal_funcs.add()
+        F.entry_address = ea
+        B = F.blocks.add()
+        B.base_address = ea
+        I = B.insts.add()
+        I.inst_bytes = "\xc3"
+        I.inst_addr = ea
+        I.inst_len = 1
+    D = M.internal_data.add()
+    D.base_address = 0x402000
+    D.data = "\x00" * 8
+    D.read_only = False
+    X = M.external_funcs.add()
+    X.symbol_name = "ExitProcess"
+    X.calling_convention = CFG_pb2.ExternalFunction.CalleeCleanup
+    X.has_return = False
+    X.no_return = True
+    X.argument_count = 1
+    Y = M.external_data.add()
+    Y.symbol_name = "_environ"
+    Y.data_size = 4
+    E = M.entries.add()
+    E.entry_name = "start"
+    E.entry_address = 0x401000
+    return M
+
+def stream(M, version=1):
+    out = StringIO()
+    W = cfg_stream.StreamWriter(out, M.module_name, version=version)
+    W.flush(M)
+    return out.getvalue()
+
+class TestVarint(unittest.TestCase):
+    def test_round_trip(self):
+        for n in (0, 1, 0x7f, 0x80, 0x3fff, 0x4000, 2**31, 2**63-1):
+            data = cfg_stream.encodeVarint(n)
+            self.assertEqual(cfg_stream.readVarint(StringIO(data)), n)
+
+    def test_end_of_stream(self):
+        self.assertEqual(cfg_stream.readVarint(StringIO("")), None)
+
+    def test_truncated(self):
+        data = cfg_stream.encodeVarint(0x4000)[:-1]
+        self.assertRaises(Exception, cfg_stream.readVarint, StringIO(data))
+
+class TestStream(unittest.TestCase):
+    def test_round_trip(self):
+        data = stream(module())
+        f = StringIO(data)
+        self.assertTrue(cfg_stream.isStream(f))
+        self.assertEqual(f.tell(), 0)
+        self.assertEqual(cfg_stream.readModule(f), module())
+
+    def test_flush_empties_module(self):
+        M = module()
+        stream(M)
+        self.assertEqual(len(M.internal_funcs), 0)
+        self.assertEqual(len(M.entries), 0)
+        self.assertEqual(M.module_name, "stream.exe")
+
+    def test_records_in_order(self):
+        kinds = [kind for (kind, msg) in cfg_stream.iterRecords(StringIO(stream(module())))]
+        self.assertEqual(kinds, ['H', 'F', 'F', 'D', 'X', 'Y', 'E'])
+
+    def test_appended_records(self):
+        out = StringIO()
+        cfg_stream.StreamWriter(out, "stream.exe").flush(module())
+        cfg_stream.StreamWriter(out, "stream.exe", header=False).flush(module())
+        M = cfg_stream.readModule(StringIO(out.getvalue()))
+        self.assertEqual(len(M.internal_funcs), 4)
+
+    def test_version_in_header(self):
+        M = cfg_stream.readModule(StringIO(stream(module(), version=2)))
+        self.assertEqual(M.cfg_version, 2)
+        M = cfg_stream.readModule(StringIO(stream(module())))
+        self.assertFalse(M.HasField('cfg_version'))
+
+    def test_single_message(self):
+        f = StringIO(module().SerializeToString())
+        self.assertFalse(cfg_stream.isStream(f))
+        self.assertEqual(cfg_stream.readModule(f), module())
+        self.assertRaises(Exception, list, cfg_stream.iterRecords(StringIO(module().SerializeToString())))
+
+    def test_truncated_record(self):
+        data = stream(module())
+        for cut in (1, 3, 10):
+            f = StringIO(data[:-cut])
+            self.assertRaises(Exception, cfg_stream.readModule, f)
+
+    def test_missing_length(self):
+        data = stream(module()) + 'F'
+        self.assertRaises(Exception, cfg_stream.readModule, StringIO(data))
+
+    def test_unknown_kind(self):
+        data = stream(module()) + 'Q' + cfg_stream.encodeVarint(0)
+        self.assertRaises(Exception, cfg_stream.readModule, StringIO(data))
+
+class TestSortModule(unittest.TestCase):
+    def test_canonical_bytes(self):
+        M = module()
+        N = module()
+        N.internal_funcs.sort(key=lambda F: -F.entry_address)
+        self.assertNotEqual(M.SerializeToString(), N.SerializeToString())
+        cfg_stream.sortModule(M)
+        cfg_stream.sortModule(N)
+        self.assertEqual(M.SerializeToString(), N.SerializeToString())
+
+if __name__ == '__main__':
+    unittest.main()
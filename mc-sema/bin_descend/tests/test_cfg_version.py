@@ -0,0 +1,149 @@
+import os
+import shutil
+import tempfile
+import unittest
+from StringIO import StringIO
+
+import CFG_pb2
+import cfg_convert
+import cfg_stream
+from cfg_common import packFunction, unpackFunction, moduleVersion
+
+BASE = 0x401000
+
+def function():
+    # targets before and after the block, and at the block itself
+    F = CFG_pb2.Function()
+    F.entry_address = BASE
+    B = F.blocks.add()
+    B.base_address = BASE
+    B.block_follows.extend([BASE-0x100, BASE+0x20, BASE])
+
+    I = B.insts.add()
+    I.inst_addr = BASE
+    I.inst_bytes = "\x74\x00"
+    I.inst_len = 2
+    I.true_target = BASE-0x400000
+    I.false_target = BASE+2
+
+    I = B.insts.add()
+    I.inst_addr = BASE+2
+    I.inst_bytes = "\xe8\x00\x00\x00\x00"
+    I.inst_len = 5
+    I.call_target = BASE-1
+
+    I = B.insts.add()
+    I.inst_addr = BASE+7
+    I.inst_bytes = "\xff\x24\x85\x00\x00\x00\x00"
+    I.inst_len = 7
+    I.jump_table.zero_offset = 0
+    I.jump_table.table_entries.extend([BASE+0x10, BASE-0x10, BASE])
+
+    # no follows or targets at all
+    E = F.blocks.add()
+    E.base_address = BASE+0x20
+    return F
+
+class TestPackFunction(unittest.TestCase):
+    def test_deltas(self):
+        F = function()
+        packFunction(F)
+        B = F.blocks[0]
+
+        self.assertEqual(list(B.follow_deltas), [-0x100, 0x20, 0])
+        self.assertEqual(len(B.block_follows), 0)
+        self.assertEqual(B.insts[0].true_delta, -0x400000)
+        self.assertEqual(B.insts[0].false_delta, 2)
+        self.assertFalse(B.insts[0].HasField('true_target'))
+        self.assertEqual(B.insts[1].call_delta, -1)
+        self.assertEqual(list(B.insts[2].jump_table.entry_deltas), [0x10, -0x10, 0])
+        self.assertEqual(len(B.insts[2].jump_table.table_entries), 0)
+        self.assertEqual(F.blocks[1], function().blocks[1])
+
+    def test_round_trip(self):
+        F = function()
+        packFunction(F)
+        unpackFunction(F)
+        self.assertEqual(F, function())
+
+    def test_round_trip_through_bytes(self):
+        F = function()
+        packFunction(F)
+        G = CFG_pb2.Function()
+        G.ParseFromString(F.SerializeToString())
+        unpackFunction(G)
+        self.assertEqual(G, function())
+
+class TestConvert(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def module(self):
+        M = CFG_pb2.Module()
+        M.module_name = "convert.exe"
+        M.internal_funcs.add().CopyFrom(function())
+        return M
+
+    def write(self, name, data):
+        fname = os.path.join(self.dir, name)
+        f = open(fname, 'wb')
+        f.write(data)
+        f.close()
+        return fname
+
+    def read(self, fname):
+        f = open(fname, 'rb')
+        try:
+            return cfg_stream.readModule(f)
+        finally:
+            f.close()
+
+    def convert(self, fname, version):
+        out = fname + ".v{0}".format(version)
+        cfg_convert.convertFile(fname, out, version)
+        return out
+
+    def test_single_message(self):
+        v1 = self.write("m.cfg", self.module().SerializeToString())
+        v2 = self.convert(v1, 2)
+
+        M = self.read(v2)
+        self.assertEqual(moduleVersion(M), 2)
+        self.assertEqual(list(M.internal_funcs[0].blocks[0].follow_deltas), [-0x100, 0x20, 0])
+
+        self.assertEqual(self.read(self.convert(v2, 1)), self.module())
+
+    def test_stream(self):
+        out = StringIO()
+        cfg_stream.StreamWriter(out, "convert.exe").flush(self.module())
+        v1 = self.write("s.cfg", out.getvalue())
+
+        v2 = self.convert(v1, 2)
+        f = open(v2, 'rb')
+        self.assertTrue(cfg_stream.isStream(f))
+        f.close()
+        self.assertEqual(moduleVersion(self.read(v2)), 2)
+
+        self.assertEqual(self.read(self.convert(v2, 1)), self.module())
+
+    def test_same_version(self):
+        v1 = self.write("m.cfg", self.module().SerializeToString())
+        self.assertEqual(self.read(self.convert(v1, 1)), self.module())
+
+    def test_unknown_version(self):
+        M = self.module()
+        M.cfg_version = 3
+        v3 = self.write("m.cfg", M.SerializeToString())
+        self.assertRaises(Exception, self.convert, v3, 1)
+
+    def test_stream_without_header(self):
+        out = StringIO()
+        cfg_stream.StreamWriter(out, "convert.exe", header=False).flush(self.module())
+        bad = self.write("s.cfg", cfg_stream.MAGIC + out.getvalue())
+        self.assertRaises(Exception, self.convert, bad, 2)
+
+if __name__ == '__main__':
+    unittest.main()
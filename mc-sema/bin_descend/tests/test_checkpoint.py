@@ -0,0 +1,104 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import fake_ida
+import cfg_stream
+from cfg_common import ExternalNameIndex
+from cfg_builder import CfgBuilder
+from test_cfg_builder import CallProgram
+
+get_cfg = fake_ida.install(fake_ida.FakeDatabase(0x400000, 0x10, []))
+
+class Interrupted(Exception):
+    pass
+
+class InterruptedCheckpointer(get_cfg.Checkpointer):
+    # stops recovery right after the stop-th checkpoint is saved
+    def __init__(self, path, every, stop):
+        get_cfg.Checkpointer.__init__(self, path, every)
+        self.stop = stop
+        self.saved = 0
+
+    def save(self, state):
+        get_cfg.Checkpointer.save(self, state)
+        self.saved += 1
+        if self.saved == self.stop:
+            raise Interrupted()
+
+class TestCheckpointer(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "out.cfg.ckpt")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_due_every(self):
+        C = get_cfg.Checkpointer(self.path, every=3)
+        self.assertEqual([C.due() for i in xrange(7)],
+                         [False, False, True, False, False, True, False])
+
+    def test_due_interval(self):
+        C = get_cfg.Checkpointer(self.path, interval=60)
+        self.assertFalse(C.due())
+        C.last -= 61
+        self.assertTrue(C.due())
+
+    def test_save_load_remove(self):
+        C = get_cfg.Checkpointer(self.path)
+        self.assertEqual(C.load(), None)
+
+        C.save({'recovered_eas': [1, 2]})
+        C.save({'recovered_eas': [1, 2, 3]})
+        self.assertEqual(get_cfg.Checkpointer(self.path).load(), {'recovered_eas': [1, 2, 3]})
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+        C.remove()
+        self.assertFalse(os.path.exists(self.path))
+        C.remove()
+
+    def recover(self, checkpoint=None, resume=False, stream=None):
+        builder = CfgBuilder(CallProgram(), ExternalNameIndex())
+        return builder.recover(['a', 'b'], stream=stream, checkpoint=checkpoint, resume=resume)
+
+    def test_resume_matches_uninterrupted(self):
+        whole = self.recover()
+
+        # interrupted among the entries, and among the subfunctions
+        for stop in (1, 4):
+            C = InterruptedCheckpointer(self.path, 1, stop)
+            self.assertRaises(Interrupted, self.recover, C)
+
+            M = self.recover(get_cfg.Checkpointer(self.path, 1), resume=True)
+            self.assertEqual(M, whole)
+
+    def test_resume_without_checkpoint(self):
+        M = self.recover(get_cfg.Checkpointer(self.path, 1), resume=True)
+        self.assertEqual(M, self.recover())
+
+    def test_resume_stream(self):
+        whole = open(os.path.join(self.dir, "whole.cfg"), 'w+b')
+        self.recover(stream=whole)
+        whole.seek(0)
+        expected = cfg_stream.readModule(whole)
+        whole.close()
+
+        out = open(os.path.join(self.dir, "out.cfg"), 'w+b')
+        C = InterruptedCheckpointer(self.path, 1, 3)
+        self.assertRaises(Interrupted, self.recover, C, False, out)
+        # records written after the checkpoint are dropped on resume
+        out.write("F" + "\xff" * 8)
+
+        self.recover(get_cfg.Checkpointer(self.path, 1), True, out)
+        out.seek(0)
+        M = cfg_stream.readModule(out)
+        out.close()
+
+        cfg_stream.sortModule(M)
+        cfg_stream.sortModule(expected)
+        self.assertEqual(M, expected)
+
+if __name__ == '__main__':
+    unittest.main()
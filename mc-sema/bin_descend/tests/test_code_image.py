@@ -0,0 +1,116 @@
+import unittest
+
+import CFG_pb2
+from cfg_common import compactFunction
+
+def block(F, base, insts):
+    # insts is a list of (ea, bytes)
+    B = F.blocks.add()
+    B.base_address = base
+    for (ea, inst_bytes) in insts:
+        I = B.insts.add()
+        I.inst_addr = ea
+        I.inst_bytes = inst_bytes
+        I.inst_len = len(inst_bytes)
+    return B
+
+def expand(F):
+    # the (ea, bytes) of every instruction, as cfg_to_bc decodes them
+    out = []
+    for B in F.blocks:
+        if not B.HasField('inst_lengths'):
+            out.append([(I.inst_addr, I.inst_bytes) for I in B.insts])
+            continue
+
+        insts = []
+        ea = B.base_address
+        offset = B.code_offset
+        for n in B.inst_lengths:
+            n = ord(n)
+            insts.append((ea, F.code_image[offset:offset+n]))
+            ea += n
+            offset += n
+        out.append(insts)
+    return out
+
+class TestCompactFunction(unittest.TestCase):
+    def test_round_trip(self):
+        F = CFG_pb2.Function()
+        F.entry_address = 0x1000
+        a = [(0x1000, "\x55"), (0x1001, "\x8b\xec"), (0x1003, "\x74\x10")]
+        # a block far from the first, and one before it
+        b = [(0x5000, "\x33\xc0"), (0x5002, "\xc3")]
+        c = [(0x0800, "\x90")]
+        for insts in (a, b, c):
+            block(F, insts[0][0], insts)
+
+        compactFunction(F)
+
+        self.assertEqual(F.code_image, "\x55\x8b\xec\x74\x10\x33\xc0\xc3\x90")
+        self.assertEqual([B.code_offset for B in F.blocks], [0, 5, 8])
+        self.assertEqual(expand(F), [a, b, c])
+        for B in F.blocks:
+            for I in B.insts:
+                self.assertFalse(I.HasField('inst_bytes'))
+                self.assertFalse(I.HasField('inst_addr'))
+
+    def test_block_with_gap_keeps_its_bytes(self):
+        F = CFG_pb2.Function()
+        F.entry_address = 0x1000
+        # a skipped hlt at 0x1001
+        gap = [(0x1000, "\x90"), (0x1002, "\xc3")]
+        block(F, 0x1000, gap)
+        whole = [(0x2000, "\xc3")]
+        block(F, 0x2000, whole)
+
+        compactFunction(F)
+
+        self.assertFalse(F.blocks[0].HasField('inst_lengths'))
+        self.assertEqual(F.blocks[1].code_offset, 0)
+        self.assertEqual(F.code_image, "\xc3")
+        self.assertEqual(expand(F), [gap, whole])
+
+    def test_block_not_at_its_base(self):
+        F = CFG_pb2.Function()
+        F.entry_address = 0x1000
+        insts = [(0x1004, "\xc3")]
+        block(F, 0x1000, insts)
+
+        compactFunction(F)
+
+        self.assertFalse(F.HasField('code_image'))
+        self.assertEqual(expand(F), [insts])
+
+    def test_empty_blocks(self):
+        F = CFG_pb2.Function()
+        F.entry_address = 0x1000
+        block(F, 0x1000, [])
+        insts = [(0x1010, "\xc3")]
+        block(F, 0x1010, insts)
+
+        compactFunction(F)
+
+        self.assertFalse(F.blocks[0].HasField('inst_lengths'))
+        self.assertEqual(F.blocks[1].code_offset, 0)
+        self.assertEqual(expand(F), [[], insts])
+
+    def test_no_blocks(self):
+        F = CFG_pb2.Function()
+        F.entry_address = 0x1000
+        compactFunction(F)
+        self.assertFalse(F.HasField('code_image'))
+
+    def test_long_instruction_keeps_its_bytes(self):
+        # lengths are stored in one byte each
+        F = CFG_pb2.Function()
+        F.entry_address = 0x1000
+        insts = [(0x1000, "\x90" * 0x100)]
+        block(F, 0x1000, insts)
+
+        compactFunction(F)
+
+        self.assertFalse(F.blocks[0].HasField('inst_lengths'))
+        self.assertEqual(expand(F), [insts])
+
+if __name__ == '__main__':
+    unittest.main()
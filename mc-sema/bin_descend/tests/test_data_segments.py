@@ -0,0 +1,80 @@
+import random
+import unittest
+
+from cfg_common import DataSegmentIndex
+
+def linearContains(segments, start_ea, end_ea):
+    # the scan over every segment that DataSegmentIndex replaces
+    for (start, end) in segments:
+        if start_ea >= start and start_ea < end:
+            if end_ea <= end:
+                return True
+            raise Exception("Overlapping data segments!")
+        elif end_ea > start and end_ea <= end:
+            raise Exception("Overlapping data segments!")
+    return False
+
+def outcome(f, *args):
+    try:
+        return f(*args)
+    except Exception:
+        return 'overlap'
+
+class TestDataSegmentIndex(unittest.TestCase):
+    def index(self, segments):
+        D = DataSegmentIndex()
+        for (start, end) in segments:
+            D.add(start, end)
+        return D
+
+    def test_sorted_whatever_the_insert_order(self):
+        D = self.index([(0x3000, 0x3100), (0x1000, 0x1010), (0x2000, 0x2800)])
+        self.assertEqual(list(D), [(0x1000, 0x1010), (0x2000, 0x2800), (0x3000, 0x3100)])
+        self.assertEqual(len(D), 3)
+        self.assertEqual(D.max_end, 0x3100)
+
+    def test_contains(self):
+        D = self.index([(0x1000, 0x1010), (0x2000, 0x2800)])
+        self.assertTrue(D.contains(0x1000, 0x1010))
+        self.assertTrue(D.contains(0x2004, 0x2008))
+        self.assertFalse(D.contains(0x1010, 0x1020))
+        self.assertFalse(D.contains(0x0ff0, 0x1000))
+        self.assertFalse(D.contains(0x3000, 0x3004))
+
+    def test_empty(self):
+        D = DataSegmentIndex()
+        self.assertFalse(D.contains(0x1000, 0x1004))
+        self.assertEqual(D.findFree(), 4)
+
+    def test_overlaps(self):
+        D = self.index([(0x1000, 0x1010), (0x2000, 0x2800)])
+        # starts inside and runs past the end
+        self.assertRaises(Exception, D.contains, 0x100c, 0x1014)
+        # starts before and ends inside
+        self.assertRaises(Exception, D.contains, 0x1ffc, 0x2004)
+        # starts in one segment and ends in the next
+        self.assertRaises(Exception, D.contains, 0x1008, 0x2004)
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(3)
+        for trial in xrange(20):
+            cuts = sorted(rng.sample(xrange(0, 0x1000, 4), 20))
+            segments = [(cuts[i], cuts[i+1]) for i in xrange(0, len(cuts), 2)]
+            D = self.index(rng.sample(segments, len(segments)))
+            for query in xrange(200):
+                start = rng.randrange(0, 0x1000)
+                end = start + rng.randrange(1, 0x100)
+                self.assertEqual(outcome(D.contains, start, end),
+                                 outcome(linearContains, segments, start, end),
+                                 (segments, start, end))
+
+    def test_free_space(self):
+        D = self.index([(0x2000, 0x2800), (0x1000, 0x1010)])
+        self.assertEqual(D.findFree(), 0x2804)
+        D.reserve(0x1000)
+        self.assertEqual(D.findFree(), 0x3804)
+        D.add(0x4000, 0x4010)
+        self.assertEqual(D.findFree(), 0x4014)
+
+if __name__ == '__main__':
+    unittest.main()
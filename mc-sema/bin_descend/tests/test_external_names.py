@@ -0,0 +1,60 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from StringIO import StringIO
+
+import std_defs_index
+from cfg_common import ExternalNameIndex
+
+class TestExternalNames(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def names(self, *texts):
+        paths = []
+        for (i, text) in enumerate(texts):
+            path = os.path.join(self.dir, "defs{0}.txt".format(i))
+            f = open(path, 'w')
+            f.write(text)
+            f.close()
+            paths.append(path)
+
+        defs = std_defs_index.loadDefs(paths)
+        return ExternalNameIndex(defs.functions, defs.data)
+
+    def add_names(self, index, names):
+        # returns what addNames reported
+        stderr = sys.stderr
+        sys.stderr = StringIO()
+        try:
+            index.addNames(names)
+            return sys.stderr.getvalue()
+        finally:
+            sys.stderr = stderr
+
+    def test_conflict_across_layers(self):
+        index = self.names("CreateFileA 7 E N\n", "DATA: CreateFileA 4\n")
+        report = self.add_names(index, ["__imp_CreateFileA", "exit"])
+
+        self.assertEqual(report, "WARNING: CreateFileA is defined as both code and data\n")
+
+        sym = index.lookup("__imp_CreateFileA")
+        self.assertTrue(sym.conflict)
+        self.assertRaises(Exception, sym.isData)
+
+    def test_no_conflict(self):
+        index = self.names("CreateFileA 7 E N\nDATA: errno 4\n")
+        report = self.add_names(index, ["_CreateFileA", "errno"])
+
+        self.assertEqual(report, "")
+        self.assertFalse(index.lookup("_CreateFileA").isData())
+        self.assertTrue(index.lookup("errno").isData())
+        self.assertEqual(index.lookup("_CreateFileA").func, (7, 'E', 'N'))
+
+if __name__ == "__main__":
+    unittest.main()
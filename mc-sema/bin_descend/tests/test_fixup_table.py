@@ -0,0 +1,54 @@
+import unittest
+
+from cfg_common import FixupTable
+
+FIXUPS = [(0x1000, 4, 0x2000), (0x1004, 5, 0x2010), (0x1010, 4, 0xfffffff0)]
+
+class TestFixupTable(unittest.TestCase):
+    def table(self, fixups=FIXUPS):
+        T = FixupTable()
+        T.load(fixups)
+        return T
+
+    def test_lookups(self):
+        T = self.table()
+        self.assertEqual(len(T), 3)
+        self.assertEqual(T.find(0x1004), 1)
+        self.assertEqual(T.type(0x1004), 5)
+        self.assertEqual(T.target(0x1004), 0x2010)
+
+    def test_missing(self):
+        T = self.table()
+        for ea in (0, 0x0fff, 0x1001, 0x1008, 0x1014):
+            self.assertEqual(T.find(ea), -1)
+            self.assertEqual(T.type(ea), -1)
+            self.assertEqual(T.target(ea), -1)
+
+    def test_empty(self):
+        T = self.table([])
+        self.assertEqual(len(T), 0)
+        self.assertEqual(T.find(0x1000), -1)
+        self.assertEqual(list(T.inRange(0, 0xffffffff)), [])
+
+    def test_high_addresses(self):
+        # addresses are unsigned 32-bit
+        T = self.table([(0xfffffffc, 4, 0xffffffff)])
+        self.assertEqual(T.target(0xfffffffc), 0xffffffff)
+        self.assertEqual("0x{0:x}".format(T.target(0xfffffffc)), "0xffffffff")
+
+    def test_in_range(self):
+        T = self.table()
+        self.assertEqual(list(T.inRange(0x1000, 0x1010)), [0x1000, 0x1004])
+        self.assertEqual(list(T.inRange(0x1001, 0x1011)), [0x1004, 0x1010])
+        self.assertEqual(list(T.inRange(0x1005, 0x1010)), [])
+        self.assertEqual(list(T.inRange(0x1010, 0x1000)), [])
+
+    def test_reload_replaces(self):
+        T = self.table()
+        T.load([(0x3000, 4, 0x4000)])
+        self.assertEqual(len(T), 1)
+        self.assertEqual(T.find(0x1000), -1)
+        self.assertEqual(T.target(0x3000), 0x4000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import unittest
+from StringIO import StringIO
+
+import idb_cache
+from idb_cache import IdbCache
+
+class TestIdbCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.dir, "cache")
+        self.stdout = idb_cache.sys.stdout
+        idb_cache.sys.stdout = StringIO()
+
+    def tearDown(self):
+        idb_cache.sys.stdout = self.stdout
+        shutil.rmtree(self.dir)
+
+    def idb(self, name, size):
+        fname = os.path.join(self.dir, name)
+        f = open(fname, 'wb')
+        f.write(name[0] * size)
+        f.close()
+        return fname
+
+    def insert(self, cache, key, size, used):
+        # used is the entry's last use time, in seconds
+        dest = cache.insert(key, self.idb(key + ".idb", size))
+        os.utime(dest, (used, used))
+        return dest
+
+    def cached(self, cache):
+        return sorted([os.path.basename(fname) for (mtime, size, fname) in cache.entries()])
+
+    def test_miss_then_hit(self):
+        cache = IdbCache(self.cache_dir, 100)
+        out = os.path.join(self.dir, "out.idb")
+
+        self.assertFalse(cache.fetch('a', out))
+        self.assertFalse(os.path.exists(out))
+
+        src = self.idb("a.idb", 10)
+        cache.insert('a', src)
+        # the analyzed database is left for the caller
+        self.assertTrue(os.path.exists(src))
+
+        self.assertTrue(cache.fetch('a', out))
+        self.assertEqual(open(out, 'rb').read(), "a" * 10)
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1})
+
+    def test_fetch_copies(self):
+        cache = IdbCache(self.cache_dir, 100)
+        cache.insert('a', self.idb("a.idb", 10))
+        out = os.path.join(self.dir, "out.idb")
+        cache.fetch('a', out)
+
+        f = open(out, 'wb')
+        f.write("changed by IDA")
+        f.close()
+        self.assertEqual(open(cache.path('a'), 'rb').read(), "a" * 10)
+
+    def test_evicts_least_recently_used(self):
+        cache = IdbCache(self.cache_dir, 25)
+        self.insert(cache, 'a', 10, 1000)
+        self.insert(cache, 'b', 10, 2000)
+        # a is used again, so b is now the oldest
+        cache.fetch('a', os.path.join(self.dir, "out.idb"))
+
+        self.insert(cache, 'c', 10, 3000)
+        self.assertEqual(self.cached(cache), ['a.idb', 'c.idb'])
+
+    def test_evicts_until_under_limit(self):
+        cache = IdbCache(self.cache_dir, 25)
+        self.insert(cache, 'a', 10, 1000)
+        self.insert(cache, 'b', 10, 2000)
+        cache.insert('c', self.idb("c.idb", 20))
+        self.assertEqual(self.cached(cache), ['c.idb'])
+
+    def test_keeps_newest_over_limit(self):
+        cache = IdbCache(self.cache_dir, 5)
+        cache.insert('a', self.idb("a.idb", 10))
+        self.assertEqual(self.cached(cache), ['a.idb'])
+
+    def test_reinsert_replaces(self):
+        cache = IdbCache(self.cache_dir, 100)
+        cache.insert('a', self.idb("a.idb", 10))
+        cache.insert('a', self.idb("aa.idb", 20))
+        self.assertEqual(self.cached(cache), ['a.idb'])
+        self.assertEqual(os.path.getsize(cache.path('a')), 20)
+        self.assertEqual([name for name in os.listdir(self.cache_dir) if name.endswith(".tmp")], [])
+
+    def test_stats_survive_instances(self):
+        out = os.path.join(self.dir, "out.idb")
+        IdbCache(self.cache_dir, 100).fetch('a', out)
+        IdbCache(self.cache_dir, 100).fetch('a', out)
+        cache = IdbCache(self.cache_dir, 100)
+        self.assertEqual(cache.stats(), {'hits': 0, 'misses': 2})
+
+        report = StringIO()
+        cache.report(report)
+        self.assertTrue(report.getvalue().startswith("IDB cache: 0 hits, 2 misses (0.0% hit rate)"))
+
+    def test_key_depends_on_input(self):
+        cache = IdbCache(self.cache_dir, 100)
+        a = self.idb("a.exe", 10)
+        b = self.idb("b.exe", 10)
+        self.assertEqual(cache.key(a, "idaq.exe", "-B"), cache.key(a, "idaq.exe", "-B"))
+        self.assertNotEqual(cache.key(a, "idaq.exe", "-B"), cache.key(b, "idaq.exe", "-B"))
+        self.assertNotEqual(cache.key(a, "idaq.exe", "-B"), cache.key(a, "idaq.exe", ""))
+
+if __name__ == '__main__':
+    unittest.main()
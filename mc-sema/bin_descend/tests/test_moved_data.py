@@ -0,0 +1,60 @@
+import unittest
+
+import CFG_pb2
+from cfg_common import ExternalNameIndex
+from cfg_builder import Program, Segment, CfgBuilder, SEG_CODE, SEG_DATA
+
+TEXT = 0x401000
+TEXT_SIZE = 0x1000
+DATA = 0x402000
+DATA_SIZE = 0x100
+# an 8 byte table in the middle of .text
+TABLE = TEXT + 0x800
+
+class TableProgram(Program):
+    def __init__(self):
+        Program.__init__(self, "moved.exe")
+        self.addSegment(Segment(".text", TEXT, TEXT+TEXT_SIZE, SEG_CODE, False,
+                                "\x90" * TEXT_SIZE))
+        self.addSegment(Segment(".data", DATA, DATA+DATA_SIZE, SEG_DATA, True,
+                                "\x00" * DATA_SIZE))
+
+    def itemSize(self, ea):
+        return TABLE+8-ea
+
+    def decode(self, ea):
+        return None
+
+class TestMovedData(unittest.TestCase):
+    def builder(self):
+        builder = CfgBuilder(TableProgram(), ExternalNameIndex())
+        builder.processDataSegments(CFG_pb2.Module(), set())
+        return builder
+
+    def test_rewalk_reuses_moved_copy(self):
+        builder = self.builder()
+        M = CFG_pb2.Module()
+
+        moved = builder.handleDataRelocation(M, TABLE, set())
+        self.assertNotEqual(moved, TABLE)
+        self.assertEqual(len(M.internal_data), 1)
+
+        # a block walked again after the block cache dropped it
+        self.assertEqual(builder.handleDataRelocation(M, TABLE, set()), moved)
+        self.assertEqual(builder.handleDataRelocation(M, TABLE+4, set()), moved+4)
+        self.assertEqual(len(M.internal_data), 1)
+
+    def test_resume_reuses_moved_copy(self):
+        builder = self.builder()
+        M = CFG_pb2.Module()
+        moved = builder.handleDataRelocation(M, TABLE, set())
+
+        # what a checkpoint keeps, restored into a new builder
+        resumed = CfgBuilder(TableProgram(), ExternalNameIndex())
+        resumed.restore(builder.state())
+
+        self.assertEqual(resumed.handleDataRelocation(M, TABLE, set()), moved)
+        self.assertEqual(len(M.internal_data), 1)
+
+if __name__ == '__main__':
+    unittest.main()
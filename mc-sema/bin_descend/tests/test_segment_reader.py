@@ -0,0 +1,82 @@
+import random
+import unittest
+
+import fake_ida
+
+BASE = 0x400000
+
+def expected(size, runs, fill):
+    buf = bytearray(size)
+    for (s, e) in runs:
+        buf[s:e] = fill * (e-s)
+    return str(buf)
+
+def randomRuns(rng, size, count):
+    cuts = sorted(rng.sample(xrange(size+1), count*2))
+    return [(cuts[i], cuts[i+1]) for i in xrange(0, len(cuts), 2) if cuts[i] < cuts[i+1]]
+
+class TestSegmentReader(unittest.TestCase):
+    def read(self, size, runs, masks, chunk=None):
+        db = fake_ida.FakeDatabase(BASE, size, runs)
+        get_cfg = fake_ida.install(db)
+        fake_ida.useMasks(get_cfg, db, masks)
+
+        old_chunk = get_cfg.READ_CHUNK_SIZE
+        if chunk is not None:
+            get_cfg.READ_CHUNK_SIZE = chunk
+        try:
+            data = get_cfg.readSegmentBytes(BASE, BASE+size)
+        finally:
+            get_cfg.READ_CHUNK_SIZE = old_chunk
+
+        self.assertEqual(data, expected(size, runs, db.fill))
+        return db.calls
+
+    def test_random_layouts(self):
+        rng = random.Random(2)
+        for i in xrange(50):
+            size = rng.randint(1, 3000)
+            runs = randomRuns(rng, size, rng.randint(0, 10))
+            for masks in (True, False):
+                self.read(size, runs, masks, chunk=rng.choice([7, 64, 1000]))
+
+    def test_whole_and_empty(self):
+        for masks in (True, False):
+            self.read(4096, [(0, 4096)], masks)
+            self.read(4096, [], masks)
+            self.read(4096, [(0, 1), (4095, 4096)], masks)
+
+    def test_uninitialized_chunk_is_skipped(self):
+        # a chunk with no values at all costs a handful of calls, not
+        # calls per byte
+        calls = self.read(0x100000, [], False)
+        self.assertTrue(sum(calls.values()) <= 4, calls)
+
+    def test_run_costs_log_reads(self):
+        calls = self.read(0x100000, [(0x10, 0x80010)], False)
+        self.assertTrue(calls['get_many_bytes'] <= 2*20 + 3, calls)
+        self.assertEqual(calls['Byte'], 0)
+
+class TestMaskRuns(unittest.TestCase):
+    def test_random_masks(self):
+        rng = random.Random(3)
+        get_cfg = fake_ida.install(fake_ida.FakeDatabase(BASE, 0, []))
+        for i in xrange(200):
+            size = rng.randint(1, 300)
+            bits = [rng.random() < 0.5 for b in xrange(size)]
+            mask = bytearray((size+7)/8)
+            for (b, v) in enumerate(bits):
+                if v:
+                    mask[b/8] |= 1 << (b%8)
+
+            runs = []
+            for (b, v) in enumerate(bits):
+                if v and (b == 0 or not bits[b-1]):
+                    runs.append([b, b+1])
+                elif v:
+                    runs[-1][1] = b+1
+
+            self.assertEqual(get_cfg.maskRuns(str(mask), size), [tuple(r) for r in runs])
+
+if __name__ == "__main__":
+    unittest.main()
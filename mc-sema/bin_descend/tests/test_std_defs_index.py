@@ -0,0 +1,61 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import std_defs_index
+
+class TestDefsLayers(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write_defs(self, name, text):
+        path = os.path.join(self.dir, name)
+        f = open(path, 'w')
+        f.write(text)
+        f.close()
+        return path
+
+    def load(self, *texts):
+        paths = [self.write_defs("defs{0}.txt".format(i), t) for (i, t) in enumerate(texts)]
+        return std_defs_index.loadDefs(paths)
+
+    def test_code_and_data_in_one_file(self):
+        defs = self.load("CreateFileA 7 E N\nDATA: CreateFileA 4\n")
+
+        self.assertEqual(defs.functions["CreateFileA"], (7, 'E', 'N'))
+        self.assertEqual(defs.data["CreateFileA"], 4)
+
+    def test_data_layer_keeps_code(self):
+        defs = self.load("CreateFileA 7 E N\nexit 1 C Y\n", "DATA: CreateFileA 4\n")
+
+        self.assertTrue("CreateFileA" in defs.functions)
+        self.assertEqual(defs.functions["CreateFileA"], (7, 'E', 'N'))
+        self.assertEqual(defs.data["CreateFileA"], 4)
+        self.assertEqual(sorted(defs.functions.keys()), ["CreateFileA", "exit"])
+        self.assertEqual(defs.data.keys(), ["CreateFileA"])
+
+    def test_code_layer_keeps_data(self):
+        defs = self.load("DATA: environ 4\n", "environ 0 C N\n")
+
+        self.assertEqual(defs.data["environ"], 4)
+        self.assertEqual(defs.functions["environ"], (0, 'C', 'N'))
+
+    def test_later_layer_overrides_same_kind(self):
+        defs = self.load("exit 1 C Y\nDATA: errno 4\n", "exit 2 E N\nDATA: errno 8\n")
+
+        self.assertEqual(defs.functions["exit"], (2, 'E', 'N'))
+        self.assertEqual(defs.data["errno"], 8)
+
+    def test_missing(self):
+        defs = self.load("exit 1 C Y\n")
+
+        self.assertFalse("exit" in defs.data)
+        self.assertEqual(defs.data.get("exit", 0), 0)
+        self.assertRaises(KeyError, lambda: defs.functions["abort"])
+
+if __name__ == "__main__":
+    unittest.main()
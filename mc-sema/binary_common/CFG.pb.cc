@@ -105,9 +105,10 @@ void protobuf_AssignDesc_CFG_2eproto() {
       "CFG.proto");
   GOOGLE_CHECK(file != NULL);
   JumpTbl_descriptor_ = file->message_type(0);
-  static const int JumpTbl_offsets_[2] = {
+  static const int JumpTbl_offsets_[3] = {
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(JumpTbl, table_entries_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(JumpTbl, zero_offset_),
+    GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(JumpTbl, entry_deltas_),
   };
   JumpTbl_reflection_ =
     new ::google::protobuf::internal::GeneratedMessageReflection(
@@ -137,7 +138,7 @@ void protobuf_AssignDesc_CFG_2eproto() {
       ::google::protobuf::MessageFactory::generated_factory(),
       sizeof(JumpIndexTbl));
   Instruction_descriptor_ = file->message_type(2);
-  static const int Instruction_offsets_[12] = {
+  static const int Instruction_offsets_[15] = {
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Instruction, inst_bytes_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Instruction, inst_addr_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Instruction, true_target_),
@@ -150,6 +151,9 @@ void protobuf_AssignDesc_CFG_2eproto() {
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Instruction, jump_table_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Instruction, jump_index_table_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Instruction, ext_data_name_),
+    GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Instruction, true_delta_),
+    GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Instruction, false_delta_),
+    GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Instruction, call_delta_),
   };
   Instruction_reflection_ =
     new ::google::protobuf::internal::GeneratedMessageReflection(
@@ -163,10 +167,13 @@ void protobuf_AssignDesc_CFG_2eproto() {
       ::google::protobuf::MessageFactory::generated_factory(),
       sizeof(Instruction));
   Block_descriptor_ = file->message_type(3);
-  static const int Block_offsets_[3] = {
+  static const int Block_offsets_[6] = {
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Block, insts_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Block, base_address_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Block, block_follows_),
+    GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Block, code_offset_),
+    GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Block, inst_lengths_),
+    GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Block, follow_deltas_),
   };
   Block_reflection_ =
     new ::google::protobuf::internal::GeneratedMessageReflection(
@@ -180,9 +187,10 @@ void protobuf_AssignDesc_CFG_2eproto() {
       ::google::protobuf::MessageFactory::generated_factory(),
       sizeof(Block));
   Function_descriptor_ = file->message_type(4);
-  static const int Function_offsets_[2] = {
+  static const int Function_offsets_[3] = {
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Function, blocks_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Function, entry_address_),
+    GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Function, code_image_),
   };
   Function_reflection_ =
     new ::google::protobuf::internal::GeneratedMessageReflection(
@@ -300,13 +308,14 @@ void protobuf_AssignDesc_CFG_2eproto() {
       ::google::protobuf::MessageFactory::generated_factory(),
       sizeof(EntrySymbol));
   Module_descriptor_ = file->message_type(11);
-  static const int Module_offsets_[6] = {
+  static const int Module_offsets_[7] = {
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Module, internal_funcs_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Module, external_funcs_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Module, internal_data_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Module, module_name_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Module, entries_),
     GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Module, external_data_),
+    GOOGLE_PROTOBUF_GENERATED_MESSAGE_FIELD_OFFSET(Module, cfg_version_),
   };
   Module_reflection_ =
     new ::google::protobuf::internal::GeneratedMessageReflection(
@@ -653,107 +662,112 @@ void protobuf_AddDesc_CFG_2eproto() {
   GOOGLE_PROTOBUF_VERIFY_VERSION;
 
   ::google::protobuf::DescriptorPool::InternalAddGeneratedFile(
-    "\n\tCFG.proto\"5\n\007JumpTbl\022\025\n\rtable_entries\030"
-    "\001 \003(\003\022\023\n\013zero_offset\030\002 \002(\005\":\n\014JumpIndexT"
-    "bl\022\025\n\rtable_entries\030\001 \002(\014\022\023\n\013zero_offset"
-    "\030\002 \002(\005\"\246\002\n\013Instruction\022\022\n\ninst_bytes\030\001 \002"
-    "(\014\022\021\n\tinst_addr\030\002 \002(\003\022\023\n\013true_target\030\003 \001"
-    "(\003\022\024\n\014false_target\030\004 \001(\003\022\020\n\010inst_len\030\005 \002"
-    "(\005\022\023\n\013data_offset\030\006 \001(\003\022\025\n\rext_call_name"
-    "\030\007 \001(\t\022\023\n\013call_target\030\010 \001(\003\022\024\n\014reloc_off"
-    "set\030\t \001(\005\022\034\n\njump_table\030\n \001(\0132\010.JumpTbl\022"
-    "\'\n\020jump_index_table\030\013 \001(\0132\r.JumpIndexTbl"
-    "\022\025\n\rext_data_name\030\014 \001(\t\"Q\n\005Block\022\033\n\005inst"
-    "s\030\001 \003(\0132\014.Instruction\022\024\n\014base_address\030\002 "
-    "\002(\003\022\025\n\rblock_follows\030\003 \003(\003\"9\n\010Function\022\026"
-    "\n\006blocks\030\001 \003(\0132\006.Block\022\025\n\rentry_address\030"
-    "\002 \002(\003\"\360\001\n\020ExternalFunction\022\023\n\013symbol_nam"
-    "e\030\001 \002(\t\022\?\n\022calling_convention\030\002 \002(\0162#.Ex"
-    "ternalFunction.CallingConvention\022\022\n\nhas_"
-    "return\030\003 \002(\010\022\021\n\tno_return\030\004 \002(\010\022\026\n\016argum"
-    "ent_count\030\005 \002(\005\"G\n\021CallingConvention\022\021\n\r"
-    "CallerCleanup\020\000\022\021\n\rCalleeCleanup\020\001\022\014\n\010Fa"
-    "stCall\020\002\"6\n\014ExternalData\022\023\n\013symbol_name\030"
-    "\001 \002(\t\022\021\n\tdata_size\030\002 \002(\005\"7\n\nDataSymbol\022\024"
-    "\n\014base_address\030\001 \002(\003\022\023\n\013symbol_name\030\002 \002("
-    "\t\"[\n\004Data\022\024\n\014base_address\030\001 \002(\003\022\014\n\004data\030"
-    "\002 \002(\014\022\034\n\007symbols\030\003 \003(\0132\013.DataSymbol\022\021\n\tr"
-    "ead_only\030\004 \002(\010\"u\n\020EntrySymbolExtra\022\022\n\nen"
-    "try_argc\030\001 \002(\005\0228\n\013entry_cconv\030\002 \002(\0162#.Ex"
-    "ternalFunction.CallingConvention\022\023\n\013does"
-    "_return\030\003 \002(\010\"`\n\013EntrySymbol\022\022\n\nentry_na"
-    "me\030\001 \002(\t\022\025\n\rentry_address\030\002 \002(\003\022&\n\013entry"
-    "_extra\030\003 \001(\0132\021.EntrySymbolExtra\"\316\001\n\006Modu"
-    "le\022!\n\016internal_funcs\030\001 \003(\0132\t.Function\022)\n"
-    "\016external_funcs\030\002 \003(\0132\021.ExternalFunction"
-    "\022\034\n\rinternal_data\030\003 \003(\0132\005.Data\022\023\n\013module"
-    "_name\030\004 \002(\t\022\035\n\007entries\030\005 \003(\0132\014.EntrySymb"
-    "ol\022$\n\rexternal_data\030\006 \003(\0132\r.ExternalData"
-    "\"l\n\007Edge_64\022\r\n\005value\030\001 \002(\003\022\033\n\004kind\030\002 \002(\016"
-    "2\r.Edge_64.Kind\022\r\n\005label\030\003 \001(\010\"&\n\004Kind\022\013"
-    "\n\007Unknown\020\000\022\007\n\003May\020\001\022\010\n\004Must\020\002\"l\n\007Edge_3"
-    "2\022\r\n\005value\030\001 \002(\005\022\033\n\004kind\030\002 \002(\0162\r.Edge_32"
-    ".Kind\022\r\n\005label\030\003 \001(\010\"&\n\004Kind\022\013\n\007Unknown\020"
-    "\000\022\007\n\003May\020\001\022\010\n\004Must\020\002\"\205\004\n\034Annotated_Branc"
-    "h_Instruction\022\?\n\021branch_instr_name\030\001 \002(\016"
-    "2$.Annotated_Branch_Instruction.Branch\022\023"
-    "\n\013is_resolved\030\002 \002(\010\022\023\n\013is_indirect\030\003 \002(\010"
-    "\022\026\n\016is_conditional\030\004 \002(\010\022\017\n\007is_leaf\030\005 \002("
-    "\010\022\033\n\ttarget_to\030\006 \003(\0132\010.Edge_64\022%\n\005instr\030"
-    "\007 \002(\0132\026.Annotated_Instruction\022\033\n\023abstrac"
-    "t_expression\030\010 \001(\t\"\357\001\n\006Branch\022\013\n\007Unknown"
-    "\020\000\022\007\n\003jmp\020\001\022\010\n\004ljmp\020\002\022\006\n\002jo\020\003\022\007\n\003jno\020\004\022\006"
-    "\n\002jb\020\005\022\007\n\003jae\020\006\022\006\n\002je\020\007\022\007\n\003jne\020\010\022\007\n\003jbe\020"
-    "\t\022\006\n\002ja\020\n\022\006\n\002js\020\013\022\007\n\003jns\020\014\022\006\n\002jp\020\r\022\007\n\003jn"
-    "p\020\016\022\006\n\002jl\020\017\022\007\n\003jge\020\020\022\007\n\003jle\020\021\022\006\n\002jg\020\022\022\n\n"
-    "\006loopne\020\023\022\t\n\005loope\020\024\022\010\n\004loop\020\025\022\t\n\005jCcxz\020"
-    "\026\022\007\n\003ret\020\027\022\010\n\004call\020\030\"\270\003\n\025Annotated_Instr"
-    "uction\022\022\n\ninstr_name\030\001 \002(\t\022\024\n\014instr_stri"
-    "ng\030\002 \002(\t\022\021\n\tinst_addr\030\003 \002(\003\022\020\n\010inst_len\030"
-    "\004 \002(\005\022\020\n\010op_count\030\005 \002(\005\022\025\n\rinst_addr_hex"
-    "\030\006 \001(\t\022\035\n\025is_branch_instruction\030\007 \002(\010\0220\n"
-    "\010argument\030\010 \003(\0132\036.Annotated_Instruction."
-    "Operand\022 \n\016referered_from\030\t \003(\0132\010.Edge_6"
-    "4\032\263\001\n\007Operand\022\013\n\003pos\030\001 \002(\005\0229\n\004type\030\002 \002(\016"
-    "2+.Annotated_Instruction.Operand.Operand"
-    "_Type\022\r\n\005value\030\003 \001(\t\"Q\n\014Operand_Type\022\013\n\007"
-    "Unknown\020\000\022\r\n\tImmediate\020\001\022\014\n\010Register\020\002\022\n"
-    "\n\006Memory\020\003\022\013\n\007Address\020\004\"\251\003\n\025Annotated_Re"
-    "gister_32\022-\n\004name\030\001 \002(\0162\037.Annotated_Regi"
-    "ster_32.Register\022\024\n\014used_at_addr\030\002 \002(\003\022\030"
-    "\n\020used_at_addr_hex\030\003 \001(\t\022\027\n\005value\030\007 \003(\0132"
-    "\010.Edge_32\022-\n\004fact\030\010 \002(\0132\037.Annotated_Regi"
-    "ster_32.Property\022\033\n\023abstract_expression\030"
-    "\t \001(\t\032*\n\010Property\022\017\n\007Unknown\030\001 \002(\010\022\r\n\005Al"
-    "ive\030\002 \001(\010\"\237\001\n\010Register\022\013\n\007Unknown\020\000\022\007\n\003e"
-    "ax\020\001\022\007\n\003ecx\020\002\022\007\n\003edx\020\003\022\007\n\003ebx\020\004\022\007\n\003esp\020\005"
-    "\022\007\n\003ebp\020\006\022\007\n\003esi\020\007\022\007\n\003edi\020\010\022\007\n\003eip\020\t\022\013\n\007"
-    "fs_base\020\n\022\013\n\007gs_base\020\013\022\007\n\003gtd\020\014\022\007\n\003ldt\020\r"
-    "\022\t\n\005mxcsr\020\016\"\344\003\n\025Annotated_Register_64\022-\n"
-    "\004name\030\001 \002(\0162\037.Annotated_Register_64.Regi"
-    "ster\022\024\n\014used_at_addr\030\002 \002(\003\022\030\n\020used_at_ad"
-    "dr_hex\030\003 \001(\t\022\027\n\005value\030\004 \003(\0132\010.Edge_64\022-\n"
-    "\004fact\030\005 \002(\0132\037.Annotated_Register_64.Prop"
-    "erty\022\033\n\023abstract_expression\030\006 \001(\t\032*\n\010Pro"
-    "perty\022\017\n\007Unknown\030\001 \002(\010\022\r\n\005Alive\030\002 \001(\010\"\332\001"
-    "\n\010Register\022\013\n\007Unknown\020\000\022\007\n\003rax\020\n\022\007\n\003rcx\020"
-    "\013\022\007\n\003rdx\020\014\022\007\n\003rbx\020\r\022\007\n\003rsp\020\016\022\007\n\003rbp\020\017\022\007\n"
-    "\003rsi\020\020\022\007\n\003rdi\020\021\022\007\n\003rip\020\022\022\006\n\002r8\020\023\022\006\n\002r9\020\024"
-    "\022\007\n\003r10\020\025\022\007\n\003r11\020\026\022\007\n\003r12\020\027\022\007\n\003r13\020\030\022\007\n\003"
-    "r14\020\031\022\007\n\003r15\020\032\022\013\n\007fs_base\020\033\022\013\n\007gs_base\020\034"
-    "\022\007\n\003gdt\020\035\022\007\n\003ldt\020\036\"\215\002\n\022Annotated_Functio"
-    "n\022\014\n\004name\030\001 \002(\t\022\025\n\rstart_at_addr\030\002 \002(\003\022\031"
-    "\n\021start_at_addr_hex\030\003 \001(\t\022\023\n\013end_at_addr"
-    "\030\004 \001(\003\022\027\n\017end_at_addr_hex\030\005 \001(\t\022&\n\006prolo"
-    "g\030\006 \003(\0132\026.Annotated_Instruction\022&\n\006epilo"
-    "g\030\007 \003(\0132\026.Annotated_Instruction\022 \n\016refer"
-    "ered_from\030\010 \003(\0132\010.Edge_64\022\027\n\005calls\030\t \003(\013"
-    "2\010.Edge_64\"\334\001\n\013Disassembly\022%\n\005instr\030\001 \003("
-    "\0132\026.Annotated_Instruction\0223\n\014branch_inst"
-    "r\030\002 \003(\0132\035.Annotated_Branch_Instruction\022&"
-    "\n\006reg_32\030\003 \003(\0132\026.Annotated_Register_32\022&"
-    "\n\006reg_64\030\004 \003(\0132\026.Annotated_Register_64\022!"
-    "\n\004func\030\005 \003(\0132\023.Annotated_Function", 4033);
+    "\n\tCFG.proto\"O\n\007JumpTbl\022\025\n\rtable_entries\030"
+    "\001 \003(\003\022\023\n\013zero_offset\030\002 \002(\005\022\030\n\014entry_delt"
+    "as\030\003 \003(\022B\002\020\001\":\n\014JumpIndexTbl\022\025\n\rtable_en"
+    "tries\030\001 \002(\014\022\023\n\013zero_offset\030\002 \002(\005\"\343\002\n\013Ins"
+    "truction\022\022\n\ninst_bytes\030\001 \001(\014\022\021\n\tinst_add"
+    "r\030\002 \001(\003\022\023\n\013true_target\030\003 \001(\003\022\024\n\014false_ta"
+    "rget\030\004 \001(\003\022\020\n\010inst_len\030\005 \001(\005\022\023\n\013data_off"
+    "set\030\006 \001(\003\022\025\n\rext_call_name\030\007 \001(\t\022\023\n\013call"
+    "_target\030\010 \001(\003\022\024\n\014reloc_offset\030\t \001(\005\022\034\n\nj"
+    "ump_table\030\n \001(\0132\010.JumpTbl\022\'\n\020jump_index_"
+    "table\030\013 \001(\0132\r.JumpIndexTbl\022\025\n\rext_data_n"
+    "ame\030\014 \001(\t\022\022\n\ntrue_delta\030\r \001(\022\022\023\n\013false_d"
+    "elta\030\016 \001(\022\022\022\n\ncall_delta\030\017 \001(\022\"\227\001\n\005Block"
+    "\022\033\n\005insts\030\001 \003(\0132\014.Instruction\022\024\n\014base_ad"
+    "dress\030\002 \002(\003\022\025\n\rblock_follows\030\003 \003(\003\022\023\n\013co"
+    "de_offset\030\004 \001(\005\022\024\n\014inst_lengths\030\005 \001(\014\022\031\n"
+    "\rfollow_deltas\030\006 \003(\022B\002\020\001\"M\n\010Function\022\026\n\006"
+    "blocks\030\001 \003(\0132\006.Block\022\025\n\rentry_address\030\002 "
+    "\002(\003\022\022\n\ncode_image\030\003 \001(\014\"\360\001\n\020ExternalFunc"
+    "tion\022\023\n\013symbol_name\030\001 \002(\t\022\?\n\022calling_con"
+    "vention\030\002 \002(\0162#.ExternalFunction.Calling"
+    "Convention\022\022\n\nhas_return\030\003 \002(\010\022\021\n\tno_ret"
+    "urn\030\004 \002(\010\022\026\n\016argument_count\030\005 \002(\005\"G\n\021Cal"
+    "lingConvention\022\021\n\rCallerCleanup\020\000\022\021\n\rCal"
+    "leeCleanup\020\001\022\014\n\010FastCall\020\002\"6\n\014ExternalDa"
+    "ta\022\023\n\013symbol_name\030\001 \002(\t\022\021\n\tdata_size\030\002 \002"
+    "(\005\"7\n\nDataSymbol\022\024\n\014base_address\030\001 \002(\003\022\023"
+    "\n\013symbol_name\030\002 \002(\t\"[\n\004Data\022\024\n\014base_addr"
+    "ess\030\001 \002(\003\022\014\n\004data\030\002 \002(\014\022\034\n\007symbols\030\003 \003(\013"
+    "2\013.DataSymbol\022\021\n\tread_only\030\004 \002(\010\"u\n\020Entr"
+    "ySymbolExtra\022\022\n\nentry_argc\030\001 \002(\005\0228\n\013entr"
+    "y_cconv\030\002 \002(\0162#.ExternalFunction.Calling"
+    "Convention\022\023\n\013does_return\030\003 \002(\010\"`\n\013Entry"
+    "Symbol\022\022\n\nentry_name\030\001 \002(\t\022\025\n\rentry_addr"
+    "ess\030\002 \002(\003\022&\n\013entry_extra\030\003 \001(\0132\021.EntrySy"
+    "mbolExtra\"\343\001\n\006Module\022!\n\016internal_funcs\030\001"
+    " \003(\0132\t.Function\022)\n\016external_funcs\030\002 \003(\0132"
+    "\021.ExternalFunction\022\034\n\rinternal_data\030\003 \003("
+    "\0132\005.Data\022\023\n\013module_name\030\004 \002(\t\022\035\n\007entries"
+    "\030\005 \003(\0132\014.EntrySymbol\022$\n\rexternal_data\030\006 "
+    "\003(\0132\r.ExternalData\022\023\n\013cfg_version\030\007 \001(\005\""
+    "l\n\007Edge_64\022\r\n\005value\030\001 \002(\003\022\033\n\004kind\030\002 \002(\0162"
+    "\r.Edge_64.Kind\022\r\n\005label\030\003 \001(\010\"&\n\004Kind\022\013\n"
+    "\007Unknown\020\000\022\007\n\003May\020\001\022\010\n\004Must\020\002\"l\n\007Edge_32"
+    "\022\r\n\005value\030\001 \002(\005\022\033\n\004kind\030\002 \002(\0162\r.Edge_32."
+    "Kind\022\r\n\005label\030\003 \001(\010\"&\n\004Kind\022\013\n\007Unknown\020\000"
+    "\022\007\n\003May\020\001\022\010\n\004Must\020\002\"\205\004\n\034Annotated_Branch"
+    "_Instruction\022\?\n\021branch_instr_name\030\001 \002(\0162"
+    "$.Annotated_Branch_Instruction.Branch\022\023\n"
+    "\013is_resolved\030\002 \002(\010\022\023\n\013is_indirect\030\003 \002(\010\022"
+    "\026\n\016is_conditional\030\004 \002(\010\022\017\n\007is_leaf\030\005 \002(\010"
+    "\022\033\n\ttarget_to\030\006 \003(\0132\010.Edge_64\022%\n\005instr\030\007"
+    " \002(\0132\026.Annotated_Instruction\022\033\n\023abstract"
+    "_expression\030\010 \001(\t\"\357\001\n\006Branch\022\013\n\007Unknown\020"
+    "\000\022\007\n\003jmp\020\001\022\010\n\004ljmp\020\002\022\006\n\002jo\020\003\022\007\n\003jno\020\004\022\006\n"
+    "\002jb\020\005\022\007\n\003jae\020\006\022\006\n\002je\020\007\022\007\n\003jne\020\010\022\007\n\003jbe\020\t"
+    "\022\006\n\002ja\020\n\022\006\n\002js\020\013\022\007\n\003jns\020\014\022\006\n\002jp\020\r\022\007\n\003jnp"
+    "\020\016\022\006\n\002jl\020\017\022\007\n\003jge\020\020\022\007\n\003jle\020\021\022\006\n\002jg\020\022\022\n\n\006"
+    "loopne\020\023\022\t\n\005loope\020\024\022\010\n\004loop\020\025\022\t\n\005jCcxz\020\026"
+    "\022\007\n\003ret\020\027\022\010\n\004call\020\030\"\270\003\n\025Annotated_Instru"
+    "ction\022\022\n\ninstr_name\030\001 \002(\t\022\024\n\014instr_strin"
+    "g\030\002 \002(\t\022\021\n\tinst_addr\030\003 \002(\003\022\020\n\010inst_len\030\004"
+    " \002(\005\022\020\n\010op_count\030\005 \002(\005\022\025\n\rinst_addr_hex\030"
+    "\006 \001(\t\022\035\n\025is_branch_instruction\030\007 \002(\010\0220\n\010"
+    "argument\030\010 \003(\0132\036.Annotated_Instruction.O"
+    "perand\022 \n\016referered_from\030\t \003(\0132\010.Edge_64"
+    "\032\263\001\n\007Operand\022\013\n\003pos\030\001 \002(\005\0229\n\004type\030\002 \002(\0162"
+    "+.Annotated_Instruction.Operand.Operand_"
+    "Type\022\r\n\005value\030\003 \001(\t\"Q\n\014Operand_Type\022\013\n\007U"
+    "nknown\020\000\022\r\n\tImmediate\020\001\022\014\n\010Register\020\002\022\n\n"
+    "\006Memory\020\003\022\013\n\007Address\020\004\"\251\003\n\025Annotated_Reg"
+    "ister_32\022-\n\004name\030\001 \002(\0162\037.Annotated_Regis"
+    "ter_32.Register\022\024\n\014used_at_addr\030\002 \002(\003\022\030\n"
+    "\020used_at_addr_hex\030\003 \001(\t\022\027\n\005value\030\007 \003(\0132\010"
+    ".Edge_32\022-\n\004fact\030\010 \002(\0132\037.Annotated_Regis"
+    "ter_32.Property\022\033\n\023abstract_expression\030\t"
+    " \001(\t\032*\n\010Property\022\017\n\007Unknown\030\001 \002(\010\022\r\n\005Ali"
+    "ve\030\002 \001(\010\"\237\001\n\010Register\022\013\n\007Unknown\020\000\022\007\n\003ea"
+    "x\020\001\022\007\n\003ecx\020\002\022\007\n\003edx\020\003\022\007\n\003ebx\020\004\022\007\n\003esp\020\005\022"
+    "\007\n\003ebp\020\006\022\007\n\003esi\020\007\022\007\n\003edi\020\010\022\007\n\003eip\020\t\022\013\n\007f"
+    "s_base\020\n\022\013\n\007gs_base\020\013\022\007\n\003gtd\020\014\022\007\n\003ldt\020\r\022"
+    "\t\n\005mxcsr\020\016\"\344\003\n\025Annotated_Register_64\022-\n\004"
+    "name\030\001 \002(\0162\037.Annotated_Register_64.Regis"
+    "ter\022\024\n\014used_at_addr\030\002 \002(\003\022\030\n\020used_at_add"
+    "r_hex\030\003 \001(\t\022\027\n\005value\030\004 \003(\0132\010.Edge_64\022-\n\004"
+    "fact\030\005 \002(\0132\037.Annotated_Register_64.Prope"
+    "rty\022\033\n\023abstract_expression\030\006 \001(\t\032*\n\010Prop"
+    "erty\022\017\n\007Unknown\030\001 \002(\010\022\r\n\005Alive\030\002 \001(\010\"\332\001\n"
+    "\010Register\022\013\n\007Unknown\020\000\022\007\n\003rax\020\n\022\007\n\003rcx\020\013"
+    "\022\007\n\003rdx\020\014\022\007\n\003rbx\020\r\022\007\n\003rsp\020\016\022\007\n\003rbp\020\017\022\007\n\003"
+    "rsi\020\020\022\007\n\003rdi\020\021\022\007\n\003rip\020\022\022\006\n\002r8\020\023\022\006\n\002r9\020\024\022"
+    "\007\n\003r10\020\025\022\007\n\003r11\020\026\022\007\n\003r12\020\027\022\007\n\003r13\020\030\022\007\n\003r"
+    "14\020\031\022\007\n\003r15\020\032\022\013\n\007fs_base\020\033\022\013\n\007gs_base\020\034\022"
+    "\007\n\003gdt\020\035\022\007\n\003ldt\020\036\"\215\002\n\022Annotated_Function"
+    "\022\014\n\004name\030\001 \002(\t\022\025\n\rstart_at_addr\030\002 \002(\003\022\031\n"
+    "\021start_at_addr_hex\030\003 \001(\t\022\023\n\013end_at_addr\030"
+    "\004 \001(\003\022\027\n\017end_at_addr_hex\030\005 \001(\t\022&\n\006prolog"
+    "\030\006 \003(\0132\026.Annotated_Instruction\022&\n\006epilog"
+    "\030\007 \003(\0132\026.Annotated_Instruction\022 \n\016refere"
+    "red_from\030\010 \003(\0132\010.Edge_64\022\027\n\005calls\030\t \003(\0132"
+    "\010.Edge_64\"\334\001\n\013Disassembly\022%\n\005instr\030\001 \003(\013"
+    "2\026.Annotated_Instruction\0223\n\014branch_instr"
+    "\030\002 \003(\0132\035.Annotated_Branch_Instruction\022&\n"
+    "\006reg_32\030\003 \003(\0132\026.Annotated_Register_32\022&\n"
+    "\006reg_64\030\004 \003(\0132\026.Annotated_Register_64\022!\n"
+    "\004func\030\005 \003(\0132\023.Annotated_Function", 4232);
   ::google::protobuf::MessageFactory::InternalRegisterGeneratedFile(
     "CFG.proto", &protobuf_RegisterTypes);
   JumpTbl::default_instance_ = new JumpTbl();
@@ -817,6 +831,7 @@ struct StaticDescriptorInitializer_CFG_2eproto {
 #ifndef _MSC_VER
 const int JumpTbl::kTableEntriesFieldNumber;
 const int JumpTbl::kZeroOffsetFieldNumber;
+const int JumpTbl::kEntryDeltasFieldNumber;
 #endif  // !_MSC_VER
 
 JumpTbl::JumpTbl()
@@ -874,6 +889,7 @@ void JumpTbl::Clear() {
     zero_offset_ = 0;
   }
   table_entries_.Clear();
+  entry_deltas_.Clear();
   ::memset(_has_bits_, 0, sizeof(_has_bits_));
   mutable_unknown_fields()->Clear();
 }
@@ -918,6 +934,27 @@ bool JumpTbl::MergePartialFromCodedStream(
         } else {
           goto handle_uninterpreted;
         }
+        if (input->ExpectTag(26)) goto parse_entry_deltas;
+        break;
+      }
+
+      // repeated sint64 entry_deltas = 3 [packed = true];
+      case 3: {
+        if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag) ==
+            ::google::protobuf::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED) {
+         parse_entry_deltas:
+          DO_((::google::protobuf::internal::WireFormatLite::ReadPackedPrimitive<
+                   ::google::protobuf::int64, ::google::protobuf::internal::WireFormatLite::TYPE_SINT64>(
+                 input, this->mutable_entry_deltas())));
+        } else if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag)
+                   == ::google::protobuf::internal::WireFormatLite::
+                      WIRETYPE_VARINT) {
+          DO_((::google::protobuf::internal::WireFormatLite::ReadRepeatedPrimitiveNoInline<
+                   ::google::protobuf::int64, ::google::protobuf::internal::WireFormatLite::TYPE_SINT64>(
+                 1, 26, input, this->mutable_entry_deltas())));
+        } else {
+          goto handle_uninterpreted;
+        }
         if (input->ExpectAtEnd()) return true;
         break;
       }
@@ -951,6 +988,16 @@ void JumpTbl::SerializeWithCachedSizes(
     ::google::protobuf::internal::WireFormatLite::WriteInt32(2, this->zero_offset(), output);
   }
 
+  // repeated sint64 entry_deltas = 3 [packed = true];
+  if (this->entry_deltas_size() > 0) {
+    ::google::protobuf::internal::WireFormatLite::WriteTag(3, ::google::protobuf::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED, output);
+    output->WriteVarint32(_entry_deltas_cached_byte_size_);
+  }
+  for (int i = 0; i < this->entry_deltas_size(); i++) {
+    ::google::protobuf::internal::WireFormatLite::WriteSInt64NoTag(
+      this->entry_deltas(i), output);
+  }
+
   if (!unknown_fields().empty()) {
     ::google::protobuf::internal::WireFormat::SerializeUnknownFields(
         unknown_fields(), output);
@@ -970,6 +1017,20 @@ void JumpTbl::SerializeWithCachedSizes(
     target = ::google::protobuf::internal::WireFormatLite::WriteInt32ToArray(2, this->zero_offset(), target);
   }
 
+  // repeated sint64 entry_deltas = 3 [packed = true];
+  if (this->entry_deltas_size() > 0) {
+    target = ::google::protobuf::internal::WireFormatLite::WriteTagToArray(
+      3,
+      ::google::protobuf::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED,
+      target);
+    target = ::google::protobuf::io::CodedOutputStream::WriteVarint32ToArray(
+      _entry_deltas_cached_byte_size_, target);
+  }
+  for (int i = 0; i < this->entry_deltas_size(); i++) {
+    target = ::google::protobuf::internal::WireFormatLite::
+      WriteSInt64NoTagToArray(this->entry_deltas(i), target);
+  }
+
   if (!unknown_fields().empty()) {
     target = ::google::protobuf::internal::WireFormat::SerializeUnknownFieldsToArray(
         unknown_fields(), target);
@@ -999,6 +1060,23 @@ int JumpTbl::ByteSize() const {
     total_size += 1 * this->table_entries_size() + data_size;
   }
 
+  // repeated sint64 entry_deltas = 3 [packed = true];
+  {
+    int data_size = 0;
+    for (int i = 0; i < this->entry_deltas_size(); i++) {
+      data_size += ::google::protobuf::internal::WireFormatLite::
+        SInt64Size(this->entry_deltas(i));
+    }
+    if (data_size > 0) {
+      total_size += 1 +
+        ::google::protobuf::internal::WireFormatLite::Int32Size(data_size);
+    }
+    GOOGLE_SAFE_CONCURRENT_WRITES_BEGIN();
+    _entry_deltas_cached_byte_size_ = data_size;
+    GOOGLE_SAFE_CONCURRENT_WRITES_END();
+    total_size += data_size;
+  }
+
   if (!unknown_fields().empty()) {
     total_size +=
       ::google::protobuf::internal::WireFormat::ComputeUnknownFieldsSize(
@@ -1025,6 +1103,7 @@ void JumpTbl::MergeFrom(const ::google::protobuf::Message& from) {
 void JumpTbl::MergeFrom(const JumpTbl& from) {
   GOOGLE_CHECK_NE(&from, this);
   table_entries_.MergeFrom(from.table_entries_);
+  entry_deltas_.MergeFrom(from.entry_deltas_);
   if (from._has_bits_[1 / 32] & (0xffu << (1 % 32))) {
     if (from.has_zero_offset()) {
       set_zero_offset(from.zero_offset());
@@ -1055,6 +1134,7 @@ void JumpTbl::Swap(JumpTbl* other) {
   if (other != this) {
     table_entries_.Swap(&other->table_entries_);
     std::swap(zero_offset_, other->zero_offset_);
+    entry_deltas_.Swap(&other->entry_deltas_);
     std::swap(_has_bits_[0], other->_has_bits_[0]);
     _unknown_fields_.Swap(&other->_unknown_fields_);
     std::swap(_cached_size_, other->_cached_size_);
@@ -1342,6 +1422,9 @@ const int Instruction::kRelocOffsetFieldNumber;
 const int Instruction::kJumpTableFieldNumber;
 const int Instruction::kJumpIndexTableFieldNumber;
 const int Instruction::kExtDataNameFieldNumber;
+const int Instruction::kTrueDeltaFieldNumber;
+const int Instruction::kFalseDeltaFieldNumber;
+const int Instruction::kCallDeltaFieldNumber;
 #endif  // !_MSC_VER
 
 Instruction::Instruction()
@@ -1374,6 +1457,9 @@ void Instruction::SharedCtor() {
   jump_table_ = NULL;
   jump_index_table_ = NULL;
   ext_data_name_ = const_cast< ::std::string*>(&::google::protobuf::internal::kEmptyString);
+  true_delta_ = GOOGLE_LONGLONG(0);
+  false_delta_ = GOOGLE_LONGLONG(0);
+  call_delta_ = GOOGLE_LONGLONG(0);
   ::memset(_has_bits_, 0, sizeof(_has_bits_));
 }
 
@@ -1450,6 +1536,9 @@ void Instruction::Clear() {
         ext_data_name_->clear();
       }
     }
+    true_delta_ = GOOGLE_LONGLONG(0);
+    false_delta_ = GOOGLE_LONGLONG(0);
+    call_delta_ = GOOGLE_LONGLONG(0);
   }
   ::memset(_has_bits_, 0, sizeof(_has_bits_));
   mutable_unknown_fields()->Clear();
@@ -1461,7 +1550,7 @@ bool Instruction::MergePartialFromCodedStream(
   ::google::protobuf::uint32 tag;
   while ((tag = input->ReadTag()) != 0) {
     switch (::google::protobuf::internal::WireFormatLite::GetTagFieldNumber(tag)) {
-      // required bytes inst_bytes = 1;
+      // optional bytes inst_bytes = 1;
       case 1: {
         if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag) ==
             ::google::protobuf::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED) {
@@ -1474,7 +1563,7 @@ bool Instruction::MergePartialFromCodedStream(
         break;
       }
 
-      // required int64 inst_addr = 2;
+      // optional int64 inst_addr = 2;
       case 2: {
         if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag) ==
             ::google::protobuf::internal::WireFormatLite::WIRETYPE_VARINT) {
@@ -1522,7 +1611,7 @@ bool Instruction::MergePartialFromCodedStream(
         break;
       }
 
-      // required int32 inst_len = 5;
+      // optional int32 inst_len = 5;
       case 5: {
         if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag) ==
             ::google::protobuf::internal::WireFormatLite::WIRETYPE_VARINT) {
@@ -1644,6 +1733,54 @@ bool Instruction::MergePartialFromCodedStream(
         } else {
           goto handle_uninterpreted;
         }
+        if (input->ExpectTag(104)) goto parse_true_delta;
+        break;
+      }
+
+      // optional sint64 true_delta = 13;
+      case 13: {
+        if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag) ==
+            ::google::protobuf::internal::WireFormatLite::WIRETYPE_VARINT) {
+         parse_true_delta:
+          DO_((::google::protobuf::internal::WireFormatLite::ReadPrimitive<
+                   ::google::protobuf::int64, ::google::protobuf::internal::WireFormatLite::TYPE_SINT64>(
+                 input, &true_delta_)));
+          set_has_true_delta();
+        } else {
+          goto handle_uninterpreted;
+        }
+        if (input->ExpectTag(112)) goto parse_false_delta;
+        break;
+      }
+
+      // optional sint64 false_delta = 14;
+      case 14: {
+        if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag) ==
+            ::google::protobuf::internal::WireFormatLite::WIRETYPE_VARINT) {
+         parse_false_delta:
+          DO_((::google::protobuf::internal::WireFormatLite::ReadPrimitive<
+                   ::google::protobuf::int64, ::google::protobuf::internal::WireFormatLite::TYPE_SINT64>(
+                 input, &false_delta_)));
+          set_has_false_delta();
+        } else {
+          goto handle_uninterpreted;
+        }
+        if (input->ExpectTag(120)) goto parse_call_delta;
+        break;
+      }
+
+      // optional sint64 call_delta = 15;
+      case 15: {
+        if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag) ==
+            ::google::protobuf::internal::WireFormatLite::WIRETYPE_VARINT) {
+         parse_call_delta:
+          DO_((::google::protobuf::internal::WireFormatLite::ReadPrimitive<
+                   ::google::protobuf::int64, ::google::protobuf::internal::WireFormatLite::TYPE_SINT64>(
+                 input, &call_delta_)));
+          set_has_call_delta();
+        } else {
+          goto handle_uninterpreted;
+        }
         if (input->ExpectAtEnd()) return true;
         break;
       }
@@ -1666,13 +1803,13 @@ bool Instruction::MergePartialFromCodedStream(
 
 void Instruction::SerializeWithCachedSizes(
     ::google::protobuf::io::CodedOutputStream* output) const {
-  // required bytes inst_bytes = 1;
+  // optional bytes inst_bytes = 1;
   if (has_inst_bytes()) {
     ::google::protobuf::internal::WireFormatLite::WriteBytes(
       1, this->inst_bytes(), output);
   }
 
-  // required int64 inst_addr = 2;
+  // optional int64 inst_addr = 2;
   if (has_inst_addr()) {
     ::google::protobuf::internal::WireFormatLite::WriteInt64(2, this->inst_addr(), output);
   }
@@ -1687,7 +1824,7 @@ void Instruction::SerializeWithCachedSizes(
     ::google::protobuf::internal::WireFormatLite::WriteInt64(4, this->false_target(), output);
   }
 
-  // required int32 inst_len = 5;
+  // optional int32 inst_len = 5;
   if (has_inst_len()) {
     ::google::protobuf::internal::WireFormatLite::WriteInt32(5, this->inst_len(), output);
   }
@@ -1737,6 +1874,21 @@ void Instruction::SerializeWithCachedSizes(
       12, this->ext_data_name(), output);
   }
 
+  // optional sint64 true_delta = 13;
+  if (has_true_delta()) {
+    ::google::protobuf::internal::WireFormatLite::WriteSInt64(13, this->true_delta(), output);
+  }
+
+  // optional sint64 false_delta = 14;
+  if (has_false_delta()) {
+    ::google::protobuf::internal::WireFormatLite::WriteSInt64(14, this->false_delta(), output);
+  }
+
+  // optional sint64 call_delta = 15;
+  if (has_call_delta()) {
+    ::google::protobuf::internal::WireFormatLite::WriteSInt64(15, this->call_delta(), output);
+  }
+
   if (!unknown_fields().empty()) {
     ::google::protobuf::internal::WireFormat::SerializeUnknownFields(
         unknown_fields(), output);
@@ -1745,14 +1897,14 @@ void Instruction::SerializeWithCachedSizes(
 
 ::google::protobuf::uint8* Instruction::SerializeWithCachedSizesToArray(
     ::google::protobuf::uint8* target) const {
-  // required bytes inst_bytes = 1;
+  // optional bytes inst_bytes = 1;
   if (has_inst_bytes()) {
     target =
       ::google::protobuf::internal::WireFormatLite::WriteBytesToArray(
         1, this->inst_bytes(), target);
   }
 
-  // required int64 inst_addr = 2;
+  // optional int64 inst_addr = 2;
   if (has_inst_addr()) {
     target = ::google::protobuf::internal::WireFormatLite::WriteInt64ToArray(2, this->inst_addr(), target);
   }
@@ -1767,7 +1919,7 @@ void Instruction::SerializeWithCachedSizes(
     target = ::google::protobuf::internal::WireFormatLite::WriteInt64ToArray(4, this->false_target(), target);
   }
 
-  // required int32 inst_len = 5;
+  // optional int32 inst_len = 5;
   if (has_inst_len()) {
     target = ::google::protobuf::internal::WireFormatLite::WriteInt32ToArray(5, this->inst_len(), target);
   }
@@ -1821,6 +1973,21 @@ void Instruction::SerializeWithCachedSizes(
         12, this->ext_data_name(), target);
   }
 
+  // optional sint64 true_delta = 13;
+  if (has_true_delta()) {
+    target = ::google::protobuf::internal::WireFormatLite::WriteSInt64ToArray(13, this->true_delta(), target);
+  }
+
+  // optional sint64 false_delta = 14;
+  if (has_false_delta()) {
+    target = ::google::protobuf::internal::WireFormatLite::WriteSInt64ToArray(14, this->false_delta(), target);
+  }
+
+  // optional sint64 call_delta = 15;
+  if (has_call_delta()) {
+    target = ::google::protobuf::internal::WireFormatLite::WriteSInt64ToArray(15, this->call_delta(), target);
+  }
+
   if (!unknown_fields().empty()) {
     target = ::google::protobuf::internal::WireFormat::SerializeUnknownFieldsToArray(
         unknown_fields(), target);
@@ -1832,14 +1999,14 @@ int Instruction::ByteSize() const {
   int total_size = 0;
 
   if (_has_bits_[0 / 32] & (0xffu << (0 % 32))) {
-    // required bytes inst_bytes = 1;
+    // optional bytes inst_bytes = 1;
     if (has_inst_bytes()) {
       total_size += 1 +
         ::google::protobuf::internal::WireFormatLite::BytesSize(
           this->inst_bytes());
     }
 
-    // required int64 inst_addr = 2;
+    // optional int64 inst_addr = 2;
     if (has_inst_addr()) {
       total_size += 1 +
         ::google::protobuf::internal::WireFormatLite::Int64Size(
@@ -1860,7 +2027,7 @@ int Instruction::ByteSize() const {
           this->false_target());
     }
 
-    // required int32 inst_len = 5;
+    // optional int32 inst_len = 5;
     if (has_inst_len()) {
       total_size += 1 +
         ::google::protobuf::internal::WireFormatLite::Int32Size(
@@ -1918,6 +2085,27 @@ int Instruction::ByteSize() const {
           this->ext_data_name());
     }
 
+    // optional sint64 true_delta = 13;
+    if (has_true_delta()) {
+      total_size += 1 +
+        ::google::protobuf::internal::WireFormatLite::SInt64Size(
+          this->true_delta());
+    }
+
+    // optional sint64 false_delta = 14;
+    if (has_false_delta()) {
+      total_size += 1 +
+        ::google::protobuf::internal::WireFormatLite::SInt64Size(
+          this->false_delta());
+    }
+
+    // optional sint64 call_delta = 15;
+    if (has_call_delta()) {
+      total_size += 1 +
+        ::google::protobuf::internal::WireFormatLite::SInt64Size(
+          this->call_delta());
+    }
+
   }
   if (!unknown_fields().empty()) {
     total_size +=
@@ -1983,6 +2171,15 @@ void Instruction::MergeFrom(const Instruction& from) {
     if (from.has_ext_data_name()) {
       set_ext_data_name(from.ext_data_name());
     }
+    if (from.has_true_delta()) {
+      set_true_delta(from.true_delta());
+    }
+    if (from.has_false_delta()) {
+      set_false_delta(from.false_delta());
+    }
+    if (from.has_call_delta()) {
+      set_call_delta(from.call_delta());
+    }
   }
   mutable_unknown_fields()->MergeFrom(from.unknown_fields());
 }
@@ -2000,7 +2197,6 @@ void Instruction::CopyFrom(const Instruction& from) {
 }
 
 bool Instruction::IsInitialized() const {
-  if ((_has_bits_[0] & 0x00000013) != 0x00000013) return false;
 
   if (has_jump_table()) {
     if (!this->jump_table().IsInitialized()) return false;
@@ -2025,6 +2221,9 @@ void Instruction::Swap(Instruction* other) {
     std::swap(jump_table_, other->jump_table_);
     std::swap(jump_index_table_, other->jump_index_table_);
     std::swap(ext_data_name_, other->ext_data_name_);
+    std::swap(true_delta_, other->true_delta_);
+    std::swap(false_delta_, other->false_delta_);
+    std::swap(call_delta_, other->call_delta_);
     std::swap(_has_bits_[0], other->_has_bits_[0]);
     _unknown_fields_.Swap(&other->_unknown_fields_);
     std::swap(_cached_size_, other->_cached_size_);
@@ -2046,6 +2245,9 @@ void Instruction::Swap(Instruction* other) {
 const int Block::kInstsFieldNumber;
 const int Block::kBaseAddressFieldNumber;
 const int Block::kBlockFollowsFieldNumber;
+const int Block::kCodeOffsetFieldNumber;
+const int Block::kInstLengthsFieldNumber;
+const int Block::kFollowDeltasFieldNumber;
 #endif  // !_MSC_VER
 
 Block::Block()
@@ -2065,6 +2267,8 @@ Block::Block(const Block& from)
 void Block::SharedCtor() {
   _cached_size_ = 0;
   base_address_ = GOOGLE_LONGLONG(0);
+  code_offset_ = 0;
+  inst_lengths_ = const_cast< ::std::string*>(&::google::protobuf::internal::kEmptyString);
   ::memset(_has_bits_, 0, sizeof(_has_bits_));
 }
 
@@ -2073,6 +2277,9 @@ Block::~Block() {
 }
 
 void Block::SharedDtor() {
+  if (inst_lengths_ != &::google::protobuf::internal::kEmptyString) {
+    delete inst_lengths_;
+  }
   if (this != default_instance_) {
   }
 }
@@ -2101,9 +2308,16 @@ Block* Block::New() const {
 void Block::Clear() {
   if (_has_bits_[1 / 32] & (0xffu << (1 % 32))) {
     base_address_ = GOOGLE_LONGLONG(0);
+    code_offset_ = 0;
+    if (has_inst_lengths()) {
+      if (inst_lengths_ != &::google::protobuf::internal::kEmptyString) {
+        inst_lengths_->clear();
+      }
+    }
   }
   insts_.Clear();
   block_follows_.Clear();
+  follow_deltas_.Clear();
   ::memset(_has_bits_, 0, sizeof(_has_bits_));
   mutable_unknown_fields()->Clear();
 }
@@ -2163,6 +2377,57 @@ bool Block::MergePartialFromCodedStream(
           goto handle_uninterpreted;
         }
         if (input->ExpectTag(24)) goto parse_block_follows;
+        if (input->ExpectTag(32)) goto parse_code_offset;
+        break;
+      }
+
+      // optional int32 code_offset = 4;
+      case 4: {
+        if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag) ==
+            ::google::protobuf::internal::WireFormatLite::WIRETYPE_VARINT) {
+         parse_code_offset:
+          DO_((::google::protobuf::internal::WireFormatLite::ReadPrimitive<
+                   ::google::protobuf::int32, ::google::protobuf::internal::WireFormatLite::TYPE_INT32>(
+                 input, &code_offset_)));
+          set_has_code_offset();
+        } else {
+          goto handle_uninterpreted;
+        }
+        if (input->ExpectTag(42)) goto parse_inst_lengths;
+        break;
+      }
+
+      // optional bytes inst_lengths = 5;
+      case 5: {
+        if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag) ==
+            ::google::protobuf::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED) {
+         parse_inst_lengths:
+          DO_(::google::protobuf::internal::WireFormatLite::ReadBytes(
+                input, this->mutable_inst_lengths()));
+        } else {
+          goto handle_uninterpreted;
+        }
+        if (input->ExpectTag(50)) goto parse_follow_deltas;
+        break;
+      }
+
+      // repeated sint64 follow_deltas = 6 [packed = true];
+      case 6: {
+        if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag) ==
+            ::google::protobuf::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED) {
+         parse_follow_deltas:
+          DO_((::google::protobuf::internal::WireFormatLite::ReadPackedPrimitive<
+                   ::google::protobuf::int64, ::google::protobuf::internal::WireFormatLite::TYPE_SINT64>(
+                 input, this->mutable_follow_deltas())));
+        } else if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag)
+                   == ::google::protobuf::internal::WireFormatLite::
+                      WIRETYPE_VARINT) {
+          DO_((::google::protobuf::internal::WireFormatLite::ReadRepeatedPrimitiveNoInline<
+                   ::google::protobuf::int64, ::google::protobuf::internal::WireFormatLite::TYPE_SINT64>(
+                 1, 50, input, this->mutable_follow_deltas())));
+        } else {
+          goto handle_uninterpreted;
+        }
         if (input->ExpectAtEnd()) return true;
         break;
       }
@@ -2202,6 +2467,27 @@ void Block::SerializeWithCachedSizes(
       3, this->block_follows(i), output);
   }
 
+  // optional int32 code_offset = 4;
+  if (has_code_offset()) {
+    ::google::protobuf::internal::WireFormatLite::WriteInt32(4, this->code_offset(), output);
+  }
+
+  // optional bytes inst_lengths = 5;
+  if (has_inst_lengths()) {
+    ::google::protobuf::internal::WireFormatLite::WriteBytes(
+      5, this->inst_lengths(), output);
+  }
+
+  // repeated sint64 follow_deltas = 6 [packed = true];
+  if (this->follow_deltas_size() > 0) {
+    ::google::protobuf::internal::WireFormatLite::WriteTag(6, ::google::protobuf::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED, output);
+    output->WriteVarint32(_follow_deltas_cached_byte_size_);
+  }
+  for (int i = 0; i < this->follow_deltas_size(); i++) {
+    ::google::protobuf::internal::WireFormatLite::WriteSInt64NoTag(
+      this->follow_deltas(i), output);
+  }
+
   if (!unknown_fields().empty()) {
     ::google::protobuf::internal::WireFormat::SerializeUnknownFields(
         unknown_fields(), output);
@@ -2228,6 +2514,32 @@ void Block::SerializeWithCachedSizes(
       WriteInt64ToArray(3, this->block_follows(i), target);
   }
 
+  // optional int32 code_offset = 4;
+  if (has_code_offset()) {
+    target = ::google::protobuf::internal::WireFormatLite::WriteInt32ToArray(4, this->code_offset(), target);
+  }
+
+  // optional bytes inst_lengths = 5;
+  if (has_inst_lengths()) {
+    target =
+      ::google::protobuf::internal::WireFormatLite::WriteBytesToArray(
+        5, this->inst_lengths(), target);
+  }
+
+  // repeated sint64 follow_deltas = 6 [packed = true];
+  if (this->follow_deltas_size() > 0) {
+    target = ::google::protobuf::internal::WireFormatLite::WriteTagToArray(
+      6,
+      ::google::protobuf::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED,
+      target);
+    target = ::google::protobuf::io::CodedOutputStream::WriteVarint32ToArray(
+      _follow_deltas_cached_byte_size_, target);
+  }
+  for (int i = 0; i < this->follow_deltas_size(); i++) {
+    target = ::google::protobuf::internal::WireFormatLite::
+      WriteSInt64NoTagToArray(this->follow_deltas(i), target);
+  }
+
   if (!unknown_fields().empty()) {
     target = ::google::protobuf::internal::WireFormat::SerializeUnknownFieldsToArray(
         unknown_fields(), target);
@@ -2246,6 +2558,20 @@ int Block::ByteSize() const {
           this->base_address());
     }
 
+    // optional int32 code_offset = 4;
+    if (has_code_offset()) {
+      total_size += 1 +
+        ::google::protobuf::internal::WireFormatLite::Int32Size(
+          this->code_offset());
+    }
+
+    // optional bytes inst_lengths = 5;
+    if (has_inst_lengths()) {
+      total_size += 1 +
+        ::google::protobuf::internal::WireFormatLite::BytesSize(
+          this->inst_lengths());
+    }
+
   }
   // repeated .Instruction insts = 1;
   total_size += 1 * this->insts_size();
@@ -2265,6 +2591,23 @@ int Block::ByteSize() const {
     total_size += 1 * this->block_follows_size() + data_size;
   }
 
+  // repeated sint64 follow_deltas = 6 [packed = true];
+  {
+    int data_size = 0;
+    for (int i = 0; i < this->follow_deltas_size(); i++) {
+      data_size += ::google::protobuf::internal::WireFormatLite::
+        SInt64Size(this->follow_deltas(i));
+    }
+    if (data_size > 0) {
+      total_size += 1 +
+        ::google::protobuf::internal::WireFormatLite::Int32Size(data_size);
+    }
+    GOOGLE_SAFE_CONCURRENT_WRITES_BEGIN();
+    _follow_deltas_cached_byte_size_ = data_size;
+    GOOGLE_SAFE_CONCURRENT_WRITES_END();
+    total_size += data_size;
+  }
+
   if (!unknown_fields().empty()) {
     total_size +=
       ::google::protobuf::internal::WireFormat::ComputeUnknownFieldsSize(
@@ -2292,10 +2635,17 @@ void Block::MergeFrom(const Block& from) {
   GOOGLE_CHECK_NE(&from, this);
   insts_.MergeFrom(from.insts_);
   block_follows_.MergeFrom(from.block_follows_);
+  follow_deltas_.MergeFrom(from.follow_deltas_);
   if (from._has_bits_[1 / 32] & (0xffu << (1 % 32))) {
     if (from.has_base_address()) {
       set_base_address(from.base_address());
     }
+    if (from.has_code_offset()) {
+      set_code_offset(from.code_offset());
+    }
+    if (from.has_inst_lengths()) {
+      set_inst_lengths(from.inst_lengths());
+    }
   }
   mutable_unknown_fields()->MergeFrom(from.unknown_fields());
 }
@@ -2326,6 +2676,9 @@ void Block::Swap(Block* other) {
     insts_.Swap(&other->insts_);
     std::swap(base_address_, other->base_address_);
     block_follows_.Swap(&other->block_follows_);
+    std::swap(code_offset_, other->code_offset_);
+    std::swap(inst_lengths_, other->inst_lengths_);
+    follow_deltas_.Swap(&other->follow_deltas_);
     std::swap(_has_bits_[0], other->_has_bits_[0]);
     _unknown_fields_.Swap(&other->_unknown_fields_);
     std::swap(_cached_size_, other->_cached_size_);
@@ -2346,6 +2699,7 @@ void Block::Swap(Block* other) {
 #ifndef _MSC_VER
 const int Function::kBlocksFieldNumber;
 const int Function::kEntryAddressFieldNumber;
+const int Function::kCodeImageFieldNumber;
 #endif  // !_MSC_VER
 
 Function::Function()
@@ -2365,6 +2719,7 @@ Function::Function(const Function& from)
 void Function::SharedCtor() {
   _cached_size_ = 0;
   entry_address_ = GOOGLE_LONGLONG(0);
+  code_image_ = const_cast< ::std::string*>(&::google::protobuf::internal::kEmptyString);
   ::memset(_has_bits_, 0, sizeof(_has_bits_));
 }
 
@@ -2373,6 +2728,9 @@ Function::~Function() {
 }
 
 void Function::SharedDtor() {
+  if (code_image_ != &::google::protobuf::internal::kEmptyString) {
+    delete code_image_;
+  }
   if (this != default_instance_) {
   }
 }
@@ -2401,6 +2759,11 @@ Function* Function::New() const {
 void Function::Clear() {
   if (_has_bits_[1 / 32] & (0xffu << (1 % 32))) {
     entry_address_ = GOOGLE_LONGLONG(0);
+    if (has_code_image()) {
+      if (code_image_ != &::google::protobuf::internal::kEmptyString) {
+        code_image_->clear();
+      }
+    }
   }
   blocks_.Clear();
   ::memset(_has_bits_, 0, sizeof(_has_bits_));
@@ -2440,6 +2803,20 @@ bool Function::MergePartialFromCodedStream(
         } else {
           goto handle_uninterpreted;
         }
+        if (input->ExpectTag(26)) goto parse_code_image;
+        break;
+      }
+
+      // optional bytes code_image = 3;
+      case 3: {
+        if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag) ==
+            ::google::protobuf::internal::WireFormatLite::WIRETYPE_LENGTH_DELIMITED) {
+         parse_code_image:
+          DO_(::google::protobuf::internal::WireFormatLite::ReadBytes(
+                input, this->mutable_code_image()));
+        } else {
+          goto handle_uninterpreted;
+        }
         if (input->ExpectAtEnd()) return true;
         break;
       }
@@ -2473,6 +2850,12 @@ void Function::SerializeWithCachedSizes(
     ::google::protobuf::internal::WireFormatLite::WriteInt64(2, this->entry_address(), output);
   }
 
+  // optional bytes code_image = 3;
+  if (has_code_image()) {
+    ::google::protobuf::internal::WireFormatLite::WriteBytes(
+      3, this->code_image(), output);
+  }
+
   if (!unknown_fields().empty()) {
     ::google::protobuf::internal::WireFormat::SerializeUnknownFields(
         unknown_fields(), output);
@@ -2493,6 +2876,13 @@ void Function::SerializeWithCachedSizes(
     target = ::google::protobuf::internal::WireFormatLite::WriteInt64ToArray(2, this->entry_address(), target);
   }
 
+  // optional bytes code_image = 3;
+  if (has_code_image()) {
+    target =
+      ::google::protobuf::internal::WireFormatLite::WriteBytesToArray(
+        3, this->code_image(), target);
+  }
+
   if (!unknown_fields().empty()) {
     target = ::google::protobuf::internal::WireFormat::SerializeUnknownFieldsToArray(
         unknown_fields(), target);
@@ -2511,6 +2901,13 @@ int Function::ByteSize() const {
           this->entry_address());
     }
 
+    // optional bytes code_image = 3;
+    if (has_code_image()) {
+      total_size += 1 +
+        ::google::protobuf::internal::WireFormatLite::BytesSize(
+          this->code_image());
+    }
+
   }
   // repeated .Block blocks = 1;
   total_size += 1 * this->blocks_size();
@@ -2550,6 +2947,9 @@ void Function::MergeFrom(const Function& from) {
     if (from.has_entry_address()) {
       set_entry_address(from.entry_address());
     }
+    if (from.has_code_image()) {
+      set_code_image(from.code_image());
+    }
   }
   mutable_unknown_fields()->MergeFrom(from.unknown_fields());
 }
@@ -2579,6 +2979,7 @@ void Function::Swap(Function* other) {
   if (other != this) {
     blocks_.Swap(&other->blocks_);
     std::swap(entry_address_, other->entry_address_);
+    std::swap(code_image_, other->code_image_);
     std::swap(_has_bits_[0], other->_has_bits_[0]);
     _unknown_fields_.Swap(&other->_unknown_fields_);
     std::swap(_cached_size_, other->_cached_size_);
@@ -4491,6 +4892,7 @@ const int Module::kInternalDataFieldNumber;
 const int Module::kModuleNameFieldNumber;
 const int Module::kEntriesFieldNumber;
 const int Module::kExternalDataFieldNumber;
+const int Module::kCfgVersionFieldNumber;
 #endif  // !_MSC_VER
 
 Module::Module()
@@ -4510,6 +4912,7 @@ Module::Module(const Module& from)
 void Module::SharedCtor() {
   _cached_size_ = 0;
   module_name_ = const_cast< ::std::string*>(&::google::protobuf::internal::kEmptyString);
+  cfg_version_ = 0;
   ::memset(_has_bits_, 0, sizeof(_has_bits_));
 }
 
@@ -4553,6 +4956,7 @@ void Module::Clear() {
         module_name_->clear();
       }
     }
+    cfg_version_ = 0;
   }
   internal_funcs_.Clear();
   external_funcs_.Clear();
@@ -4657,6 +5061,22 @@ bool Module::MergePartialFromCodedStream(
           goto handle_uninterpreted;
         }
         if (input->ExpectTag(50)) goto parse_external_data;
+        if (input->ExpectTag(56)) goto parse_cfg_version;
+        break;
+      }
+
+      // optional int32 cfg_version = 7;
+      case 7: {
+        if (::google::protobuf::internal::WireFormatLite::GetTagWireType(tag) ==
+            ::google::protobuf::internal::WireFormatLite::WIRETYPE_VARINT) {
+         parse_cfg_version:
+          DO_((::google::protobuf::internal::WireFormatLite::ReadPrimitive<
+                   ::google::protobuf::int32, ::google::protobuf::internal::WireFormatLite::TYPE_INT32>(
+                 input, &cfg_version_)));
+          set_has_cfg_version();
+        } else {
+          goto handle_uninterpreted;
+        }
         if (input->ExpectAtEnd()) return true;
         break;
       }
@@ -4718,6 +5138,11 @@ void Module::SerializeWithCachedSizes(
       6, this->external_data(i), output);
   }
 
+  // optional int32 cfg_version = 7;
+  if (has_cfg_version()) {
+    ::google::protobuf::internal::WireFormatLite::WriteInt32(7, this->cfg_version(), output);
+  }
+
   if (!unknown_fields().empty()) {
     ::google::protobuf::internal::WireFormat::SerializeUnknownFields(
         unknown_fields(), output);
@@ -4771,6 +5196,11 @@ void Module::SerializeWithCachedSizes(
         6, this->external_data(i), target);
   }
 
+  // optional int32 cfg_version = 7;
+  if (has_cfg_version()) {
+    target = ::google::protobuf::internal::WireFormatLite::WriteInt32ToArray(7, this->cfg_version(), target);
+  }
+
   if (!unknown_fields().empty()) {
     target = ::google::protobuf::internal::WireFormat::SerializeUnknownFieldsToArray(
         unknown_fields(), target);
@@ -4789,6 +5219,13 @@ int Module::ByteSize() const {
           this->module_name());
     }
 
+    // optional int32 cfg_version = 7;
+    if (has_cfg_version()) {
+      total_size += 1 +
+        ::google::protobuf::internal::WireFormatLite::Int32Size(
+          this->cfg_version());
+    }
+
   }
   // repeated .Function internal_funcs = 1;
   total_size += 1 * this->internal_funcs_size();
@@ -4864,6 +5301,9 @@ void Module::MergeFrom(const Module& from) {
     if (from.has_module_name()) {
       set_module_name(from.module_name());
     }
+    if (from.has_cfg_version()) {
+      set_cfg_version(from.cfg_version());
+    }
   }
   mutable_unknown_fields()->MergeFrom(from.unknown_fields());
 }
@@ -4909,6 +5349,7 @@ void Module::Swap(Module* other) {
     std::swap(module_name_, other->module_name_);
     entries_.Swap(&other->entries_);
     external_data_.Swap(&other->external_data_);
+    std::swap(cfg_version_, other->cfg_version_);
     std::swap(_has_bits_[0], other->_has_bits_[0]);
     _unknown_fields_.Swap(&other->_unknown_fields_);
     std::swap(_cached_size_, other->_cached_size_);
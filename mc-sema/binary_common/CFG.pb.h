@@ -326,6 +326,18 @@ class JumpTbl : public ::google::protobuf::Message {
   inline ::google::protobuf::int32 zero_offset() const;
   inline void set_zero_offset(::google::protobuf::int32 value);
 
+  // repeated sint64 entry_deltas = 3 [packed = true];
+  inline int entry_deltas_size() const;
+  inline void clear_entry_deltas();
+  static const int kEntryDeltasFieldNumber = 3;
+  inline ::google::protobuf::int64 entry_deltas(int index) const;
+  inline void set_entry_deltas(int index, ::google::protobuf::int64 value);
+  inline void add_entry_deltas(::google::protobuf::int64 value);
+  inline const ::google::protobuf::RepeatedField< ::google::protobuf::int64 >&
+      entry_deltas() const;
+  inline ::google::protobuf::RepeatedField< ::google::protobuf::int64 >*
+      mutable_entry_deltas();
+
   // @@protoc_insertion_point(class_scope:JumpTbl)
  private:
   inline void set_has_zero_offset();
@@ -334,10 +346,12 @@ class JumpTbl : public ::google::protobuf::Message {
   ::google::protobuf::UnknownFieldSet _unknown_fields_;
 
   ::google::protobuf::RepeatedField< ::google::protobuf::int64 > table_entries_;
+  ::google::protobuf::RepeatedField< ::google::protobuf::int64 > entry_deltas_;
+  mutable int _entry_deltas_cached_byte_size_;
   ::google::protobuf::int32 zero_offset_;
 
   mutable int _cached_size_;
-  ::google::protobuf::uint32 _has_bits_[(2 + 31) / 32];
+  ::google::protobuf::uint32 _has_bits_[(3 + 31) / 32];
 
   friend void  protobuf_AddDesc_CFG_2eproto();
   friend void protobuf_AssignDesc_CFG_2eproto();
@@ -499,7 +513,7 @@ class Instruction : public ::google::protobuf::Message {
 
   // accessors -------------------------------------------------------
 
-  // required bytes inst_bytes = 1;
+  // optional bytes inst_bytes = 1;
   inline bool has_inst_bytes() const;
   inline void clear_inst_bytes();
   static const int kInstBytesFieldNumber = 1;
@@ -511,7 +525,7 @@ class Instruction : public ::google::protobuf::Message {
   inline ::std::string* release_inst_bytes();
   inline void set_allocated_inst_bytes(::std::string* inst_bytes);
 
-  // required int64 inst_addr = 2;
+  // optional int64 inst_addr = 2;
   inline bool has_inst_addr() const;
   inline void clear_inst_addr();
   static const int kInstAddrFieldNumber = 2;
@@ -532,7 +546,7 @@ class Instruction : public ::google::protobuf::Message {
   inline ::google::protobuf::int64 false_target() const;
   inline void set_false_target(::google::protobuf::int64 value);
 
-  // required int32 inst_len = 5;
+  // optional int32 inst_len = 5;
   inline bool has_inst_len() const;
   inline void clear_inst_len();
   static const int kInstLenFieldNumber = 5;
@@ -602,6 +616,27 @@ class Instruction : public ::google::protobuf::Message {
   inline ::std::string* release_ext_data_name();
   inline void set_allocated_ext_data_name(::std::string* ext_data_name);
 
+  // optional sint64 true_delta = 13;
+  inline bool has_true_delta() const;
+  inline void clear_true_delta();
+  static const int kTrueDeltaFieldNumber = 13;
+  inline ::google::protobuf::int64 true_delta() const;
+  inline void set_true_delta(::google::protobuf::int64 value);
+
+  // optional sint64 false_delta = 14;
+  inline bool has_false_delta() const;
+  inline void clear_false_delta();
+  static const int kFalseDeltaFieldNumber = 14;
+  inline ::google::protobuf::int64 false_delta() const;
+  inline void set_false_delta(::google::protobuf::int64 value);
+
+  // optional sint64 call_delta = 15;
+  inline bool has_call_delta() const;
+  inline void clear_call_delta();
+  static const int kCallDeltaFieldNumber = 15;
+  inline ::google::protobuf::int64 call_delta() const;
+  inline void set_call_delta(::google::protobuf::int64 value);
+
   // @@protoc_insertion_point(class_scope:Instruction)
  private:
   inline void set_has_inst_bytes();
@@ -628,6 +663,12 @@ class Instruction : public ::google::protobuf::Message {
   inline void clear_has_jump_index_table();
   inline void set_has_ext_data_name();
   inline void clear_has_ext_data_name();
+  inline void set_has_true_delta();
+  inline void clear_has_true_delta();
+  inline void set_has_false_delta();
+  inline void clear_has_false_delta();
+  inline void set_has_call_delta();
+  inline void clear_has_call_delta();
 
   ::google::protobuf::UnknownFieldSet _unknown_fields_;
 
@@ -643,9 +684,12 @@ class Instruction : public ::google::protobuf::Message {
   ::JumpTbl* jump_table_;
   ::JumpIndexTbl* jump_index_table_;
   ::std::string* ext_data_name_;
+  ::google::protobuf::int64 true_delta_;
+  ::google::protobuf::int64 false_delta_;
+  ::google::protobuf::int64 call_delta_;
 
   mutable int _cached_size_;
-  ::google::protobuf::uint32 _has_bits_[(12 + 31) / 32];
+  ::google::protobuf::uint32 _has_bits_[(15 + 31) / 32];
 
   friend void  protobuf_AddDesc_CFG_2eproto();
   friend void protobuf_AssignDesc_CFG_2eproto();
@@ -741,19 +785,58 @@ class Block : public ::google::protobuf::Message {
   inline ::google::protobuf::RepeatedField< ::google::protobuf::int64 >*
       mutable_block_follows();
 
+  // optional int32 code_offset = 4;
+  inline bool has_code_offset() const;
+  inline void clear_code_offset();
+  static const int kCodeOffsetFieldNumber = 4;
+  inline ::google::protobuf::int32 code_offset() const;
+  inline void set_code_offset(::google::protobuf::int32 value);
+
+  // optional bytes inst_lengths = 5;
+  inline bool has_inst_lengths() const;
+  inline void clear_inst_lengths();
+  static const int kInstLengthsFieldNumber = 5;
+  inline const ::std::string& inst_lengths() const;
+  inline void set_inst_lengths(const ::std::string& value);
+  inline void set_inst_lengths(const char* value);
+  inline void set_inst_lengths(const void* value, size_t size);
+  inline ::std::string* mutable_inst_lengths();
+  inline ::std::string* release_inst_lengths();
+  inline void set_allocated_inst_lengths(::std::string* inst_lengths);
+
+  // repeated sint64 follow_deltas = 6 [packed = true];
+  inline int follow_deltas_size() const;
+  inline void clear_follow_deltas();
+  static const int kFollowDeltasFieldNumber = 6;
+  inline ::google::protobuf::int64 follow_deltas(int index) const;
+  inline void set_follow_deltas(int index, ::google::protobuf::int64 value);
+  inline void add_follow_deltas(::google::protobuf::int64 value);
+  inline const ::google::protobuf::RepeatedField< ::google::protobuf::int64 >&
+      follow_deltas() const;
+  inline ::google::protobuf::RepeatedField< ::google::protobuf::int64 >*
+      mutable_follow_deltas();
+
   // @@protoc_insertion_point(class_scope:Block)
  private:
   inline void set_has_base_address();
   inline void clear_has_base_address();
+  inline void set_has_code_offset();
+  inline void clear_has_code_offset();
+  inline void set_has_inst_lengths();
+  inline void clear_has_inst_lengths();
 
   ::google::protobuf::UnknownFieldSet _unknown_fields_;
 
   ::google::protobuf::RepeatedPtrField< ::Instruction > insts_;
   ::google::protobuf::int64 base_address_;
   ::google::protobuf::RepeatedField< ::google::protobuf::int64 > block_follows_;
+  ::std::string* inst_lengths_;
+  ::google::protobuf::RepeatedField< ::google::protobuf::int64 > follow_deltas_;
+  mutable int _follow_deltas_cached_byte_size_;
+  ::google::protobuf::int32 code_offset_;
 
   mutable int _cached_size_;
-  ::google::protobuf::uint32 _has_bits_[(3 + 31) / 32];
+  ::google::protobuf::uint32 _has_bits_[(6 + 31) / 32];
 
   friend void  protobuf_AddDesc_CFG_2eproto();
   friend void protobuf_AssignDesc_CFG_2eproto();
@@ -837,18 +920,33 @@ class Function : public ::google::protobuf::Message {
   inline ::google::protobuf::int64 entry_address() const;
   inline void set_entry_address(::google::protobuf::int64 value);
 
+  // optional bytes code_image = 3;
+  inline bool has_code_image() const;
+  inline void clear_code_image();
+  static const int kCodeImageFieldNumber = 3;
+  inline const ::std::string& code_image() const;
+  inline void set_code_image(const ::std::string& value);
+  inline void set_code_image(const char* value);
+  inline void set_code_image(const void* value, size_t size);
+  inline ::std::string* mutable_code_image();
+  inline ::std::string* release_code_image();
+  inline void set_allocated_code_image(::std::string* code_image);
+
   // @@protoc_insertion_point(class_scope:Function)
  private:
   inline void set_has_entry_address();
   inline void clear_has_entry_address();
+  inline void set_has_code_image();
+  inline void clear_has_code_image();
 
   ::google::protobuf::UnknownFieldSet _unknown_fields_;
 
   ::google::protobuf::RepeatedPtrField< ::Block > blocks_;
   ::google::protobuf::int64 entry_address_;
+  ::std::string* code_image_;
 
   mutable int _cached_size_;
-  ::google::protobuf::uint32 _has_bits_[(2 + 31) / 32];
+  ::google::protobuf::uint32 _has_bits_[(3 + 31) / 32];
 
   friend void  protobuf_AddDesc_CFG_2eproto();
   friend void protobuf_AssignDesc_CFG_2eproto();
@@ -1662,10 +1760,19 @@ class Module : public ::google::protobuf::Message {
   inline ::google::protobuf::RepeatedPtrField< ::ExternalData >*
       mutable_external_data();
 
+  // optional int32 cfg_version = 7;
+  inline bool has_cfg_version() const;
+  inline void clear_cfg_version();
+  static const int kCfgVersionFieldNumber = 7;
+  inline ::google::protobuf::int32 cfg_version() const;
+  inline void set_cfg_version(::google::protobuf::int32 value);
+
   // @@protoc_insertion_point(class_scope:Module)
  private:
   inline void set_has_module_name();
   inline void clear_has_module_name();
+  inline void set_has_cfg_version();
+  inline void clear_has_cfg_version();
 
   ::google::protobuf::UnknownFieldSet _unknown_fields_;
 
@@ -1675,9 +1782,10 @@ class Module : public ::google::protobuf::Message {
   ::std::string* module_name_;
   ::google::protobuf::RepeatedPtrField< ::EntrySymbol > entries_;
   ::google::protobuf::RepeatedPtrField< ::ExternalData > external_data_;
+  ::google::protobuf::int32 cfg_version_;
 
   mutable int _cached_size_;
-  ::google::protobuf::uint32 _has_bits_[(6 + 31) / 32];
+  ::google::protobuf::uint32 _has_bits_[(7 + 31) / 32];
 
   friend void  protobuf_AddDesc_CFG_2eproto();
   friend void protobuf_AssignDesc_CFG_2eproto();
@@ -3411,6 +3519,31 @@ inline void JumpTbl::set_zero_offset(::google::protobuf::int32 value) {
   zero_offset_ = value;
 }
 
+// repeated sint64 entry_deltas = 3 [packed = true];
+inline int JumpTbl::entry_deltas_size() const {
+  return entry_deltas_.size();
+}
+inline void JumpTbl::clear_entry_deltas() {
+  entry_deltas_.Clear();
+}
+inline ::google::protobuf::int64 JumpTbl::entry_deltas(int index) const {
+  return entry_deltas_.Get(index);
+}
+inline void JumpTbl::set_entry_deltas(int index, ::google::protobuf::int64 value) {
+  entry_deltas_.Set(index, value);
+}
+inline void JumpTbl::add_entry_deltas(::google::protobuf::int64 value) {
+  entry_deltas_.Add(value);
+}
+inline const ::google::protobuf::RepeatedField< ::google::protobuf::int64 >&
+JumpTbl::entry_deltas() const {
+  return entry_deltas_;
+}
+inline ::google::protobuf::RepeatedField< ::google::protobuf::int64 >*
+JumpTbl::mutable_entry_deltas() {
+  return &entry_deltas_;
+}
+
 // -------------------------------------------------------------------
 
 // JumpIndexTbl
@@ -3511,7 +3644,7 @@ inline void JumpIndexTbl::set_zero_offset(::google::protobuf::int32 value) {
 
 // Instruction
 
-// required bytes inst_bytes = 1;
+// optional bytes inst_bytes = 1;
 inline bool Instruction::has_inst_bytes() const {
   return (_has_bits_[0] & 0x00000001u) != 0;
 }
@@ -3581,7 +3714,7 @@ inline void Instruction::set_allocated_inst_bytes(::std::string* inst_bytes) {
   }
 }
 
-// required int64 inst_addr = 2;
+// optional int64 inst_addr = 2;
 inline bool Instruction::has_inst_addr() const {
   return (_has_bits_[0] & 0x00000002u) != 0;
 }
@@ -3647,7 +3780,7 @@ inline void Instruction::set_false_target(::google::protobuf::int64 value) {
   false_target_ = value;
 }
 
-// required int32 inst_len = 5;
+// optional int32 inst_len = 5;
 inline bool Instruction::has_inst_len() const {
   return (_has_bits_[0] & 0x00000010u) != 0;
 }
@@ -3951,6 +4084,72 @@ inline void Instruction::set_allocated_ext_data_name(::std::string* ext_data_nam
   }
 }
 
+// optional sint64 true_delta = 13;
+inline bool Instruction::has_true_delta() const {
+  return (_has_bits_[0] & 0x00001000u) != 0;
+}
+inline void Instruction::set_has_true_delta() {
+  _has_bits_[0] |= 0x00001000u;
+}
+inline void Instruction::clear_has_true_delta() {
+  _has_bits_[0] &= ~0x00001000u;
+}
+inline void Instruction::clear_true_delta() {
+  true_delta_ = GOOGLE_LONGLONG(0);
+  clear_has_true_delta();
+}
+inline ::google::protobuf::int64 Instruction::true_delta() const {
+  return true_delta_;
+}
+inline void Instruction::set_true_delta(::google::protobuf::int64 value) {
+  set_has_true_delta();
+  true_delta_ = value;
+}
+
+// optional sint64 false_delta = 14;
+inline bool Instruction::has_false_delta() const {
+  return (_has_bits_[0] & 0x00002000u) != 0;
+}
+inline void Instruction::set_has_false_delta() {
+  _has_bits_[0] |= 0x00002000u;
+}
+inline void Instruction::clear_has_false_delta() {
+  _has_bits_[0] &= ~0x00002000u;
+}
+inline void Instruction::clear_false_delta() {
+  false_delta_ = GOOGLE_LONGLONG(0);
+  clear_has_false_delta();
+}
+inline ::google::protobuf::int64 Instruction::false_delta() const {
+  return false_delta_;
+}
+inline void Instruction::set_false_delta(::google::protobuf::int64 value) {
+  set_has_false_delta();
+  false_delta_ = value;
+}
+
+// optional sint64 call_delta = 15;
+inline bool Instruction::has_call_delta() const {
+  return (_has_bits_[0] & 0x00004000u) != 0;
+}
+inline void Instruction::set_has_call_delta() {
+  _has_bits_[0] |= 0x00004000u;
+}
+inline void Instruction::clear_has_call_delta() {
+  _has_bits_[0] &= ~0x00004000u;
+}
+inline void Instruction::clear_call_delta() {
+  call_delta_ = GOOGLE_LONGLONG(0);
+  clear_has_call_delta();
+}
+inline ::google::protobuf::int64 Instruction::call_delta() const {
+  return call_delta_;
+}
+inline void Instruction::set_call_delta(::google::protobuf::int64 value) {
+  set_has_call_delta();
+  call_delta_ = value;
+}
+
 // -------------------------------------------------------------------
 
 // Block
@@ -4027,6 +4226,123 @@ Block::mutable_block_follows() {
   return &block_follows_;
 }
 
+// optional int32 code_offset = 4;
+inline bool Block::has_code_offset() const {
+  return (_has_bits_[0] & 0x00000008u) != 0;
+}
+inline void Block::set_has_code_offset() {
+  _has_bits_[0] |= 0x00000008u;
+}
+inline void Block::clear_has_code_offset() {
+  _has_bits_[0] &= ~0x00000008u;
+}
+inline void Block::clear_code_offset() {
+  code_offset_ = 0;
+  clear_has_code_offset();
+}
+inline ::google::protobuf::int32 Block::code_offset() const {
+  return code_offset_;
+}
+inline void Block::set_code_offset(::google::protobuf::int32 value) {
+  set_has_code_offset();
+  code_offset_ = value;
+}
+
+// optional bytes inst_lengths = 5;
+inline bool Block::has_inst_lengths() const {
+  return (_has_bits_[0] & 0x00000010u) != 0;
+}
+inline void Block::set_has_inst_lengths() {
+  _has_bits_[0] |= 0x00000010u;
+}
+inline void Block::clear_has_inst_lengths() {
+  _has_bits_[0] &= ~0x00000010u;
+}
+inline void Block::clear_inst_lengths() {
+  if (inst_lengths_ != &::google::protobuf::internal::kEmptyString) {
+    inst_lengths_->clear();
+  }
+  clear_has_inst_lengths();
+}
+inline const ::std::string& Block::inst_lengths() const {
+  return *inst_lengths_;
+}
+inline void Block::set_inst_lengths(const ::std::string& value) {
+  set_has_inst_lengths();
+  if (inst_lengths_ == &::google::protobuf::internal::kEmptyString) {
+    inst_lengths_ = new ::std::string;
+  }
+  inst_lengths_->assign(value);
+}
+inline void Block::set_inst_lengths(const char* value) {
+  set_has_inst_lengths();
+  if (inst_lengths_ == &::google::protobuf::internal::kEmptyString) {
+    inst_lengths_ = new ::std::string;
+  }
+  inst_lengths_->assign(value);
+}
+inline void Block::set_inst_lengths(const void* value, size_t size) {
+  set_has_inst_lengths();
+  if (inst_lengths_ == &::google::protobuf::internal::kEmptyString) {
+    inst_lengths_ = new ::std::string;
+  }
+  inst_lengths_->assign(reinterpret_cast<const char*>(value), size);
+}
+inline ::std::string* Block::mutable_inst_lengths() {
+  set_has_inst_lengths();
+  if (inst_lengths_ == &::google::protobuf::internal::kEmptyString) {
+    inst_lengths_ = new ::std::string;
+  }
+  return inst_lengths_;
+}
+inline ::std::string* Block::release_inst_lengths() {
+  clear_has_inst_lengths();
+  if (inst_lengths_ == &::google::protobuf::internal::kEmptyString) {
+    return NULL;
+  } else {
+    ::std::string* temp = inst_lengths_;
+    inst_lengths_ = const_cast< ::std::string*>(&::google::protobuf::internal::kEmptyString);
+    return temp;
+  }
+}
+inline void Block::set_allocated_inst_lengths(::std::string* inst_lengths) {
+  if (inst_lengths_ != &::google::protobuf::internal::kEmptyString) {
+    delete inst_lengths_;
+  }
+  if (inst_lengths) {
+    set_has_inst_lengths();
+    inst_lengths_ = inst_lengths;
+  } else {
+    clear_has_inst_lengths();
+    inst_lengths_ = const_cast< ::std::string*>(&::google::protobuf::internal::kEmptyString);
+  }
+}
+
+// repeated sint64 follow_deltas = 6 [packed = true];
+inline int Block::follow_deltas_size() const {
+  return follow_deltas_.size();
+}
+inline void Block::clear_follow_deltas() {
+  follow_deltas_.Clear();
+}
+inline ::google::protobuf::int64 Block::follow_deltas(int index) const {
+  return follow_deltas_.Get(index);
+}
+inline void Block::set_follow_deltas(int index, ::google::protobuf::int64 value) {
+  follow_deltas_.Set(index, value);
+}
+inline void Block::add_follow_deltas(::google::protobuf::int64 value) {
+  follow_deltas_.Add(value);
+}
+inline const ::google::protobuf::RepeatedField< ::google::protobuf::int64 >&
+Block::follow_deltas() const {
+  return follow_deltas_;
+}
+inline ::google::protobuf::RepeatedField< ::google::protobuf::int64 >*
+Block::mutable_follow_deltas() {
+  return &follow_deltas_;
+}
+
 // -------------------------------------------------------------------
 
 // Function
@@ -4078,6 +4394,76 @@ inline void Function::set_entry_address(::google::protobuf::int64 value) {
   entry_address_ = value;
 }
 
+// optional bytes code_image = 3;
+inline bool Function::has_code_image() const {
+  return (_has_bits_[0] & 0x00000004u) != 0;
+}
+inline void Function::set_has_code_image() {
+  _has_bits_[0] |= 0x00000004u;
+}
+inline void Function::clear_has_code_image() {
+  _has_bits_[0] &= ~0x00000004u;
+}
+inline void Function::clear_code_image() {
+  if (code_image_ != &::google::protobuf::internal::kEmptyString) {
+    code_image_->clear();
+  }
+  clear_has_code_image();
+}
+inline const ::std::string& Function::code_image() const {
+  return *code_image_;
+}
+inline void Function::set_code_image(const ::std::string& value) {
+  set_has_code_image();
+  if (code_image_ == &::google::protobuf::internal::kEmptyString) {
+    code_image_ = new ::std::string;
+  }
+  code_image_->assign(value);
+}
+inline void Function::set_code_image(const char* value) {
+  set_has_code_image();
+  if (code_image_ == &::google::protobuf::internal::kEmptyString) {
+    code_image_ = new ::std::string;
+  }
+  code_image_->assign(value);
+}
+inline void Function::set_code_image(const void* value, size_t size) {
+  set_has_code_image();
+  if (code_image_ == &::google::protobuf::internal::kEmptyString) {
+    code_image_ = new ::std::string;
+  }
+  code_image_->assign(reinterpret_cast<const char*>(value), size);
+}
+inline ::std::string* Function::mutable_code_image() {
+  set_has_code_image();
+  if (code_image_ == &::google::protobuf::internal::kEmptyString) {
+    code_image_ = new ::std::string;
+  }
+  return code_image_;
+}
+inline ::std::string* Function::release_code_image() {
+  clear_has_code_image();
+  if (code_image_ == &::google::protobuf::internal::kEmptyString) {
+    return NULL;
+  } else {
+    ::std::string* temp = code_image_;
+    code_image_ = const_cast< ::std::string*>(&::google::protobuf::internal::kEmptyString);
+    return temp;
+  }
+}
+inline void Function::set_allocated_code_image(::std::string* code_image) {
+  if (code_image_ != &::google::protobuf::internal::kEmptyString) {
+    delete code_image_;
+  }
+  if (code_image) {
+    set_has_code_image();
+    code_image_ = code_image;
+  } else {
+    clear_has_code_image();
+    code_image_ = const_cast< ::std::string*>(&::google::protobuf::internal::kEmptyString);
+  }
+}
+
 // -------------------------------------------------------------------
 
 // ExternalFunction
@@ -4980,6 +5366,28 @@ Module::mutable_external_data() {
   return &external_data_;
 }
 
+// optional int32 cfg_version = 7;
+inline bool Module::has_cfg_version() const {
+  return (_has_bits_[0] & 0x00000040u) != 0;
+}
+inline void Module::set_has_cfg_version() {
+  _has_bits_[0] |= 0x00000040u;
+}
+inline void Module::clear_has_cfg_version() {
+  _has_bits_[0] &= ~0x00000040u;
+}
+inline void Module::clear_cfg_version() {
+  cfg_version_ = 0;
+  clear_has_cfg_version();
+}
+inline ::google::protobuf::int32 Module::cfg_version() const {
+  return cfg_version_;
+}
+inline void Module::set_cfg_version(::google::protobuf::int32 value) {
+  set_has_cfg_version();
+  cfg_version_ = value;
+}
+
 // -------------------------------------------------------------------
 
 // Edge_64
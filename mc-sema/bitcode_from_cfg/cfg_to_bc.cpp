@@ -59,6 +59,7 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #include <boost/tokenizer.hpp>
 #include <boost/foreach.hpp>
 #include <boost/algorithm/string.hpp>
+#include <boost/ref.hpp>
 
 using namespace llvm;
 using namespace std;
@@ -84,6 +85,24 @@ OutputModule("m", cl::desc("Output native module format"));
 static cl::opt<bool>
 IgnoreUnsupported("ignore-unsupported", cl::desc("Ignore unsupported instructions"));
 
+static cl::opt<AnnotationMode>
+Annotations("annotate", cl::desc("Mark lifted code with its native instruction"),
+        cl::values(
+            clEnumValN(AnnotateNone, "none", "No annotations"),
+            clEnumValN(AnnotateAddress, "address", "!mcsema.inst metadata holding the address"),
+            clEnumValN(AnnotateFull, "full", "The address and disassembly of every instruction"),
+            clEnumValEnd),
+        cl::init(AnnotateFull));
+
+static cl::opt<unsigned>
+Jobs("j", cl::desc("Lift functions on N threads"), cl::init(1),
+     cl::value_desc("N"));
+
+static cl::opt<unsigned>
+ChunkSize("chunk-size", 
+          cl::desc("Lift N functions of a streamed CFG at a time, each chunk into a bitcode file of its own"), 
+          cl::init(0), cl::value_desc("N"));
+
 void printVersion(void) {
     cout << "0.6" << endl;
     return;
@@ -109,25 +128,95 @@ public:
     }
 };
 
-void doPrintModule(NativeModulePtr m) {
+void doPrintFunction(NativeFunctionPtr f) {
     string  pathBase = "./";
+    string  n = pathBase+to_string<uint64_t>(f->get_start(), hex) + ".dot";
 
+    ofstream    out(n.c_str());
+
+    block_label_writer  bgl(f);
+    CFG                 g = f->get_cfg();
+    write_graphviz(out, g, bgl);
+
+    return;
+}
+
+void doPrintModule(NativeModulePtr m) {
     list<NativeFunctionPtr>           mod_funcs = m->get_funcs();
     list<NativeFunctionPtr>::iterator it = mod_funcs.begin();
 
     for(; it != mod_funcs.end(); ++it) {
-        NativeFunctionPtr f = *it;
-        string n =
-            pathBase+to_string<uint64_t>(f->get_start(), hex) + ".dot";
+        doPrintFunction(*it);
+    }
 
-        ofstream    out(n.c_str());
+    return;
+}
 
-        block_label_writer  bgl(f);
-        CFG                 g = f->get_cfg();
-        write_graphviz(out, g, bgl);
+// collects the functions of the CFG as they are read, and lifts every 
+// ChunkSize of them into <output>.<n>.bc. once a chunk is written its 
+// native functions are dropped
+class ChunkWriter {
+private:
+    NativeModulePtr         mod;
+    llvm::Module            *stub;
+    string                  base;
+    list<NativeFunctionPtr> funcs;
+public:
+    unsigned                chunks;
+
+    ChunkWriter(NativeModulePtr m, llvm::Module *M, const string &b) : 
+        mod(m), stub(M), base(b), chunks(0)
+    {
+        return;
     }
 
-    return;
+    void operator()(NativeFunctionPtr f) {
+        if(OutputModule)
+            doPrintFunction(f);
+
+        funcs.push_back(f);
+        if(funcs.size() >= ChunkSize) {
+            flush();
+        }
+    }
+
+    void flush(void) {
+        if(funcs.empty()) {
+            return;
+        }
+
+        string                  name = chunkName(chunks);
+        string                  errorInfo;
+        llvm::tool_output_file  Out(name.c_str(), 
+                errorInfo, 
+                llvm::raw_fd_ostream::F_Binary);
+
+        if(!errorInfo.empty()) {
+            throw LErr(__LINE__, __FILE__, errorInfo);
+        }
+
+        if(!natFuncsToBitcode(mod, funcs, stub, Out.os())) {
+            throw LErr(__LINE__, __FILE__, "Could not lift the functions of "+name);
+        }
+
+        Out.keep();
+        cout << "Wrote " << funcs.size() << " functions to " << name << std::endl;
+
+        chunks++;
+        funcs.clear();
+    }
+
+    string chunkName(unsigned n) const {
+        return base + "." + to_string<unsigned>(n, dec) + ".bc";
+    }
+};
+
+static string chunkBase(const string &out) {
+    if(boost::algorithm::ends_with(out, ".bc")) {
+        return out.substr(0, out.size()-3);
+    }
+
+    return out;
 }
 
 #ifdef WIN32
@@ -322,8 +411,19 @@ int main(int argc, char *argv[])
   }
 
 
-  //reproduce NativeModule from CFG input argument
-  NativeModulePtr mod = readModule(InputFilename, ProtoBuff, list<VA>());
+  if(ChunkSize > 0 && OutputFilename == "-") {
+      cout << "-chunk-size needs an output file to name the chunks after" << endl;
+      return -1;
+  }
+
+  //reproduce NativeModule from CFG input argument. when lifting in 
+  //chunks, the functions are read later, one chunk at a time
+  NativeModulePtr mod;
+  if(ChunkSize > 0) {
+      mod = readModuleOutline(InputFilename);
+  } else {
+      mod = readModule(InputFilename, ProtoBuff, list<VA>());
+  }
   if(mod == NULL) {
       cerr << "Could not process input module: " << InputFilename << std::endl;
       return -2;
@@ -360,13 +460,19 @@ int main(int argc, char *argv[])
     return -1;
   }
 
-  if(OutputModule)
+  if(OutputModule && ChunkSize == 0)
     doPrintModule(mod);
 
   if(IgnoreUnsupported) {
       ignoreUnsupportedInsts = true;
   }
 
+  annotationMode = Annotations;
+
+  if(Jobs > 0) {
+      liftThreads = Jobs;
+  }
+
   //now, convert it to an LLVM module 
   llvm::Module  *M = getLLVMModule(mod->name());
 
@@ -376,10 +482,17 @@ int main(int argc, char *argv[])
     return -1;
   }
 
-  bool  modResult = false;
+  bool        modResult = false;
+  ChunkWriter chunker(mod, M, chunkBase(OutputFilename));
 
   try {
-    modResult = natModToModule(mod, M, outs());
+    if(ChunkSize > 0) {
+        modResult = natModToStubModule(mod, M, outs()) &&
+                    readModuleFunctions(InputFilename, boost::ref(chunker));
+        chunker.flush();
+    } else {
+        modResult = natModToModule(mod, M, outs());
+    }
   } catch(std::exception &e) {
     cout << "error: " << endl << e.what() << endl;
     return -1;
@@ -429,6 +542,9 @@ int main(int argc, char *argv[])
                   errorInfo,
                   llvm::raw_fd_ostream::F_Binary);
 
+          if(ChunkSize > 0)
+              finishStubModule(M);
+
 		  doPostAnalysis(mod, M);
 
           // will abort if verification fails
@@ -436,6 +552,13 @@ int main(int argc, char *argv[])
 
           WriteBitcodeToFile(M, Out.os());
           Out.keep(); 
+
+          if(ChunkSize > 0 && chunker.chunks > 0) {
+              cout << "Link " << OutputFilename << " with " << chunker.chunkName(0);
+              if(chunker.chunks > 1) 
+                  cout << " through " << chunker.chunkName(chunker.chunks-1);
+              cout << " using llvm-link" << endl;
+          }
       } catch(std::exception &e) {
           cout << "error: " << endl << e.what() << endl;
           return -1;
@@ -52,6 +52,12 @@ DispatchMap translationDispatchMap;
 
 bool initInstructionDispatch() {
 
+    //doGlobalInit runs for every module we build, and lifting threads
+    //read the map while later modules are set up
+    if( !translationDispatchMap.empty() ) {
+        return true;
+    }
+
     FPU_populateDispatchMap(translationDispatchMap);
     MOV_populateDispatchMap(translationDispatchMap);
     CMOV_populateDispatchMap(translationDispatchMap);
@@ -42,8 +42,6 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 using namespace std;
 using namespace llvm;
 
-extern llvm::PointerType *g_PRegStruct;
-
 // convert a jump table to a data section of symbols
 static DataSection* tableToDataSection(VA new_base, const JumpTable& jt) {
     DataSection *ds = new DataSection();
@@ -240,9 +238,8 @@ void doJumpTableViaSwitch(
         itr != jmpblocks.end();
         itr++) 
     {
-        std::string  bbname = "block_0x"+to_string<VA>(*itr, std::hex);
-        BasicBlock *toBlock = bbFromStrName(bbname, F);
-        TASSERT(toBlock != NULL, "Could not find block: "+bbname);
+        BasicBlock *toBlock = bbFromBase(*itr, F);
+        TASSERT(toBlock != NULL, "Could not find block: block_0x"+to_string<VA>(*itr, std::hex));
         theSwitch->addCase(CONST_V<32>(block, myindex), toBlock);
         ++myindex;
     }
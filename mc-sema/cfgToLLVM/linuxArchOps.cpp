@@ -11,12 +11,12 @@
 #include "llvm/Instructions.h"
 
 #include "raiseX86.h"
+#include "toLLVM.h"
 #include "X86.h"
 
 #include "../common/to_string.h"
 #include "../common/Defaults.h"
 
-extern llvm::PointerType *g_PRegStruct;
 
 using namespace llvm;
 using namespace std;
@@ -41,6 +41,11 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #include "llvm/DebugInfo.h"
 #include "llvm/Module.h"
 #include "llvm/Bitcode/ReaderWriter.h"
+#include "llvm/Linker.h"
+#include "llvm/Analysis/Verifier.h"
+#include "llvm/ADT/OwningPtr.h"
+#include "llvm/Support/MemoryBuffer.h"
+#include "llvm/Support/Threading.h"
 #include "llvm/LinkAllPasses.h"
 
 #include "postPasses.h"
@@ -50,11 +55,16 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 #include <vector>
 #include <llvm/InlineAsm.h>
+#include <boost/thread.hpp>
+#include <boost/thread/mutex.hpp>
+#include <boost/bind.hpp>
 
 using namespace llvm;
 using namespace std;
 
 bool ignoreUnsupportedInsts = false;
+AnnotationMode annotationMode = AnnotateFull;
+unsigned liftThreads = 1;
 
 
 CallingConv::ID getLLVMCC(ExternalCodeRef::CallingConvention cc) {
@@ -267,8 +277,9 @@ int mapStrToFloatOff(std::string regName)
     return off;
 }
 
-int mapStrToGEPOff(string regName) {
-    int off = StringSwitch<int>(regName)
+// the context field of a register or flag, or -1 if there is none
+static int findGEPOff(StringRef regName) {
+    return StringSwitch<int>(regName)
         //UPDATEREGS
         .Case("EAX", 0)
         .Case("EBX", 1)
@@ -333,10 +344,13 @@ int mapStrToGEPOff(string regName) {
 		.Case("STACK_BASE", 53)
 		.Case("STACK_LIMIT", 54)
         .Default(-1);
-        
+}
+
+int mapStrToGEPOff(StringRef regName) {
+    int off = findGEPOff(regName);
         
     if( off == -1 )
-      throw  TErr(__LINE__, __FILE__, "Float reg name "+regName+" unknown");
+      throw  TErr(__LINE__, __FILE__, "Float reg name "+regName.str()+" unknown");
 
     return off;
 }
@@ -354,7 +368,139 @@ public:
     void discover_vertex(Vertex u, const Graph & g) const;
 };
 
+// allocateLocals records the local it makes for every field of the 
+// register context here, indexed by mapStrToGEPOff offset, so register
+// and flag accesses do not search the entry block by name. ST0-ST7 share
+// one context field; its slot holds STi_val, the whole FPU stack.
+// Each lifting thread has its own table.
+typedef vector<Value *>   RegisterLocals;
+typedef DenseMap<Function *, RegisterLocals>  RegisterLocalMap;
+static boost::thread_specific_ptr<RegisterLocalMap>   registerLocalMaps;
+
+static RegisterLocalMap &registerLocals(void) {
+    if( registerLocalMaps.get() == NULL )
+        registerLocalMaps.reset(new RegisterLocalMap());
+
+    return *registerLocalMaps;
+}
+
+//UPDATEREGS
+static const int FPU_STACK_OFF = 15;
+static const int NUM_REG_LOCALS = 55;
+
+// the offset of a register's local, or -1 if it has none of its own
+static int mapStrToLocalOff(StringRef regName) {
+    if( regName == "STi" )
+        return FPU_STACK_OFF;
+
+    int off = findGEPOff(regName);
+    if( off == FPU_STACK_OFF )
+        return -1;
+
+    return off;
+}
+
+static int mapPlatRegToLocalOff(unsigned reg) {
+    //UPDATEREGS
+    switch(reg) {
+        case X86::AX:
+        case X86::AH:
+        case X86::AL:
+        case X86::EAX:
+            return 0;
+        case X86::BX:
+        case X86::BH:
+        case X86::BL:
+        case X86::EBX:
+            return 1;
+        case X86::CX:
+        case X86::CH:
+        case X86::CL:
+        case X86::ECX:
+            return 2;
+        case X86::DX:
+        case X86::DH:
+        case X86::DL:
+        case X86::EDX:
+            return 3;
+        case X86::SI:
+        case X86::ESI:
+            return 4;
+        case X86::DI:
+        case X86::EDI:
+            return 5;
+        case X86::SP:
+        case X86::ESP:
+            return 6;
+        case X86::BP:
+        case X86::EBP:
+            return 7;
+        case X86::XMM0:
+            return 45;
+        case X86::XMM1:
+            return 46;
+        case X86::XMM2:
+            return 47;
+        case X86::XMM3:
+            return 48;
+        case X86::XMM4:
+            return 49;
+        case X86::XMM5:
+            return 50;
+        case X86::XMM6:
+            return 51;
+        case X86::XMM7:
+            return 52;
+        default:
+            return -1;
+    }
+}
+
+static void recordRegisterLocals(Function *F) {
+    RegisterLocals  &locals = registerLocals()[F];
+    BasicBlock      *entry = &F->getEntryBlock();
+
+    locals.assign(NUM_REG_LOCALS, NULL);
+    for( BasicBlock::iterator it = entry->begin(); it != entry->end(); ++it ) {
+        StringRef   name = it->getName();
+        if( !isa<AllocaInst>(it) || !name.endswith("_val") )
+            continue;
+
+        int off = mapStrToLocalOff(name.drop_back(4));
+        if( off != -1 )
+            locals[off] = it;
+    }
+}
+
+static Value *findRegisterLocal(Function *F, int off) {
+    RegisterLocalMap            &locals = registerLocals();
+    RegisterLocalMap::iterator  it = locals.find(F);
+    if( off == -1 || it == locals.end() )
+        return NULL;
+
+    return it->second[off];
+}
+
+static Value *lookupRegisterLocal(Function *F, StringRef regName) {
+    Value   *v = findRegisterLocal(F, mapStrToLocalOff(regName));
+    if( v == NULL )
+        return lookupLocalByName(F, regName.str()+"_val");
+
+    return v;
+}
+
+void releaseLocals(Function *F) {
+    registerLocals().erase(F);
+}
+
 Value *lookupLocalByName(Function *F, string localName) {
+    StringRef   name(localName);
+    if( name.endswith("_val") ) {
+        Value   *v = findRegisterLocal(F, mapStrToLocalOff(name.drop_back(4)));
+        if( v != NULL )
+            return v;
+    }
+
     BasicBlock  *entry = &F->getEntryBlock();
     BasicBlock::iterator    it = entry->begin(); 
 
@@ -374,14 +520,15 @@ Value *lookupLocalByName(Function *F, string localName) {
 }
 
 Value *MCRegToValue(BasicBlock *b, unsigned reg) {
-    string      regValName = mapPlatRegToStr(reg);
-    Function    *F = b->getParent();
+    Value   *v = findRegisterLocal(b->getParent(), mapPlatRegToLocalOff(reg));
+    if( v == NULL )
+        return lookupLocalByName(b->getParent(), mapPlatRegToStr(reg)+"_val");
 
-    return lookupLocalByName(F, regValName+"_val");
+    return v;
 }
 
 Value *GENERIC_READREG(BasicBlock *b, string regname) {
-    Value       *localRegVar = lookupLocalByName(b->getParent(), regname+"_val");
+    Value       *localRegVar = lookupRegisterLocal(b->getParent(), regname);
     Instruction *readFlag = new LoadInst(localRegVar, "", b);
     return readFlag;
 }
@@ -391,7 +538,7 @@ Value *F_READ(BasicBlock *b, string flag) {
 }
 
 void GENERIC_WRITEREG(BasicBlock *b, string regname, Value *v) {
-    Value   *localRegVar = lookupLocalByName(b->getParent(), regname+"_val");
+    Value   *localRegVar = lookupRegisterLocal(b->getParent(), regname);
     if(localRegVar == NULL)
       throw TErr(__LINE__, __FILE__, "regname "+regname+" not found");
     Value   *st = new StoreInst(v, localRegVar, b);
@@ -562,6 +709,9 @@ void allocateLocals(Function *F, int bits) {
                 new AllocaInst( Type::getInt32Ty(F->getContext()),
                                 "STACK_LIMIT_val",
                                 stack_base);
+            TASSERT(stack_limit != NULL, "");
+
+            recordRegisterLocals(F);
         }
             break;
 
@@ -591,18 +741,70 @@ BasicBlock *bbFromStrName(string n, Function *F) {
     return found;
 }
 
+// discover_vertex records the LLVM block it makes for every native block
+// here, by the native block's base, so branches and jump tables find their
+// targets without scanning the function by name. Each lifting thread has
+// its own table.
+typedef DenseMap<VA, BasicBlock *>  NativeBlockMap;
+typedef DenseMap<Function *, NativeBlockMap>  FunctionBlockMap;
+static boost::thread_specific_ptr<FunctionBlockMap>   nativeBlockMaps;
+
+static FunctionBlockMap &nativeBlocks(void) {
+    if( nativeBlockMaps.get() == NULL )
+        nativeBlockMaps.reset(new FunctionBlockMap());
+
+    return *nativeBlockMaps;
+}
+
+BasicBlock *bbFromBase(VA base, Function *F) {
+    FunctionBlockMap            &blocks = nativeBlocks();
+    FunctionBlockMap::iterator  it = blocks.find(F);
+    if( it == blocks.end() )
+        return NULL;
+
+    NativeBlockMap::iterator    bit = it->second.find(base);
+    if( bit == it->second.end() )
+        return NULL;
+
+    return bit->second;
+}
+
+static BasicBlock *bbForNativeBlock(NativeBlockPtr nb, Function *F) {
+    BasicBlock  *&b = nativeBlocks()[F][nb->get_base()];
+
+    if( b == NULL ) {
+        b = BasicBlock::Create(F->getContext(), nb->get_name(), F);
+        TASSERT(b != NULL, "" );
+    }
+
+    return b;
+}
+
+//every native block of a module shares the decoder's instruction printer,
+//so lifting threads take turns printing through it
+static boost::mutex printerMutex;
+
+string printNativeInst(MCInstPrinter *IP, const MCInst &inst) {
+    string              outS;
+    raw_string_ostream  strOut(outS);
+
+    {
+        boost::mutex::scoped_lock   lock(printerMutex);
+        IP->printInst(&inst, strOut, "");
+    }
+
+    return strOut.str();
+}
+
 static void addAnnotation( BasicBlock  *block,
                     InstPtr     ip,
                     Function    *F,
                     MCInstPrinter   *IP)
 {
-    string              outS;
-    raw_string_ostream  strOut(outS);
     MCInst              inst = ip->get_inst();
 
-    IP->printInst(&inst, strOut, "");
     //create the string name of the annotation
-    string  tmp = strOut.str();
+    string  tmp = printNativeInst(IP, inst);
 
     replace(tmp.begin(), tmp.end(), '\x09', ' ');
     string annotVal =   "inst_0x" + 
@@ -618,6 +820,35 @@ static void addAnnotation( BasicBlock  *block,
                     block); 
 }
 
+//tag every instruction lifted from the native instruction at addr with a 
+//!mcsema.inst node holding that address. last is the final instruction of
+//start before it was lifted, or NULL if start was empty, and lastBlock is 
+//the final block of F before it was lifted. blocks made while lifting, 
+//such as the loop of a REP prefixed instruction, come after lastBlock
+static void addAddressAnnotation(   VA          addr,
+                                    BasicBlock  *start,
+                                    Instruction *last,
+                                    Function    *F,
+                                    BasicBlock  *lastBlock)
+{
+    LLVMContext &C = start->getContext();
+    MDNode      *node = MDNode::get(C, ConstantInt::get(Type::getInt64Ty(C), addr));
+    unsigned    kind = C.getMDKindID("mcsema.inst");
+
+    BasicBlock::iterator    it = start->begin();
+    if( last != NULL )
+        it = ++BasicBlock::iterator(last);
+
+    for( ; it != start->end(); ++it )
+        it->setMetadata(kind, node);
+
+    Function::iterator  bit = lastBlock;
+    for( ++bit; bit != F->end(); ++bit ) {
+        for( it = bit->begin(); it != bit->end(); ++it )
+            it->setMetadata(kind, node);
+    }
+}
+
 InstTransResult disInstr(   InstPtr             ip, 
                             BasicBlock          *&block, 
                             NativeBlockPtr      nb,
@@ -625,12 +856,27 @@ InstTransResult disInstr(   InstPtr             ip,
                             NativeFunctionPtr   natF,
                             NativeModulePtr     natM) 
 {
-    //add a string representation of this instruction to the CFG
-    //this string representation should be removed by optimizations
-    addAnnotation(block, ip, F, nb->get_printer());
+    BasicBlock  *start = block;
+    Instruction *last = NULL;
+    BasicBlock  *lastBlock = NULL;
+
+    if( annotationMode == AnnotateFull ) {
+        //add a string representation of this instruction to the CFG
+        //this string representation should be removed by optimizations
+        addAnnotation(block, ip, F, nb->get_printer());
+    } else if( annotationMode == AnnotateAddress ) {
+        if( !start->empty() )
+            last = &start->back();
+        lastBlock = &F->back();
+    }
 
     //in the future, we could have different target decoders here
-    return disInstrX86(ip, block, nb, F, natF, natM);
+    InstTransResult r = disInstrX86(ip, block, nb, F, natF, natM);
+
+    if( annotationMode == AnnotateAddress )
+        addAddressAnnotation(ip->get_loc(), start, last, F, lastBlock);
+
+    return r;
 }
 
 template <typename Vertex, typename Graph>
@@ -644,33 +890,16 @@ void bfs_cfg_visitor::discover_vertex(Vertex u, const Graph &g) const {
     //first, either create or look up the LLVM basic block for this native 
     //block. we are either creating it for the first time, or, we are 
     //going to look up a blank block
-    curLLVMBlock = bbFromStrName(curBlock->get_name(), this->F);
-
-    if( curLLVMBlock == NULL ) {
-        //we need to create the block, so do that 
-        curLLVMBlock = BasicBlock::Create(  this->F->getContext(),
-                                            curBlock->get_name(),
-                                            this->F);
-        TASSERT(curLLVMBlock != NULL, "" );
-    }
+    curLLVMBlock = bbForNativeBlock(curBlock, this->F);
 
     //then, create a basic block for every follow of this block, if we do not
     //already have that basic block in our LLVM CFG
     list<VA>    &follows = curBlock->get_follows();
     for(list<VA>::iterator i = follows.begin(); i != follows.end(); ++i) {
         VA      blockBase = *i;
-        //try and look up a block that has this blocks name
         NativeBlockPtr followNat = this->natFun->block_from_base(blockBase);
-        string followName = followNat->get_name();
         
-        BasicBlock  *fBB = bbFromStrName(followName, this->F);
-
-        if( fBB == NULL ) {
-            fBB = BasicBlock::Create(  this->F->getContext(),
-                                                followNat->get_name(),
-                                                this->F);
-            TASSERT(fBB != NULL, "" );
-        }
+        bbForNativeBlock(followNat, this->F);
     }
 
     //now, go through each statement and translate it into LLVM IR
@@ -728,10 +957,7 @@ static bool insertFunctionIntoModule(NativeModulePtr mod, NativeFunctionPtr func
     //then we put an unconditional branch from the 'entry' block to the first
     //block, and we create the first block
     NativeBlockPtr  funcEntry = func->block_from_base(func->get_start());
-    BasicBlock      *firstBlock = BasicBlock::Create(   F->getContext(),
-                                                        funcEntry->get_name(),
-                                                        F);
-    TASSERT( firstBlock != NULL, "" );
+    BasicBlock      *firstBlock = bbForNativeBlock(funcEntry, F);
     //create a branch from the end of the entry block to the first block
     BranchInst::Create(firstBlock, entryBlock);
 
@@ -747,6 +973,11 @@ static bool insertFunctionIntoModule(NativeModulePtr mod, NativeFunctionPtr func
                                 boost::vertex(func->entry_block_id(), funcGraph), 
                                 boost::visitor(v));
 
+    //every branch and jump table in F has been lowered, so its block map
+    //and register locals are no longer needed
+    nativeBlocks().erase(F);
+    releaseLocals(F);
+
     //check that the function we created is valid
 
     //we should be done, having inserted every block into the module
@@ -1293,42 +1524,19 @@ static bool insertDataSections(NativeModulePtr natMod, Module *M, raw_ostream &r
 
 }
 
-bool natModToModule(NativeModulePtr natMod, Module *M, raw_ostream &report) {
-    bool    result = true;
-
-    //iterate over every functions CFG we identified in natMod
-    list<NativeFunctionPtr> funcs = natMod->get_funcs();
-    list<NativeFunctionPtr>::iterator   i = funcs.begin();
-
-    // insert all functions (but not populate yet)
-    while( i != funcs.end() ) {
-        NativeFunctionPtr   f = *i;
-        std::string fname = f->get_name();
-
-        Function *F = M->getFunction(fname);
+static Function *declareFunction(Module *M, const string &fname) {
+    Constant *FC = M->getOrInsertFunction(fname, getBaseFunctionType(M));
+    Function *F = dyn_cast<Function>(FC);
 
-        if(F == NULL) { 
-            Constant *FC = M->getOrInsertFunction(fname, getBaseFunctionType(M));
-            F = dyn_cast<Function>(FC);
+    TASSERT(F != NULL, "Could not insert function into module");
 
-            TASSERT(F != NULL, "Could not insert function into module");
+    // default to stdcall
+    F->setCallingConv(CallingConv::X86_StdCall);
 
-            // default to stdcall
-            F->setCallingConv(CallingConv::X86_StdCall);
-            // make local functions 'static'
-            F->setLinkage(GlobalValue::InternalLinkage);
-            cout << "Inserted function: " << fname << std::endl;
-        } else {
-            cout << "Already inserted function: " << fname << ", skipping." << std::endl;
-        }
-
-        ++i;
-    }
-
-
-    // insert data after functions -- data may have function references
-    insertDataSections(natMod, M, report);
+    return F;
+}
 
+static void insertExternals(NativeModulePtr natMod, Module *M) {
     list<ExternalDataRefPtr> extDataRefs = natMod->getExtDataRefs();
     list<ExternalDataRefPtr>::iterator data_it = extDataRefs.begin();
 
@@ -1402,6 +1610,286 @@ bool natModToModule(NativeModulePtr natMod, Module *M, raw_ostream &report) {
             f->setCallingConv(getLLVMCC(conv));
         }
     }
+}
+
+// a lifting thread only needs the addresses of the data sections, so it
+// declares each as a byte array. linking resolves them to the sections
+// insertDataSections made in the final module
+static void declareDataSections(NativeModulePtr natMod, Module *M) {
+    list<DataSection>  &globaldata = natMod->getData();
+
+    for(list<DataSection>::iterator git = globaldata.begin();
+        git != globaldata.end();
+        git++)
+    {
+        DataSection     &dt = *git;
+        string          bufferName = "data_0x" + to_string<VA>(dt.getBase(), hex);
+        ArrayType       *arrT = ArrayType::get(Type::getInt8Ty(M->getContext()), dt.getSize());
+
+        new GlobalVariable(*M,
+                        arrT, 
+                        dt.isReadOnly(),
+                        GlobalVariable::ExternalLinkage,
+                        NULL,
+                        bufferName);
+    }
+}
+
+typedef vector<pair<string, GlobalValue::LinkageTypes> >  LinkageList;
+
+// helpers that every module lifting needs them defines its own copy of,
+// always with the same body: do_call_value, the state backup, and the 
+// win32 callback adapters and their strings
+static bool isSharedHelper(const string &name) {
+    static const char *helpers[] = {
+        "do_call_value",
+        "state.backup",
+        "FPU_GET_REG",
+        "FPU_SET_REG",
+        "NATIVEFPU_TO_LD",
+        "LD_TO_NATIVEFPU",
+        "callback_adapter_prologue_internal",
+        "callback_adapter_epilogue",
+        ".str",
+        ".str1",
+        ".str2",
+        ".str3",
+        NULL
+    };
+
+    for(const char **h = helpers; *h != NULL; h++) {
+        if( name == *h ) {
+            return true;
+        }
+    }
+
+    // the adapter for a callback is made from nothing but its address
+    return name.compare(0, 13, "callback_sub_") == 0;
+}
+
+// make every named local of M visible, so modules can be linked by name,
+// and remember what its linkage was. shared helpers get the linkage 
+// helpers and everything else, including declarations, becomes external.
+// a function or data section defined by two modules then fails to link 
+// instead of one copy being kept silently
+static void exportLocals(Module *M, GlobalValue::LinkageTypes helpers, LinkageList &was) {
+    vector<GlobalValue *>   locals;
+
+    for(Module::iterator it = M->begin(); it != M->end(); ++it) {
+        locals.push_back(it);
+    }
+    for(Module::global_iterator it = M->global_begin(); it != M->global_end(); ++it) {
+        locals.push_back(it);
+    }
+
+    for(vector<GlobalValue *>::iterator it = locals.begin(); it != locals.end(); ++it) {
+        GlobalValue *gv = *it;
+        if( !gv->hasName() || !gv->hasLocalLinkage() ) {
+            continue;
+        }
+
+        string  name = gv->getName().str();
+
+        was.push_back(make_pair(name, gv->getLinkage()));
+        if( !gv->isDeclaration() && isSharedHelper(name) ) {
+            gv->setLinkage(helpers);
+        } else {
+            gv->setLinkage(GlobalValue::ExternalLinkage);
+        }
+    }
+}
+
+static void restoreLocals(Module *M, const LinkageList &was) {
+    for(LinkageList::const_iterator it = was.begin(); it != was.end(); ++it) {
+        GlobalValue *gv = M->getNamedValue(it->first);
+        if( gv != NULL ) {
+            gv->setLinkage(it->second);
+        }
+    }
+}
+
+// a share of the functions of a module, lifted on its own thread into its
+// own LLVMContext and handed back as bitcode
+struct LiftChunk {
+    list<NativeFunctionPtr> funcs;
+    string                  triple;
+    string                  layout;
+    string                  bitcode;
+    LinkageList             locals;
+    string                  error;
+    bool                    ok;
+};
+
+// lift funcs into CM, a module of their own that declares everything
+// else in natMod they may refer to
+static bool liftIntoChunkModule(NativeModulePtr                natMod,
+                                const list<NativeFunctionPtr>  &allFuncs,
+                                list<NativeFunctionPtr>        &funcs,
+                                Module                         *CM)
+{
+    doGlobalInit(CM);
+
+    // functions in other chunks stay external declarations here
+    for(list<NativeFunctionPtr>::const_iterator it = allFuncs.begin();
+        it != allFuncs.end();
+        ++it)
+    {
+        declareFunction(CM, (*it)->get_name());
+    }
+
+    declareDataSections(natMod, CM);
+    insertExternals(natMod, CM);
+
+    for(list<NativeFunctionPtr>::iterator it = funcs.begin();
+        it != funcs.end();
+        ++it)
+    {
+        if( insertFunctionIntoModule(natMod, *it, CM) == false ) {
+            return false;
+        }
+    }
+
+    return true;
+}
+
+static void liftChunk(NativeModulePtr natMod, 
+                      const list<NativeFunctionPtr> *allFuncs,
+                      LiftChunk *chunk)
+{
+    chunk->ok = true;
+
+    try {
+        LLVMContext         ctx;
+        OwningPtr<Module>   CM(new Module(natMod->name(), ctx));
+
+        CM->setTargetTriple(chunk->triple);
+        CM->setDataLayout(chunk->layout);
+
+        chunk->ok = liftIntoChunkModule(natMod, *allFuncs, chunk->funcs, CM.get());
+
+        // every chunk makes its own copy of helpers like do_call_value and
+        // the win32 callbacks. linkonce keeps just one of them, as the 
+        // serial path would have. the chunk's functions stay external
+        exportLocals(CM.get(), GlobalValue::LinkOnceODRLinkage, chunk->locals);
+
+        raw_string_ostream  out(chunk->bitcode);
+        WriteBitcodeToFile(CM.get(), out);
+        out.flush();
+    } catch(std::exception &e) {
+        chunk->ok = false;
+        chunk->error = e.what();
+    }
+}
+
+static bool liftFunctionsInParallel(NativeModulePtr natMod, 
+                                    list<NativeFunctionPtr> &funcs,
+                                    Module *M)
+{
+    unsigned            nchunks = min<size_t>(liftThreads, funcs.size());
+    vector<LiftChunk>   chunks(nchunks);
+    unsigned            n = 0;
+
+    // deal the functions out in turn, so that every chunk gets a mix of 
+    // large and small ones and the output does not depend on scheduling
+    for(list<NativeFunctionPtr>::iterator it = funcs.begin(); it != funcs.end(); ++it) {
+        chunks[n++ % nchunks].funcs.push_back(*it);
+    }
+
+    boost::thread_group threads;
+    for(unsigned i = 0; i < nchunks; i++) {
+        chunks[i].triple = M->getTargetTriple();
+        chunks[i].layout = M->getDataLayout();
+        threads.create_thread(boost::bind(liftChunk, natMod, &funcs, &chunks[i]));
+    }
+    threads.join_all();
+
+    // link the chunks back in order. the module's own locals are exported
+    // while linking so the chunks' declarations resolve to them
+    bool        result = true;
+    LinkageList locals;
+
+    exportLocals(M, GlobalValue::ExternalLinkage, locals);
+
+    for(unsigned i = 0; i < nchunks; i++) {
+        LiftChunk   &chunk = chunks[i];
+
+        if( chunk.error.size() > 0 ) {
+            throw TErr(__LINE__, __FILE__, chunk.error);
+        }
+
+        string                  errorInfo;
+        OwningPtr<MemoryBuffer> buf(MemoryBuffer::getMemBuffer(chunk.bitcode, "", false));
+        OwningPtr<Module>       CM(ParseBitcodeFile(buf.get(), M->getContext(), &errorInfo));
+
+        if( !CM ) {
+            throw TErr(__LINE__, __FILE__, "Could not read lifted functions: "+errorInfo);
+        }
+
+        if( Linker::LinkModules(M, CM.get(), Linker::DestroySource, &errorInfo) ) {
+            throw TErr(__LINE__, __FILE__, "Could not link lifted functions: "+errorInfo);
+        }
+
+        chunk.bitcode.clear();
+
+        if( chunk.ok == false ) {
+            result = false;
+        }
+    }
+
+    // once everything is linked, put back the linkage each local had
+    for(unsigned i = 0; i < nchunks; i++) {
+        restoreLocals(M, chunks[i].locals);
+    }
+    restoreLocals(M, locals);
+
+    return result;
+}
+
+bool natModToModule(NativeModulePtr natMod, Module *M, raw_ostream &report) {
+    bool    result = true;
+
+    //iterate over every functions CFG we identified in natMod
+    list<NativeFunctionPtr> funcs = natMod->get_funcs();
+    list<NativeFunctionPtr>::iterator   i = funcs.begin();
+
+    // insert all functions (but not populate yet)
+    while( i != funcs.end() ) {
+        NativeFunctionPtr   f = *i;
+        std::string fname = f->get_name();
+
+        Function *F = M->getFunction(fname);
+
+        if(F == NULL) { 
+            F = declareFunction(M, fname);
+            // make local functions 'static'
+            F->setLinkage(GlobalValue::InternalLinkage);
+            cout << "Inserted function: " << fname << std::endl;
+        } else {
+            cout << "Already inserted function: " << fname << ", skipping." << std::endl;
+        }
+
+        ++i;
+    }
+
+
+    // insert data after functions -- data may have function references
+    insertDataSections(natMod, M, report);
+
+    insertExternals(natMod, M);
+
+    // make the data sections for non-conformant jump tables before lifting
+    // anything, so the data of natMod does not change while it is lifted
+    for( i = funcs.begin(); i != funcs.end(); ++i ) {
+        preprocessFunction(natMod, *i, M);
+    }
+
+    if( liftThreads > 1 && funcs.size() > 1 ) {
+        if( llvm_is_multithreaded() || llvm_start_multithreaded() ) {
+            return liftFunctionsInParallel(natMod, funcs, M);
+        }
+
+        report << "LLVM was built without thread support, lifting on one thread\n";
+    }
 
     // populate functions
     i = funcs.begin();
@@ -1417,3 +1905,65 @@ bool natModToModule(NativeModulePtr natMod, Module *M, raw_ostream &report) {
 
     return result;
 }
+
+bool natModToStubModule(NativeModulePtr natMod, Module *M, raw_ostream &report) {
+    list<NativeFunctionPtr> funcs = natMod->get_funcs();
+
+    // the functions are defined by the chunks, so they stay external here
+    for(list<NativeFunctionPtr>::iterator it = funcs.begin(); it != funcs.end(); ++it) {
+        declareFunction(M, (*it)->get_name());
+    }
+
+    insertDataSections(natMod, M, report);
+    insertExternals(natMod, M);
+
+    return true;
+}
+
+bool natFuncsToBitcode(NativeModulePtr          natMod, 
+                       list<NativeFunctionPtr>  &funcs, 
+                       Module                   *M, 
+                       raw_ostream              &out)
+{
+    // jump table data sections go in the stub, and have to exist before
+    // the chunk declares the data sections it can see
+    for(list<NativeFunctionPtr>::iterator it = funcs.begin(); it != funcs.end(); ++it) {
+        preprocessFunction(natMod, *it, M);
+    }
+
+    // a context of its own, so nothing made while lifting this chunk 
+    // outlives it
+    LLVMContext         ctx;
+    OwningPtr<Module>   CM(new Module(natMod->name(), ctx));
+    LinkageList         locals;
+
+    CM->setTargetTriple(M->getTargetTriple());
+    CM->setDataLayout(M->getDataLayout());
+
+    if( liftIntoChunkModule(natMod, natMod->get_funcs(), funcs, CM.get()) == false ) {
+        return false;
+    }
+
+    // helpers every chunk defines are merged by llvm-link. they are
+    // linkonce_odr, and the chunk's functions external, before any pass
+    // runs, so that no chunk specializes or rewrites the signature of 
+    // its own copy
+    exportLocals(CM.get(), GlobalValue::LinkOnceODRLinkage, locals);
+
+    doPostAnalysis(natMod, CM.get());
+
+    // will abort if verification fails
+    verifyModule(*CM, AbortProcessAction);
+
+    WriteBitcodeToFile(CM.get(), out);
+
+    return true;
+}
+
+void finishStubModule(Module *M) {
+    LinkageList locals;
+
+    // the chunks refer to the data sections, jump tables and helpers of 
+    // the stub by name
+    exportLocals(M, GlobalValue::ExternalLinkage, locals);
+}
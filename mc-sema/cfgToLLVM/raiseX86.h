@@ -55,13 +55,17 @@ void setupFlow(llvm::Function *, regDefT &);
 
 llvm::BasicBlock *bbFromStrName(std::string n, llvm::Function *F);
 
+//the block made for the native block at base while F is being lifted, or
+//NULL if there is none yet
+llvm::BasicBlock *bbFromBase(VA base, llvm::Function *F);
+
 ///////////////////////////////////////////////////////////////////////////////
 // state modeling functions
 ///////////////////////////////////////////////////////////////////////////////
 
 llvm::Value *MCRegToValue(llvm::BasicBlock *b, unsigned reg);
 int mapPlatRegToOffset(unsigned reg);
-int mapStrToGEPOff(std::string regName);
+int mapStrToGEPOff(llvm::StringRef regName);
 int mapStrToFloatOff(std::string regName);
 llvm::Value *lookupLocalByName(llvm::Function *F, std::string localName);
 void writeLocalsToContext(llvm::BasicBlock *B, unsigned bits);
@@ -318,6 +322,9 @@ void F_CLEAR(llvm::BasicBlock *b, std::string flag);
 
 void allocateLocals(llvm::Function *, int);
 
+//forget the locals allocateLocals recorded, once the function is complete
+void releaseLocals(llvm::Function *);
+
 llvm::BasicBlock *bbFromStrName(std::string, llvm::Function *);
 
 ///////////////////////////////////////////////////////////////////////////////
@@ -344,6 +351,22 @@ void dataSectionToTypesContents(
 
 extern bool ignoreUnsupportedInsts;
 
+//the text of inst, printed with the shared printer IP; safe to call from
+//any lifting thread
+std::string printNativeInst(llvm::MCInstPrinter *IP, const llvm::MCInst &inst);
+
+//how disInstr marks the code lifted from each native instruction
+enum AnnotationMode {
+    AnnotateNone,       //no annotations
+    AnnotateAddress,    //a !mcsema.inst node holding the instruction address
+    AnnotateFull        //a dummy add named with the address and disassembly
+};
+
+extern AnnotationMode annotationMode;
+
+//how many threads natModToModule lifts functions on
+extern unsigned liftThreads;
+
 
 template <int width, int maskbits>
 static void SHR_SET_FLAG_V(llvm::BasicBlock *block, llvm::Value *val,
@@ -39,10 +39,10 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 using namespace llvm;
 using namespace std;
 
-StructType  *g_RegStruct;
-PointerType *g_PRegStruct;
+THREAD_LOCAL StructType  *g_RegStruct;
+THREAD_LOCAL PointerType *g_PRegStruct;
 
-GlobalVariable* g_StateBackup;
+THREAD_LOCAL GlobalVariable* g_StateBackup;
 
 
 FunctionType    *getBaseFunctionType(Module *M) {
@@ -58,12 +58,15 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 #include "peToCFG.h"
 #include "TransExcn.h"
+#include "../common/Defaults.h"
 
 #include <stack>
 
 llvm::FunctionType *getBaseFunctionType(llvm::Module *M);
 
-extern llvm::StructType  *g_RegStruct;
-extern llvm::PointerType *g_PRegStruct;
+//set by doGlobalInit for the module being built on this thread
+extern THREAD_LOCAL llvm::StructType  *g_RegStruct;
+extern THREAD_LOCAL llvm::PointerType *g_PRegStruct;
+extern THREAD_LOCAL llvm::GlobalVariable *g_StateBackup;
 
 void doGlobalInit(llvm::Module *);
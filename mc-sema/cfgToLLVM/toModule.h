@@ -35,4 +35,12 @@ bool natModToModule(NativeModulePtr, llvm::Module *, llvm::raw_ostream &);
 bool addEntryPointDriver(llvm::Module *, std::string, VA, int, bool, llvm::raw_ostream &, ExternalCodeRef::CallingConvention cconv);
 bool addEntryPointDriverRaw(llvm::Module *M, std::string name, VA entry);
 bool doPostAnalysis(NativeModulePtr N, llvm::Module *M);
+
+//translate a NativeModule in pieces that llvm-link puts back together. 
+//the stub module holds the data sections, externals and drivers, and 
+//each chunk of functions is written out as bitcode of its own. 
+//finishStubModule must run before any passes are run on the stub
+bool natModToStubModule(NativeModulePtr, llvm::Module *, llvm::raw_ostream &);
+bool natFuncsToBitcode(NativeModulePtr, std::list<NativeFunctionPtr> &, llvm::Module *, llvm::raw_ostream &);
+void finishStubModule(llvm::Module *);
 #endif
@@ -15,17 +15,13 @@
 
 #include "TransExcn.h"
 #include "raiseX86.h"
+#include "toLLVM.h"
 
 #include "../common/to_string.h"
 
 using namespace llvm;
 using namespace std;
 
-extern llvm::GlobalVariable* g_StateBackup;
-extern llvm::PointerType *g_PRegStruct;
-
-static bool added_callbacks = false;
-
 Value* win32GetStackSize(Module *M, BasicBlock *&driverBB) {
     Value *pTEB = win32GetTib(driverBB);
     Value *stackSize = win32GetStackSize(pTEB, driverBB);
@@ -263,10 +259,10 @@ static Function *win32MakeCallbackStub(Module *M, VA local_target) {
 }
 
 llvm::Value *win32MakeCallbackForLocalFunction(Module *M, VA local_target) {
-    if(!added_callbacks) {
+    // the callback adapters are added once per module
+    if(M->getFunction("callback_adapter_prologue_internal") == NULL) {
         std::cout << __FUNCTION__ << ": Adding Callbacks to Module!" << std::endl;
         addWin32CallbacksToModule(M);
-        added_callbacks = true;
     }
 
 
@@ -532,6 +528,7 @@ void win32AddCallValue(Module *mod) {
 
 
         writeLocalsToContext(main_block, 32);
+        releaseLocals(func_do_call_value);
 
         // return
         ReturnInst::Create(mod->getContext(), main_block);
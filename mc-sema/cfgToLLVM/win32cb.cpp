@@ -48,11 +48,9 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #include <llvm/Support/MathExtras.h>
 #include <llvm/DataLayout.h>
 #include <algorithm>
+#include "toLLVM.h"
 using namespace llvm;
 
-extern llvm::PointerType *g_PRegStruct;
-extern llvm::StructType *g_RegStruct;
-
 static PointerType* getTibPtrTy(Module *mod) {
     PointerType* Int8PtrTy = PointerType::get(IntegerType::get(mod->getContext(), 8), 0);
     StructType *StructTy_struct__NT_TIB = mod->getTypeByName("struct._NT_TIB");
@@ -425,7 +425,7 @@ using namespace x86;
 //
 static void preprocessInstruction(
         NativeModulePtr   natM,
-        BasicBlock        *&block,
+        Module            *M,
         InstPtr           ip,
         MCInst            &inst 
         ) 
@@ -442,7 +442,7 @@ static void preprocessInstruction(
 
         bool ok = addJumpTableDataSection(
                 natM,
-                block->getParent()->getParent(),
+                M,
                 tbl_va,
                 *jmptbl);
 
@@ -465,7 +465,7 @@ static void preprocessInstruction(
 
         bool ok = addJumpIndexTableDataSection(
                 natM,
-                block->getParent()->getParent(),
+                M,
                 idx_va,
                 *idxtbl);
 
@@ -479,6 +479,26 @@ static void preprocessInstruction(
 
 }
 
+// preprocess every instruction of natF that has a translation. this runs 
+// for all functions before any are translated, so the data sections of
+// natM do not change while functions are being lifted
+void preprocessFunction(NativeModulePtr natM, NativeFunctionPtr natF, Module *M)
+{
+    for(uint64_t i = 0; i < natF->num_blocks(); ++i) {
+        NativeBlockPtr  nb = natF->block_from_id(i);
+        list<InstPtr>   insts = nb->get_insts();
+
+        for(list<InstPtr>::iterator it = insts.begin(); it != insts.end(); ++it) {
+            InstPtr ip = *it;
+            MCInst  inst = ip->get_inst();
+
+            if(translationDispatchMap.count(inst.getOpcode()) != 0) {
+                preprocessInstruction(natM, M, ip, inst);
+            }
+        }
+    }
+}
+
 // Take the supplied MCInst and turn it into a series of LLVM instructions.
 // Insert those instructions into the supplied block.
 // Here's the philosophy:
@@ -514,8 +534,6 @@ InstTransResult disInstrX86(    InstPtr           ip,
 {
     MCInst              inst = ip->get_inst();
     InstTransResult     itr = ContinueBlock;
-    string              outS;
-    raw_string_ostream  strOut(outS); 
     MCInstPrinter       *IP = nb->get_printer();
 
     if (IP == NULL)
@@ -532,16 +550,16 @@ InstTransResult disInstrX86(    InstPtr           ip,
     if (translationDispatchMap.find(opcode) != translationDispatchMap.end()) {
         // Instruction translation defined.
         translationPtr = translationDispatchMap[opcode];
-        preprocessInstruction(natM, block, ip, inst);
         itr = translationPtr(natM, block, ip, inst);
     } else {
         // Instruction translation not defined.
-        errs() << "Unsupported!\n";
-        // Print out the unhandled opcode.
-        errs() << to_string<VA>(ip->get_loc(), hex) << " ";
-        IP->printInst(&inst, strOut, "");
-        errs() << strOut.str() << "\n";
-        errs() << inst.getOpcode() << "\n";
+        // Print out the unhandled opcode, in one write so that
+        // lifting threads do not interleave their reports.
+        string report = "Unsupported!\n" +
+                        to_string<VA>(ip->get_loc(), hex) + " " +
+                        printNativeInst(IP, inst) + "\n" +
+                        to_string<unsigned>(inst.getOpcode(), dec) + "\n";
+        errs() << report;
         itr = TranslateErrorUnsupported;
     }
     return itr;
@@ -32,3 +32,5 @@ InstTransResult disInstrX86(    InstPtr             ip,
                                 llvm::Function            *F,
                                 NativeFunctionPtr   natF,
                                 NativeModulePtr		natM);
+
+void preprocessFunction(NativeModulePtr natM, NativeFunctionPtr natF, llvm::Module *M);
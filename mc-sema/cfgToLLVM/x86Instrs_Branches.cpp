@@ -515,11 +515,9 @@ static InstTransResult translate_JMP32r(NativeModulePtr  natM,
 
 #define BLOCKNAMES_TRANSLATION(NAME, THECALL) static InstTransResult translate_ ## NAME (NativeModulePtr natM, BasicBlock *& block, InstPtr ip, MCInst &inst) {\
     Function *F = block->getParent(); \
-    std::string  trueStrName = "block_0x"+to_string<VA>(ip->get_tr(), std::hex); \
-    std::string  falseStrName = "block_0x"+to_string<VA>(ip->get_fa(), std::hex); \
-    BasicBlock          *ifTrue = bbFromStrName(trueStrName, F); \
-    TASSERT(ifTrue != NULL, "Could not find true block:"+trueStrName); \
-    BasicBlock          *ifFalse = bbFromStrName(falseStrName, F); \
+    BasicBlock          *ifTrue = bbFromBase(ip->get_tr(), F); \
+    TASSERT(ifTrue != NULL, "Could not find true block:block_0x"+to_string<VA>(ip->get_tr(), std::hex)); \
+    BasicBlock          *ifFalse = bbFromBase(ip->get_fa(), F); \
     InstTransResult ret;\
     ret = THECALL ; \
     return ret ;\
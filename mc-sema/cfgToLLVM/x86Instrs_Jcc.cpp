@@ -208,11 +208,8 @@ static InstTransResult doCondBranch(InstPtr ip,   BasicBlock *&b,
 static InstTransResult translate_Jcc(NativeModulePtr natM, BasicBlock *& block, InstPtr ip, MCInst &inst) {
 
     Function *F = block->getParent();
-    std::string  trueStrName = "block_0x"+to_string<VA>(ip->get_tr(), std::hex);
-    std::string  falseStrName = "block_0x"+to_string<VA>(ip->get_fa(), std::hex);
-
-    BasicBlock          *ifTrue = bbFromStrName(trueStrName, F);
-    BasicBlock          *ifFalse = bbFromStrName(falseStrName, F);
+    BasicBlock          *ifTrue = bbFromBase(ip->get_tr(), F);
+    BasicBlock          *ifFalse = bbFromBase(ip->get_fa(), F);
 
     return doCondBranch(ip, block, ifTrue, 
                                 ifFalse, 
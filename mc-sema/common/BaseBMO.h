@@ -49,4 +49,31 @@ public:
     }
 };
 
+// a view of bytes owned by someone else, e.g. the code image of a
+// deserialized Function; nothing is copied
+class ConstBufferMemoryObject : public llvm::MemoryObject {
+private:
+    const boost::uint8_t  *Bytes;
+    boost::uint64_t       Size;
+    boost::uint64_t       Base;
+public:
+    ConstBufferMemoryObject( const boost::uint8_t  *bytes,
+                             boost::uint64_t       size,
+                             boost::uint64_t       baseAddr) :
+                             Bytes(bytes), Size(size), Base(baseAddr) {
+        return;
+    }
+
+    uint64_t getBase() const { return this->Base; }
+    uint64_t getExtent() const { return this->Size+this->Base; }
+
+    int readByte(uint64_t addr, uint8_t *byte) const {
+        if (addr < this->getBase() || addr >= this->getExtent())
+          return -1;
+
+        *byte = this->Bytes[addr-this->Base];
+        return 0;
+    }
+};
+
 #endif
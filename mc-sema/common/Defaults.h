@@ -13,4 +13,12 @@
         #define DEFAULT_TRIPLE WINDOWS_TRIPLE
     #endif
 
+    // per-thread storage for plain globals, e.g. the register context 
+    // types of the module a lifting thread is building
+    #ifdef _WIN32
+        #define THREAD_LOCAL __declspec(thread)
+    #else
+        #define THREAD_LOCAL __thread
+    #endif
+
 #endif //COMMON_DEFAULTS_H
@@ -35,10 +35,31 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #include "../cfgToLLVM/JumpTables.h"
 #include "../common/to_string.h"
 #include "LExcn.h"
+#include <google/protobuf/io/coded_stream.h>
+#include <google/protobuf/io/zero_copy_stream_impl.h>
+#include <climits>
+#include <cstring>
 
 using namespace llvm;
 using namespace std;
 
+// Streamed CFG container, as written by get_cfg.py --stream: the magic
+// bytes, followed by records of (kind byte, varint length, message).
+static const char CFG_STREAM_MAGIC[] = {'M', 'C', 'S', 'C', 'F', 'G', '\x00', '\x01'};
+
+enum CFGStreamRecord {
+  CFG_STREAM_HEADER            = 'H',
+  CFG_STREAM_FUNCTION          = 'F',
+  CFG_STREAM_DATA              = 'D',
+  CFG_STREAM_EXTERNAL_FUNCTION = 'X',
+  CFG_STREAM_EXTERNAL_DATA     = 'Y',
+  CFG_STREAM_ENTRY             = 'E'
+};
+
+// the newest Module.cfg_version this reader understands. Modules without
+// a version are version 1.
+static const int CFG_VERSION = 2;
+
 
 NativeModule::NativeModule(string modName, list<NativeFunctionPtr> f, llvm::MCInstPrinter *p) :   
                                                         funcs(f), 
@@ -269,18 +290,26 @@ void NativeModule::addDataSection(const DataSection &d)
     this->dataSecs.push_back(d);
 }
 
-InstPtr deserializeInst(const ::Instruction &inst, LLVMByteDecoder &decoder)
+// decode the instruction at addr out of mo, and attach what the CFG
+// recorded about it. Version 2 addresses are relative to base, the
+// address of the instruction's block.
+static InstPtr deserializeInst(const ::Instruction  &inst,
+                               VA                   addr,
+                               VA                   base,
+                               llvm::MemoryObject   &mo,
+                               LLVMByteDecoder      &decoder)
 {
-  VA                      addr = inst.inst_addr();
   boost::int64_t          tr_tgt = inst.true_target();
   boost::int64_t          fa_tgt = inst.false_target();
-  //boost::uint32_t         len = inst.inst_len();
-  string                  instData = inst.inst_bytes();
-  vector<boost::uint8_t>  bytes(instData.begin(), instData.end());
-  BaseBufferMemoryObject  bbmo(bytes, addr);
+
+  if(inst.has_true_delta())
+    tr_tgt = base + inst.true_delta();
+
+  if(inst.has_false_delta())
+    fa_tgt = base + inst.false_delta();
 
   //produce an MCInst from the instruction buffer using the ByteDecoder
-  InstPtr ip = decoder.getInstFromBuff(addr, &bbmo);
+  InstPtr ip = decoder.getInstFromBuff(addr, &mo);
 
   if(tr_tgt > 0)
     ip->set_tr(tr_tgt);
@@ -308,6 +337,11 @@ InstPtr deserializeInst(const ::Instruction &inst, LLVMByteDecoder &decoder)
       ip->set_call_tgt(inst.call_target());
   }
 
+  if(inst.has_call_delta()) 
+  {
+      ip->set_call_tgt(base + inst.call_delta());
+  }
+
   if(inst.has_reloc_offset()) {
       ip->set_reloc_offset(inst.reloc_offset());
   }
@@ -321,6 +355,10 @@ InstPtr deserializeInst(const ::Instruction &inst, LLVMByteDecoder &decoder)
       for(int i = 0; i < jmp_tbl.table_entries_size(); i++) {
           table_entries.push_back(jmp_tbl.table_entries(i));
       }
+
+      for(int i = 0; i < jmp_tbl.entry_deltas_size(); i++) {
+          table_entries.push_back(base + jmp_tbl.entry_deltas(i));
+      }
       
       JumpTable *jmp = new JumpTable(table_entries, jmp_tbl.zero_offset());
       ip->set_jump_table(JumpTablePtr(jmp));
@@ -340,19 +378,62 @@ InstPtr deserializeInst(const ::Instruction &inst, LLVMByteDecoder &decoder)
   return ip;
 }
 
+InstPtr deserializeInst(const ::Instruction &inst, VA base, LLVMByteDecoder &decoder)
+{
+  VA                      addr = inst.inst_addr();
+  const string            &instData = inst.inst_bytes();
+  ConstBufferMemoryObject mo((const boost::uint8_t *)instData.data(), 
+                             instData.size(), 
+                             addr);
+
+  return deserializeInst(inst, addr, base, mo, decoder);
+}
+
 NativeBlockPtr  deserializeBlock( const ::Block   &block,
+                                  const string    &codeImage,
                                   LLVMByteDecoder &decoder)
 {
+  VA              base = block.base_address();
   NativeBlockPtr  natB = 
-    NativeBlockPtr(new NativeBlock(block.base_address(), decoder.getPrinter()));
-  /* read all the instructions in */
-  for(int i = 0; i < block.insts_size(); i++)
-    natB->add_inst(deserializeInst(block.insts(i), decoder));
+    NativeBlockPtr(new NativeBlock(base, decoder.getPrinter()));
+
+  if(block.has_inst_lengths()) {
+    /* the instructions are back to back in the function's code image */
+    const string    &lengths = block.inst_lengths();
+    VA              addr = base;
+    boost::uint64_t off = block.code_offset();
+
+    if((int)lengths.size() != block.insts_size()) {
+      throw LErr(__LINE__, __FILE__, "Block instruction lengths do not match its instructions");
+    }
+
+    for(int i = 0; i < block.insts_size(); i++) {
+      boost::uint64_t len = (boost::uint8_t)lengths[i];
+      if(off + len > codeImage.size()) {
+        throw LErr(__LINE__, __FILE__, "Block extends past the end of the code image");
+      }
+
+      ConstBufferMemoryObject mo((const boost::uint8_t *)codeImage.data() + off, 
+                                 len, 
+                                 addr);
+      natB->add_inst(deserializeInst(block.insts(i), addr, base, mo, decoder));
+
+      addr += len;
+      off += len;
+    }
+  } else {
+    /* read all the instructions in */
+    for(int i = 0; i < block.insts_size(); i++)
+      natB->add_inst(deserializeInst(block.insts(i), base, decoder));
+  }
 
   /* add the follows */
   for(int i = 0; i < block.block_follows_size(); i++)
     natB->add_follow(block.block_follows(i));
 
+  for(int i = 0; i < block.follow_deltas_size(); i++)
+    natB->add_follow(base + block.follow_deltas(i));
+
   return natB;
 }
 
@@ -365,7 +446,7 @@ NativeFunctionPtr deserializeFunction(const ::Function  &func,
   //read all the blocks from this function
   for(int i = 0; i < func.blocks_size(); i++)
   {
-    natF->add_block(deserializeBlock(func.blocks(i), decoder));
+    natF->add_block(deserializeBlock(func.blocks(i), func.code_image(), decoder));
   }
 
   natF->compute_graph();
@@ -508,7 +589,211 @@ void deserializeData(const ::Data &d, DataSection &ds)
 
 }
 
-NativeModulePtr readProtoBuf(std::string fName) {
+static NativeModule::EntrySymbol deserializeEntry(const ::EntrySymbol &es)
+{
+  NativeModule::EntrySymbol native_es(es.entry_name(), es.entry_address());
+  if(es.has_entry_extra()) {
+      const ::EntrySymbolExtra &ese = es.entry_extra();
+      ExternalCodeRef::CallingConvention c = deserCC(ese.entry_cconv());
+      native_es.setExtra(ese.entry_argc(), ese.does_return(), c);
+  }
+
+  return native_es;
+}
+
+static NativeModulePtr makeModule(const string                      &name,
+                                  list<NativeFunctionPtr>           &foundFuncs,
+                                  list<ExternalCodeRefPtr>          &externFuncs,
+                                  list<ExternalDataRefPtr>          &externData,
+                                  list<DataSection>                 &dataSecs,
+                                  vector<NativeModule::EntrySymbol> &entries)
+{
+    //create the module 
+    NativeModulePtr m = NativeModulePtr(
+          new NativeModule(name, foundFuncs, NULL));
+
+    //populate the module with externals calls
+    for(list<ExternalCodeRefPtr>::iterator it = externFuncs.begin();
+        it != externFuncs.end();
+        ++it)
+    {
+      m->addExtCall(*it);
+    }
+
+    //populate the module with externals data
+    for(list<ExternalDataRefPtr>::iterator it = externData.begin();
+        it != externData.end();
+        ++it)
+    {
+      m->addExtDataRef(*it);
+    }
+
+    //populate the module with internal data
+    for(list<DataSection>::iterator it = dataSecs.begin(); 
+        it != dataSecs.end();
+        ++it)
+    {
+      m->addDataSection(*it);
+    }
+
+    // set entry points for the module
+    for(vector<NativeModule::EntrySymbol>::iterator it = entries.begin();
+        it != entries.end();
+        ++it)
+    {
+      m->addEntryPoint(*it);
+    }
+
+    return m;
+}
+
+// refuse CFGs written with a newer schema than this reader knows about,
+// instead of silently dropping the fields it cannot see
+static void checkVersion(const ::Module &mod)
+{
+  if(mod.has_cfg_version() && 
+     (mod.cfg_version() < 1 || mod.cfg_version() > CFG_VERSION))
+  {
+    throw LErr(__LINE__, __FILE__, 
+        "Unsupported CFG version " + to_string<int>(mod.cfg_version(), dec));
+  }
+}
+
+// what the readers below do with the functions of a CFG
+enum CFGReadMode {
+  // decode every function into the module
+  ReadAll,
+  // put every function in the module as just its entry address
+  ReadOutline,
+  // decode each function in turn and hand it to a visitor, reading
+  // nothing else
+  ReadFunctions
+};
+
+static void readFunction(const ::Function             &f,
+                         LLVMByteDecoder              &decode,
+                         CFGReadMode                  mode,
+                         const NativeFunctionVisitor  &visit,
+                         list<NativeFunctionPtr>      &foundFuncs)
+{
+  switch(mode) {
+    case ReadAll:
+      foundFuncs.push_back(deserializeFunction(f, decode));
+      break;
+    case ReadOutline:
+      foundFuncs.push_back(NativeFunctionPtr(new NativeFunction(f.entry_address())));
+      break;
+    case ReadFunctions:
+      visit(deserializeFunction(f, decode));
+      break;
+  }
+}
+
+// parse one length-delimited record out of a CFG stream
+static void parseStreamRecord(google::protobuf::io::CodedInputStream &cis,
+                              google::protobuf::Message             &msg)
+{
+  if(!msg.ParseFromCodedStream(&cis) || !cis.ConsumedEntireMessage()) {
+    throw LErr(__LINE__, __FILE__, "Malformed record in CFG stream");
+  }
+}
+
+// Read a streamed CFG (see bin_descend/cfg_stream.py). Each record is
+// converted to its native form as soon as it is read, so only one
+// serialized function is held in memory at a time.
+static NativeModulePtr readProtoBufStream(istream                     &inStream,
+                                          CFGReadMode                 mode,
+                                          const NativeFunctionVisitor &visit)
+{
+  google::protobuf::io::IstreamInputStream zin(&inStream);
+  LLVMByteDecoder                   decode;
+  string                            modName;
+  list<NativeFunctionPtr>           foundFuncs;
+  list<ExternalCodeRefPtr>          externFuncs;
+  list<ExternalDataRefPtr>          externData;
+  list<DataSection>                 dataSecs;
+  vector<NativeModule::EntrySymbol> entries;
+
+  while(true) {
+    // a fresh CodedInputStream per record, so protobuf's total bytes
+    // limit applies to each record rather than to the whole file
+    google::protobuf::io::CodedInputStream cis(&zin);
+    cis.SetTotalBytesLimit(INT_MAX, -1);
+
+    boost::uint8_t    kind;
+    boost::uint32_t   size;
+
+    if(!cis.ReadRaw(&kind, 1)) {
+      break;
+    }
+
+    if(!cis.ReadVarint32(&size)) {
+      throw LErr(__LINE__, __FILE__, "Truncated record in CFG stream");
+    }
+
+    if(mode == ReadFunctions && kind != CFG_STREAM_FUNCTION) {
+      if(!cis.Skip(size)) {
+        throw LErr(__LINE__, __FILE__, "Truncated record in CFG stream");
+      }
+      continue;
+    }
+
+    google::protobuf::io::CodedInputStream::Limit lim = cis.PushLimit(size);
+
+    switch(kind) {
+      case CFG_STREAM_HEADER: {
+        ::Module  hdr;
+        parseStreamRecord(cis, hdr);
+        checkVersion(hdr);
+        modName = hdr.module_name();
+        break;
+      }
+      case CFG_STREAM_FUNCTION: {
+        ::Function  f;
+        parseStreamRecord(cis, f);
+        readFunction(f, decode, mode, visit, foundFuncs);
+        break;
+      }
+      case CFG_STREAM_DATA: {
+        ::Data  d;
+        parseStreamRecord(cis, d);
+        DataSection ds;
+        deserializeData(d, ds);
+        dataSecs.push_back(ds);
+        break;
+      }
+      case CFG_STREAM_EXTERNAL_FUNCTION: {
+        ::ExternalFunction  f;
+        parseStreamRecord(cis, f);
+        externFuncs.push_back(deserializeExt(f));
+        break;
+      }
+      case CFG_STREAM_EXTERNAL_DATA: {
+        ::ExternalData  ed;
+        parseStreamRecord(cis, ed);
+        externData.push_back(deserializeExtData(ed));
+        break;
+      }
+      case CFG_STREAM_ENTRY: {
+        ::EntrySymbol es;
+        parseStreamRecord(cis, es);
+        entries.push_back(deserializeEntry(es));
+        break;
+      }
+      default:
+        throw LErr(__LINE__, __FILE__, "Unknown record kind in CFG stream");
+    }
+
+    cis.PopLimit(lim);
+  }
+
+  return makeModule(modName, foundFuncs, externFuncs, externData, dataSecs, entries);
+}
+
+static NativeModulePtr readProtoBufWith(std::string                 fName,
+                                        CFGReadMode                 mode,
+                                        const NativeFunctionVisitor &visit)
+{
   NativeModulePtr m;
   ::Module        serializedMod;
   ifstream        inStream(fName.c_str(), ios::binary);
@@ -521,18 +806,45 @@ NativeModulePtr readProtoBuf(std::string fName) {
     return m;
   }
 
+  char  magic[sizeof(CFG_STREAM_MAGIC)];
+  inStream.read(magic, sizeof(magic));
+  if(inStream.gcount() == sizeof(magic) &&
+     memcmp(magic, CFG_STREAM_MAGIC, sizeof(magic)) == 0)
+  {
+    return readProtoBufStream(inStream, mode, visit);
+  }
+
+  // a single Module message can only be parsed whole, which is what 
+  // reading functions a few at a time is meant to avoid
+  if(mode != ReadAll) {
+    cout << "Lifting in chunks needs a streamed CFG: " << fName 
+         << " is a single message. Recover it with get_cfg.py --stream" << endl;
+    return m;
+  }
+
+  // not a stream: rewind and read a single Module message
+  inStream.clear();
+  inStream.seekg(0, ios::beg);
+
+  google::protobuf::io::IstreamInputStream  zin(&inStream);
+  google::protobuf::io::CodedInputStream    cis(&zin);
+  cis.SetTotalBytesLimit(INT_MAX, -1);
+
   //read the protobuf object in 
-  if(serializedMod.ParseFromIstream(&inStream)) {
+  if(serializedMod.ParseFromCodedStream(&cis)) {
+    checkVersion(serializedMod);
+
     //now, make everything we need to build a NativeModulePtr 
     list<NativeFunctionPtr> foundFuncs;
     list<ExternalCodeRefPtr>     externFuncs;
     list<ExternalDataRefPtr>     externData;
     list<DataSection>              dataSecs;
+    vector<NativeModule::EntrySymbol> entries;
 
     //iterate over every function 
     for(int i = 0; i < serializedMod.internal_funcs_size(); i++) {
       const ::Function  &f = serializedMod.internal_funcs(i);
-      foundFuncs.push_back(deserializeFunction(f, decode));
+      readFunction(f, decode, mode, visit, foundFuncs);
     }
 
     //iterate over every data element
@@ -555,47 +867,18 @@ NativeModulePtr readProtoBuf(std::string fName) {
       externData.push_back(deserializeExtData(ed)); 
     }
 
-    //create the module 
-    m = NativeModulePtr(
-          new NativeModule(serializedMod.module_name(), foundFuncs, NULL));
-
-    //populate the module with externals calls
-    for(list<ExternalCodeRefPtr>::iterator it = externFuncs.begin();
-        it != externFuncs.end();
-        ++it)
-    {
-      m->addExtCall(*it);
-    }
-
-    //populate the module with externals data
-    for(list<ExternalDataRefPtr>::iterator it = externData.begin();
-        it != externData.end();
-        ++it)
-    {
-      m->addExtDataRef(*it);
-    }
-
-    //populate the module with internal data
-    for(list<DataSection>::iterator it = dataSecs.begin(); 
-        it != dataSecs.end();
-        ++it)
-    {
-      m->addDataSection(*it);
-    }
-
-    // set entry points for the module
+    // collect entry points for the module
     for(int i = 0; i < serializedMod.entries_size(); i++) {
-        const ::EntrySymbol &es = serializedMod.entries(i);
-        
-        NativeModule::EntrySymbol native_es(es.entry_name(), es.entry_address());
-        if(es.has_entry_extra()) {
-            const ::EntrySymbolExtra &ese = es.entry_extra();
-            ExternalCodeRef::CallingConvention c = deserCC(ese.entry_cconv());
-            native_es.setExtra(ese.entry_argc(), ese.does_return(), c);
-        } 
-        m->addEntryPoint(native_es);
+      entries.push_back(deserializeEntry(serializedMod.entries(i)));
     }
 
+    m = makeModule(serializedMod.module_name(), 
+                   foundFuncs, 
+                   externFuncs, 
+                   externData, 
+                   dataSecs, 
+                   entries);
+
   } else {
     cout << "Failed to deserialize protobuf module" << endl;
   }
@@ -604,6 +887,18 @@ NativeModulePtr readProtoBuf(std::string fName) {
   return m;
 }
 
+NativeModulePtr readProtoBuf(std::string fName) {
+  return readProtoBufWith(fName, ReadAll, NativeFunctionVisitor());
+}
+
+NativeModulePtr readModuleOutline(std::string fName) {
+  return readProtoBufWith(fName, ReadOutline, NativeFunctionVisitor());
+}
+
+bool readModuleFunctions(std::string fName, NativeFunctionVisitor visit) {
+  return readProtoBufWith(fName, ReadFunctions, visit) != NULL;
+}
+
 NativeModulePtr readModule( std::string         fName, 
                             ModuleInputFormat   inf,
                             list<VA>            entries) 
@@ -64,6 +64,7 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 #include <boost/shared_ptr.hpp>
 #include <boost/enable_shared_from_this.hpp>
+#include <boost/function.hpp>
 
 #include <boost/program_options/config.hpp>
 #include <boost/program_options/parsers.hpp>
@@ -563,6 +564,16 @@ enum ModuleInputFormat {
 const llvm::Target *findDisTarget(std::string );
 NativeModulePtr readModule(std::string, ModuleInputFormat, std::list<VA>);
 
+typedef boost::function<void (NativeFunctionPtr)>   NativeFunctionVisitor;
+
+// For modules too big to decode at once. readModuleOutline reads a CFG
+// with every function present only as its entry address, and 
+// readModuleFunctions then decodes the functions one at a time, handing 
+// each to the visitor. Both only read streamed CFGs (get_cfg.py --stream),
+// and fail on a single message CFG
+NativeModulePtr readModuleOutline(std::string);
+bool readModuleFunctions(std::string, NativeFunctionVisitor);
+
 // used in testSemantics.cpp via funcFromBuff
 NativeBlockPtr blockFromBuff( VA, 
                               BufferMemoryObject &, 
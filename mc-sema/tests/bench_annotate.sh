@@ -0,0 +1,45 @@
+#!/bin/bash
+#
+# Compare cfg_to_bc wall time, peak memory and output size across the
+# -annotate modes, and the time opt -O3 then takes on each result.
+#
+# usage: bench_annotate.sh <cfg> <driver> [runs]
+# e.g.:  bench_annotate.sh demo_maze.cfg mcsema_main,main,raw,return,C 3
+
+source env.sh
+
+if [ $# -lt 2 ]
+then
+    echo "usage: $0 <cfg> <driver> [runs]"
+    exit 1
+fi
+
+CFG=$1
+DRIVER=$2
+RUNS=${3:-1}
+TIME=/usr/bin/time
+
+printf "%-8s %4s %10s %14s %12s %10s\n" mode run "lift (s)" "peak RSS (KB)" "bitcode (B)" "opt (s)"
+
+for MODE in full address none
+do
+    OUT=bench_annotate_${MODE}.bc
+    for RUN in $(seq 1 ${RUNS})
+    do
+        rm -f ${OUT} bench_annotate_${MODE}_opt.bc
+        ${TIME} -f "%e %M" -o bench_annotate.time \
+            ${CFG_TO_BC_PATH}/cfg_to_bc -annotate=${MODE} -i ${CFG} -driver=${DRIVER} -o ${OUT} > /dev/null
+        if [ ! -e ${OUT} ]
+        then
+            echo "cfg_to_bc failed for -annotate=${MODE}"
+            exit 1
+        fi
+        LIFT=$(cat bench_annotate.time)
+        ${TIME} -f "%e" -o bench_annotate.time \
+            ${LLVM_PATH}/opt -O3 -o bench_annotate_${MODE}_opt.bc ${OUT}
+        OPT=$(cat bench_annotate.time)
+        printf "%-8s %4s %10s %14s %12s %10s\n" ${MODE} ${RUN} ${LIFT} $(stat -c %s ${OUT}) ${OPT}
+    done
+done
+
+rm -f bench_annotate_*.bc bench_annotate.time
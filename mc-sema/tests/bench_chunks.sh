@@ -0,0 +1,52 @@
+#!/bin/bash
+#
+# Compare cfg_to_bc wall time and peak memory when lifting a whole module
+# against lifting it -chunk-size functions at a time, and check that the
+# linked chunks define every symbol the whole module does.
+#
+# <cfg> has to be streamed (get_cfg.py --stream).
+#
+# usage: bench_chunks.sh <cfg> <driver> [chunk sizes...]
+# e.g.:  bench_chunks.sh demo_maze.cfg mcsema_main,main,raw,return,C 1 16 256
+
+source env.sh
+
+if [ $# -lt 2 ]
+then
+    echo "usage: $0 <cfg> <driver> [chunk sizes...]"
+    exit 1
+fi
+
+CFG=$1
+DRIVER=$2
+shift 2
+SIZES=${@:-16 256}
+TIME=/usr/bin/time
+
+printf "%6s %10s %14s %8s\n" chunk "lift (s)" "peak RSS (KB)" complete
+
+for N in 0 ${SIZES}
+do
+    rm -f bench_chunks.bc bench_chunks.*.bc
+    ${TIME} -f "%e %M" -o bench_chunks.time \
+        ${CFG_TO_BC_PATH}/cfg_to_bc -chunk-size=${N} -i ${CFG} -driver=${DRIVER} -o bench_chunks.bc > /dev/null
+    if [ ! -e bench_chunks.bc ]
+    then
+        echo "cfg_to_bc failed for -chunk-size=${N}"
+        exit 1
+    fi
+    if [ ${N} -ne 0 ]
+    then
+        ${LLVM_PATH}/llvm-link -o bench_chunks_linked.bc bench_chunks.bc bench_chunks.*.bc
+        mv bench_chunks_linked.bc bench_chunks.bc
+    fi
+    ${LLVM_PATH}/llvm-nm bench_chunks.bc | grep -v " [Uu] " | awk '{print $NF}' | sort > bench_chunks_${N}.syms
+    COMPLETE=yes
+    if [ -n "$(comm -23 bench_chunks_0.syms bench_chunks_${N}.syms)" ]
+    then
+        COMPLETE=no
+    fi
+    printf "%6s %10s %14s %8s\n" ${N} $(cat bench_chunks.time) ${COMPLETE}
+done
+
+rm -f bench_chunks.bc bench_chunks.*.bc bench_chunks_*.syms bench_chunks.time
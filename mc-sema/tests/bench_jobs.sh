@@ -0,0 +1,44 @@
+#!/bin/bash
+#
+# Compare cfg_to_bc wall time and peak memory across -j thread counts,
+# and check that every run lifts the same functions as the first one.
+#
+# usage: bench_jobs.sh <cfg> <driver> [thread counts...]
+# e.g.:  bench_jobs.sh demo_maze.cfg mcsema_main,main,raw,return,C 1 2 4 8
+
+source env.sh
+
+if [ $# -lt 2 ]
+then
+    echo "usage: $0 <cfg> <driver> [thread counts...]"
+    exit 1
+fi
+
+CFG=$1
+DRIVER=$2
+shift 2
+JOBS=${@:-1 2 4}
+TIME=/usr/bin/time
+
+printf "%4s %10s %14s %12s %8s\n" jobs "lift (s)" "peak RSS (KB)" "bitcode (B)" same
+
+FIRST=
+for J in ${JOBS}
+do
+    OUT=bench_jobs_${J}.bc
+    rm -f ${OUT}
+    ${TIME} -f "%e %M" -o bench_jobs.time \
+        ${CFG_TO_BC_PATH}/cfg_to_bc -j=${J} -i ${CFG} -driver=${DRIVER} -o ${OUT} > /dev/null
+    if [ ! -e ${OUT} ]
+    then
+        echo "cfg_to_bc failed for -j=${J}"
+        exit 1
+    fi
+    ${LLVM_PATH}/llvm-nm ${OUT} | sort > bench_jobs_${J}.syms
+    FIRST=${FIRST:-${J}}
+    SAME=yes
+    cmp -s bench_jobs_${FIRST}.syms bench_jobs_${J}.syms || SAME=no
+    printf "%4s %10s %14s %12s %8s\n" ${J} $(cat bench_jobs.time) $(stat -c %s ${OUT}) ${SAME}
+done
+
+rm -f bench_jobs_*.bc bench_jobs_*.syms bench_jobs.time